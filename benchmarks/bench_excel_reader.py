@@ -0,0 +1,92 @@
+"""Benchmark ExcelReader load time for large input workbooks.
+
+Generates a synthetic input workbook (tema, foco, periodo plus a few extra
+columns that the reader must skip) and compares ExcelReader.read_input
+against the previous full-frame pandas path (read every column with the
+openpyxl engine, regex replace over the frame, iterrows into FocoInput), plus
+a warm restart served from the sidecar input cache.
+
+Usage:
+    uv run python benchmarks/bench_excel_reader.py --rows 100000
+"""
+
+import argparse
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+from openpyxl import Workbook
+
+from construtor.io import ExcelReader
+from construtor.models.question import FocoInput
+
+PERIODOS = ["1º ano", "2º ano", "3º ano", "4º ano"]
+EXTRA_COLUMNS = ["observacoes", "responsavel", "prioridade"]
+
+
+def build_workbook(path: Path, rows: int) -> None:
+    """Write a synthetic input workbook with ``rows`` data rows."""
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet()
+    sheet.append(["Tema", "Foco", "Periodo", *EXTRA_COLUMNS])
+    for i in range(rows):
+        sheet.append(
+            [
+                f"Tema {i % 40}",
+                f"  Foco específico {i}  ",
+                PERIODOS[i % len(PERIODOS)],
+                "revisar bibliografia",
+                f"autor {i % 7}",
+                i % 3,
+            ]
+        )
+    workbook.save(path)
+
+
+def legacy_read(path: Path) -> list[FocoInput]:
+    """Previous implementation: full-frame read + iterrows model building."""
+    df = pd.read_excel(path, engine="openpyxl", dtype=str, na_filter=True, keep_default_na=True)
+    df.columns = df.columns.str.strip().str.lower()
+    for col in ExcelReader.REQUIRED_COLUMNS:
+        df[col] = df[col].str.strip()
+    df = df.replace(r"^\s*$", pd.NA, regex=True)
+    df = df[ExcelReader.REQUIRED_COLUMNS]
+    return [
+        FocoInput(tema=row["tema"], foco=row["foco"], periodo=row["periodo"])
+        for _, row in df.iterrows()
+    ]
+
+
+def timed(label: str, func: Callable[..., list[FocoInput]], *args: object) -> float:
+    """Run ``func`` once and print its wall-clock time."""
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {elapsed:8.2f}s  ({len(result)} focos)")
+    return elapsed
+
+
+def main() -> None:
+    """Build the workbook and time both read paths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "bench_input.xlsx"
+        build_workbook(path, args.rows)
+        print(f"Workbook: {args.rows} rows, {path.stat().st_size / 1e6:.1f} MB")
+
+        legacy = timed("legacy pandas/iterrows", legacy_read, path)
+        fast = timed("ExcelReader.read_input", ExcelReader().read_input, str(path))
+        print(f"Speedup: {legacy / fast:.1f}x")
+
+        cached_reader = ExcelReader(use_cache=True)
+        cached_reader.read_input(str(path))  # populate the sidecar cache
+        timed("read_input (cache hit)", cached_reader.read_input, str(path))
+
+
+if __name__ == "__main__":
+    main()
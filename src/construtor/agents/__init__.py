@@ -2,15 +2,20 @@
 
 This module contains AI agents that perform specific tasks in the pipeline:
 - SubFocoGenerator: Generates specific sub-focos from a general foco
+- SubFocoDeduplicator: Drops near-duplicate (paraphrased) sub-focos per foco
 - CriadorAgent: Creates multiple-choice questions
-- (Future) ComentadorAgent: Generates educational comments
+- ComentadorAgent: Reviews questions blind and generates educational comments
 - (Future) ValidadorAgent: Validates question quality
 """
 
+from construtor.agents.comentador import ComentadorAgent
 from construtor.agents.criador import CriadorAgent
+from construtor.agents.subfoco_dedup import SubFocoDeduplicator
 from construtor.agents.subfoco_generator import SubFocoGenerator
 
 __all__ = [
+    "ComentadorAgent",
     "CriadorAgent",
+    "SubFocoDeduplicator",
     "SubFocoGenerator",
 ]
@@ -0,0 +1,179 @@
+"""Blind-review commentator agent."""
+
+import logging
+import time
+from collections.abc import Sequence
+
+from construtor.config.exceptions import LLMProviderError, OutputParsingError
+from construtor.config.prompt_loader import compile_prompt
+from construtor.config.settings import PipelineConfig
+from construtor.io.pinecone_client import PineconeClient
+from construtor.models.feedback import ComentadorOutput
+from construtor.models.question import CriadorOutput, SubFocoInput
+from construtor.models.rag import RagQueryResult
+from construtor.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+RAG_UNAVAILABLE_REFERENCE = "Fonte não disponível (RAG offline)"
+
+_PROMPT_PLACEHOLDERS = frozenset(
+    {
+        "tema",
+        "foco",
+        "sub_foco",
+        "periodo",
+        "enunciado",
+        "alternativa_a",
+        "alternativa_b",
+        "alternativa_c",
+        "alternativa_d",
+        "contexto_rag",
+    }
+)
+
+
+def format_rag_context(rag_context: RagQueryResult | None) -> str:
+    """Render retrieved documents as the prompt's reference section.
+
+    Args:
+        rag_context: Documents retrieved for the question (None = RAG offline)
+
+    Returns:
+        Numbered documents with their citation, or a note that none is available
+    """
+    if rag_context is None or not rag_context.documentos:
+        return "Nenhum documento disponível."
+    return "\n\n".join(
+        f"[{i}] {document.citation() or 'Referência sem metadados'}\n{document.texto}"
+        for i, document in enumerate(rag_context.documentos, start=1)
+    )
+
+
+class ComentadorAgent:
+    """Reviews questions blind (without the gabarito) and writes their comments.
+
+    The prompt never contains ``resposta_correta``: the agent declares the
+    alternative it considers correct, which the Validador then compares with
+    the Criador's gabarito (FR10). References come from the RAG documents
+    retrieved by the PineconeClient (FR19, FR21).
+
+    Args:
+        provider: LLM provider for generation calls.
+        config: Pipeline configuration with model and temperature.
+        rag_client: Client retrieving RAG context (None = always without RAG).
+
+    Raises:
+        ConfigurationError: If ``prompts/comentador.md`` does not use exactly
+            the placeholders the agent fills.
+
+    Example:
+        agent = ComentadorAgent(provider, config, rag_client)
+        contexts = await agent.fetch_contexts(sub_focos)  # one batch query
+        output = await agent.review_question(sub_focos[0], questions[0], contexts[0])
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        config: PipelineConfig,
+        rag_client: PineconeClient | None = None,
+    ) -> None:
+        self._provider = provider
+        self._config = config
+        self._rag_client = rag_client
+        self._prompt_template = compile_prompt("comentador", placeholders=_PROMPT_PLACEHOLDERS)
+
+    async def fetch_contexts(
+        self, subfoco_inputs: Sequence[SubFocoInput]
+    ) -> list[RagQueryResult | None]:
+        """Retrieve the RAG context of a batch of questions at once.
+
+        Args:
+            subfoco_inputs: Sub-foco of each question
+
+        Returns:
+            One context per question; None where RAG is unavailable
+        """
+        if self._rag_client is None:
+            return [None] * len(subfoco_inputs)
+        return await self._rag_client.query_many(subfoco_inputs)
+
+    async def review_question(
+        self,
+        subfoco_input: SubFocoInput,
+        criador_output: CriadorOutput,
+        rag_context: RagQueryResult | None = None,
+    ) -> ComentadorOutput:
+        """Review a question blind and generate its structured comment.
+
+        Args:
+            subfoco_input: Input with tema, foco, sub_foco, periodo.
+            criador_output: Question to review (its gabarito is not shown).
+            rag_context: Documents retrieved for the question; None means RAG
+                is unavailable and the reference is marked as such.
+
+        Returns:
+            ComentadorOutput with the declared answer, comments and reference.
+
+        Raises:
+            LLMProviderError: If the LLM provider is unavailable.
+            OutputParsingError: If generation fails.
+        """
+        # Blind review: resposta_correta is deliberately not rendered
+        prompt = self._prompt_template.render(
+            tema=subfoco_input.tema,
+            foco=subfoco_input.foco,
+            sub_foco=subfoco_input.sub_foco,
+            periodo=subfoco_input.periodo,
+            enunciado=criador_output.enunciado,
+            alternativa_a=criador_output.alternativa_a,
+            alternativa_b=criador_output.alternativa_b,
+            alternativa_c=criador_output.alternativa_c,
+            alternativa_d=criador_output.alternativa_d,
+            contexto_rag=format_rag_context(rag_context),
+        )
+
+        start = time.monotonic()
+        try:
+            response = await self._provider.generate(
+                prompt=prompt,
+                model=self._config.default_model,
+                temperature=self._config.temperature,
+                response_model=ComentadorOutput,
+            )
+        except LLMProviderError:
+            raise
+        except Exception as e:
+            msg = f"Failed to generate comment from LLM | sub_foco={subfoco_input.sub_foco}"
+            raise OutputParsingError(
+                msg,
+                foco=subfoco_input.foco,
+                modelo=self._config.default_model,
+            ) from e
+
+        latency = time.monotonic() - start
+
+        comentador_output: ComentadorOutput = response["content"]
+
+        if rag_context is None or not rag_context.documentos:
+            logger.warning(
+                f"Comment generated without RAG context | sub_foco={subfoco_input.sub_foco}"
+            )
+            comentador_output = comentador_output.model_copy(
+                update={"referencia_bibliografica": RAG_UNAVAILABLE_REFERENCE}
+            )
+
+        logger.info(
+            "Question reviewed | sub_foco=%s | resposta_declarada=%s | rag_docs=%d | "
+            "modelo=%s | tokens=%d | cost=%.4f | latency=%.2fs",
+            subfoco_input.sub_foco,
+            comentador_output.resposta_declarada,
+            len(rag_context.documentos) if rag_context else 0,
+            self._config.default_model,
+            response["tokens_used"],
+            response["cost"],
+            latency,
+        )
+
+        return comentador_output
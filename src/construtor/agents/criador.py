@@ -3,9 +3,14 @@
 import logging
 import time
 
-from construtor.config.exceptions import OutputParsingError
-from construtor.config.prompt_loader import load_prompt
+from construtor.config.exceptions import (
+    DuplicateQuestionError,
+    LLMProviderError,
+    OutputParsingError,
+)
+from construtor.config.prompt_loader import compile_prompt
 from construtor.config.settings import PipelineConfig
+from construtor.metrics.question_index import QuestionIndex
 from construtor.models.question import CriadorOutput, SubFocoInput
 from construtor.providers.base import LLMProvider
 
@@ -13,6 +18,19 @@ logger = logging.getLogger(__name__)
 
 _DEFAULT_NIVEL_DIFICULDADE = 2
 
+_PROMPT_PLACEHOLDERS = frozenset(
+    {"tema", "foco", "sub_foco", "periodo", "posicao_correta", "nivel_dificuldade"}
+)
+
+_AVOID_DUPLICATE_INSTRUCTIONS = """
+
+## Questão já existente (não repita)
+
+{enunciado}
+
+Crie uma questão DIFERENTE da acima: outro cenário clínico, outro aspecto do
+sub-foco e outras alternativas."""
+
 
 class CriadorAgent:
     """Generates complete questions with enunciado, alternatives, and gabarito.
@@ -25,6 +43,15 @@ class CriadorAgent:
     Args:
         provider: LLM provider for generation calls.
         config: Pipeline configuration with model and temperature.
+        question_index: Optional cross-run question index; a near-duplicate
+            of an indexed question is regenerated before it reaches the
+            Comentador/Validador.
+        max_duplicate_retries: Regenerations of a near-duplicate question
+            before giving up with DuplicateQuestionError.
+
+    Raises:
+        ConfigurationError: If ``prompts/criador.md`` does not use exactly the
+            placeholders the agent fills.
 
     Example:
         agent = CriadorAgent(provider, config)
@@ -36,10 +63,22 @@ class CriadorAgent:
         # Returns CriadorOutput with question, alternatives, gabarito
     """
 
-    def __init__(self, provider: LLMProvider, config: PipelineConfig) -> None:
+    def __init__(
+        self,
+        provider: LLMProvider,
+        config: PipelineConfig,
+        question_index: QuestionIndex | None = None,
+        max_duplicate_retries: int = 1,
+    ) -> None:
+        if max_duplicate_retries < 0:
+            msg = f"max_duplicate_retries must be non-negative, got {max_duplicate_retries}"
+            raise ValueError(msg)
+
         self._provider = provider
         self._config = config
-        self._prompt_template = load_prompt("criador")
+        self._question_index = question_index
+        self._max_duplicate_retries = max_duplicate_retries
+        self._prompt_template = compile_prompt("criador", placeholders=_PROMPT_PLACEHOLDERS)
 
     async def create_question(
         self,
@@ -65,7 +104,10 @@ class CriadorAgent:
             CriadorOutput with enunciado, alternatives, gabarito, objective.
 
         Raises:
+            LLMProviderError: If the LLM provider is unavailable (including
+                CircuitOpenError when every route's circuit is open).
             OutputParsingError: If generation fails or position validation fails.
+            DuplicateQuestionError: If every attempt duplicates an indexed question.
             ValueError: If posicao_correta is not A/B/C/D or nivel_dificuldade not 1-3.
         """
         # Validate inputs
@@ -77,21 +119,60 @@ class CriadorAgent:
             msg = f"nivel_dificuldade must be 1-3, got {nivel_dificuldade}"
             raise ValueError(msg)
 
-        # Format prompt with all required variables
-        # Wrap in try/except to catch template errors early (missing/extra placeholders)
-        try:
-            prompt = self._prompt_template.format(
-                tema=subfoco_input.tema,
-                foco=subfoco_input.foco,
-                sub_foco=subfoco_input.sub_foco,
-                periodo=subfoco_input.periodo,
-                posicao_correta=posicao_correta,
-                nivel_dificuldade=nivel_dificuldade,
+        # Placeholders were validated when the template was compiled
+        prompt = self._prompt_template.render(
+            tema=subfoco_input.tema,
+            foco=subfoco_input.foco,
+            sub_foco=subfoco_input.sub_foco,
+            periodo=subfoco_input.periodo,
+            posicao_correta=posicao_correta,
+            nivel_dificuldade=nivel_dificuldade,
+        )
+
+        criador_output = await self._generate(
+            prompt, subfoco_input, posicao_correta, nivel_dificuldade
+        )
+        if self._question_index is None:
+            return criador_output
+
+        # Cross-run dedup: regenerate before any Comentador/Validador call is spent
+        for attempt in range(self._max_duplicate_retries + 1):
+            match = self._question_index.check(criador_output)
+            if match is None:
+                return criador_output
+            logger.warning(
+                f"Generated question duplicates question {match.question_id} "
+                f"(similarity {match.similarity:.2f}) | sub_foco={subfoco_input.sub_foco} "
+                f"| attempt={attempt + 1}"
+            )
+            if attempt == self._max_duplicate_retries:
+                break
+            criador_output = await self._generate(
+                prompt + _AVOID_DUPLICATE_INSTRUCTIONS.format(enunciado=criador_output.enunciado),
+                subfoco_input,
+                posicao_correta,
+                nivel_dificuldade,
             )
-        except KeyError as e:
-            msg = f"Prompt template missing required placeholder or has extra placeholder: {e}"
-            raise ValueError(msg) from e
 
+        msg = (
+            f"Generated question duplicates question {match.question_id} "
+            f"(similarity {match.similarity:.2f}) | sub_foco={subfoco_input.sub_foco}"
+        )
+        raise DuplicateQuestionError(
+            msg,
+            foco=subfoco_input.foco,
+            modelo=self._config.default_model,
+            duplicate_of=match.question_id,
+        )
+
+    async def _generate(
+        self,
+        prompt: str,
+        subfoco_input: SubFocoInput,
+        posicao_correta: str,
+        nivel_dificuldade: int,
+    ) -> CriadorOutput:
+        """Call the LLM and validate the correct answer position."""
         # Call LLM provider with structured output
         start = time.monotonic()
         try:
@@ -101,6 +182,10 @@ class CriadorAgent:
                 temperature=self._config.temperature,
                 response_model=CriadorOutput,
             )
+        except LLMProviderError:
+            # Provider failures (timeouts, open circuits) stay distinguishable
+            # from bad output, so the pipeline can fail over or pause
+            raise
         except Exception as e:
             msg = (
                 f"Failed to generate question from LLM | "
@@ -0,0 +1,205 @@
+"""Semantic near-duplicate detection for generated sub-focos.
+
+Exact-string dedup lets paraphrases through ("Critérios de Framingham para
+diagnóstico" / "Critérios de Framingham no diagnóstico da IC"), and each one
+later becomes a near-identical question that costs Criador and Comentador
+calls. SubFocoDeduplicator embeds sub-focos and drops any whose cosine
+similarity to an already accepted sub-foco of the same foco reaches a
+threshold.
+
+The default embedding needs no model: hashed words and character n-grams
+(3-5) of the normalized text, without Portuguese stopwords and without the
+words of the foco itself (shared by every sub-foco of the foco, they would
+inflate every similarity). Whole words dominate: otherwise a word that
+contains another ("Contraindicações" / "Indicações") shares most of its
+n-grams and opposite topics look like paraphrases. Any local model can be plugged in through
+``embedder`` (e.g. a sentence-transformers ``encode``).
+"""
+
+import logging
+import zlib
+from collections.abc import Callable, Iterable
+
+import numpy as np
+
+from construtor.io.foco_index import normalize_key, normalize_text
+from construtor.models.question import FocoInput
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[list[str]], np.ndarray]
+"""Maps texts to an (n, dim) array of embeddings."""
+
+_STOPWORDS = frozenset(
+    "a o as os ao aos de da do das dos e em na no nas nos num numa com para por pela "
+    "pelo pelas pelos um uma uns umas sem sob sobre entre que se ou".split()
+)
+
+
+def embed_texts(
+    texts: list[str],
+    dim: int = 2048,
+    ngram_range: tuple[int, int] = (3, 5),
+    exclude_words: Iterable[str] = (),
+) -> np.ndarray:
+    """Embed texts as L2-normalized hashed n-gram vectors.
+
+    Features are the words and character n-grams (of each space-padded
+    word) of the normalized text, hashed with CRC32 into ``dim`` signed
+    buckets, so embeddings are stable across processes. A word feature
+    weighs as much as all the n-grams of the word together: n-grams only
+    add tolerance to inflections and typos.
+
+    Args:
+        texts: Texts to embed
+        dim: Vector dimension
+        ngram_range: (min, max) character n-gram length
+        exclude_words: Normalized words to ignore besides the stopwords
+
+    Returns:
+        float32 array of shape (len(texts), dim); rows of texts without
+        features are all zeros
+
+    Example:
+        >>> vectors = embed_texts(["Critérios de Framingham", "criterios framingham"])
+        >>> float(vectors[0] @ vectors[1])
+        1.0
+    """
+    ignored = _STOPWORDS | set(exclude_words)
+    low, high = ngram_range
+    matrix = np.zeros((len(texts), dim), dtype=np.float32)
+    for row, text in enumerate(texts):
+        for word in normalize_text(text).split():
+            if word in ignored:
+                continue
+            padded = f" {word} "
+            ngrams = [
+                padded[i : i + size]
+                for size in range(low, high + 1)
+                for i in range(max(1, len(padded) - size + 1))
+            ]
+            features = [(f"w:{word}", float(len(ngrams)))]
+            features.extend((ngram, 1.0) for ngram in ngrams)
+            for feature, weight in features:
+                digest = zlib.crc32(feature.encode("utf-8"))
+                matrix[row, digest % dim] += weight if digest & 0x80000000 else -weight
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+class SubFocoDeduplicator:
+    """Per-foco index of accepted sub-focos for near-duplicate filtering.
+
+    ``filter`` only checks candidates; ``commit`` adds the sub-focos that
+    were actually kept, so a failed generation leaves the index untouched.
+
+    Args:
+        threshold: Cosine similarity at or above which a sub-foco is a
+            near-duplicate (0.85 catches rewordings but keeps
+            "Diagnóstico..." and "Tratamento..." of the same condition apart)
+        embedder: Embedding function; defaults to hashed n-gram vectors
+            ignoring the foco's own words
+
+    Raises:
+        ValueError: If threshold is not in (0, 1]
+
+    Example:
+        >>> dedup = SubFocoDeduplicator()
+        >>> kept = dedup.filter(foco_input, sub_focos)
+        >>> dedup.commit(foco_input, kept)
+    """
+
+    def __init__(self, threshold: float = 0.85, embedder: Embedder | None = None) -> None:
+        if not 0.0 < threshold <= 1.0:
+            msg = f"threshold must be in (0, 1], got {threshold}"
+            raise ValueError(msg)
+
+        self._threshold = threshold
+        self._embedder = embedder
+        self._texts: dict[tuple[str, str, str], list[str]] = {}
+        self._vectors: dict[tuple[str, str, str], np.ndarray] = {}
+        self._dropped = 0
+
+    def filter(self, foco_input: FocoInput, sub_focos: list[str]) -> list[str]:
+        """Drop sub-focos too similar to a committed or earlier sub-foco.
+
+        Args:
+            foco_input: Foco the sub-focos belong to
+            sub_focos: Candidate sub-focos, in order of preference
+
+        Returns:
+            The candidates that are not near-duplicates, in order
+        """
+        if not sub_focos:
+            return []
+
+        key = self._key(foco_input)
+        vectors = self._embed(foco_input, sub_focos)
+
+        # Against the committed index: one matrix product for the whole batch
+        blocked = np.zeros(len(sub_focos), dtype=bool)
+        committed = self._vectors.get(key)
+        if committed is not None and len(committed):
+            blocked = (vectors @ committed.T).max(axis=1) >= self._threshold
+
+        # Within the batch: a candidate loses to any earlier kept candidate
+        pairwise = vectors @ vectors.T
+        kept: list[int] = []
+        for i in range(len(sub_focos)):
+            if blocked[i] or (kept and pairwise[i, kept].max() >= self._threshold):
+                continue
+            kept.append(i)
+
+        dropped = len(sub_focos) - len(kept)
+        if dropped:
+            self._dropped += dropped
+            logger.info(
+                f"Dropped {dropped} near-duplicate sub-focos | foco={foco_input.foco} "
+                f"| threshold={self._threshold}"
+            )
+        return [sub_focos[i] for i in kept]
+
+    def commit(self, foco_input: FocoInput, sub_focos: list[str]) -> None:
+        """Add kept sub-focos to the foco's index.
+
+        Args:
+            foco_input: Foco the sub-focos belong to
+            sub_focos: Sub-focos that will become questions
+        """
+        if not sub_focos:
+            return
+        key = self._key(foco_input)
+        vectors = self._embed(foco_input, sub_focos)
+        existing = self._vectors.get(key)
+        self._vectors[key] = vectors if existing is None else np.vstack([existing, vectors])
+        self._texts.setdefault(key, []).extend(sub_focos)
+
+    def get_statistics(self) -> dict[str, int]:
+        """Get index size and number of sub-focos dropped so far.
+
+        Returns:
+            Dict with focos, sub_focos (committed) and dropped
+        """
+        return {
+            "focos": len(self._texts),
+            "sub_focos": sum(len(texts) for texts in self._texts.values()),
+            "dropped": self._dropped,
+        }
+
+    def _embed(self, foco_input: FocoInput, texts: list[str]) -> np.ndarray:
+        if self._embedder is not None:
+            vectors = np.asarray(self._embedder(texts), dtype=np.float32)
+            norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+            return np.divide(vectors, norms, out=np.zeros_like(vectors), where=norms > 0)
+        foco_words = normalize_text(foco_input.foco).split()
+        return embed_texts(texts, exclude_words=foco_words)
+
+    @staticmethod
+    def _key(foco_input: FocoInput) -> tuple[str, str, str]:
+        return (
+            normalize_key(foco_input.tema),
+            normalize_key(foco_input.foco),
+            normalize_key(foco_input.periodo),
+        )
@@ -0,0 +1,268 @@
+"""Sub-foco generator agent."""
+
+import hashlib
+import logging
+import time
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from construtor.agents.subfoco_dedup import SubFocoDeduplicator
+from construtor.config.exceptions import OutputParsingError
+from construtor.config.prompt_loader import compile_prompt
+from construtor.config.settings import PipelineConfig
+from construtor.io.subfoco_catalog import MANUAL_PROMPT_VERSION
+from construtor.metrics.store import MetricsStore
+from construtor.models.question import FocoInput, SubFocoInput
+from construtor.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_COUNT = 50
+_PROMPT_PLACEHOLDERS = frozenset({"tema", "foco", "periodo", "count"})
+_MAX_RETRIES = 2
+
+# Appended to the prompt when topping up a partial batch
+_TOP_UP_INSTRUCTIONS = """
+
+## Sub-focos já gerados (não repita)
+
+{existing}
+
+Gere apenas {missing} sub-focos NOVOS, diferentes de todos os listados acima."""
+
+
+class SubFocoBatchResponse(BaseModel):
+    """Structured LLM response with a batch of sub-focos."""
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    sub_focos: list[str] = Field(..., description="Lista de sub-focos gerados")
+
+
+class SubFocoGenerator:
+    """Generates specific sub-focos in batch from a general foco.
+
+    Each generated sub-foco becomes one question in the pipeline. The LLM output
+    is cleaned (empty strings removed, duplicates dropped) and the call is retried
+    when fewer than ``count`` valid sub-focos remain. In top-up mode (the
+    default) a retry keeps the valid sub-focos and asks only for the missing
+    ones, listing the existing ones as exclusions; otherwise the full batch is
+    regenerated.
+
+    Args:
+        provider: LLM provider for generation calls.
+        config: Pipeline configuration with model and temperature.
+        top_up: Ask only for the missing sub-focos on retry (default True).
+        deduplicator: Optional near-duplicate filter; paraphrased sub-focos
+            are dropped (and topped up) before any question is generated.
+        catalog: Optional MetricsStore holding the sub-foco catalogue. A foco
+            with enough catalogued sub-focos (manual ones first, then ones
+            generated with the same prompt version) is not sent to the LLM;
+            generated batches are saved to it.
+
+    Raises:
+        ConfigurationError: If ``prompts/subfoco_generator.md`` does not use exactly the
+            placeholders the agent fills.
+
+    Example:
+        generator = SubFocoGenerator(provider, config)
+        sub_focos = await generator.generate_batch(foco_input, count=50)
+        # Returns list[SubFocoInput] with 50 unique sub-focos
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        config: PipelineConfig,
+        top_up: bool = True,
+        deduplicator: SubFocoDeduplicator | None = None,
+        catalog: MetricsStore | None = None,
+    ) -> None:
+        self._provider = provider
+        self._config = config
+        self._top_up = top_up
+        self._deduplicator = deduplicator
+        self._catalog = catalog
+        self._prompt_template = compile_prompt(
+            "subfoco_generator", placeholders=_PROMPT_PLACEHOLDERS
+        )
+        self._calls = 0
+        self._catalog_hits = 0
+        self._tokens_used = 0
+        self._cost = 0.0
+
+    async def generate_batch(
+        self,
+        foco_input: FocoInput,
+        count: int = _DEFAULT_COUNT,
+    ) -> list[SubFocoInput]:
+        """Generate ``count`` unique sub-focos for a foco.
+
+        Args:
+            foco_input: Input with tema, foco, periodo.
+            count: Number of sub-focos to generate (default 50).
+
+        Returns:
+            List of SubFocoInput preserving tema, foco and periodo.
+
+        Raises:
+            ValueError: If count is not positive.
+            OutputParsingError: If generation fails or fewer than ``count``
+                valid sub-focos are returned after all retries.
+        """
+        if count <= 0:
+            msg = f"count must be positive, got {count}"
+            raise ValueError(msg)
+
+        if self._catalog is not None:
+            for version in (MANUAL_PROMPT_VERSION, self.prompt_version):
+                catalogued = self._catalog.get_sub_focos(foco_input, version)
+                if len(catalogued) >= count:
+                    self._catalog_hits += 1
+                    logger.info(
+                        f"Reusing {count} catalogued sub-focos | foco={foco_input.foco} "
+                        f"| prompt_version={version}"
+                    )
+                    if self._deduplicator is not None:
+                        self._deduplicator.commit(
+                            foco_input, [item.sub_foco for item in catalogued[:count]]
+                        )
+                    return catalogued[:count]
+
+        max_attempts = _MAX_RETRIES + 1
+        sub_focos: list[str] = []
+
+        for attempt in range(1, max_attempts + 1):
+            if self._top_up and sub_focos:
+                prompt = self._top_up_prompt(foco_input, count - len(sub_focos), sub_focos)
+            else:
+                prompt = self._format_prompt(foco_input, count)
+
+            start = time.monotonic()
+            try:
+                response = await self._provider.generate(
+                    prompt=prompt,
+                    model=self._config.default_model,
+                    temperature=self._config.temperature,
+                    response_model=SubFocoBatchResponse,
+                )
+            except Exception as e:
+                msg = f"Failed to generate sub-focos from LLM | attempt={attempt}"
+                raise OutputParsingError(
+                    msg,
+                    foco=foco_input.foco,
+                    modelo=self._config.default_model,
+                ) from e
+
+            latency = time.monotonic() - start
+            self._calls += 1
+            self._tokens_used += response["tokens_used"]
+            self._cost += response["cost"]
+            batch: SubFocoBatchResponse = response["content"]
+            if self._top_up:
+                # Keep what is already valid; new duplicates are dropped by _clean
+                sub_focos = self._clean([*sub_focos, *batch.sub_focos])
+            else:
+                sub_focos = self._clean(batch.sub_focos)
+            if self._deduplicator is not None:
+                sub_focos = self._deduplicator.filter(foco_input, sub_focos)
+
+            if len(sub_focos) >= count:
+                logger.info(
+                    "SubFoco generation complete | foco=%s | count=%d | attempt=%d | "
+                    "modelo=%s | tokens=%d | cost=%.4f | latency=%.2fs",
+                    foco_input.foco,
+                    count,
+                    attempt,
+                    self._config.default_model,
+                    response["tokens_used"],
+                    response["cost"],
+                    latency,
+                )
+                if self._deduplicator is not None:
+                    self._deduplicator.commit(foco_input, sub_focos[:count])
+                inputs = self._to_inputs(foco_input, sub_focos[:count])
+                if self._catalog is not None:
+                    self._catalog.save_sub_focos(self.prompt_version, inputs)
+                return inputs
+
+            logger.warning(
+                "Insufficient sub-focos | foco=%s | expected=%d | got=%d | attempt=%d/%d",
+                foco_input.foco,
+                count,
+                len(sub_focos),
+                attempt,
+                max_attempts,
+            )
+
+        msg = (
+            f"Could not generate {count} sub-focos after {max_attempts} attempts "
+            f"(only {len(sub_focos)} valid)"
+        )
+        raise OutputParsingError(
+            msg,
+            foco=foco_input.foco,
+            modelo=self._config.default_model,
+        )
+
+    @property
+    def prompt_version(self) -> str:
+        """Short hash of the prompt template, keying the sub-foco catalogue."""
+        return hashlib.sha256(self._prompt_template.text.encode("utf-8")).hexdigest()[:12]
+
+    def get_statistics(self) -> dict[str, int | float]:
+        """Get LLM usage of every batch generated so far.
+
+        Returns:
+            Dict with calls, tokens_used, cost and catalog_hits (focos served
+            from the catalogue without an LLM call)
+        """
+        return {
+            "calls": self._calls,
+            "tokens_used": self._tokens_used,
+            "cost": round(self._cost, 6),
+            "catalog_hits": self._catalog_hits,
+        }
+
+    def _format_prompt(self, foco_input: FocoInput, count: int) -> str:
+        """Format the generation prompt asking for ``count`` sub-focos."""
+        return self._prompt_template.render(
+            tema=foco_input.tema,
+            foco=foco_input.foco,
+            periodo=foco_input.periodo,
+            count=count,
+        )
+
+    def _top_up_prompt(self, foco_input: FocoInput, missing: int, existing: list[str]) -> str:
+        """Format a prompt asking only for ``missing`` sub-focos not in ``existing``."""
+        return self._format_prompt(foco_input, missing) + _TOP_UP_INSTRUCTIONS.format(
+            existing="\n".join(f"- {sub_foco}" for sub_foco in existing),
+            missing=missing,
+        )
+
+    @staticmethod
+    def _clean(raw: list[str]) -> list[str]:
+        """Strip, drop empty strings and remove duplicates preserving order."""
+        seen: set[str] = set()
+        cleaned: list[str] = []
+        for item in raw:
+            value = item.strip()
+            if not value or value in seen:
+                continue
+            seen.add(value)
+            cleaned.append(value)
+        return cleaned
+
+    @staticmethod
+    def _to_inputs(foco_input: FocoInput, sub_focos: list[str]) -> list[SubFocoInput]:
+        """Map sub-foco strings to SubFocoInput preserving the original foco data."""
+        return [
+            SubFocoInput(
+                tema=foco_input.tema,
+                foco=foco_input.foco,
+                periodo=foco_input.periodo,
+                sub_foco=sub_foco,
+            )
+            for sub_foco in sub_focos
+        ]
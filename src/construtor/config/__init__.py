@@ -1,7 +1,9 @@
 """Configuration module for Construtor de Questões pipeline."""
 
 from construtor.config.exceptions import (
+    CircuitOpenError,
     ConfigurationError,
+    DuplicateQuestionError,
     InputValidationError,
     LLMProviderError,
     LLMRateLimitError,
@@ -10,11 +12,13 @@ from construtor.config.exceptions import (
     PineconeError,
     PipelineError,
 )
-from construtor.config.prompt_loader import load_prompt
+from construtor.config.prompt_loader import PromptTemplate, compile_prompt, load_prompt
 from construtor.config.settings import PipelineConfig, get_settings
 
 __all__ = [
+    "CircuitOpenError",
     "ConfigurationError",
+    "DuplicateQuestionError",
     "InputValidationError",
     "LLMProviderError",
     "LLMRateLimitError",
@@ -23,6 +27,8 @@ __all__ = [
     "PineconeError",
     "PipelineConfig",
     "PipelineError",
+    "PromptTemplate",
+    "compile_prompt",
     "get_settings",
     "load_prompt",
 ]
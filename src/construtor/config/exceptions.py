@@ -11,7 +11,8 @@ Exception Hierarchy:
     └── PipelineError (base for all pipeline errors)
         ├── LLMProviderError (general LLM API errors)
         │   ├── LLMRateLimitError (rate limit exceeded - retryable with backoff)
-        │   └── LLMTimeoutError (request timeout - retryable with fallback)
+        │   ├── LLMTimeoutError (request timeout - retryable with fallback)
+        │   └── CircuitOpenError (provider circuit open - fail over or pause)
         ├── OutputParsingError (JSON/Pydantic parsing failed - retryable)
         ├── InputValidationError (input validation failed - non-retryable)
         ├── PineconeError (RAG query failed - fallback to no-RAG)
@@ -152,27 +153,41 @@ class LLMRateLimitError(LLMProviderError):
     """Rate limit exceeded error - retryable with exponential backoff.
 
     Raised when the LLM provider returns a rate limit error (HTTP 429).
-    These errors should be retried with exponential backoff + jitter:
-    2s → 4s → 8s → 16s
+    These errors should be retried after the server's retry hint, or with
+    exponential backoff + jitter when there is none: 2s → 4s → 8s
 
     Context should include:
         - modelo: Model ID that hit rate limit
         - question_id: Question being processed
         - foco: Foco being processed
+        - retry_after: Seconds the server asked to wait (if it said)
 
     Retry Strategy:
-        1. Wait with exponential backoff (2^retry_count seconds)
+        1. Open a cool-down window for the model (retry_after, or
+           exponential backoff) shared by every coroutine calling it
         2. Add random jitter (0-1s) to prevent thundering herd
-        3. Max 5 retries before marking as failed
+        3. Max 3 attempts before marking as failed
 
     Example:
         >>> raise LLMRateLimitError(
         ...     "Rate limit exceeded",
         ...     modelo="gpt-4o",
-        ...     rodada=2
+        ...     rodada=2,
+        ...     retry_after=1.5
         ... )
     """
 
+    def __init__(
+        self,
+        message: str,
+        *,
+        retry_after: float | None = None,
+        **context: int | str | None,
+    ) -> None:
+        """Initialize with the optional server retry hint in seconds."""
+        super().__init__(message, **context)  # type: ignore[arg-type]
+        self.retry_after = retry_after
+
 
 class LLMTimeoutError(LLMProviderError):
     """Request timeout error - retryable with fallback.
@@ -199,6 +214,28 @@ class LLMTimeoutError(LLMProviderError):
     """
 
 
+class CircuitOpenError(LLMProviderError):
+    """Call shed by an open circuit breaker - fail over or pause.
+
+    Raised without calling the API when the circuit breaker of a
+    provider/model is open, i.e. the model failed repeatedly and is being
+    given time to recover. Fails fast instead of waiting on timeouts.
+
+    Context should include:
+        - modelo: Model whose circuit is open
+
+    Handling:
+        1. Fail over to an alternative model or provider (FailoverProvider)
+        2. If every alternative is open, pause the batch and retry later
+
+    Example:
+        >>> raise CircuitOpenError(
+        ...     "Circuit open for gpt-4o, retry in 25s",
+        ...     modelo="gpt-4o"
+        ... )
+    """
+
+
 class OutputParsingError(PipelineError):
     """JSON or Pydantic parsing failed - retryable with prompt modification.
 
@@ -230,6 +267,38 @@ class OutputParsingError(PipelineError):
     """
 
 
+class DuplicateQuestionError(OutputParsingError):
+    """Generated question duplicates an indexed question - retryable.
+
+    Raised when a CriadorOutput is a near-duplicate (by the question index's
+    MinHash estimate) of a question saved by this or an earlier run, after
+    the regeneration attempts also came back as duplicates.
+
+    Context should include:
+        - foco: Foco being processed
+        - modelo: Model that generated the question
+        - duplicate_of: ID of the existing question
+
+    Example:
+        >>> raise DuplicateQuestionError(
+        ...     "Question duplicates question 42 (similarity 0.91)",
+        ...     foco="Cardiologia",
+        ...     duplicate_of=42
+        ... )
+    """
+
+    def __init__(
+        self,
+        message: str,
+        *,
+        duplicate_of: int | None = None,
+        **context: int | str | None,
+    ) -> None:
+        """Initialize with the ID of the question this one duplicates."""
+        super().__init__(message, **context)  # type: ignore[arg-type]
+        self.duplicate_of = duplicate_of
+
+
 class InputValidationError(PipelineError):
     """Input validation failed - non-retryable, requires user intervention.
 
@@ -309,7 +378,9 @@ class ConfigurationError(PipelineError):
 
 
 __all__ = [
+    "CircuitOpenError",
     "ConfigurationError",
+    "DuplicateQuestionError",
     "InputValidationError",
     "LLMProviderError",
     "LLMRateLimitError",
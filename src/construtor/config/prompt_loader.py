@@ -0,0 +1,295 @@
+"""Prompt loading and compiled prompt templates.
+
+Prompts live as Markdown files in ``prompts/`` (FR37: editable without code
+changes). ``load_prompt`` returns a file's raw text. ``compile_prompt``
+parses it once into alternating static text and placeholders, checks the
+placeholders against the ones the agent fills, and returns a PromptTemplate
+whose rendering is a single join. A compiled template reloads itself when
+its file changes, so prompt edits apply without restarting the pipeline.
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from pathlib import Path
+from string import Formatter
+
+from construtor.config.exceptions import ConfigurationError
+
+logger = logging.getLogger(__name__)
+
+PROMPTS_DIR = Path(__file__).resolve().parents[3] / "prompts"
+
+_RELOAD_CHECK_SECONDS = 1.0
+
+
+def load_prompt(name: str) -> str:
+    """Read the raw text of a prompt file.
+
+    Args:
+        name: Prompt name (file ``prompts/<name>.md``)
+
+    Returns:
+        The prompt text
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+    """
+    return (PROMPTS_DIR / f"{name}.md").read_text(encoding="utf-8")
+
+
+class RenderedPrompt(str):
+    """A rendered prompt that remembers the template and values it came from.
+
+    Behaves exactly like ``str`` (string operations such as appending
+    instructions return a plain ``str``). TokenEstimator counts it from the
+    template's cached static segments plus the values instead of
+    re-tokenizing the whole text.
+
+    Attributes:
+        template: Template the prompt was rendered from
+        source: Template text at render time (a hot reload may change it later)
+        values: Values the placeholders were filled with
+    """
+
+    template: "PromptTemplate"
+    source: str
+    values: dict[str, object]
+
+
+class PromptTemplate:
+    """A prompt compiled into static segments and placeholders.
+
+    Supports the ``str.format`` placeholder syntax of the prompt files
+    (``{name}``, ``{name!r}``, ``{name:spec}``, ``{{``/``}}`` escapes);
+    positional and attribute/index placeholders are rejected.
+
+    Args:
+        text: Template text
+        name: Name used in errors and logs
+        placeholders: Placeholders the template must use, exactly (None =
+            any named placeholders)
+
+    Raises:
+        ConfigurationError: If the template is malformed or its placeholders
+            differ from ``placeholders``
+
+    Example:
+        >>> template = PromptTemplate("Gere {count} sub-focos de {foco}")
+        >>> template.render(count=50, foco="Insuficiência Cardíaca")
+        'Gere 50 sub-focos de Insuficiência Cardíaca'
+    """
+
+    def __init__(
+        self,
+        text: str,
+        name: str = "<string>",
+        placeholders: set[str] | frozenset[str] | None = None,
+    ) -> None:
+        self.name = name
+        self._required = frozenset(placeholders) if placeholders is not None else None
+        self._compile(text)
+
+    @property
+    def text(self) -> str:
+        """The template source text."""
+        return self._text
+
+    @property
+    def segments(self) -> tuple[str, ...]:
+        """Static text between the placeholders (one more than the placeholders)."""
+        return tuple(self._literals)
+
+    @property
+    def fields(self) -> tuple[str, ...]:
+        """Placeholder names in order of appearance (repeats included)."""
+        return tuple(field for field, _, _ in self._fields)
+
+    @property
+    def placeholders(self) -> frozenset[str]:
+        """Names of the placeholders used by the template."""
+        return self._placeholders
+
+    def render(self, **values: object) -> RenderedPrompt:
+        """Fill the placeholders (extra values are ignored, like ``str.format``).
+
+        Args:
+            **values: Value of every placeholder
+
+        Returns:
+            The rendered prompt (a ``str``)
+
+        Raises:
+            KeyError: If a placeholder has no value
+        """
+        parts = [self._literals[0]]
+        for (field, conversion, spec), literal in zip(
+            self._fields, self._literals[1:], strict=True
+        ):
+            value = values[field]
+            if conversion == "r":
+                value = repr(value)
+            elif conversion == "s":
+                value = str(value)
+            elif conversion == "a":
+                value = ascii(value)
+            parts.append(value if type(value) is str and not spec else format(value, spec))
+            parts.append(literal)
+        rendered = RenderedPrompt("".join(parts))
+        rendered.template = self
+        rendered.source = self._text
+        rendered.values = values
+        return rendered
+
+    # Drop-in for the raw ``str`` templates the agents used to hold
+    format = render
+
+    def __str__(self) -> str:
+        return self._text
+
+    def _compile(self, text: str) -> None:
+        """Split ``text`` into literals and fields and validate the fields."""
+        literals = [""]
+        fields: list[tuple[str, str | None, str]] = []
+        try:
+            for literal, field, spec, conversion in Formatter().parse(text):
+                literals[-1] += literal
+                if field is None:
+                    continue
+                if not field.isidentifier():
+                    msg = (
+                        f"Prompt '{self.name}' has an unsupported placeholder {{{field}}} "
+                        f"(only named placeholders are allowed)"
+                    )
+                    raise ConfigurationError(msg)
+                if spec and "{" in spec:
+                    msg = f"Prompt '{self.name}' has a nested placeholder in {{{field}:{spec}}}"
+                    raise ConfigurationError(msg)
+                fields.append((field, conversion, spec or ""))
+                literals.append("")
+        except ValueError as e:
+            msg = f"Prompt '{self.name}' is not a valid template: {e}"
+            raise ConfigurationError(msg) from e
+
+        used = frozenset(field for field, _, _ in fields)
+        if self._required is not None and used != self._required:
+            missing = sorted(self._required - used)
+            unexpected = sorted(used - self._required)
+            msg = (
+                f"Prompt '{self.name}' placeholders do not match: "
+                f"missing={missing} unexpected={unexpected}"
+            )
+            raise ConfigurationError(msg)
+
+        self._text = text
+        self._literals = literals
+        self._fields = fields
+        self._placeholders = used
+
+
+class FilePromptTemplate(PromptTemplate):
+    """PromptTemplate of a prompt file that recompiles when the file changes.
+
+    The file's modification time is checked at most once per
+    ``check_interval`` seconds, at render time. A reloaded file that does
+    not compile is rejected with an error log and the previous version
+    stays in use.
+
+    Args:
+        name: Prompt name (file ``prompts/<name>.md``)
+        placeholders: Placeholders the template must use, exactly
+        loader: Function reading a prompt's text by name (default
+            ``load_prompt``)
+        auto_reload: Recompile when the file changes
+        check_interval: Minimum seconds between modification time checks
+        clock: Monotonic clock
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+        ConfigurationError: If the prompt does not compile
+    """
+
+    def __init__(
+        self,
+        name: str,
+        placeholders: set[str] | frozenset[str] | None = None,
+        loader: Callable[[str], str] | None = None,
+        auto_reload: bool = True,
+        check_interval: float = _RELOAD_CHECK_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._path = PROMPTS_DIR / f"{name}.md"
+        self._loader = loader or load_prompt
+        self._auto_reload = auto_reload
+        self._check_interval = check_interval
+        self._clock = clock
+        self._mtime = self._modified_at()
+        self._checked_at = clock()
+        super().__init__(self._loader(name), name=name, placeholders=placeholders)
+
+    def render(self, **values: object) -> RenderedPrompt:
+        """Reload the file if it changed, then fill the placeholders."""
+        if self._auto_reload:
+            self.reload_if_changed()
+        return super().render(**values)
+
+    format = render
+
+    def reload_if_changed(self) -> bool:
+        """Recompile the template if its file changed since it was loaded.
+
+        Returns:
+            True if a new version was loaded
+        """
+        now = self._clock()
+        if now - self._checked_at < self._check_interval:
+            return False
+        self._checked_at = now
+
+        mtime = self._modified_at()
+        if mtime == self._mtime:
+            return False
+        self._mtime = mtime
+
+        previous = (self._text, self._literals, self._fields, self._placeholders)
+        try:
+            self._compile(self._loader(self.name))
+        except (OSError, ConfigurationError):
+            self._text, self._literals, self._fields, self._placeholders = previous
+            logger.exception(f"Prompt '{self.name}' changed but could not be reloaded")
+            return False
+        logger.info(f"Prompt '{self.name}' reloaded from {self._path}")
+        return True
+
+    def _modified_at(self) -> int | None:
+        try:
+            return self._path.stat().st_mtime_ns
+        except OSError:
+            return None
+
+
+def compile_prompt(
+    name: str,
+    placeholders: set[str] | frozenset[str] | None = None,
+    auto_reload: bool = True,
+) -> FilePromptTemplate:
+    """Load and compile a prompt file, validating its placeholders.
+
+    Args:
+        name: Prompt name (file ``prompts/<name>.md``)
+        placeholders: Placeholders the prompt must use, exactly
+        auto_reload: Recompile the prompt when its file changes
+
+    Returns:
+        The compiled, self-reloading template
+
+    Raises:
+        FileNotFoundError: If the prompt file does not exist
+        ConfigurationError: If the prompt is malformed or its placeholders
+            differ from ``placeholders``
+
+    Example:
+        >>> template = compile_prompt("criador", placeholders={"tema", "foco", ...})
+        >>> prompt = template.render(tema="Cardiologia", foco="IC", ...)
+    """
+    return FilePromptTemplate(name, placeholders=placeholders, auto_reload=auto_reload)
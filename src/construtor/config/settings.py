@@ -0,0 +1,30 @@
+"""Pipeline settings (local scaffold)."""
+
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class PipelineConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
+
+    openai_api_key: str
+    anthropic_api_key: str
+    pinecone_api_key: str
+    pinecone_index_host: str
+    pinecone_top_k: int = 5
+    pinecone_timeout: float = 5.0
+    default_model: str = "gpt-4o"
+    temperature: float = 0.7
+    max_retries: int = 3
+    batch_size: int = 50
+    checkpoint_interval: int = 10
+    concurrency_limit: int = 5
+
+
+_settings: PipelineConfig | None = None
+
+
+def get_settings() -> PipelineConfig:
+    global _settings  # noqa: PLW0603
+    if _settings is None:
+        _settings = PipelineConfig()
+    return _settings
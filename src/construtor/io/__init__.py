@@ -1,7 +1,34 @@
-"""IO module for reading/writing Excel files and Pinecone RAG queries."""
+"""IO module for reading input files, writing Excel files and Pinecone RAG queries."""
 
+from construtor.io.csv_reader import CsvReader
 from construtor.io.excel_reader import ExcelReader
 from construtor.io.excel_writer import ExcelWriter
-from construtor.io.pinecone_client import PineconeClient
+from construtor.io.foco_index import DuplicateFoco, FocoIndex
+from construtor.io.input_formats import get_input_reader
+from construtor.io.input_reader import InputReader, InputRowError
+from construtor.io.jsonl_reader import JsonlReader
+from construtor.io.local_index import LocalVectorIndex, export_local_index
+from construtor.io.parquet_reader import ParquetReader
+from construtor.io.pinecone_client import InMemoryVectorIndex, PineconeClient
+from construtor.io.rag_cache import RagCache
+from construtor.io.subfoco_catalog import export_sub_foco_catalog, import_sub_foco_catalog
 
-__all__ = ["ExcelReader", "ExcelWriter", "PineconeClient"]
+__all__ = [
+    "CsvReader",
+    "DuplicateFoco",
+    "ExcelReader",
+    "ExcelWriter",
+    "FocoIndex",
+    "InMemoryVectorIndex",
+    "InputReader",
+    "InputRowError",
+    "JsonlReader",
+    "LocalVectorIndex",
+    "ParquetReader",
+    "PineconeClient",
+    "RagCache",
+    "export_local_index",
+    "export_sub_foco_catalog",
+    "get_input_reader",
+    "import_sub_foco_catalog",
+]
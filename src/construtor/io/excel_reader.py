@@ -2,23 +2,34 @@
 
 This module provides ExcelReader for reading and validating input Excel files
 containing medical themes (temas), focus topics (focos), and academic periods.
+
+Validation, caching and streaming live in the shared InputReader core; this
+module only pulls rows out of the first worksheet. Rows are read with
+python-calamine when it is installed and with openpyxl's read-only streaming
+mode otherwise.
 """
 
 import logging
-from pathlib import Path
+from collections.abc import Iterator, Sequence
 from typing import ClassVar
 
-import pandas as pd
+from openpyxl import load_workbook
 from openpyxl.utils.exceptions import InvalidFileException
-from pydantic import ValidationError as PydanticValidationError
 
-from construtor.config.exceptions import InputValidationError, OutputParsingError
-from construtor.models.question import FocoInput
+from construtor.config.exceptions import OutputParsingError
+from construtor.io.input_reader import InputReader, InputRowError
+
+try:  # Optional fast engine (Rust calamine bindings)
+    from python_calamine import CalamineWorkbook
+except ImportError:  # pragma: no cover - depends on environment
+    CalamineWorkbook = None
 
 logger = logging.getLogger(__name__)
 
+__all__ = ["ExcelReader", "InputRowError"]
+
 
-class ExcelReader:
+class ExcelReader(InputReader):
     """Excel input file reader with validation.
 
     This class reads Excel files (.xlsx format) containing medical themes,
@@ -26,6 +37,10 @@ class ExcelReader:
     including column existence, periodo value validation, and missing data
     detection.
 
+    Args:
+        use_cache: Keep validated rows in a sidecar cache next to the input
+            file, keyed by file content hash and validation rules version.
+
     Example:
         >>> reader = ExcelReader()
         >>> focos = reader.read_input("data/input.xlsx")
@@ -33,224 +48,39 @@ class ExcelReader:
         Loaded 156 focos
     """
 
-    # Class constants
-    REQUIRED_COLUMNS: ClassVar[list[str]] = ["tema", "foco", "periodo"]
-    VALID_PERIODOS: ClassVar[list[str]] = ["1º ano", "2º ano", "3º ano", "4º ano"]
+    FORMAT_NAME: ClassVar[str] = "Excel"
+    SUPPORTED_EXTENSIONS: ClassVar[tuple[str, ...]] = (".xlsx", ".xlsm")
 
-    def read_input(self, file_path: str) -> list[FocoInput]:
-        """Read and validate Excel input file.
+    def _iter_raw_rows(self, file_path: str) -> Iterator[Sequence[object]]:
+        """Yield raw cell values of the first worksheet, header row first.
 
-        This method reads an Excel file, validates its structure and content,
-        and returns a list of validated FocoInput objects.
+        Uses the Rust-backed calamine reader when ``python-calamine`` is
+        installed, otherwise openpyxl in read-only streaming mode.
 
         Args:
-            file_path: Path to Excel file (.xlsx format)
+            file_path: Path to Excel file
 
-        Returns:
-            List of validated FocoInput objects
+        Yields:
+            One sequence of cell values per worksheet row
 
         Raises:
-            FileNotFoundError: If file doesn't exist or is not a file
-            InputValidationError: If columns missing, periodo invalid, or data missing
-            OutputParsingError: If Excel format is invalid or cannot be read
-
-        Example:
-            >>> reader = ExcelReader()
-            >>> focos = reader.read_input("data/input.xlsx")
-            >>> print(focos[0].tema)
-            'Cardiologia'
+            OutputParsingError: If the file is not a valid Excel workbook
         """
-        logger.info(f"Loading Excel from {file_path}")
-
-        # Validate file exists
-        self._validate_file_exists(file_path)
+        if CalamineWorkbook is not None:
+            workbook = CalamineWorkbook.from_path(file_path)
+            try:
+                sheet = workbook.get_sheet_by_index(0)
+                yield from sheet.to_python(skip_empty_area=False)
+            finally:
+                workbook.close()
+            return
 
-        # Read Excel file
         try:
-            df = pd.read_excel(
-                file_path,
-                engine="openpyxl",
-                dtype=str,  # Read all as strings to prevent auto-conversion
-                na_filter=True,  # Detect missing values
-                keep_default_na=True,  # Use default NaN markers
-            )
-        except FileNotFoundError:
-            logger.exception(f"File not found: {file_path}")
-            raise
+            workbook = load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
         except InvalidFileException as e:
             logger.exception(f"Invalid Excel format: {file_path}")
             raise OutputParsingError(f"Invalid Excel format: {file_path}") from e
-        except Exception as e:
-            logger.exception(f"Failed to read Excel {file_path}")
-            raise OutputParsingError(f"Failed to read Excel: {e}") from e
-
-        # Validate and clean data
-        self._validate_columns(df, file_path)
-        df = self._normalize_data(df)
-        # Performance: keep only required columns after normalization
-        df = df[self.REQUIRED_COLUMNS]
-        self._validate_periodo_values(df, file_path)
-        self._validate_no_missing_data(df, file_path)
-
-        # Convert to Pydantic models
-        focos = self._dataframe_to_focos(df, file_path)
-
-        logger.info(f"Successfully loaded {len(focos)} focos from {file_path}")
-        return focos
-
-    def _validate_file_exists(self, file_path: str) -> None:
-        """Validate file exists and is readable.
-
-        Args:
-            file_path: Path to validate
-
-        Raises:
-            FileNotFoundError: If file doesn't exist or is not a file
-            InputValidationError: If file extension is not .xlsx or .xlsm
-        """
-        path = Path(file_path)
-
-        if not path.exists():
-            raise FileNotFoundError(f"Excel file not found: {file_path}")
-
-        if not path.is_file():
-            raise FileNotFoundError(f"Path is not a file: {file_path}")
-
-        # Validate file extension
-        if path.suffix.lower() not in [".xlsx", ".xlsm"]:
-            raise InputValidationError(
-                f"Invalid file format: {path.suffix}. "
-                f"Expected Excel file with .xlsx or .xlsm extension."
-            )
-
-    def _validate_columns(self, df: pd.DataFrame, file_path: str) -> None:
-        """Validate required columns exist.
-
-        Performs case-insensitive column matching and handles extra whitespace.
-
-        Args:
-            df: DataFrame to validate
-            file_path: Path to Excel file (for error messages)
-
-        Raises:
-            InputValidationError: If required columns are missing
-        """
-        # Normalize column names: lowercase and strip whitespace
-        actual_columns = {col.strip().lower() for col in df.columns}
-        required_columns = {col.lower() for col in self.REQUIRED_COLUMNS}
-
-        missing_columns = required_columns - actual_columns
-
-        if missing_columns:
-            logger.error(
-                f"Missing columns {missing_columns} in {file_path}. "
-                f"Expected: {self.REQUIRED_COLUMNS}. Found: {list(df.columns)}"
-            )
-            raise InputValidationError(
-                f"Missing required columns: {sorted(missing_columns)}. "
-                f"Expected: {self.REQUIRED_COLUMNS}. Found: {list(df.columns)}"
-            )
-
-    def _normalize_data(self, df: pd.DataFrame) -> pd.DataFrame:
-        """Normalize DataFrame column names and data.
-
-        Normalizes column names to lowercase and strips whitespace from all
-        string values. Also treats whitespace-only values as missing.
-
-        Args:
-            df: DataFrame to normalize
-
-        Returns:
-            Normalized DataFrame with clean column names and data
-        """
-        # Normalize column names: lowercase and strip
-        df.columns = df.columns.str.strip().str.lower()
-
-        # Strip whitespace from all string columns
-        for col in self.REQUIRED_COLUMNS:
-            if col in df.columns:
-                df[col] = df[col].str.strip()
-
-        # Replace whitespace-only values with NaN
-        df.replace(r"^\s*$", pd.NA, regex=True, inplace=True)
-
-        return df
-
-    def _validate_periodo_values(self, df: pd.DataFrame, file_path: str) -> None:
-        """Validate all periodo values are valid academic periods.
-
-        Args:
-            df: DataFrame to validate
-            file_path: Path to Excel file (for error messages)
-
-        Raises:
-            InputValidationError: If invalid periodo values are found
-        """
-        # Check all values against valid periodos
-        invalid_mask = ~df["periodo"].isin(self.VALID_PERIODOS)
-        invalid_rows = df[invalid_mask]
-
-        if not invalid_rows.empty:
-            # Collect row numbers (1-indexed for Excel, +2 for header)
-            errors = [(idx + 2, row["periodo"]) for idx, row in invalid_rows.iterrows()]
-
-            error_msg = (
-                f"Invalid periodo values found in {file_path}:\n"
-                + "\n".join(f"  Row {row_num}: '{value}'" for row_num, value in errors)
-                + f"\nValid values: {self.VALID_PERIODOS}"
-            )
-
-            logger.error(error_msg)
-            raise InputValidationError(error_msg)
-
-    def _validate_no_missing_data(self, df: pd.DataFrame, file_path: str) -> None:
-        """Validate no missing data in required columns.
-
-        Args:
-            df: DataFrame to validate
-            file_path: Path to Excel file (for error messages)
-
-        Raises:
-            InputValidationError: If missing data is found
-        """
-        for col in self.REQUIRED_COLUMNS:
-            missing_mask = df[col].isna()
-            if missing_mask.any():
-                # Get row numbers (1-indexed, +2 for header)
-                row_numbers = [idx + 2 for idx in df[missing_mask].index]
-
-                error_msg = f"Missing data in column '{col}' at rows {row_numbers} in {file_path}"
-
-                logger.error(error_msg)
-                raise InputValidationError(error_msg)
-
-    def _dataframe_to_focos(self, df: pd.DataFrame, file_path: str) -> list[FocoInput]:
-        """Convert validated DataFrame to list of FocoInput models.
-
-        Args:
-            df: Validated DataFrame with clean data
-            file_path: Path to Excel file (for error messages)
-
-        Returns:
-            List of FocoInput objects
-
-        Raises:
-            InputValidationError: If Pydantic validation fails for any row
-        """
-        focos: list[FocoInput] = []
-
-        for idx, row in df.iterrows():
-            try:
-                foco = FocoInput(
-                    tema=row["tema"],
-                    foco=row["foco"],
-                    periodo=row["periodo"],
-                )
-                focos.append(foco)
-            except PydanticValidationError as e:
-                row_num = idx + 2  # Excel row number (header + 0-index)
-                error_msg = f"Validation failed at row {row_num} in {file_path}: {e}"
-                logger.exception(error_msg)
-                raise InputValidationError(error_msg) from e
-
-        return focos
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
@@ -0,0 +1,144 @@
+"""Duplicate foco detection for input files.
+
+This module provides FocoIndex, a hash index over normalized (tema, foco,
+periodo) keys used by the input readers to catch repeated rows before they
+reach the pipeline. Every repeated row would otherwise trigger its own
+sub-foco generation and ~50 Criador calls.
+
+Keys fold accents, case and whitespace, so ``"Insuficiência  Cardíaca"``
+and ``"insuficiencia cardiaca"`` are the same foco. Symbols are kept:
+``"HER2+"`` and ``"HER2-"`` are clinically different focos. The periodo is
+part of the key: the same foco for a different year is a different set of
+questions.
+"""
+
+import hashlib
+import re
+import unicodedata
+from functools import lru_cache
+
+from pydantic import BaseModel, ConfigDict
+
+from construtor.models.question import FocoInput
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def _strip_accents(value: str) -> str:
+    decomposed = unicodedata.normalize("NFKD", value)
+    return "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+
+
+@lru_cache(maxsize=4096)  # temas repeat on almost every row
+def normalize_key(value: str) -> str:
+    """Fold a tema/foco value to its duplicate-detection form.
+
+    Args:
+        value: Raw tema or foco text
+
+    Returns:
+        Lowercase text without accents, with runs of whitespace collapsed to
+        single spaces; punctuation and symbols are kept
+
+    Example:
+        >>> normalize_key("  Câncer de mama   HER2+ ")
+        'cancer de mama her2+'
+    """
+    return " ".join(_strip_accents(value).casefold().split())
+
+
+@lru_cache(maxsize=4096)
+def normalize_text(value: str) -> str:
+    """Fold text to its word-tokenization form.
+
+    Used to split text into words for embeddings and shingles, not for
+    duplicate keys: it also drops punctuation and symbols.
+
+    Args:
+        value: Raw text
+
+    Returns:
+        Lowercase text without accents, with punctuation and runs of
+        whitespace collapsed to single spaces
+
+    Example:
+        >>> normalize_text("  Insuficiência   Cardíaca. ")
+        'insuficiencia cardiaca'
+    """
+    return _NON_WORD.sub(" ", _strip_accents(value).casefold()).strip()
+
+
+class DuplicateFoco(BaseModel):
+    """A row whose tema/foco/periodo repeats an earlier row.
+
+    Attributes:
+        row: Row number of the repeated row
+        first_row: Row number of the first occurrence (the one that is kept)
+        exact: True if the values are identical, False if they only match
+            after normalization
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    row: int
+    first_row: int
+    tema: str
+    foco: str
+    periodo: str
+    exact: bool
+
+
+class FocoIndex:
+    """Hash index of the focos seen so far in one input file.
+
+    Keys are 16-byte BLAKE2b digests of the normalized values. Each key keeps
+    the row and FocoInput of its first occurrence, to report it and to tell
+    exact repeats from normalized ones.
+
+    Example:
+        >>> index = FocoIndex()
+        >>> index.check(foco_a, row=2) is None
+        True
+        >>> index.check(foco_a_with_typos_in_case, row=3).first_row
+        2
+    """
+
+    def __init__(self) -> None:
+        self._first_rows: dict[bytes, tuple[int, FocoInput]] = {}
+
+    def __len__(self) -> int:
+        return len(self._first_rows)
+
+    @staticmethod
+    def key(foco: FocoInput) -> bytes:
+        """Return the duplicate-detection key of a foco."""
+        normalized = "\x1f".join((normalize_key(foco.tema), normalize_key(foco.foco), foco.periodo))
+        return hashlib.blake2b(normalized.encode("utf-8"), digest_size=16).digest()
+
+    def check(self, foco: FocoInput, row: int) -> DuplicateFoco | None:
+        """Register a foco, returning the duplicate record if it was seen before.
+
+        Args:
+            foco: Validated foco read from the input file
+            row: Row number of the foco in the input file
+
+        Returns:
+            DuplicateFoco pointing at the first occurrence, or None if this is
+            the first time the normalized key is seen
+        """
+        key = self.key(foco)
+        first = self._first_rows.get(key)
+        if first is None:
+            self._first_rows[key] = (row, foco)
+            return None
+
+        first_row, original = first
+        return DuplicateFoco(
+            row=row,
+            first_row=first_row,
+            tema=foco.tema,
+            foco=foco.foco,
+            periodo=foco.periodo,
+            exact=(foco.tema, foco.foco) == (original.tema, original.foco),
+        )
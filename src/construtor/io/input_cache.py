@@ -0,0 +1,192 @@
+"""Sidecar cache of validated input rows.
+
+This module provides InputCache, which stores the validated FocoInput rows of
+an input file next to it in a compact binary format. Entries are keyed by the
+SHA-256 of the file content and by a fingerprint of the validation rules, so a
+restart with an unchanged workbook skips parsing and validation entirely, while
+any edit to the workbook (or to the rules) invalidates the entry automatically.
+
+File layout (little-endian):
+    magic ``FOCO`` | format version (u8) | content sha256 (32 bytes)
+    | rules fingerprint (32 bytes) | zlib-compressed body
+
+Body:
+    string count (u32) | row count (u32)
+    | NUL-separated UTF-8 string table (tema/foco values, deduplicated)
+    | tema indexes (u32 * rows) | foco indexes (u32 * rows) | periodo indexes (u8 * rows)
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import sys
+import zlib
+from array import array
+from pathlib import Path
+
+from construtor.models.question import FocoInput
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"FOCO"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sB32s32s")
+_COUNTS = struct.Struct("<II")
+
+
+class InputCache:
+    """Sidecar cache of validated FocoInput rows for one input file.
+
+    The cache lives at ``.<file name>.focos.cache`` in the same directory as the
+    input file. Reads never raise: a missing, stale or corrupted cache is a
+    miss. Writes are atomic (temp file + rename) and failures are logged but
+    never interrupt the pipeline.
+
+    Args:
+        file_path: Path to the input file being cached
+        rules_fingerprint: 32-byte digest of the validation rules in effect
+        periodos: Valid periodo values (stored as 1-byte indexes)
+
+    Example:
+        >>> cache = InputCache("data/input.xlsx", reader.rules_fingerprint(), periodos)
+        >>> focos = cache.load()
+        >>> if focos is None:
+        ...     focos = parse_and_validate("data/input.xlsx")
+        ...     cache.save(focos)
+    """
+
+    def __init__(self, file_path: str, rules_fingerprint: bytes, periodos: list[str]) -> None:
+        self.file_path = Path(file_path)
+        self.cache_path = self.file_path.with_name(f".{self.file_path.name}.focos.cache")
+        self._rules_fingerprint = rules_fingerprint
+        self._periodos = list(periodos)
+        self._content_hash: bytes | None = None
+
+    def content_hash(self) -> bytes:
+        """Return the SHA-256 digest of the input file content (computed once)."""
+        if self._content_hash is None:
+            with self.file_path.open("rb") as f:
+                self._content_hash = hashlib.file_digest(f, "sha256").digest()
+        return self._content_hash
+
+    def load(self) -> list[FocoInput] | None:
+        """Load cached rows if the cache matches the current file and rules.
+
+        Returns:
+            Cached FocoInput list, or None on any miss (absent, stale, corrupted)
+        """
+        try:
+            data = self.cache_path.read_bytes()
+        except OSError:
+            return None
+
+        try:
+            magic, version, content_hash, rules = _HEADER.unpack_from(data)
+            if magic != _MAGIC or version != _FORMAT_VERSION:
+                logger.info(f"Ignoring input cache with unknown format: {self.cache_path}")
+                return None
+            if rules != self._rules_fingerprint:
+                logger.info(f"Input cache invalidated (rules changed): {self.cache_path}")
+                return None
+            if content_hash != self.content_hash():
+                logger.info(f"Input cache invalidated (file changed): {self.cache_path}")
+                return None
+            focos = self._decode(zlib.decompress(data[_HEADER.size :]))
+        except (struct.error, zlib.error, ValueError, IndexError, UnicodeDecodeError):
+            logger.warning(f"Ignoring corrupted input cache: {self.cache_path}", exc_info=True)
+            return None
+
+        logger.info(f"Loaded {len(focos)} focos from input cache {self.cache_path}")
+        return focos
+
+    def save(self, focos: list[FocoInput]) -> None:
+        """Write the cache atomically. Failures are logged, never raised.
+
+        Args:
+            focos: Validated FocoInput rows read from the input file
+        """
+        temp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            header = _HEADER.pack(
+                _MAGIC, _FORMAT_VERSION, self.content_hash(), self._rules_fingerprint
+            )
+            temp_path.write_bytes(header + zlib.compress(self._encode(focos)))
+            os.replace(temp_path, self.cache_path)
+            logger.info(f"Saved {len(focos)} focos to input cache {self.cache_path}")
+        except OSError:
+            logger.warning(f"Could not write input cache {self.cache_path}", exc_info=True)
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    def _encode(self, focos: list[FocoInput]) -> bytes:
+        """Serialize rows as a deduplicated string table plus index arrays."""
+        strings: dict[str, int] = {}
+        temas = array("I", (strings.setdefault(f.tema, len(strings)) for f in focos))
+        foco_idx = array("I", (strings.setdefault(f.foco, len(strings)) for f in focos))
+        periodo_idx = {periodo: idx for idx, periodo in enumerate(self._periodos)}
+        periodos = bytes(periodo_idx[f.periodo] for f in focos)
+
+        table = "\0".join(strings).encode("utf-8")
+        return b"".join(
+            [
+                _COUNTS.pack(len(strings), len(focos)),
+                struct.pack("<I", len(table)),
+                table,
+                _to_le(temas),
+                _to_le(foco_idx),
+                periodos,
+            ]
+        )
+
+    def _decode(self, body: bytes) -> list[FocoInput]:
+        """Rebuild FocoInput rows from ``_encode`` output.
+
+        Rows were validated before being cached under the same rules
+        fingerprint, so they are rebuilt with ``model_construct`` (no
+        re-validation).
+        """
+        n_strings, n_rows = _COUNTS.unpack_from(body)
+        offset = _COUNTS.size
+        (table_len,) = struct.unpack_from("<I", body, offset)
+        offset += 4
+        table = body[offset : offset + table_len].decode("utf-8")
+        offset += table_len
+        strings = table.split("\0") if n_strings else []
+        if len(strings) != n_strings:
+            raise ValueError("string table size mismatch")
+
+        temas = _from_le(body[offset : offset + 4 * n_rows])
+        offset += 4 * n_rows
+        focos_idx = _from_le(body[offset : offset + 4 * n_rows])
+        offset += 4 * n_rows
+        periodos = body[offset : offset + n_rows]
+        if len(temas) != n_rows or len(focos_idx) != n_rows or len(periodos) != n_rows:
+            raise ValueError("row arrays size mismatch")
+
+        return [
+            FocoInput.model_construct(
+                tema=strings[tema], foco=strings[foco], periodo=self._periodos[periodo]
+            )
+            for tema, foco, periodo in zip(temas, focos_idx, periodos, strict=True)
+        ]
+
+
+def _to_le(arr: array) -> bytes:
+    """Return the bytes of a u32 array in little-endian order."""
+    if sys.byteorder == "big":  # pragma: no cover - big-endian hosts
+        arr = array(arr.typecode, arr)
+        arr.byteswap()
+    return arr.tobytes()
+
+
+def _from_le(data: bytes) -> array:
+    """Parse little-endian u32 bytes into an array."""
+    if len(data) % 4:
+        raise ValueError("truncated index array")
+    arr = array("I")
+    arr.frombytes(data)
+    if sys.byteorder == "big":  # pragma: no cover - big-endian hosts
+        arr.byteswap()
+    return arr
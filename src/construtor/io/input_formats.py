@@ -0,0 +1,57 @@
+"""Input format registry.
+
+This module maps input file extensions to their InputReader backend, so
+callers can load focos from any supported format without choosing the reader
+themselves.
+"""
+
+from pathlib import Path
+
+from construtor.config.exceptions import InputValidationError
+from construtor.io.csv_reader import CsvReader
+from construtor.io.excel_reader import ExcelReader
+from construtor.io.input_reader import DuplicatePolicy, InputReader
+from construtor.io.jsonl_reader import JsonlReader
+from construtor.io.parquet_reader import ParquetReader
+
+INPUT_READERS: tuple[type[InputReader], ...] = (
+    ExcelReader,
+    CsvReader,
+    ParquetReader,
+    JsonlReader,
+)
+
+
+def get_input_reader(
+    file_path: str,
+    use_cache: bool = False,
+    on_duplicate: DuplicatePolicy = "merge",
+) -> InputReader:
+    """Return a reader for ``file_path`` based on its extension.
+
+    Args:
+        file_path: Path to the input file
+        use_cache: Enable the sidecar input cache on the returned reader
+        on_duplicate: Duplicate foco policy of the returned reader
+
+    Returns:
+        InputReader backend for the file format
+
+    Raises:
+        InputValidationError: If the extension is not supported by any reader
+        ConfigurationError: If the format needs an optional dependency that is
+            not installed (Parquet without pyarrow)
+
+    Example:
+        >>> reader = get_input_reader("data/input.csv")
+        >>> focos = reader.read_input("data/input.csv")
+    """
+    suffix = Path(file_path).suffix.lower()
+    for reader_cls in INPUT_READERS:
+        if suffix in reader_cls.SUPPORTED_EXTENSIONS:
+            return reader_cls(use_cache=use_cache, on_duplicate=on_duplicate)
+
+    supported = [ext for reader_cls in INPUT_READERS for ext in reader_cls.SUPPORTED_EXTENSIONS]
+    raise InputValidationError(
+        f"Unsupported input format: {suffix or file_path}. Supported extensions: {supported}"
+    )
@@ -0,0 +1,805 @@
+"""Shared validation core for foco input files.
+
+This module provides InputReader, the base class of every input format reader
+(Excel, CSV, Parquet, JSONL). It owns required-column resolution,
+normalization, periodo and missing-data validation, bulk FocoInput
+construction, duplicate foco detection, the streaming ``iter_input`` API and
+the sidecar InputCache.
+Format backends only implement ``_iter_raw_rows``: how raw rows are pulled out
+of a file, header first.
+
+Only the three required columns are materialized, so large inputs (100k+ rows)
+load without building a full-width DataFrame.
+"""
+
+import hashlib
+import logging
+from abc import ABC, abstractmethod
+from collections.abc import Generator, Iterator, Sequence
+from itertools import islice
+from pathlib import Path
+from typing import ClassVar, Literal
+
+import pandas as pd
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from pydantic import ValidationError as PydanticValidationError
+
+from construtor.config.exceptions import InputValidationError, OutputParsingError
+from construtor.io.foco_index import DuplicateFoco, FocoIndex
+from construtor.io.input_cache import InputCache
+from construtor.models.question import FocoInput
+
+logger = logging.getLogger(__name__)
+
+# Bulk validator: one pydantic-core call for the whole file instead of one per row
+_FOCOS_ADAPTER = TypeAdapter(list[FocoInput])
+
+# What to do with rows that repeat an earlier tema/foco/periodo
+DuplicatePolicy = Literal["merge", "flag"]
+
+
+def _cell_to_str(value: object) -> str:
+    """Convert a raw cell value to text the way ``pd.read_excel(dtype=str)`` does.
+
+    Integral floats (calamine returns every number as float) lose the ``.0``.
+    """
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+class InputRowError(BaseModel):
+    """Validation problem found in a single input row.
+
+    Collected by ``InputReader.iter_input`` so that one bad cell does not stop
+    the rest of the file from being processed.
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    row: int  # Row number as the user sees it (Excel/CSV: header is row 1)
+    column: str | None = None
+    value: str | None = None
+    message: str
+
+
+class InputReader(ABC):
+    """Base class for foco input readers with validation.
+
+    Subclasses declare the format they read (FORMAT_NAME, SUPPORTED_EXTENSIONS,
+    FIRST_DATA_ROW) and implement ``_iter_raw_rows``. Everything else (column
+    matching, normalization, periodo and missing-data validation, caching and
+    streaming) is shared, so every format accepts and rejects exactly the same
+    rows.
+
+    Rows that repeat an earlier tema/foco/periodo (after folding accents, case
+    and whitespace) are detected with a FocoIndex. With the default
+    ``on_duplicate="merge"`` only the first occurrence is returned, so a
+    repeated row never costs a second sub-foco generation; ``"flag"`` keeps
+    every row and only reports the duplicates.
+
+    Args:
+        use_cache: Keep validated rows in a sidecar cache next to the input
+            file, keyed by file content hash and validation rules version.
+        on_duplicate: ``"merge"`` drops repeated focos, ``"flag"`` keeps them.
+
+    Raises:
+        ValueError: If on_duplicate is not a known policy
+
+    Example:
+        >>> reader = CsvReader()
+        >>> focos = reader.read_input("data/input.csv")
+        >>> print(f"Loaded {len(focos)} focos")
+        Loaded 156 focos
+    """
+
+    # Format metadata (overridden by each backend)
+    FORMAT_NAME: ClassVar[str] = "input"
+    SUPPORTED_EXTENSIONS: ClassVar[tuple[str, ...]] = ()
+    # Row number reported for the first data row (header on row 1 by default)
+    FIRST_DATA_ROW: ClassVar[int] = 2
+
+    # Validation rules
+    REQUIRED_COLUMNS: ClassVar[list[str]] = ["tema", "foco", "periodo"]
+    VALID_PERIODOS: ClassVar[list[str]] = ["1º ano", "2º ano", "3º ano", "4º ano"]
+    # Same markers pandas treats as missing by default (keep_default_na=True)
+    NA_VALUES: ClassVar[frozenset[str]] = frozenset(
+        {
+            "",
+            "#N/A",
+            "#N/A N/A",
+            "#NA",
+            "-1.#IND",
+            "-1.#QNAN",
+            "-NaN",
+            "-nan",
+            "1.#IND",
+            "1.#QNAN",
+            "<NA>",
+            "N/A",
+            "NA",
+            "NULL",
+            "NaN",
+            "None",
+            "n/a",
+            "nan",
+            "null",
+        }
+    )
+    # Bump when validation semantics change without touching the constants above
+    VALIDATION_RULES_VERSION: ClassVar[int] = 1
+
+    def __init__(self, use_cache: bool = False, on_duplicate: DuplicatePolicy = "merge") -> None:
+        if on_duplicate not in ("merge", "flag"):
+            msg = f"on_duplicate must be 'merge' or 'flag', got {on_duplicate!r}"
+            raise ValueError(msg)
+        self.use_cache = use_cache
+        self.on_duplicate = on_duplicate
+
+    def read_input(
+        self,
+        file_path: str,
+        duplicates: list[DuplicateFoco] | None = None,
+    ) -> list[FocoInput]:
+        """Read and validate an input file.
+
+        This method reads the file, validates its structure and content, and
+        returns a list of validated FocoInput objects.
+
+        Args:
+            file_path: Path to the input file
+            duplicates: Optional list that receives one DuplicateFoco per
+                repeated row
+
+        Returns:
+            List of validated FocoInput objects
+
+        Raises:
+            FileNotFoundError: If file doesn't exist or is not a file
+            InputValidationError: If columns missing, periodo invalid, or data missing
+            OutputParsingError: If the file format is invalid or cannot be read
+
+        Example:
+            >>> reader = ExcelReader()
+            >>> focos = reader.read_input("data/input.xlsx")
+            >>> print(focos[0].tema)
+            'Cardiologia'
+        """
+        logger.info(f"Loading {self.FORMAT_NAME} from {file_path}")
+
+        # Validate file exists
+        self._validate_file_exists(file_path)
+
+        # Reuse validated rows from a previous run if the file is unchanged
+        cache = self._cache_for(file_path)
+        if cache is not None and (cached := cache.load()) is not None:
+            return self._merge_duplicates(file_path, cached, None, duplicates)
+
+        # Read file (streaming, required columns only)
+        df = self._read_required_columns(file_path)
+
+        # Validate and clean data
+        self._validate_columns(df, file_path)
+        df = self._normalize_data(df)
+        self._validate_periodo_values(df, file_path)
+        self._validate_no_missing_data(df, file_path)
+
+        # Convert to Pydantic models
+        focos = self._dataframe_to_focos(df, file_path)
+
+        if cache is not None:
+            cache.save(focos)
+
+        rows = (df.index + self.FIRST_DATA_ROW).tolist()
+        focos = self._merge_duplicates(file_path, focos, rows, duplicates)
+
+        logger.info(f"Successfully loaded {len(focos)} focos from {file_path}")
+        return focos
+
+    def iter_input(
+        self,
+        file_path: str,
+        chunk_size: int = 500,
+        errors: list[InputRowError] | None = None,
+        duplicates: list[DuplicateFoco] | None = None,
+    ) -> Generator[list[FocoInput], None, None]:
+        """Stream validated FocoInput chunks while the file is being read.
+
+        Unlike ``read_input``, rows are validated chunk by chunk and invalid rows
+        are collected instead of aborting the read, so the pipeline can start on
+        the first focos while the rest of a large file is still parsed.
+        Structural problems (missing file, unreadable file, missing required
+        columns) still raise before the first chunk is yielded.
+
+        Args:
+            file_path: Path to the input file
+            chunk_size: Maximum number of data rows per validated chunk
+            errors: Optional list that receives one InputRowError per invalid
+                cell. If omitted, an InputValidationError summarizing every
+                invalid row is raised after the last valid chunk is yielded.
+            duplicates: Optional list that receives one DuplicateFoco per
+                repeated row, as soon as its chunk is read
+
+        Yields:
+            Non-empty lists of validated FocoInput objects, in file order
+
+        Raises:
+            ValueError: If chunk_size is not positive
+            FileNotFoundError: If file doesn't exist or is not a file
+            InputValidationError: If columns are missing, or rows were invalid
+                and no ``errors`` list was given
+            OutputParsingError: If the file format is invalid or cannot be read
+
+        Example:
+            >>> reader = ExcelReader()
+            >>> row_errors: list[InputRowError] = []
+            >>> for chunk in reader.iter_input("data/input.xlsx", errors=row_errors):
+            ...     await queue.put_many(chunk)
+        """
+        if chunk_size <= 0:
+            msg = f"chunk_size must be positive, got {chunk_size}"
+            raise ValueError(msg)
+
+        logger.info(f"Streaming {self.FORMAT_NAME} from {file_path} (chunk_size={chunk_size})")
+        self._validate_file_exists(file_path)
+
+        index = FocoIndex()
+        found: list[DuplicateFoco] = duplicates if duplicates is not None else []
+
+        cache = self._cache_for(file_path)
+        if cache is not None and (cached := cache.load()) is not None:
+            for start in range(0, len(cached), chunk_size):
+                chunk = cached[start : start + chunk_size]
+                rows = range(start + self.FIRST_DATA_ROW, start + self.FIRST_DATA_ROW + len(chunk))
+                if focos := self._drop_duplicates(chunk, rows, index, found):
+                    yield focos
+            self._log_duplicates(file_path, found)
+            return
+
+        collected: list[InputRowError] = []
+        # Only a fully valid file is cached, so rows are kept while streaming
+        to_cache: list[FocoInput] | None = [] if cache is not None else None
+        total = 0
+        rows_iter = self._iter_rows(file_path)
+        try:
+            header = self._header_names(next(rows_iter, ()))
+            indices = self._required_indices(header)
+            if indices is None:
+                self._validate_columns(pd.DataFrame(columns=header), file_path)
+                return
+
+            names = [header[idx] for idx in indices]
+            selected = self._select_required(rows_iter, indices)
+            start = 0
+            while rows := list(islice(selected, chunk_size)):
+                df = self._normalize_data(self._rows_to_frame(rows, names, start))
+                start += len(rows)
+
+                focos, rows, chunk_errors = self._validate_chunk(df)
+                collected.extend(chunk_errors)
+                # The cache keeps every valid row; duplicates are merged on load
+                if to_cache is not None:
+                    to_cache.extend(focos)
+                if focos := self._drop_duplicates(focos, rows, index, found):
+                    total += len(focos)
+                    yield focos
+        finally:
+            rows_iter.close()
+
+        if cache is not None and to_cache is not None and not collected:
+            cache.save(to_cache)
+
+        self._log_duplicates(file_path, found)
+
+        logger.info(
+            f"Streamed {total} focos from {file_path} "
+            f"({len({error.row for error in collected})} invalid rows)"
+        )
+
+        if errors is not None:
+            errors.extend(collected)
+        elif collected:
+            error_msg = f"Invalid rows found in {file_path}:\n" + "\n".join(
+                f"  Row {error.row}: {error.message}" for error in collected
+            )
+            logger.error(error_msg)
+            raise InputValidationError(error_msg)
+
+    def rules_fingerprint(self) -> bytes:
+        """Digest of the validation rules, used to invalidate cached rows.
+
+        Returns:
+            32-byte SHA-256 over the reader format and parser options,
+            VALIDATION_RULES_VERSION, REQUIRED_COLUMNS, VALID_PERIODOS and
+            NA_VALUES
+        """
+        rules = (
+            self.FORMAT_NAME,
+            sorted(self._parser_options().items()),
+            self.VALIDATION_RULES_VERSION,
+            self.REQUIRED_COLUMNS,
+            self.VALID_PERIODOS,
+            sorted(self.NA_VALUES),
+        )
+        return hashlib.sha256(repr(rules).encode("utf-8")).digest()
+
+    def _merge_duplicates(
+        self,
+        file_path: str,
+        focos: list[FocoInput],
+        rows: list[int] | None,
+        duplicates: list[DuplicateFoco] | None,
+    ) -> list[FocoInput]:
+        """Apply the duplicate policy to a fully read file.
+
+        Args:
+            file_path: Path to the input file (for log messages)
+            focos: Validated focos in file order
+            rows: Row number of each foco, or None if rows are contiguous from
+                FIRST_DATA_ROW (cached files are always fully valid)
+            duplicates: Optional list that receives the duplicates found
+
+        Returns:
+            Focos to process (duplicates removed when merging)
+        """
+        if rows is None:
+            rows = range(self.FIRST_DATA_ROW, self.FIRST_DATA_ROW + len(focos))
+        found: list[DuplicateFoco] = duplicates if duplicates is not None else []
+        kept = self._drop_duplicates(focos, rows, FocoIndex(), found)
+        self._log_duplicates(file_path, found)
+        return kept
+
+    def _drop_duplicates(
+        self,
+        focos: list[FocoInput],
+        rows: Sequence[int],
+        index: FocoIndex,
+        found: list[DuplicateFoco],
+    ) -> list[FocoInput]:
+        """Register focos in ``index`` and collect the repeated ones.
+
+        Args:
+            focos: Validated focos in file order
+            rows: Row number of each foco
+            index: Index of the focos seen so far in this file
+            found: Receives one DuplicateFoco per repeated row
+
+        Returns:
+            Focos to process: first occurrences only when merging, all of them
+            when flagging
+        """
+        kept: list[FocoInput] = []
+        for foco, row in zip(focos, rows, strict=True):
+            duplicate = index.check(foco, row)
+            if duplicate is not None:
+                found.append(duplicate)
+            if duplicate is None or self.on_duplicate == "flag":
+                kept.append(foco)
+        return kept
+
+    def _log_duplicates(self, file_path: str, found: list[DuplicateFoco]) -> None:
+        """Log a summary of the duplicate focos found in a file."""
+        if not found:
+            return
+        exact = sum(duplicate.exact for duplicate in found)
+        action = "merged into their first occurrence" if self.on_duplicate == "merge" else "kept"
+        logger.warning(
+            f"{len(found)} duplicate focos in {file_path} "
+            f"({exact} exact, {len(found) - exact} after normalization), {action}"
+        )
+        for duplicate in found:
+            logger.debug(
+                f"Row {duplicate.row} duplicates row {duplicate.first_row}: "
+                f"{duplicate.tema} / {duplicate.foco} / {duplicate.periodo}"
+            )
+
+    def _parser_options(self) -> dict[str, object]:
+        """Backend options that change how a file is parsed (part of the cache key)."""
+        return {}
+
+    @abstractmethod
+    def _iter_raw_rows(self, file_path: str) -> Iterator[Sequence[object]]:
+        """Yield raw cell values of the file, header row first.
+
+        Implemented by each format backend. Rows may be shorter than the
+        header; missing trailing cells are treated as empty.
+
+        Args:
+            file_path: Path to the input file
+
+        Yields:
+            One sequence of cell values per row
+        """
+
+    def _cache_for(self, file_path: str) -> InputCache | None:
+        """Return the sidecar cache for ``file_path`` if caching is enabled."""
+        if not self.use_cache:
+            return None
+        return InputCache(file_path, self.rules_fingerprint(), self.VALID_PERIODOS)
+
+    def _validate_file_exists(self, file_path: str) -> None:
+        """Validate file exists and is readable.
+
+        Args:
+            file_path: Path to validate
+
+        Raises:
+            FileNotFoundError: If file doesn't exist or is not a file
+            InputValidationError: If the extension is not in SUPPORTED_EXTENSIONS
+        """
+        path = Path(file_path)
+
+        if not path.exists():
+            raise FileNotFoundError(f"{self.FORMAT_NAME} file not found: {file_path}")
+
+        if not path.is_file():
+            raise FileNotFoundError(f"Path is not a file: {file_path}")
+
+        # Validate file extension
+        if path.suffix.lower() not in self.SUPPORTED_EXTENSIONS:
+            raise InputValidationError(
+                f"Invalid file format: {path.suffix}. "
+                f"Expected {self.FORMAT_NAME} file with "
+                f"{' or '.join(self.SUPPORTED_EXTENSIONS)} extension."
+            )
+
+    def _read_required_columns(self, file_path: str) -> pd.DataFrame:
+        """Read the file keeping only the required columns.
+
+        If any required column is absent, a header-only DataFrame is returned so
+        that ``_validate_columns`` can report what was actually found.
+
+        Args:
+            file_path: Path to the input file
+
+        Returns:
+            DataFrame with the original (non-normalized) names of the required
+            columns, one row per data row, object dtype
+        """
+        rows_iter = self._iter_rows(file_path)
+        try:
+            header = self._header_names(next(rows_iter, ()))
+            indices = self._required_indices(header)
+            if indices is None:
+                return pd.DataFrame(columns=header)
+            rows = list(self._select_required(rows_iter, indices))
+        finally:
+            rows_iter.close()
+
+        return self._rows_to_frame(rows, [header[idx] for idx in indices])
+
+    def _iter_rows(self, file_path: str) -> Generator[Sequence[object], None, None]:
+        """Yield ``_iter_raw_rows`` with reader failures translated.
+
+        Backend failures are translated to pipeline exceptions wherever they
+        happen while streaming.
+
+        Args:
+            file_path: Path to the input file
+
+        Yields:
+            One sequence of cell values per row, header row first
+
+        Raises:
+            FileNotFoundError: If file disappears before it is opened
+            OutputParsingError: If the file format is invalid or cannot be read
+        """
+        try:
+            yield from self._iter_raw_rows(file_path)
+        except FileNotFoundError:
+            logger.exception(f"File not found: {file_path}")
+            raise
+        except OutputParsingError:
+            raise
+        except Exception as e:
+            logger.exception(f"Failed to read {self.FORMAT_NAME} {file_path}")
+            raise OutputParsingError(f"Failed to read {self.FORMAT_NAME}: {e}") from e
+
+    def _header_names(self, header_row: Sequence[object]) -> list[str]:
+        """Convert the raw header row to column names as pandas would name them.
+
+        Args:
+            header_row: Raw cell values of the header row
+
+        Returns:
+            Column names, with ``Unnamed: <idx>`` for empty header cells
+        """
+        return [
+            str(name) if name not in (None, "") else f"Unnamed: {idx}"
+            for idx, name in enumerate(header_row)
+        ]
+
+    def _required_indices(self, header: list[str]) -> list[int] | None:
+        """Locate the required columns (case-insensitive, whitespace-tolerant).
+
+        Args:
+            header: Column names from ``_header_names``
+
+        Returns:
+            Positions of tema/foco/periodo in REQUIRED_COLUMNS order, or None
+            if any of them is missing
+        """
+        # First occurrence of each normalized column name
+        positions: dict[str, int] = {}
+        for idx, name in enumerate(header):
+            positions.setdefault(name.strip().lower(), idx)
+
+        if any(col not in positions for col in self.REQUIRED_COLUMNS):
+            return None
+        return [positions[col] for col in self.REQUIRED_COLUMNS]
+
+    def _select_required(
+        self,
+        rows: Iterator[Sequence[object]],
+        indices: list[int],
+    ) -> Generator[tuple[object, ...], None, None]:
+        """Yield only the required cells of each data row.
+
+        Fully blank rows are held back until a non-blank row follows them, so
+        blank rows inside the data are still reported as missing data while
+        trailing blank rows (formatting leftovers) are dropped.
+
+        Args:
+            rows: Raw data rows (header already consumed)
+            indices: Positions of the required columns
+
+        Yields:
+            One tuple of (tema, foco, periodo) raw values per data row
+        """
+        width = max(indices) + 1
+        blank_rows = 0
+
+        for row in rows:
+            if len(row) >= width:
+                values = tuple(row[idx] for idx in indices)
+            else:
+                values = tuple(row[idx] if idx < len(row) else None for idx in indices)
+
+            if all(value in (None, "") for value in values):
+                blank_rows += 1
+                continue
+
+            for _ in range(blank_rows):
+                yield (None,) * len(indices)
+            blank_rows = 0
+            yield values
+
+    def _rows_to_frame(
+        self,
+        rows: list[tuple[object, ...]],
+        names: list[str],
+        start: int = 0,
+    ) -> pd.DataFrame:
+        """Build a string DataFrame from raw required-column rows.
+
+        Cell values are converted to strings and pandas' default missing-value
+        markers are mapped to NA, which matches ``pd.read_excel(dtype=str)``.
+
+        Args:
+            rows: Raw (tema, foco, periodo) values per data row
+            names: Column names to use (original header names)
+            start: Position of the first row among all data rows, so that
+                ``index + FIRST_DATA_ROW`` is always the file row number
+
+        Returns:
+            DataFrame with object dtype columns
+        """
+        columns = list(zip(*rows, strict=True)) if rows else [() for _ in names]
+        index = pd.RangeIndex(start, start + len(rows))
+        df = pd.DataFrame(
+            {
+                name: pd.Series(values, dtype=object, index=index)
+                for name, values in zip(names, columns, strict=True)
+            },
+            index=index,
+        )
+
+        # Vectorized equivalent of dtype=str + na_filter
+        for col in df.columns:
+            present = df[col].notna()
+            df.loc[present, col] = df.loc[present, col].map(_cell_to_str)
+            df[col] = df[col].mask(df[col].isin(self.NA_VALUES), pd.NA)
+
+        return df
+
+    def _validate_columns(self, df: pd.DataFrame, file_path: str) -> None:
+        """Validate required columns exist.
+
+        Performs case-insensitive column matching and handles extra whitespace.
+
+        Args:
+            df: DataFrame to validate
+            file_path: Path to the input file (for error messages)
+
+        Raises:
+            InputValidationError: If required columns are missing
+        """
+        # Normalize column names: lowercase and strip whitespace
+        actual_columns = {col.strip().lower() for col in df.columns}
+        required_columns = {col.lower() for col in self.REQUIRED_COLUMNS}
+
+        missing_columns = required_columns - actual_columns
+
+        if missing_columns:
+            logger.error(
+                f"Missing columns {missing_columns} in {file_path}. "
+                f"Expected: {self.REQUIRED_COLUMNS}. Found: {list(df.columns)}"
+            )
+            raise InputValidationError(
+                f"Missing required columns: {sorted(missing_columns)}. "
+                f"Expected: {self.REQUIRED_COLUMNS}. Found: {list(df.columns)}"
+            )
+
+    def _normalize_data(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Normalize DataFrame column names and data.
+
+        Normalizes column names to lowercase and strips whitespace from all
+        string values. Also treats whitespace-only values as missing.
+
+        Args:
+            df: DataFrame to normalize
+
+        Returns:
+            Normalized DataFrame with clean column names and data
+        """
+        # Normalize column names: lowercase and strip
+        df.columns = df.columns.str.strip().str.lower()
+
+        # Performance: keep only required columns before touching the data
+        df = df[self.REQUIRED_COLUMNS].astype(object)
+
+        # Strip whitespace and treat whitespace-only values as missing
+        for col in self.REQUIRED_COLUMNS:
+            stripped = df[col].str.strip()
+            df[col] = stripped.mask(stripped == "", pd.NA)
+
+        return df
+
+    def _validate_periodo_values(self, df: pd.DataFrame, file_path: str) -> None:
+        """Validate all periodo values are valid academic periods.
+
+        Args:
+            df: DataFrame to validate
+            file_path: Path to the input file (for error messages)
+
+        Raises:
+            InputValidationError: If invalid periodo values are found
+        """
+        # Check all values against valid periodos
+        invalid_mask = ~df["periodo"].isin(self.VALID_PERIODOS)
+        invalid_rows = df[invalid_mask]
+
+        if not invalid_rows.empty:
+            # Collect file row numbers
+            errors = zip(
+                invalid_rows.index + self.FIRST_DATA_ROW, invalid_rows["periodo"], strict=True
+            )
+
+            error_msg = (
+                f"Invalid periodo values found in {file_path}:\n"
+                + "\n".join(f"  Row {row_num}: '{value}'" for row_num, value in errors)
+                + f"\nValid values: {self.VALID_PERIODOS}"
+            )
+
+            logger.error(error_msg)
+            raise InputValidationError(error_msg)
+
+    def _validate_no_missing_data(self, df: pd.DataFrame, file_path: str) -> None:
+        """Validate no missing data in required columns.
+
+        Args:
+            df: DataFrame to validate
+            file_path: Path to the input file (for error messages)
+
+        Raises:
+            InputValidationError: If missing data is found
+        """
+        for col in self.REQUIRED_COLUMNS:
+            missing_mask = df[col].isna()
+            if missing_mask.any():
+                # Get file row numbers
+                row_numbers = [idx + self.FIRST_DATA_ROW for idx in df[missing_mask].index]
+
+                error_msg = f"Missing data in column '{col}' at rows {row_numbers} in {file_path}"
+
+                logger.error(error_msg)
+                raise InputValidationError(error_msg)
+
+    def _validate_chunk(
+        self,
+        df: pd.DataFrame,
+    ) -> tuple[list[FocoInput], list[int], list[InputRowError]]:
+        """Validate a normalized chunk, splitting valid rows from row errors.
+
+        Args:
+            df: Normalized DataFrame chunk (index + FIRST_DATA_ROW is the row number)
+
+        Returns:
+            Tuple of (FocoInput for valid rows, their row numbers, errors for
+            invalid rows)
+        """
+        missing = df.isna()
+        invalid_periodo = df["periodo"].notna() & ~df["periodo"].isin(self.VALID_PERIODOS)
+        bad_mask = missing.any(axis=1) | invalid_periodo
+
+        errors: list[InputRowError] = []
+        for idx in df.index[bad_mask]:
+            row_num = int(idx) + self.FIRST_DATA_ROW
+            errors.extend(
+                InputRowError(row=row_num, column=col, message=f"Missing data in column '{col}'")
+                for col in self.REQUIRED_COLUMNS
+                if missing.at[idx, col]
+            )
+            if invalid_periodo.at[idx]:
+                value = df.at[idx, "periodo"]
+                errors.append(
+                    InputRowError(
+                        row=row_num,
+                        column="periodo",
+                        value=value,
+                        message=f"Invalid periodo '{value}'. Valid values: {self.VALID_PERIODOS}",
+                    )
+                )
+
+        valid = df[~bad_mask]
+        records = self._records(valid)
+        rows = (valid.index + self.FIRST_DATA_ROW).tolist()
+        try:
+            focos = _FOCOS_ADAPTER.validate_python(records)
+        except PydanticValidationError:
+            # Rare: isolate the offending rows one by one
+            focos = []
+            rows = []
+            for idx, record in zip(valid.index, records, strict=True):
+                try:
+                    focos.append(FocoInput(**record))
+                    rows.append(int(idx) + self.FIRST_DATA_ROW)
+                except PydanticValidationError as e:
+                    errors.append(InputRowError(row=int(idx) + self.FIRST_DATA_ROW, message=str(e)))
+
+        if errors:
+            logger.warning(
+                f"{len(errors)} validation errors in rows {errors[0].row}-{errors[-1].row}"
+            )
+        return focos, rows, errors
+
+    def _records(self, df: pd.DataFrame) -> list[dict[str, str]]:
+        """Convert a validated DataFrame to FocoInput keyword dicts.
+
+        Column lists + zip avoid DataFrame.to_dict's per-cell boxing.
+        """
+        return [
+            {"tema": tema, "foco": foco, "periodo": periodo}
+            for tema, foco, periodo in zip(
+                df["tema"].tolist(),
+                df["foco"].tolist(),
+                df["periodo"].tolist(),
+                strict=True,
+            )
+        ]
+
+    def _dataframe_to_focos(self, df: pd.DataFrame, file_path: str) -> list[FocoInput]:
+        """Convert validated DataFrame to list of FocoInput models.
+
+        Args:
+            df: Validated DataFrame with clean data
+            file_path: Path to the input file (for error messages)
+
+        Returns:
+            List of FocoInput objects
+
+        Raises:
+            InputValidationError: If Pydantic validation fails for any row
+        """
+        records = self._records(df)
+
+        try:
+            return _FOCOS_ADAPTER.validate_python(records)
+        except PydanticValidationError as e:
+            # First error location is (list position, field)
+            position = e.errors()[0]["loc"][0]
+            row_num = df.index[position] + self.FIRST_DATA_ROW
+            error_msg = f"Validation failed at row {row_num} in {file_path}: {e}"
+            logger.exception(error_msg)
+            raise InputValidationError(error_msg) from e
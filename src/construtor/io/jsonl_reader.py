@@ -0,0 +1,79 @@
+"""JSON Lines input file reader.
+
+This module provides JsonlReader, which reads foco input from JSON Lines files
+(one JSON object per line) through the shared InputReader validation core.
+Row numbers in error messages are line numbers.
+"""
+
+import json
+import logging
+from collections.abc import Iterator, Sequence
+from typing import ClassVar
+
+from construtor.config.exceptions import OutputParsingError
+from construtor.io.input_reader import InputReader
+
+logger = logging.getLogger(__name__)
+
+
+class JsonlReader(InputReader):
+    """JSON Lines input file reader with validation.
+
+    Each non-blank line must be a JSON object. Keys are matched to the required
+    columns the same way Excel headers are (case-insensitive, whitespace
+    tolerant); other keys are ignored and absent keys count as missing data.
+
+    Example:
+        >>> reader = JsonlReader()
+        >>> focos = reader.read_input("data/input.jsonl")
+    """
+
+    FORMAT_NAME: ClassVar[str] = "JSONL"
+    SUPPORTED_EXTENSIONS: ClassVar[tuple[str, ...]] = (".jsonl", ".ndjson")
+    # No header line: the first object is on line 1
+    FIRST_DATA_ROW: ClassVar[int] = 1
+
+    def _iter_raw_rows(self, file_path: str) -> Iterator[Sequence[object]]:
+        """Yield a synthetic header, then one row per line.
+
+        The header holds the normalized required column names; each row holds
+        the values of those keys (None when absent). Blank lines become blank
+        rows so that line numbers and row numbers stay aligned.
+
+        Args:
+            file_path: Path to JSONL file
+
+        Yields:
+            Header row, then one tuple of values per line
+
+        Raises:
+            OutputParsingError: If a line is not valid JSON or not an object
+        """
+        yield self.REQUIRED_COLUMNS
+
+        with open(file_path, encoding="utf-8-sig") as f:
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    yield ()
+                    continue
+
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    msg = f"Invalid JSON at line {line_num} in {file_path}: {e.msg}"
+                    logger.exception(msg)
+                    raise OutputParsingError(msg) from e
+
+                if not isinstance(record, dict):
+                    msg = (
+                        f"Expected a JSON object at line {line_num} in {file_path}, "
+                        f"got {type(record).__name__}"
+                    )
+                    logger.error(msg)
+                    raise OutputParsingError(msg)
+
+                # First occurrence of each normalized key, like Excel headers
+                values: dict[str, object] = {}
+                for key, value in record.items():
+                    values.setdefault(str(key).strip().lower(), value)
+                yield tuple(values.get(col) for col in self.REQUIRED_COLUMNS)
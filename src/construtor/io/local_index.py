@@ -0,0 +1,294 @@
+"""Local replica of the curated document index.
+
+NFR9 asks for a fallback when Pinecone is slow or unreachable. A
+LocalVectorIndex is an exported copy of the curated documents that answers
+the same ``search`` calls as PineconeIndex with zero network calls. It
+serves as PineconeClient's ``fallback`` (queries that exceed
+``PINECONE_TIMEOUT``) or as its ``index`` for local runs.
+
+Documents are embedded locally (hashed n-grams by default; Pinecone's
+integrated embedding model is not available offline), so replica rankings
+approximate Pinecone's rather than reproduce them.
+
+Directory layout:
+    manifest.json      format version, dimension, count, IVF lists, index version
+    vectors.npy        float32 (count, dim) L2-normalized embeddings, memory-mapped
+    documents.jsonl    one {"document": ..., "metadata": ...} per row, same order
+    ivf_centroids.npy  float32 (nlist, dim) cluster centroids (IVF only)
+    ivf_offsets.npy    int64 (nlist + 1,) row range of each cluster (IVF only)
+
+With IVF, rows are stored grouped by cluster, so a search reads
+``nprobe`` contiguous slices of the memory-mapped matrix instead of all of it.
+"""
+
+import json
+import logging
+import os
+import time
+from collections.abc import Callable, Iterable, Mapping
+from pathlib import Path
+
+import numpy as np
+
+from construtor.config.exceptions import ConfigurationError
+from construtor.io.pinecone_client import MetadataFilter, PineconeIndex, matches_filter
+from construtor.models.rag import RagDocument
+
+logger = logging.getLogger(__name__)
+
+Embedder = Callable[[list[str]], np.ndarray]
+"""Maps texts to an (n, dim) array of L2-normalized embeddings."""
+
+_FORMAT_VERSION = 1
+_DEFAULT_DIM = 1024
+_KMEANS_ITERATIONS = 10
+
+
+def _default_embedder(dim: int) -> Embedder:
+    # Imported here: the agents package imports construtor.io
+    from construtor.agents.subfoco_dedup import embed_texts
+
+    def embed(texts: list[str]) -> np.ndarray:
+        return embed_texts(texts, dim=dim)
+
+    return embed
+
+
+def _document_text(document: RagDocument) -> str:
+    return f"{document.titulo} {document.texto}"
+
+
+def _kmeans(vectors: np.ndarray, nlist: int, seed: int) -> tuple[np.ndarray, np.ndarray]:
+    """Spherical k-means: return (centroids, assignment of each row)."""
+    rng = np.random.default_rng(seed)
+    centroids = vectors[rng.choice(len(vectors), size=nlist, replace=False)].copy()
+    assignments = np.zeros(len(vectors), dtype=np.int64)
+    for _ in range(_KMEANS_ITERATIONS):
+        assignments = np.argmax(vectors @ centroids.T, axis=1)
+        for cluster in range(nlist):
+            members = vectors[assignments == cluster]
+            if len(members):
+                centroid = members.sum(axis=0)
+                norm = np.linalg.norm(centroid)
+                centroids[cluster] = centroid / norm if norm > 0 else centroid
+    return centroids.astype(np.float32), assignments
+
+
+class LocalVectorIndex:
+    """Memory-mapped replica of the curated index with brute-force or IVF search.
+
+    Args:
+        path: Directory written by ``LocalVectorIndex.build``
+        nprobe: Clusters searched per query when the replica has IVF lists
+        embedder: Embedder used at build time, when it was not the default
+
+    Raises:
+        ConfigurationError: If the directory is not a replica of a known
+            format, or ``embedder`` does not match the replica's dimension
+
+    Example:
+        >>> replica = LocalVectorIndex("data/rag_replica")
+        >>> docs = await replica.search("Cardiologia Insuficiência Cardíaca", top_k=5)
+    """
+
+    def __init__(self, path: str, nprobe: int = 8, embedder: Embedder | None = None) -> None:
+        if nprobe <= 0:
+            msg = f"nprobe must be positive, got {nprobe}"
+            raise ValueError(msg)
+
+        directory = Path(path)
+        try:
+            manifest = json.loads((directory / "manifest.json").read_text(encoding="utf-8"))
+            if manifest.get("format_version") != _FORMAT_VERSION:
+                msg = f"Unsupported local index format in {path}: {manifest.get('format_version')}"
+                raise ConfigurationError(msg)
+            # An empty matrix cannot be memory-mapped
+            mmap_mode = "r" if manifest["count"] else None
+            self._vectors = np.load(directory / "vectors.npy", mmap_mode=mmap_mode)
+            with (directory / "documents.jsonl").open(encoding="utf-8") as f:
+                rows = [json.loads(line) for line in f if line.strip()]
+            if manifest["nlist"]:
+                self._centroids = np.load(directory / "ivf_centroids.npy")
+                self._offsets = np.load(directory / "ivf_offsets.npy")
+            else:
+                self._centroids = None
+                self._offsets = None
+        except (OSError, ValueError, KeyError) as e:
+            msg = f"Cannot load local vector index from {path}: {e}"
+            raise ConfigurationError(msg) from e
+
+        self._documents = [RagDocument(**row["document"]) for row in rows]
+        self._metadata: list[Mapping[str, object]] = [row["metadata"] for row in rows]
+        if len(self._documents) != len(self._vectors):
+            msg = (
+                f"Local vector index in {path} has {len(self._vectors)} vectors "
+                f"for {len(rows)} documents"
+            )
+            raise ConfigurationError(msg)
+
+        self.dim = int(manifest["dim"])
+        self.index_version = str(manifest.get("index_version", ""))
+        self._nprobe = nprobe
+        self._embedder = embedder or _default_embedder(self.dim)
+        query_dim = np.asarray(self._embedder(["probe"])).shape[1]
+        if self._vectors.shape[1] != self.dim or query_dim != self.dim:
+            msg = (
+                f"Local vector index in {path} has dimension {self.dim}, but its vectors "
+                f"have {self._vectors.shape[1]} and the embedder produces {query_dim}"
+            )
+            raise ConfigurationError(msg)
+
+        search = (
+            f"IVF, {len(self._centroids)} lists" if self._centroids is not None else "brute force"
+        )
+        logger.info(
+            f"Local vector index loaded: {len(self._documents)} documents from {path} ({search})"
+        )
+
+    @classmethod
+    def build(
+        cls,
+        documents: Iterable[tuple[RagDocument, Mapping[str, object]]],
+        path: str,
+        nlist: int = 0,
+        dim: int = _DEFAULT_DIM,
+        embedder: Embedder | None = None,
+        index_version: str = "",
+        seed: int = 0,
+    ) -> "LocalVectorIndex":
+        """Embed documents and write a replica directory.
+
+        Args:
+            documents: (document, metadata) pairs, e.g. exported from Pinecone
+            path: Destination directory (files are replaced)
+            nlist: Number of IVF clusters (0 = brute-force search only)
+            dim: Embedding dimension of the default embedder
+            embedder: Custom embedder (must be passed again when loading)
+            index_version: Version of the curated index the replica copies
+            seed: Seed of the k-means initialization
+
+        Returns:
+            The loaded replica
+
+        Raises:
+            ValueError: If nlist is negative or larger than the document count
+        """
+        pairs = list(documents)
+        if nlist < 0 or nlist > len(pairs):
+            msg = f"nlist must be between 0 and the document count ({len(pairs)}), got {nlist}"
+            raise ValueError(msg)
+
+        embed = embedder or _default_embedder(dim)
+        if pairs:
+            vectors = np.asarray(embed([_document_text(doc) for doc, _ in pairs]), dtype=np.float32)
+        else:
+            vectors = np.zeros((0, dim), dtype=np.float32)
+
+        directory = Path(path)
+        directory.mkdir(parents=True, exist_ok=True)
+        if nlist:
+            centroids, assignments = _kmeans(vectors, nlist, seed)
+            order = np.argsort(assignments, kind="stable")
+            vectors = vectors[order]
+            pairs = [pairs[i] for i in order]
+            offsets = np.searchsorted(assignments[order], np.arange(nlist + 1)).astype(np.int64)
+            np.save(directory / "ivf_centroids.npy", centroids)
+            np.save(directory / "ivf_offsets.npy", offsets)
+
+        np.save(directory / "vectors.npy", vectors)
+        with (directory / "documents.jsonl").open("w", encoding="utf-8") as f:
+            for document, metadata in pairs:
+                row = {
+                    "document": document.model_dump(exclude={"score"}),
+                    "metadata": dict(metadata),
+                }
+                f.write(json.dumps(row, ensure_ascii=False) + "\n")
+        manifest = {
+            "format_version": _FORMAT_VERSION,
+            "dim": int(vectors.shape[1]),
+            "count": len(pairs),
+            "nlist": nlist,
+            "index_version": index_version,
+            "embedder": "hashed-ngrams" if embedder is None else "custom",
+            "created_at": time.time(),
+        }
+        # Manifest last: a replica without one is incomplete and does not load
+        temp_path = directory / "manifest.json.tmp"
+        temp_path.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        os.replace(temp_path, directory / "manifest.json")
+
+        logger.info(f"Local vector index built: {len(pairs)} documents, nlist={nlist}, in {path}")
+        return cls(path, embedder=embedder)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    async def search(
+        self,
+        text: str,
+        top_k: int,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[RagDocument]:
+        """Return the ``top_k`` matching documents by cosine similarity.
+
+        Without IVF lists every row is scored; with them, only the rows of
+        the ``nprobe`` clusters closest to the query. The metadata filter is
+        applied to the scored rows.
+        """
+        if not self._documents:
+            return []
+        query = np.asarray(self._embedder([text])[0], dtype=np.float32)
+
+        if self._centroids is None:
+            rows = np.arange(len(self._documents))
+            scores = self._vectors @ query
+        else:
+            probes = np.argsort(-(self._centroids @ query))[: self._nprobe]
+            rows = np.concatenate(
+                [np.arange(self._offsets[c], self._offsets[c + 1]) for c in probes]
+            )
+            scores = np.concatenate(
+                [self._vectors[self._offsets[c] : self._offsets[c + 1]] @ query for c in probes]
+            )
+
+        results = []
+        for position in np.argsort(-scores, kind="stable"):
+            row = int(rows[position])
+            if matches_filter(self._metadata[row], metadata_filter):
+                results.append(
+                    self._documents[row].model_copy(update={"score": float(scores[position])})
+                )
+                if len(results) == top_k:
+                    break
+        return results
+
+    async def close(self) -> None:
+        """Nothing to release (the memory map closes with the object)."""
+
+
+async def export_local_index(
+    source: PineconeIndex,
+    path: str,
+    nlist: int = 0,
+    index_version: str = "",
+) -> LocalVectorIndex:
+    """Copy every record of a Pinecone namespace into a local replica.
+
+    Args:
+        source: Index to export (any object with ``iter_documents``)
+        path: Replica directory
+        nlist: Number of IVF clusters (0 = brute force)
+        index_version: Version of the curated index being exported
+
+    Returns:
+        The replica
+
+    Example:
+        >>> source = PineconeIndex(config.pinecone_api_key, config.pinecone_index_host)
+        >>> await export_local_index(source, "data/rag_replica", nlist=64)
+    """
+    documents: list[tuple[RagDocument, Mapping[str, object]]] = []
+    async for page in source.iter_documents():
+        documents.extend(page)
+    logger.info(f"Exported {len(documents)} documents from the curated index")
+    return LocalVectorIndex.build(documents, path, nlist=nlist, index_version=index_version)
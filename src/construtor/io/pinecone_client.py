@@ -0,0 +1,519 @@
+"""Pinecone RAG client for the Comentador agent.
+
+PineconeClient queries the curated medical documents (FR19) with tema + foco
+as search text, optionally filtered by ``metadata.periodo``, and returns the
+top K documents with their bibliographic metadata. Every query is bounded by
+``PINECONE_TIMEOUT``; a failed query raises PineconeError so the caller can
+fall back to generation without RAG (NFR9).
+
+``query_many`` retrieves the context of a whole batch at once: questions of
+the same tema/foco/periodo share one query, distinct queries run
+concurrently over a single connection, and the batch is bounded by one
+timeout, so RAG adds about one round trip per batch instead of one per
+question. With a RagCache, repeated and near-identical queries (within and
+across runs) are answered locally and never reach Pinecone.
+
+The vector index behind the client is pluggable. ``PineconeIndex`` uses the
+async Pinecone SDK (integrated-embedding ``search``); ``InMemoryVectorIndex``
+is a local stand-in with hashed n-gram embeddings, for tests and offline
+runs.
+"""
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable, Iterable, Mapping, Sequence
+from typing import Protocol
+
+import numpy as np
+
+from construtor.config.exceptions import ConfigurationError, PineconeError
+from construtor.config.settings import PipelineConfig
+from construtor.io.rag_cache import RagCache
+from construtor.models.question import FocoInput
+from construtor.models.rag import RagDocument, RagQueryResult
+
+try:  # Declared dependency, but only needed against a real index
+    from pinecone import PineconeAsyncio
+except ImportError:  # pragma: no cover - depends on environment
+    PineconeAsyncio = None
+
+logger = logging.getLogger(__name__)
+
+MetadataFilter = dict[str, object]
+"""Pinecone metadata filter, e.g. ``{"periodo": {"$eq": "3º ano"}}``."""
+
+_DOCUMENT_FIELDS = ("texto", "titulo", "autores", "ano", "fonte")
+
+_DEFAULT_NAMESPACE = "__default__"
+
+
+class VectorIndex(Protocol):
+    """Text search over a vector index of curated documents."""
+
+    async def search(
+        self,
+        text: str,
+        top_k: int,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[RagDocument]:
+        """Return the ``top_k`` documents most similar to ``text``."""
+        ...
+
+    async def close(self) -> None:
+        """Release the index's connections."""
+        ...
+
+
+def matches_filter(metadata: Mapping[str, object], metadata_filter: MetadataFilter | None) -> bool:
+    """Evaluate a metadata filter locally (equality, ``$eq`` and ``$in``).
+
+    Args:
+        metadata: Metadata of a document
+        metadata_filter: Filter in Pinecone syntax (None = match everything)
+
+    Returns:
+        True if the metadata satisfies every condition
+    """
+    for field, condition in (metadata_filter or {}).items():
+        value = metadata.get(field)
+        if isinstance(condition, dict):
+            if "$eq" in condition and value != condition["$eq"]:
+                return False
+            if "$in" in condition and value not in condition["$in"]:
+                return False
+        elif value != condition:
+            return False
+    return True
+
+
+def _to_document(fields: Mapping[str, object], score: float) -> RagDocument:
+    """Build a RagDocument from a record's metadata fields."""
+    values = {name: str(fields.get(name) or "") for name in _DOCUMENT_FIELDS}
+    return RagDocument(**values, score=float(score))
+
+
+class PineconeIndex:
+    """Pinecone index with integrated embedding, through the async SDK.
+
+    The connection is opened on the first search (inside the event loop)
+    and reused by every later query.
+
+    Args:
+        api_key: Pinecone API key
+        host: Index host (``PINECONE_INDEX_HOST``)
+        namespace: Namespace holding the curated documents
+
+    Raises:
+        ConfigurationError: If the ``pinecone`` package is not installed
+    """
+
+    def __init__(self, api_key: str, host: str, namespace: str = _DEFAULT_NAMESPACE) -> None:
+        if PineconeAsyncio is None:
+            raise ConfigurationError(
+                "Querying Pinecone requires the pinecone SDK. "
+                "Install it with: uv add 'pinecone[asyncio]'"
+            )
+        self._api_key = api_key
+        self._host = host
+        self._namespace = namespace
+        self._client = None
+        self._index = None
+
+    async def search(
+        self,
+        text: str,
+        top_k: int,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[RagDocument]:
+        """Search the namespace by text (embedded by the index)."""
+        index = self._connect()
+        query: dict[str, object] = {"inputs": {"text": text}, "top_k": top_k}
+        if metadata_filter:
+            query["filter"] = metadata_filter
+        response = await index.search(
+            namespace=self._namespace,
+            query=query,
+            fields=list(_DOCUMENT_FIELDS),
+        )
+        return [_to_document(hit["fields"], hit["_score"]) for hit in response.result.hits]
+
+    async def iter_documents(
+        self, page_size: int = 100
+    ) -> AsyncIterator[list[tuple[RagDocument, Mapping[str, object]]]]:
+        """Yield every record of the namespace as (document, metadata) pages.
+
+        Used to export a local replica of the index (see
+        ``construtor.io.local_index``).
+
+        Args:
+            page_size: Records listed and fetched per request
+        """
+        index = self._connect()
+        async for ids in index.list(namespace=self._namespace, limit=page_size):
+            response = await index.fetch(ids=list(ids), namespace=self._namespace)
+            page = []
+            for record in response.vectors.values():
+                metadata = dict(record.metadata or {})
+                page.append((_to_document(metadata, 0.0), metadata))
+            yield page
+
+    async def close(self) -> None:
+        """Close the index and client sessions."""
+        if self._index is not None:
+            await self._index.close()
+            await self._client.close()
+            self._index = None
+            self._client = None
+
+    def _connect(self) -> object:
+        """Open the client and index sessions on first use (inside the event loop)."""
+        if self._index is None:
+            self._client = PineconeAsyncio(api_key=self._api_key)
+            self._index = self._client.IndexAsyncio(host=self._host)
+        return self._index
+
+
+class InMemoryVectorIndex:
+    """Local vector index with the same search interface as PineconeIndex.
+
+    Documents are embedded with the hashed n-gram embeddings of
+    SubFocoDeduplicator (or ``embedder``) and searched by cosine similarity.
+    Filters support equality (``{"periodo": "3º ano"}``), ``$eq`` and ``$in``.
+
+    Args:
+        documents: Initial (document, metadata) pairs
+        embedder: Maps texts to an (n, dim) array of L2-normalized embeddings
+        latency: Simulated seconds per search (0 = none)
+
+    Example:
+        >>> index = InMemoryVectorIndex()
+        >>> index.add(RagDocument(texto="Critérios de Framingham...", titulo="Braunwald"),
+        ...           {"periodo": "3º ano"})
+        >>> client = PineconeClient(config, index=index)
+    """
+
+    def __init__(
+        self,
+        documents: Iterable[tuple[RagDocument, Mapping[str, object]]] = (),
+        embedder: Callable[[list[str]], np.ndarray] | None = None,
+        latency: float = 0.0,
+    ) -> None:
+        if embedder is None:
+            # Imported here: the agents package imports construtor.io
+            from construtor.agents.subfoco_dedup import embed_texts
+
+            embedder = embed_texts
+        self._embedder = embedder
+        self._latency = latency
+        self._documents: list[RagDocument] = []
+        self._metadata: list[Mapping[str, object]] = []
+        self._vectors: np.ndarray | None = None
+        self.searches = 0
+        for document, metadata in documents:
+            self.add(document, metadata)
+
+    def add(self, document: RagDocument, metadata: Mapping[str, object] | None = None) -> None:
+        """Index a document (its título and texto are embedded).
+
+        Args:
+            document: Document to index
+            metadata: Filterable metadata (e.g. ``periodo``)
+        """
+        self._documents.append(document)
+        self._metadata.append(dict(metadata or {}))
+        self._vectors = None
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    async def search(
+        self,
+        text: str,
+        top_k: int,
+        metadata_filter: MetadataFilter | None = None,
+    ) -> list[RagDocument]:
+        """Return the ``top_k`` matching documents by cosine similarity."""
+        self.searches += 1
+        if self._latency:
+            await asyncio.sleep(self._latency)
+        if not self._documents:
+            return []
+        if self._vectors is None:
+            self._vectors = self._embedder([f"{doc.titulo} {doc.texto}" for doc in self._documents])
+
+        scores = self._vectors @ self._embedder([text])[0]
+        candidates = [
+            i
+            for i in np.argsort(-scores, kind="stable")
+            if matches_filter(self._metadata[i], metadata_filter)
+        ]
+        return [
+            self._documents[i].model_copy(update={"score": float(scores[i])})
+            for i in candidates[:top_k]
+        ]
+
+    async def iter_documents(
+        self,
+    ) -> AsyncIterator[list[tuple[RagDocument, Mapping[str, object]]]]:
+        """Yield every (document, metadata) pair, as one page."""
+        yield list(zip(self._documents, self._metadata, strict=True))
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+class PineconeClient:
+    """RAG client querying curated documents by tema, foco and periodo.
+
+    Args:
+        config: Pipeline configuration (Pinecone key, host, top K, timeout)
+        index: Vector index to query (default: PineconeIndex from ``config``)
+        max_concurrency: Maximum concurrent queries of a batch
+        filter_by_periodo: Restrict results to documents of the question's
+            periodo (``metadata.periodo``)
+        namespace: Pinecone namespace (ignored when ``index`` is given)
+        cache: Cache of query results, consulted before the index
+        fallback: Index serving the queries that fail or exceed the timeout,
+            typically the local replica (``LocalVectorIndex``), instead of
+            falling back to no RAG
+
+    Raises:
+        ConfigurationError: If no index is given and the pinecone SDK is missing
+
+    Example:
+        >>> async with PineconeClient(config) as client:
+        ...     contexts = await client.query_many(sub_focos)  # one per sub-foco
+        >>> replica = LocalVectorIndex("data/rag_replica")
+        >>> client = PineconeClient(config, fallback=replica)  # Pinecone, replica if slow
+        >>> client = PineconeClient(config, index=replica)  # local runs, no network
+    """
+
+    def __init__(
+        self,
+        config: PipelineConfig,
+        index: VectorIndex | None = None,
+        max_concurrency: int = 16,
+        filter_by_periodo: bool = True,
+        namespace: str = _DEFAULT_NAMESPACE,
+        cache: RagCache | None = None,
+        fallback: VectorIndex | None = None,
+    ) -> None:
+        if max_concurrency <= 0:
+            msg = f"max_concurrency must be positive, got {max_concurrency}"
+            raise ValueError(msg)
+
+        self._index = index or PineconeIndex(
+            config.pinecone_api_key, config.pinecone_index_host, namespace=namespace
+        )
+        self._top_k = config.pinecone_top_k
+        self._timeout = config.pinecone_timeout
+        self._filter_by_periodo = filter_by_periodo
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._cache = cache
+        self._fallback = fallback
+        self._cache_hits = 0
+        self._fallbacks = 0
+        self._queries = 0
+        self._failures = 0
+        self._documents = 0
+        self._latency = 0.0
+
+    async def __aenter__(self) -> "PineconeClient":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying index connections."""
+        await self._index.close()
+        if self._fallback is not None:
+            await self._fallback.close()
+
+    async def query(self, tema: str, foco: str, periodo: str | None = None) -> RagQueryResult:
+        """Retrieve the top K documents for a tema/foco.
+
+        Args:
+            tema: Tema of the question
+            foco: Foco of the question
+            periodo: Periodo to filter by (None = no filter)
+
+        Returns:
+            RagQueryResult with the documents and the query latency (of the
+            original query, for a cached result)
+
+        Raises:
+            PineconeError: If the query times out or fails and there is no
+                fallback index (fall back to no RAG)
+        """
+        text = f"{tema} {foco}"
+        cached = self._cached(tema, foco, periodo)
+        if cached is not None:
+            return cached
+        try:
+            return await asyncio.wait_for(self._search(tema, foco, periodo), timeout=self._timeout)
+        except TimeoutError as e:
+            self._failures += 1
+            if self._fallback is not None:
+                return await self._search_fallback(text, foco, periodo)
+            msg = f"Pinecone query timeout after {self._timeout}s | tema={tema}"
+            raise PineconeError(msg, foco=foco) from e
+        except PineconeError:
+            if self._fallback is not None:
+                return await self._search_fallback(text, foco, periodo)
+            raise
+
+    async def query_many(self, focos: Sequence[FocoInput]) -> list[RagQueryResult | None]:
+        """Retrieve the RAG context of many questions in one batch.
+
+        Inputs with the same tema/foco/periodo (e.g. the sub-focos of a foco)
+        share one query. The whole batch is bounded by the configured timeout;
+        a query that fails or is still running is then served by the fallback
+        index, or yields None for its inputs, which are generated without
+        RAG. Cached queries are not sent.
+
+        Args:
+            focos: Foco or sub-foco inputs, one per question
+
+        Returns:
+            One result (or None on failure) per input, in input order
+        """
+        keys = [
+            (foco.tema, foco.foco, foco.periodo if self._filter_by_periodo else None)
+            for foco in focos
+        ]
+        unique = list(dict.fromkeys(keys))
+        if not unique:
+            return []
+
+        results: dict[tuple[str, str, str | None], RagQueryResult | None] = {}
+        for key in unique:
+            tema, foco, periodo = key
+            cached = self._cached(tema, foco, periodo)
+            if cached is not None:
+                results[key] = cached
+
+        tasks = {
+            key: asyncio.create_task(self._bounded_search(*key))
+            for key in unique
+            if key not in results
+        }
+        pending: set[asyncio.Task[RagQueryResult]] = set()
+        if tasks:
+            _, pending = await asyncio.wait(tasks.values(), timeout=self._timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        for key, task in tasks.items():
+            tema, foco, periodo = key
+            if task in pending:
+                self._failures += 1
+                reason = f"Pinecone query timeout after {self._timeout}s"
+            elif task.exception() is not None:
+                reason = str(task.exception())
+            else:
+                results[key] = task.result()
+                continue
+
+            results[key] = None
+            if self._fallback is not None:
+                try:
+                    results[key] = await self._search_fallback(f"{tema} {foco}", foco, periodo)
+                except PineconeError as e:
+                    reason = str(e)
+            if results[key] is None:
+                logger.warning(f"{reason}, continuing without RAG | tema={tema} | foco={foco}")
+
+        logger.info(
+            f"RAG batch: {len(focos)} questions, {len(unique)} queries "
+            f"({len(unique) - len(tasks)} cached), "
+            f"{sum(result is None for result in results.values())} failed"
+        )
+        return [results[key] for key in keys]
+
+    def get_statistics(self) -> dict[str, int | float]:
+        """Get query statistics.
+
+        Returns:
+            Dict with cache_hits, queries (sent to the index), failures,
+            fallbacks (queries served by the fallback index), documents and
+            avg_latency (seconds per successful query to the index)
+        """
+        succeeded = self._queries - self._failures
+        return {
+            "cache_hits": self._cache_hits,
+            "fallbacks": self._fallbacks,
+            "queries": self._queries,
+            "failures": self._failures,
+            "documents": self._documents,
+            "avg_latency": round(self._latency / succeeded, 4) if succeeded > 0 else 0.0,
+        }
+
+    def _metadata_filter(self, periodo: str | None) -> MetadataFilter | None:
+        return {"periodo": {"$eq": periodo}} if periodo and self._filter_by_periodo else None
+
+    def _cached(self, tema: str, foco: str, periodo: str | None) -> RagQueryResult | None:
+        """Look a query up in the cache, if any (near matches only within the tema)."""
+        if self._cache is None:
+            return None
+        result = self._cache.get(foco, self._metadata_filter(periodo), scope=tema)
+        if result is not None:
+            self._cache_hits += 1
+        return result
+
+    async def _bounded_search(self, tema: str, foco: str, periodo: str | None) -> RagQueryResult:
+        async with self._semaphore:
+            return await self._search(tema, foco, periodo)
+
+    async def _search(self, tema: str, foco: str, periodo: str | None) -> RagQueryResult:
+        """Run one query, converting index failures to PineconeError."""
+        text = f"{tema} {foco}"
+        self._queries += 1
+        metadata_filter = self._metadata_filter(periodo)
+        start = time.monotonic()
+        try:
+            documents = await self._index.search(text, self._top_k, metadata_filter)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._failures += 1
+            msg = f"Pinecone query failed: {e}"
+            raise PineconeError(msg, foco=foco) from e
+        latency = time.monotonic() - start
+
+        self._documents += len(documents)
+        self._latency += latency
+        logger.info(
+            f"RAG query | query={text} | periodo={periodo} | docs={len(documents)} "
+            f"| latency={latency:.3f}s"
+        )
+        result = RagQueryResult(documentos=documents, query=text, latencia=latency)
+        if self._cache is not None:
+            self._cache.put(foco, metadata_filter, result, scope=tema)
+        return result
+
+    async def _search_fallback(self, text: str, foco: str, periodo: str | None) -> RagQueryResult:
+        """Serve a failed query from the fallback index (never cached).
+
+        Raises:
+            PineconeError: If the fallback index fails too
+        """
+        start = time.monotonic()
+        try:
+            documents = await self._fallback.search(
+                text, self._top_k, self._metadata_filter(periodo)
+            )
+        except Exception as e:
+            msg = f"Fallback index query failed: {e}"
+            raise PineconeError(msg, foco=foco) from e
+        latency = time.monotonic() - start
+
+        self._fallbacks += 1
+        logger.warning(
+            f"RAG query served by the fallback index | query={text} | periodo={periodo} "
+            f"| docs={len(documents)} | latency={latency:.3f}s"
+        )
+        return RagQueryResult(documentos=documents, query=text, latencia=latency)
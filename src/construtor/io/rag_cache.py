@@ -0,0 +1,358 @@
+"""Two-level cache of RAG query results.
+
+Questions of one foco query the curated index with the same tema + foco
+text, and reruns query it again for every foco. RagCache keeps
+RagQueryResult entries in an in-memory LRU backed by a SQLite file, keyed
+by the metadata filter, a scope (the tema, for PineconeClient) and the query
+text with only case and whitespace folded, so repeated queries skip Pinecone
+entirely.
+
+Reuse of near-identical queries is opt-in (``similarity_threshold``): a
+query with no exact entry can then reuse the result of the most similar one
+with the same filter and scope (e.g. "Insuficiência Cardíaca" /
+"Insuficiência Cardíaca Congestiva"). Only the query text is embedded, with
+the hashed n-gram embeddings of SubFocoDeduplicator, so a shared tema does
+not inflate the similarity; queries whose numbers or symbols differ
+("Diabetes tipo 1" / "tipo 2", "HER2+" / "HER2-") are never near-identical.
+
+Entries expire after ``ttl`` seconds and belong to an ``index_version``:
+when the curated index is re-ingested, a new version makes every older
+entry stale (they are purged when the cache is opened). The disk level is
+best-effort, like InputCache: its failures are logged, never raised.
+"""
+
+import json
+import logging
+import re
+import sqlite3
+import time
+import unicodedata
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from pathlib import Path
+
+import numpy as np
+from pydantic import ValidationError
+
+from construtor.models.rag import RagQueryResult
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600.0
+
+_EMBEDDING_DIM = 512
+
+# Separates the filter, scope and query text in keys (absent from all three)
+_KEY_SEPARATOR = "\n"
+
+# Numbers and symbols: queries that differ in them name different conditions
+_MARKERS = re.compile(r"\d+|[^\w\s]")
+
+
+def _filter_key(metadata_filter: Mapping[str, object] | None) -> str:
+    """Canonical JSON of a metadata filter ("" for no filter)."""
+    if not metadata_filter:
+        return ""
+    return json.dumps(metadata_filter, sort_keys=True, ensure_ascii=False)
+
+
+def _fold(text: str) -> str:
+    """Fold case and whitespace only; accents, digits and symbols are kept."""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def _markers(text: str) -> tuple[str, ...]:
+    return tuple(sorted(_MARKERS.findall(text)))
+
+
+class RagCache:
+    """In-memory LRU plus on-disk cache of RagQueryResult.
+
+    Args:
+        db_path: SQLite file of the disk level (None = memory only)
+        max_entries: Capacity of the in-memory LRU
+        ttl: Seconds an entry stays valid
+        similarity_threshold: Minimum cosine similarity for a near-identical
+            query of the same scope to reuse a cached result (None, the
+            default, = exact matches only)
+        index_version: Version of the curated index; entries of other
+            versions are stale
+        embedder: Maps texts to an (n, dim) array of L2-normalized
+            embeddings (default: hashed n-grams)
+        clock: Wall clock (seconds since the epoch; entries outlive the process)
+
+    Example:
+        >>> cache = RagCache("output/rag_cache.db", index_version="2026-10-01")
+        >>> client = PineconeClient(config, cache=cache)
+    """
+
+    def __init__(
+        self,
+        db_path: str | None = "output/rag_cache.db",
+        max_entries: int = 1024,
+        ttl: float = _DEFAULT_TTL_SECONDS,
+        similarity_threshold: float | None = None,
+        index_version: str = "",
+        embedder: Callable[[list[str]], np.ndarray] | None = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        if max_entries <= 0:
+            msg = f"max_entries must be positive, got {max_entries}"
+            raise ValueError(msg)
+        if ttl <= 0:
+            msg = f"ttl must be positive, got {ttl}"
+            raise ValueError(msg)
+        if similarity_threshold is not None and not 0.0 < similarity_threshold <= 1.0:
+            msg = f"similarity_threshold must be in (0, 1], got {similarity_threshold}"
+            raise ValueError(msg)
+
+        if embedder is None:
+            # Imported here: the agents package imports construtor.io
+            from construtor.agents.subfoco_dedup import embed_texts
+
+            def embedder(texts: list[str]) -> np.ndarray:
+                return embed_texts(texts, dim=_EMBEDDING_DIM)
+
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._threshold = similarity_threshold
+        self._index_version = index_version
+        self._embedder = embedder
+        self._clock = clock
+        self._memory: OrderedDict[str, tuple[float, RagQueryResult]] = OrderedDict()
+        # Query embedding and markers of every live entry (memory and disk),
+        # per filter and scope
+        self._vectors: dict[str, dict[str, tuple[np.ndarray, tuple[str, ...]]]] = {}
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "similar_hits": 0, "misses": 0}
+        self._conn = self._open(db_path) if db_path is not None else None
+
+    def get(
+        self,
+        query: str,
+        metadata_filter: Mapping[str, object] | None = None,
+        scope: str = "",
+    ) -> RagQueryResult | None:
+        """Look up the result of a query, exact or near-identical.
+
+        Args:
+            query: Query text (case and whitespace are folded)
+            metadata_filter: Filter the query was run with
+            scope: Context the query text is compared within (e.g. the tema)
+
+        Returns:
+            The cached result, or None on a miss
+        """
+        group = self._group(metadata_filter, scope)
+        text = _fold(query)
+        key = f"{group}{_KEY_SEPARATOR}{text}"
+
+        result, level = self._get_exact(key)
+        if result is None and self._threshold is not None:
+            similar = self._most_similar(group, text)
+            if similar is not None:
+                result, _ = self._get_exact(similar)
+                level = "similar"
+                if result is not None:
+                    cached_query = similar.rpartition(_KEY_SEPARATOR)[2]
+                    logger.debug(f"RAG cache: '{query}' reuses the result of '{cached_query}'")
+
+        if result is None:
+            self._stats["misses"] += 1
+            return None
+        self._stats[f"{level}_hits"] += 1
+        return result
+
+    def put(
+        self,
+        query: str,
+        metadata_filter: Mapping[str, object] | None,
+        result: RagQueryResult,
+        scope: str = "",
+    ) -> None:
+        """Store a query's result in both levels.
+
+        Args:
+            query: Query text
+            metadata_filter: Filter the query was run with
+            result: Result to cache
+            scope: Context the query text is compared within (e.g. the tema)
+        """
+        filter_key = _filter_key(metadata_filter)
+        group = self._group(metadata_filter, scope)
+        text = _fold(query)
+        key = f"{group}{_KEY_SEPARATOR}{text}"
+        stored_at = self._clock()
+
+        self._remember(key, stored_at, result)
+        if self._threshold is not None:
+            self._vectors.setdefault(group, {})[key] = (self._embedder([text])[0], _markers(text))
+
+        if self._conn is not None:
+            try:
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO rag_cache "
+                        "(key, filter, query, index_version, stored_at, result) "
+                        "VALUES (?, ?, ?, ?, ?, ?)",
+                        (
+                            key,
+                            filter_key,
+                            text,
+                            self._index_version,
+                            stored_at,
+                            result.model_dump_json(),
+                        ),
+                    )
+            except sqlite3.Error:
+                logger.warning("Could not write RAG cache entry", exc_info=True)
+
+    def invalidate(self) -> None:
+        """Drop every entry (e.g. after the curated index changed)."""
+        self._memory.clear()
+        self._vectors.clear()
+        if self._conn is not None:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM rag_cache")
+            except sqlite3.Error:
+                logger.warning("Could not clear RAG cache", exc_info=True)
+        logger.info("RAG cache invalidated")
+
+    def get_statistics(self) -> dict[str, int | float]:
+        """Get cache statistics.
+
+        Returns:
+            Dict with memory_hits, disk_hits, similar_hits, misses, hit_rate
+            and memory_entries
+        """
+        lookups = sum(self._stats.values())
+        hits = lookups - self._stats["misses"]
+        return {
+            **self._stats,
+            "hit_rate": round(hits / lookups, 4) if lookups > 0 else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self) -> None:
+        """Close the disk level."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def __enter__(self) -> "RagCache":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _open(self, db_path: str) -> sqlite3.Connection | None:
+        """Open the disk level, purge stale entries and index the live ones."""
+        try:
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(db_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            with conn:
+                conn.execute("""
+                    CREATE TABLE IF NOT EXISTS rag_cache (
+                        key TEXT PRIMARY KEY,
+                        filter TEXT NOT NULL,
+                        query TEXT NOT NULL,
+                        index_version TEXT NOT NULL,
+                        stored_at REAL NOT NULL,
+                        result TEXT NOT NULL
+                    )
+                """)
+                purged = conn.execute(
+                    "DELETE FROM rag_cache WHERE index_version != ? OR stored_at < ?",
+                    (self._index_version, self._clock() - self._ttl),
+                ).rowcount
+            rows = conn.execute("SELECT key, query FROM rag_cache").fetchall()
+        except (OSError, sqlite3.Error):
+            logger.warning(f"RAG cache disabled on disk: cannot open {db_path}", exc_info=True)
+            return None
+
+        if self._threshold is not None and rows:
+            vectors = self._embedder([query for _, query in rows])
+            for (key, query), vector in zip(rows, vectors, strict=True):
+                group = key.rpartition(_KEY_SEPARATOR)[0]
+                self._vectors.setdefault(group, {})[key] = (vector, _markers(query))
+        logger.info(f"RAG cache opened: {len(rows)} entries ({purged} stale purged) in {db_path}")
+        return conn
+
+    def _get_exact(self, key: str) -> tuple[RagQueryResult | None, str]:
+        """Look up a key in memory, then on disk (promoting disk hits)."""
+        now = self._clock()
+        entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, result = entry
+            if now - stored_at < self._ttl:
+                self._memory.move_to_end(key)
+                return result, "memory"
+            self._forget(key)
+            return None, "memory"
+
+        if self._conn is None:
+            return None, "disk"
+        try:
+            row = self._conn.execute(
+                "SELECT stored_at, result FROM rag_cache WHERE key = ? AND index_version = ?",
+                (key, self._index_version),
+            ).fetchone()
+        except sqlite3.Error:
+            logger.warning("Could not read RAG cache", exc_info=True)
+            return None, "disk"
+        if row is None:
+            return None, "disk"
+
+        stored_at, payload = row
+        if now - stored_at >= self._ttl:
+            self._forget(key)
+            return None, "disk"
+        try:
+            result = RagQueryResult.model_validate_json(payload)
+        except ValidationError:
+            logger.warning(f"Ignoring corrupted RAG cache entry: {key}")
+            self._forget(key)
+            return None, "disk"
+        self._remember(key, stored_at, result)
+        return result, "disk"
+
+    @staticmethod
+    def _group(metadata_filter: Mapping[str, object] | None, scope: str) -> str:
+        """Key prefix of the entries a query may be near-identical to."""
+        return f"{_filter_key(metadata_filter)}{_KEY_SEPARATOR}{_fold(scope)}"
+
+    def _most_similar(self, group: str, text: str) -> str | None:
+        """Return the key of the most similar live query of the same group.
+
+        Only queries with exactly the same numbers and symbols are candidates.
+        """
+        candidates = self._vectors.get(group, {})
+        markers = _markers(text)
+        keys = [key for key, (_, key_markers) in candidates.items() if key_markers == markers]
+        if not keys:
+            return None
+        similarities = np.stack([candidates[key][0] for key in keys]) @ self._embedder([text])[0]
+        best = int(np.argmax(similarities))
+        return keys[best] if similarities[best] >= self._threshold else None
+
+    def _remember(self, key: str, stored_at: float, result: RagQueryResult) -> None:
+        """Insert into the LRU, evicting the least recently used entry."""
+        self._memory[key] = (stored_at, result)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self._max_entries:
+            evicted, _ = self._memory.popitem(last=False)
+            if self._conn is None:
+                # Only memory held it: it is gone for similarity lookups too
+                self._vectors.get(evicted.rpartition(_KEY_SEPARATOR)[0], {}).pop(evicted, None)
+
+    def _forget(self, key: str) -> None:
+        """Remove an expired or corrupted entry from both levels."""
+        self._memory.pop(key, None)
+        self._vectors.get(key.rpartition(_KEY_SEPARATOR)[0], {}).pop(key, None)
+        if self._conn is not None:
+            try:
+                with self._conn:
+                    self._conn.execute("DELETE FROM rag_cache WHERE key = ?", (key,))
+            except sqlite3.Error:
+                logger.warning("Could not delete RAG cache entry", exc_info=True)
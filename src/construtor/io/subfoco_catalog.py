@@ -0,0 +1,100 @@
+"""Import and export of the sub-foco catalogue as JSON Lines.
+
+The catalogue (the ``sub_focos`` table of the MetricsStore) lets later runs
+reuse the sub-focos of a tema/foco/periodo instead of expanding it again,
+e.g. to compare models on the same sub-focos. Exporting it makes it
+portable between databases, and importing a hand-written file provides the
+manual sub-focos of FR3.
+
+Each line is one object with ``tema``, ``foco``, ``periodo``, ``sub_foco``
+and, optionally, ``prompt_version`` (lines without one are manual).
+"""
+
+import json
+import logging
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from construtor.config.exceptions import OutputParsingError
+from construtor.metrics.store import MetricsStore
+from construtor.models import SubFocoInput
+
+logger = logging.getLogger(__name__)
+
+MANUAL_PROMPT_VERSION = "manual"
+"""Prompt version of sub-focos written by hand; they take precedence when loaded."""
+
+
+def export_sub_foco_catalog(store: MetricsStore, file_path: str) -> int:
+    """Write the whole sub-foco catalogue to a JSON Lines file.
+
+    Args:
+        store: MetricsStore holding the catalogue
+        file_path: Destination path (overwritten)
+
+    Returns:
+        Number of sub-focos written
+
+    Example:
+        >>> export_sub_foco_catalog(store, "output/sub_focos.jsonl")
+        7500
+    """
+    catalog = store.get_sub_foco_catalog()
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as f:
+        for prompt_version, sub_foco in catalog:
+            record = {**sub_foco.model_dump(), "prompt_version": prompt_version}
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    logger.info(f"Exported {len(catalog)} sub-focos to {file_path}")
+    return len(catalog)
+
+
+def import_sub_foco_catalog(
+    store: MetricsStore,
+    file_path: str,
+    prompt_version: str | None = None,
+) -> int:
+    """Load a JSON Lines file into the sub-foco catalogue.
+
+    Each (tema, foco, periodo, prompt_version) in the file replaces the
+    catalogue's entry for it; the file is validated before anything is
+    written.
+
+    Args:
+        store: MetricsStore holding the catalogue
+        file_path: JSON Lines file (e.g. from ``export_sub_foco_catalog``)
+        prompt_version: Prompt version for every line, overriding the file's
+            (lines without one are imported as manual)
+
+    Returns:
+        Number of sub-focos imported
+
+    Raises:
+        OutputParsingError: If a line is not valid JSON or not a valid sub-foco
+
+    Example:
+        >>> import_sub_foco_catalog(store, "data/sub_focos_manuais.jsonl")
+        120
+    """
+    by_version: dict[str, list[SubFocoInput]] = {}
+    with open(file_path, encoding="utf-8-sig") as f:
+        for line_num, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                version = prompt_version or record.pop("prompt_version", MANUAL_PROMPT_VERSION)
+                record.pop("prompt_version", None)
+                sub_foco = SubFocoInput(**record)
+            except (json.JSONDecodeError, TypeError, AttributeError, ValidationError) as e:
+                msg = f"Invalid sub-foco at line {line_num} in {file_path}: {e}"
+                logger.exception(msg)
+                raise OutputParsingError(msg) from e
+            by_version.setdefault(version, []).append(sub_foco)
+
+    imported = sum(store.save_sub_focos(version, items) for version, items in by_version.items())
+    logger.info(f"Imported {imported} sub-focos from {file_path}")
+    return imported
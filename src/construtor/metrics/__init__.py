@@ -1,5 +1,6 @@
 """Metrics and persistence module for pipeline state management."""
 
+from .question_index import QuestionIndex, QuestionMatch
 from .store import MetricsStore
 
-__all__ = ["MetricsStore"]
+__all__ = ["MetricsStore", "QuestionIndex", "QuestionMatch"]
@@ -0,0 +1,282 @@
+"""Cross-run near-duplicate index over the questions table.
+
+QuestionIndex stores a MinHash signature of every indexed question (its
+enunciado plus the four alternatives) and the LSH band buckets of that
+signature in the MetricsStore database. A new CriadorOutput is checked
+against every question of every earlier run with one indexed lookup per
+band (sub-millisecond for tens of thousands of questions), before any
+Comentador/Validador call is spent on it.
+
+Shingles are word 3-grams of the normalized text of each field, so accents,
+case, punctuation and the order of the alternatives do not matter. With 128
+permutations in 32 bands of 4 rows, pairs with a Jaccard similarity of 0.8
+are found with probability ~1.0 and pairs below 0.3 are rarely candidates;
+candidates are then confirmed with the full signature estimate.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import zlib
+from collections.abc import Iterable
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from construtor.config.exceptions import PipelineError
+from construtor.io.foco_index import normalize_text
+from construtor.metrics.store import MetricsStore
+from construtor.models import CriadorOutput, QuestionRecord
+
+logger = logging.getLogger(__name__)
+
+_NUM_PERM = 128
+_BANDS = 32
+_ROWS = _NUM_PERM // _BANDS
+_SHINGLE_SIZE = 3
+_QUESTION_FIELDS = ("enunciado", "alternativa_a", "alternativa_b", "alternativa_c", "alternativa_d")
+
+# Fixed seed: signatures are persisted and must be comparable across runs
+_rng = np.random.default_rng(0x5EED)
+_A = _rng.integers(1, 2**63, size=_NUM_PERM, dtype=np.uint64) | np.uint64(1)
+_B = _rng.integers(0, 2**63, size=_NUM_PERM, dtype=np.uint64)
+
+
+class QuestionMatch(BaseModel):
+    """An indexed question similar to the one being checked.
+
+    Attributes:
+        question_id: ID of the indexed question in the questions table
+        similarity: Estimated Jaccard similarity of the shingle sets (0-1)
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    question_id: int
+    similarity: float
+
+
+def question_shingles(question: CriadorOutput | QuestionRecord) -> set[int]:
+    """Hashed word 3-gram shingles of the enunciado and the alternatives.
+
+    Args:
+        question: Question to shingle
+
+    Returns:
+        Set of 32-bit shingle hashes (short fields contribute their whole text)
+    """
+    return _shingles(getattr(question, field) for field in _QUESTION_FIELDS)
+
+
+def _shingles(fields: Iterable[str]) -> set[int]:
+    """Hashed word 3-grams of each field, shingled separately."""
+    shingles: set[int] = set()
+    for field in fields:
+        words = normalize_text(field).split()
+        if not words:
+            continue
+        for i in range(max(1, len(words) - _SHINGLE_SIZE + 1)):
+            shingle = " ".join(words[i : i + _SHINGLE_SIZE])
+            shingles.add(zlib.crc32(shingle.encode("utf-8")))
+    return shingles
+
+
+def minhash_signature(shingles: set[int]) -> np.ndarray:
+    """MinHash signature of a shingle set (multiply-shift hashing).
+
+    Args:
+        shingles: 32-bit shingle hashes
+
+    Returns:
+        uint32 array of length 128 (all 0xFFFFFFFF for an empty set)
+    """
+    if not shingles:
+        return np.full(_NUM_PERM, np.iinfo(np.uint32).max, dtype=np.uint32)
+    values = np.fromiter(shingles, dtype=np.uint64, count=len(shingles))
+    with np.errstate(over="ignore"):
+        hashed = (values[:, None] * _A[None, :] + _B[None, :]) >> np.uint64(32)
+    return hashed.min(axis=0).astype(np.uint32)
+
+
+def _band_buckets(signature: np.ndarray) -> list[tuple[int, int]]:
+    """(band, bucket) pairs of a signature; buckets are signed 64-bit hashes."""
+    return [
+        (
+            band,
+            int.from_bytes(
+                hashlib.blake2b(
+                    signature[band * _ROWS : (band + 1) * _ROWS].tobytes(), digest_size=8
+                ).digest(),
+                "big",
+                signed=True,
+            ),
+        )
+        for band in range(_BANDS)
+    ]
+
+
+class QuestionIndex:
+    """MinHash/LSH index of questions persisted next to the questions table.
+
+    Args:
+        store: MetricsStore holding the questions table
+        threshold: Estimated Jaccard similarity at or above which a question
+            is a duplicate
+
+    Raises:
+        ValueError: If threshold is not in (0, 1]
+
+    Example:
+        >>> index = QuestionIndex(store)
+        >>> index.sync()  # approved questions of earlier runs
+        >>> match = index.check(criador_output)
+        >>> if match is None:
+        ...     question_id = store.save_question(record)
+        ...     index.add(question_id, record)
+    """
+
+    def __init__(self, store: MetricsStore, threshold: float = 0.8) -> None:
+        if not 0.0 < threshold <= 1.0:
+            msg = f"threshold must be in (0, 1], got {threshold}"
+            raise ValueError(msg)
+
+        self._conn = store.conn
+        self._threshold = threshold
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS question_minhash (
+                question_id INTEGER PRIMARY KEY
+                    REFERENCES questions(id) ON DELETE CASCADE,
+                signature BLOB NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS question_lsh (
+                band INTEGER NOT NULL,
+                bucket INTEGER NOT NULL,
+                question_id INTEGER NOT NULL
+                    REFERENCES question_minhash(question_id) ON DELETE CASCADE,
+                PRIMARY KEY (band, bucket, question_id)
+            ) WITHOUT ROWID
+        """)
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_question_lsh_question_id ON question_lsh(question_id)"
+        )
+        self._conn.commit()
+
+    def add(self, question_id: int, question: CriadorOutput | QuestionRecord) -> None:
+        """Index a saved question (re-indexing an id replaces its signature).
+
+        Args:
+            question_id: ID of the question in the questions table
+            question: The question's content
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        signature = minhash_signature(question_shingles(question))
+        try:
+            self._conn.execute("DELETE FROM question_minhash WHERE question_id = ?", (question_id,))
+            self._insert(question_id, signature)
+            self._conn.commit()
+
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            logger.error(f"Failed to index question {question_id}: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+    def sync(self, status: str = "approved") -> int:
+        """Index every question with ``status`` that is not indexed yet.
+
+        Args:
+            status: Question status to index (approved questions by default)
+
+        Returns:
+            Number of questions indexed
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        rows = self._conn.execute(
+            """
+            SELECT q.id, q.enunciado, q.alternativa_a, q.alternativa_b,
+                q.alternativa_c, q.alternativa_d
+            FROM questions q
+            LEFT JOIN question_minhash m ON m.question_id = q.id
+            WHERE q.status = ? AND m.question_id IS NULL
+        """,
+            (status,),
+        ).fetchall()
+        try:
+            for row in rows:
+                shingles = _shingles(row[field] for field in _QUESTION_FIELDS)
+                self._insert(row["id"], minhash_signature(shingles))
+            self._conn.commit()
+
+        except sqlite3.Error as e:
+            self._conn.rollback()
+            logger.error(f"Failed to sync question index: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+        if rows:
+            logger.info(f"Indexed {len(rows)} {status} questions for duplicate detection")
+        return len(rows)
+
+    def find(self, question: CriadorOutput | QuestionRecord) -> list[QuestionMatch]:
+        """Find indexed questions similar to ``question``.
+
+        Args:
+            question: Question to check
+
+        Returns:
+            Matches at or above the threshold, most similar first
+        """
+        signature = minhash_signature(question_shingles(question))
+        buckets = _band_buckets(signature)
+        placeholders = ", ".join("(?, ?)" for _ in buckets)
+        rows = self._conn.execute(
+            f"""
+            SELECT m.question_id, m.signature
+            FROM question_minhash m
+            WHERE m.question_id IN (
+                SELECT question_id FROM question_lsh
+                WHERE (band, bucket) IN (VALUES {placeholders})
+            )
+        """,
+            [value for pair in buckets for value in pair],
+        ).fetchall()
+
+        matches = []
+        for row in rows:
+            candidate = np.frombuffer(row["signature"], dtype=np.uint32)
+            similarity = float(np.mean(candidate == signature))
+            if similarity >= self._threshold:
+                matches.append(QuestionMatch(question_id=row["question_id"], similarity=similarity))
+        return sorted(matches, key=lambda match: (-match.similarity, match.question_id))
+
+    def check(self, question: CriadorOutput | QuestionRecord) -> QuestionMatch | None:
+        """Return the most similar indexed question, or None if ``question`` is new.
+
+        Args:
+            question: Question to check
+
+        Returns:
+            Best match at or above the threshold, or None
+        """
+        matches = self.find(question)
+        return matches[0] if matches else None
+
+    def count(self) -> int:
+        """Number of indexed questions."""
+        return self._conn.execute("SELECT COUNT(*) FROM question_minhash").fetchone()[0]
+
+    def _insert(self, question_id: int, signature: np.ndarray) -> None:
+        """Insert a signature and its band buckets (no commit)."""
+        self._conn.execute(
+            "INSERT INTO question_minhash (question_id, signature) VALUES (?, ?)",
+            (question_id, signature.tobytes()),
+        )
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO question_lsh (band, bucket, question_id) VALUES (?, ?, ?)",
+            [(band, bucket, question_id) for band, bucket in _band_buckets(signature)],
+        )
@@ -1,20 +1,34 @@
 """SQLite persistence layer for pipeline state and metrics.
 
 This module provides the MetricsStore class for persisting question records,
-metrics, checkpoints, and batch state to a SQLite database with WAL mode
-for non-blocking concurrent reads during writes.
+metrics, checkpoints, batch state, the work-item run ledger and the sub-foco
+catalogue to a SQLite
+database with WAL mode for non-blocking concurrent reads during writes.
 """
 
+import hashlib
 import json
 import logging
 import sqlite3
+import time
 from pathlib import Path
 
 from construtor.config.exceptions import PipelineError
-from construtor.models import BatchState, CheckpointResult, QuestionMetrics, QuestionRecord
+from construtor.models import (
+    BatchState,
+    CheckpointResult,
+    FocoInput,
+    QuestionMetrics,
+    QuestionRecord,
+    SubFocoInput,
+    WorkItem,
+    WorkResult,
+)
 
 logger = logging.getLogger(__name__)
 
+_JOURNAL_MODES = frozenset({"DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF"})
+
 
 class MetricsStore:
     """SQLite persistence layer for pipeline state and metrics.
@@ -33,22 +47,39 @@ class MetricsStore:
         >>> store.update_question_status(question_id, "approved")
     """
 
-    def __init__(self, db_path: str = "output/pipeline_state.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "output/pipeline_state.db",
+        timeout: float = 30.0,
+        journal_mode: str = "WAL",
+    ) -> None:
         """Initialize database connection and create tables.
 
         Args:
             db_path: Path to SQLite database file
+            timeout: Seconds to wait for a write lock held by another
+                connection (e.g. another worker process) before failing
+            journal_mode: SQLite journal mode. WAL needs shared memory and
+                does not work on network filesystems; use "DELETE" for a
+                database shared over NFS.
+
+        Raises:
+            ValueError: If journal_mode is not a SQLite journal mode
         """
+        if journal_mode.upper() not in _JOURNAL_MODES:
+            msg = f"journal_mode must be one of {sorted(_JOURNAL_MODES)}, got {journal_mode!r}"
+            raise ValueError(msg)
+
         # Create output directory if needed
         db_file = Path(db_path)
         db_file.parent.mkdir(parents=True, exist_ok=True)
 
         # Connect to database
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn = sqlite3.connect(db_path, check_same_thread=False, timeout=timeout)
         self.conn.row_factory = sqlite3.Row  # Dict-like access to rows
 
         # Enable critical PRAGMAs
-        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(f"PRAGMA journal_mode={journal_mode}")
         self.conn.execute("PRAGMA foreign_keys=ON")
         self.conn.execute("PRAGMA synchronous=NORMAL")
 
@@ -159,6 +190,59 @@ class MetricsStore:
             )
         """)
 
+        # Work-item ledger (one row per question to generate)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS work_items (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                tema TEXT NOT NULL,
+                foco TEXT NOT NULL,
+                periodo TEXT NOT NULL,
+                sub_foco TEXT NOT NULL,
+                nivel_dificuldade INTEGER NOT NULL CHECK(nivel_dificuldade IN (1, 2, 3)),
+                posicao_correta TEXT NOT NULL CHECK(posicao_correta IN ('A', 'B', 'C', 'D')),
+                status TEXT NOT NULL DEFAULT 'queued'
+                    CHECK(status IN ('queued', 'in_flight', 'done', 'failed')),
+                attempts INTEGER NOT NULL DEFAULT 0 CHECK(attempts >= 0),
+                lease_owner TEXT,
+                lease_expires_at REAL,
+                question_id INTEGER,
+                last_error TEXT,
+                shard_key INTEGER NOT NULL DEFAULT 0,
+                created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                updated_at TEXT,
+                UNIQUE(tema, foco, periodo, sub_foco, nivel_dificuldade, posicao_correta)
+            )
+        """)
+
+        # Work results merged from a queue backend, one row per work item
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS merged_results (
+                tema TEXT NOT NULL,
+                foco TEXT NOT NULL,
+                periodo TEXT NOT NULL,
+                sub_foco TEXT NOT NULL,
+                nivel_dificuldade INTEGER NOT NULL,
+                posicao_correta TEXT NOT NULL,
+                question_id INTEGER,
+                merged_at TEXT NOT NULL DEFAULT (datetime('now')),
+                PRIMARY KEY (tema, foco, periodo, sub_foco, nivel_dificuldade, posicao_correta)
+            )
+        """)
+
+        # Sub-foco catalogue (reused across runs instead of calling the LLM)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS sub_focos (
+                tema TEXT NOT NULL,
+                foco TEXT NOT NULL,
+                periodo TEXT NOT NULL,
+                prompt_version TEXT NOT NULL,
+                position INTEGER NOT NULL CHECK(position >= 0),
+                sub_foco TEXT NOT NULL,
+                created_at TEXT NOT NULL DEFAULT (datetime('now')),
+                PRIMARY KEY (tema, foco, periodo, prompt_version, position)
+            )
+        """)
+
         # Create indexes for frequent queries
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_questions_status ON questions(status)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_metrics_question_id ON metrics(question_id)")
@@ -166,6 +250,7 @@ class MetricsStore:
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_checkpoints_created_at ON checkpoints(created_at DESC)"
         )
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_work_items_status ON work_items(status, id)")
 
         self.conn.commit()
         logger.info("Database tables created successfully")
@@ -187,44 +272,7 @@ class MetricsStore:
             PipelineError: If database write fails
         """
         try:
-            cursor = self.conn.cursor()
-
-            # Convert Pydantic to dict
-            data = question.model_dump()
-
-            # Convert boolean to integer (SQLite doesn't have BOOLEAN)
-            data["concordancia_comentador"] = int(data["concordancia_comentador"])
-
-            # INSERT with all 26 fields using RETURNING clause
-            cursor.execute(
-                """
-                INSERT INTO questions (
-                    tema, foco, sub_foco, periodo, nivel_dificuldade,
-                    tipo_enunciado, enunciado, alternativa_a, alternativa_b,
-                    alternativa_c, alternativa_d, resposta_correta,
-                    objetivo_educacional, comentario_introducao,
-                    comentario_visao_especifica, comentario_alt_a,
-                    comentario_alt_b, comentario_alt_c, comentario_alt_d,
-                    comentario_visao_aprovado, referencia_bibliografica,
-                    suporte_imagem, fonte_imagem, modelo_llm,
-                    rodadas_validacao, concordancia_comentador
-                ) VALUES (
-                    :tema, :foco, :sub_foco, :periodo, :nivel_dificuldade,
-                    :tipo_enunciado, :enunciado, :alternativa_a, :alternativa_b,
-                    :alternativa_c, :alternativa_d, :resposta_correta,
-                    :objetivo_educacional, :comentario_introducao,
-                    :comentario_visao_especifica, :comentario_alt_a,
-                    :comentario_alt_b, :comentario_alt_c, :comentario_alt_d,
-                    :comentario_visao_aprovado, :referencia_bibliografica,
-                    :suporte_imagem, :fonte_imagem, :modelo_llm,
-                    :rodadas_validacao, :concordancia_comentador
-                )
-                RETURNING id
-            """,
-                data,
-            )
-
-            question_id = cursor.fetchone()[0]
+            question_id = self._insert_question(self.conn.cursor(), question)
             self.conn.commit()
 
             logger.info(f"Question {question_id} saved successfully")
@@ -235,6 +283,46 @@ class MetricsStore:
             logger.error(f"Failed to save question: {e}", exc_info=True)
             raise PipelineError(f"Database write failed: {e}") from e
 
+    @staticmethod
+    def _insert_question(cursor: sqlite3.Cursor, question: QuestionRecord) -> int:
+        """INSERT a question without committing; return its ID."""
+        # Convert Pydantic to dict
+        data = question.model_dump()
+
+        # Convert boolean to integer (SQLite doesn't have BOOLEAN)
+        data["concordancia_comentador"] = int(data["concordancia_comentador"])
+
+        # INSERT with all 26 fields using RETURNING clause
+        cursor.execute(
+            """
+            INSERT INTO questions (
+                tema, foco, sub_foco, periodo, nivel_dificuldade,
+                tipo_enunciado, enunciado, alternativa_a, alternativa_b,
+                alternativa_c, alternativa_d, resposta_correta,
+                objetivo_educacional, comentario_introducao,
+                comentario_visao_especifica, comentario_alt_a,
+                comentario_alt_b, comentario_alt_c, comentario_alt_d,
+                comentario_visao_aprovado, referencia_bibliografica,
+                suporte_imagem, fonte_imagem, modelo_llm,
+                rodadas_validacao, concordancia_comentador
+            ) VALUES (
+                :tema, :foco, :sub_foco, :periodo, :nivel_dificuldade,
+                :tipo_enunciado, :enunciado, :alternativa_a, :alternativa_b,
+                :alternativa_c, :alternativa_d, :resposta_correta,
+                :objetivo_educacional, :comentario_introducao,
+                :comentario_visao_especifica, :comentario_alt_a,
+                :comentario_alt_b, :comentario_alt_c, :comentario_alt_d,
+                :comentario_visao_aprovado, :referencia_bibliografica,
+                :suporte_imagem, :fonte_imagem, :modelo_llm,
+                :rodadas_validacao, :concordancia_comentador
+            )
+            RETURNING id
+        """,
+            data,
+        )
+
+        return cursor.fetchone()[0]
+
     def update_question_status(self, question_id: int, status: str) -> None:
         """Update question status.
 
@@ -339,25 +427,7 @@ class MetricsStore:
             PipelineError: If database write fails
         """
         try:
-            cursor = self.conn.cursor()
-            data = metrics.model_dump()
-
-            cursor.execute(
-                """
-                INSERT INTO metrics (
-                    question_id, modelo, tokens, custo, rodadas,
-                    tempo, decisao, timestamp
-                ) VALUES (
-                    :question_id, :modelo, :tokens, :custo, :rodadas,
-                    :tempo, :decisao, :timestamp
-                )
-            """,
-                {
-                    "question_id": question_id,
-                    **data,
-                },
-            )
-
+            self._insert_metrics(self.conn.cursor(), question_id, metrics)
             self.conn.commit()
             logger.info(f"Metrics saved for question {question_id}")
 
@@ -366,6 +436,25 @@ class MetricsStore:
             logger.error(f"Failed to save metrics: {e}", exc_info=True)
             raise PipelineError(f"Database write failed: {e}") from e
 
+    @staticmethod
+    def _insert_metrics(cursor: sqlite3.Cursor, question_id: int, metrics: QuestionMetrics) -> None:
+        """INSERT metrics without committing."""
+        cursor.execute(
+            """
+            INSERT INTO metrics (
+                question_id, modelo, tokens, custo, rodadas,
+                tempo, decisao, timestamp
+            ) VALUES (
+                :question_id, :modelo, :tokens, :custo, :rodadas,
+                :tempo, :decisao, :timestamp
+            )
+        """,
+            {
+                "question_id": question_id,
+                **metrics.model_dump(),
+            },
+        )
+
     def get_metrics_by_question_id(self, question_id: int) -> QuestionMetrics | None:
         """Get metrics for a question.
 
@@ -624,6 +713,527 @@ class MetricsStore:
             "D": row["position_d"],
         }
 
+    # ========================================================================
+    # Work-Item Ledger Operations
+    # ========================================================================
+
+    def enqueue_work_items(self, items: list[WorkItem]) -> int:
+        """Add work items to the ledger as queued (idempotent).
+
+        Items already in the ledger (same tema, foco, periodo, sub_foco,
+        nivel_dificuldade and posicao_correta) are left untouched, whatever
+        their status, so re-enqueueing a whole run after a crash only adds
+        what is missing.
+
+        Args:
+            items: Work items to add (id, status and lease fields are ignored)
+
+        Returns:
+            Number of items actually inserted
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        try:
+            cursor = self.conn.cursor()
+            before = self.conn.total_changes
+            cursor.executemany(
+                """
+                INSERT OR IGNORE INTO work_items (
+                    tema, foco, periodo, sub_foco, nivel_dificuldade, posicao_correta, shard_key
+                ) VALUES (
+                    :tema, :foco, :periodo, :sub_foco, :nivel_dificuldade, :posicao_correta,
+                    :shard_key
+                )
+            """,
+                [{**item.model_dump(), "shard_key": self._shard_key(item)} for item in items],
+            )
+            inserted = self.conn.total_changes - before
+            self.conn.commit()
+
+            logger.info(f"Enqueued {inserted} work items ({len(items) - inserted} already known)")
+            return inserted
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to enqueue work items: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+    def claim_work_items(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lease_seconds: float = 300.0,
+        shard: tuple[int, int] | None = None,
+        max_attempts: int | None = None,
+    ) -> list[WorkItem]:
+        """Atomically claim queued work items for a worker.
+
+        Items are claimed in insertion order. Items whose lease has expired
+        (their worker crashed or stalled) are claimable again, unless they
+        already used ``max_attempts`` attempts: an item that kills its worker
+        is then marked failed instead of taking down one worker per claim.
+        The claim is a single UPDATE ... RETURNING statement, so two workers
+        (even in different processes) never receive the same item.
+
+        Args:
+            worker_id: Identifier of the claiming worker
+            limit: Maximum number of items to claim
+            lease_seconds: How long the claim stays valid without renewal
+            shard: Optional ``(index, count)``: only claim items whose foco
+                falls in shard ``index`` of ``count``. All sub-focos of a
+                foco belong to the same shard.
+            max_attempts: Attempts after which an item whose lease expired
+                is marked failed rather than claimed again (None = no cap)
+
+        Returns:
+            Claimed items (status in_flight, attempts incremented); empty
+            when there is no claimable work
+
+        Raises:
+            ValueError: If limit, lease_seconds or max_attempts is not
+                positive, or the shard is out of range
+            PipelineError: If database write fails
+        """
+        if limit <= 0:
+            msg = f"limit must be positive, got {limit}"
+            raise ValueError(msg)
+        if lease_seconds <= 0:
+            msg = f"lease_seconds must be positive, got {lease_seconds}"
+            raise ValueError(msg)
+        if max_attempts is not None and max_attempts <= 0:
+            msg = f"max_attempts must be positive, got {max_attempts}"
+            raise ValueError(msg)
+        shard_index, shard_count = shard if shard is not None else (0, 1)
+        if not 0 <= shard_index < shard_count:
+            msg = f"shard must be (index, count) with 0 <= index < count, got {shard}"
+            raise ValueError(msg)
+
+        now = time.time()
+        expired = 0
+        try:
+            cursor = self.conn.cursor()
+            if max_attempts is not None:
+                cursor.execute(
+                    """
+                    UPDATE work_items
+                    SET status = 'failed',
+                        lease_owner = NULL,
+                        lease_expires_at = NULL,
+                        last_error = :error,
+                        updated_at = datetime('now')
+                    WHERE status = 'in_flight' AND lease_expires_at < :now
+                      AND attempts >= :max_attempts
+                      AND shard_key % :shard_count = :shard_index
+                """,
+                    {
+                        "error": f"Lease expired after {max_attempts} attempts (worker lost)",
+                        "now": now,
+                        "max_attempts": max_attempts,
+                        "shard_count": shard_count,
+                        "shard_index": shard_index,
+                    },
+                )
+                expired = cursor.rowcount
+            cursor.execute(
+                """
+                UPDATE work_items
+                SET status = 'in_flight',
+                    lease_owner = ?,
+                    lease_expires_at = ?,
+                    attempts = attempts + 1,
+                    updated_at = datetime('now')
+                WHERE id IN (
+                    SELECT id FROM work_items
+                    WHERE (status = 'queued'
+                           OR (status = 'in_flight' AND lease_expires_at < ?))
+                      AND shard_key % ? = ?
+                    ORDER BY id
+                    LIMIT ?
+                )
+                RETURNING *
+            """,
+                (worker_id, now + lease_seconds, now, shard_count, shard_index, limit),
+            )
+            rows = cursor.fetchall()
+            self.conn.commit()
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to claim work items: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+        if expired:
+            logger.warning(f"Marked {expired} work items failed: lease expired at the attempt cap")
+        items = sorted((self._row_to_work_item(row) for row in rows), key=lambda item: item.id)
+        if items:
+            logger.debug(f"Worker {worker_id} claimed {len(items)} work items")
+        return items
+
+    def renew_work_item_lease(
+        self,
+        item_id: int,
+        worker_id: str,
+        lease_seconds: float = 300.0,
+    ) -> bool:
+        """Extend the lease of an in-flight item still owned by ``worker_id``.
+
+        Args:
+            item_id: ID of the work item
+            worker_id: Worker that holds the lease
+            lease_seconds: New lease duration from now
+
+        Returns:
+            True if the lease was renewed, False if the worker lost it
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        return self._update_leased_work_item(
+            item_id,
+            worker_id,
+            "lease_expires_at = :expires_at",
+            {"expires_at": time.time() + lease_seconds},
+        )
+
+    def complete_work_item(
+        self,
+        item_id: int,
+        worker_id: str,
+        question_id: int | None = None,
+    ) -> bool:
+        """Mark an in-flight item as done.
+
+        Args:
+            item_id: ID of the work item
+            worker_id: Worker that holds the lease
+            question_id: ID of the saved question, if any
+
+        Returns:
+            True if the item was completed, False if the worker no longer
+            held its lease (the result should then be discarded)
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        return self._update_leased_work_item(
+            item_id,
+            worker_id,
+            """status = 'done', question_id = :question_id,
+               lease_owner = NULL, lease_expires_at = NULL""",
+            {"question_id": question_id},
+        )
+
+    def fail_work_item(
+        self,
+        item_id: int,
+        worker_id: str,
+        error: str,
+        requeue: bool = False,
+    ) -> bool:
+        """Record a failure for an in-flight item.
+
+        Args:
+            item_id: ID of the work item
+            worker_id: Worker that holds the lease
+            error: Error description stored in last_error
+            requeue: Put the item back in the queue (retryable failure)
+                instead of marking it failed
+
+        Returns:
+            True if the failure was recorded, False if the worker no longer
+            held the lease
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        return self._update_leased_work_item(
+            item_id,
+            worker_id,
+            """status = :status, last_error = :error,
+               lease_owner = NULL, lease_expires_at = NULL""",
+            {"status": "queued" if requeue else "failed", "error": error},
+        )
+
+    def release_work_items(self, worker_id: str | None = None) -> int:
+        """Put in-flight items back in the queue without waiting for lease expiry.
+
+        Call at startup when the previous run is known to be dead (single
+        coordinator) or when a worker shuts down cleanly.
+
+        Args:
+            worker_id: Only release this worker's items; None releases all
+
+        Returns:
+            Number of items released
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                UPDATE work_items
+                SET status = 'queued', lease_owner = NULL, lease_expires_at = NULL,
+                    updated_at = datetime('now')
+                WHERE status = 'in_flight' AND (:worker_id IS NULL OR lease_owner = :worker_id)
+            """,
+                {"worker_id": worker_id},
+            )
+            released = cursor.rowcount
+            self.conn.commit()
+
+            logger.info(f"Released {released} in-flight work items")
+            return released
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to release work items: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+    def save_work_result(self, result: WorkResult) -> bool:
+        """Save the question and metrics of a merged work result, once per work item.
+
+        The work item's natural key (tema, foco, periodo, sub_foco,
+        nivel_dificuldade, posicao_correta) is recorded in the same
+        transaction as the question, so merging a result delivered twice
+        (at-least-once queue backends) saves nothing the second time.
+
+        Args:
+            result: Result read from a queue backend's inbox
+
+        Returns:
+            True if the result was saved, False if its work item was already merged
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                """
+                INSERT OR IGNORE INTO merged_results (
+                    tema, foco, periodo, sub_foco, nivel_dificuldade, posicao_correta
+                ) VALUES (
+                    :tema, :foco, :periodo, :sub_foco, :nivel_dificuldade, :posicao_correta
+                )
+            """,
+                result.item.model_dump(),
+            )
+            if cursor.rowcount == 0:
+                self.conn.rollback()
+                logger.info(f"Work item {result.item.id} already merged, result skipped")
+                return False
+
+            if result.question is not None:
+                question_id = self._insert_question(cursor, result.question)
+                if result.metrics is not None:
+                    self._insert_metrics(cursor, question_id, result.metrics)
+                cursor.execute(
+                    """
+                    UPDATE merged_results SET question_id = :question_id
+                    WHERE tema = :tema AND foco = :foco AND periodo = :periodo
+                      AND sub_foco = :sub_foco AND nivel_dificuldade = :nivel_dificuldade
+                      AND posicao_correta = :posicao_correta
+                """,
+                    {**result.item.model_dump(), "question_id": question_id},
+                )
+            self.conn.commit()
+            return True
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to save work result: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+    def get_work_item_counts(self) -> dict[str, int]:
+        """Get the number of work items in each status.
+
+        Returns:
+            Dictionary with counts for queued, in_flight, done and failed
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT status, COUNT(*) AS total FROM work_items GROUP BY status")
+        counts = {"queued": 0, "in_flight": 0, "done": 0, "failed": 0}
+        counts.update({row["status"]: row["total"] for row in cursor.fetchall()})
+        return counts
+
+    def get_work_items_by_status(self, status: str) -> list[WorkItem]:
+        """Get all work items with given status, in insertion order.
+
+        Args:
+            status: Status to filter by (queued/in_flight/done/failed)
+
+        Returns:
+            List of matching WorkItems
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT * FROM work_items WHERE status = ? ORDER BY id", (status,))
+        return [self._row_to_work_item(row) for row in cursor.fetchall()]
+
+    def get_planned_sub_focos(self) -> set[tuple[str, str, str, str]]:
+        """Get the sub-focos that already have a work item, in any status.
+
+        Returns:
+            Set of (tema, foco, periodo, sub_foco) keys
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("SELECT DISTINCT tema, foco, periodo, sub_foco FROM work_items")
+        return {tuple(row) for row in cursor.fetchall()}
+
+    def _update_leased_work_item(
+        self,
+        item_id: int,
+        worker_id: str,
+        assignments: str,
+        params: dict[str, object],
+    ) -> bool:
+        """Update an in-flight item only if ``worker_id`` still holds its lease."""
+        try:
+            cursor = self.conn.cursor()
+            # assignments are fixed SQL fragments from this class, never user input
+            cursor.execute(
+                f"""
+                UPDATE work_items
+                SET {assignments}, updated_at = datetime('now')
+                WHERE id = :item_id AND status = 'in_flight' AND lease_owner = :worker_id
+            """,
+                {"item_id": item_id, "worker_id": worker_id, **params},
+            )
+            updated = cursor.rowcount == 1
+            self.conn.commit()
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to update work item {item_id}: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+        if not updated:
+            logger.warning(f"Worker {worker_id} no longer holds the lease on work item {item_id}")
+        return updated
+
+    @staticmethod
+    def _row_to_work_item(row: sqlite3.Row) -> WorkItem:
+        """Convert a work_items row to a WorkItem."""
+        data = dict(row)
+        data.pop("created_at", None)
+        data.pop("updated_at", None)
+        data.pop("shard_key", None)
+        return WorkItem(**data)
+
+    @staticmethod
+    def _shard_key(item: WorkItem) -> int:
+        """Stable 31-bit hash of an item's (tema, foco, periodo)."""
+        key = "\x1f".join((item.tema, item.foco, item.periodo)).encode("utf-8")
+        return int.from_bytes(hashlib.blake2b(key, digest_size=4).digest(), "big") >> 1
+
+    # ========================================================================
+    # Sub-Foco Catalogue Operations
+    # ========================================================================
+
+    def save_sub_focos(self, prompt_version: str, sub_focos: list[SubFocoInput]) -> int:
+        """Save sub-focos to the catalogue, replacing their foco's entry.
+
+        Sub-focos are grouped by (tema, foco, periodo); each group replaces
+        what the catalogue held for that foco and prompt version, and keeps
+        its order.
+
+        Args:
+            prompt_version: Version of the prompt that generated the sub-focos
+                (or a label such as "manual")
+            sub_focos: Sub-focos of one or more focos
+
+        Returns:
+            Number of sub-focos saved
+
+        Raises:
+            PipelineError: If database write fails
+        """
+        groups: dict[tuple[str, str, str], list[str]] = {}
+        for sub_foco in sub_focos:
+            key = (sub_foco.tema, sub_foco.foco, sub_foco.periodo)
+            groups.setdefault(key, []).append(sub_foco.sub_foco)
+
+        try:
+            cursor = self.conn.cursor()
+            for (tema, foco, periodo), texts in groups.items():
+                cursor.execute(
+                    """
+                    DELETE FROM sub_focos
+                    WHERE tema = ? AND foco = ? AND periodo = ? AND prompt_version = ?
+                """,
+                    (tema, foco, periodo, prompt_version),
+                )
+                cursor.executemany(
+                    """
+                    INSERT INTO sub_focos (tema, foco, periodo, prompt_version, position, sub_foco)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """,
+                    [
+                        (tema, foco, periodo, prompt_version, position, text)
+                        for position, text in enumerate(texts)
+                    ],
+                )
+            self.conn.commit()
+
+            logger.info(
+                f"Saved {len(sub_focos)} sub-focos of {len(groups)} focos to the catalogue "
+                f"(prompt_version={prompt_version})"
+            )
+            return len(sub_focos)
+
+        except sqlite3.Error as e:
+            self.conn.rollback()
+            logger.error(f"Failed to save sub-focos: {e}", exc_info=True)
+            raise PipelineError(f"Database write failed: {e}") from e
+
+    def get_sub_focos(self, foco_input: FocoInput, prompt_version: str) -> list[SubFocoInput]:
+        """Get a foco's catalogued sub-focos for one prompt version.
+
+        Args:
+            foco_input: Foco to look up (tema, foco, periodo)
+            prompt_version: Prompt version (or label) the sub-focos were saved with
+
+        Returns:
+            The sub-focos in their saved order (empty if none)
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            """
+            SELECT tema, foco, periodo, sub_foco FROM sub_focos
+            WHERE tema = ? AND foco = ? AND periodo = ? AND prompt_version = ?
+            ORDER BY position
+        """,
+            (foco_input.tema, foco_input.foco, foco_input.periodo, prompt_version),
+        )
+        return [SubFocoInput(**dict(row)) for row in cursor.fetchall()]
+
+    def get_sub_foco_catalog(self) -> list[tuple[str, SubFocoInput]]:
+        """Get the whole sub-foco catalogue.
+
+        Returns:
+            (prompt_version, sub-foco) pairs ordered by foco, prompt version
+            and position
+        """
+        cursor = self.conn.cursor()
+        cursor.execute("""
+            SELECT prompt_version, tema, foco, periodo, sub_foco FROM sub_focos
+            ORDER BY tema, foco, periodo, prompt_version, position
+        """)
+        return [
+            (
+                row["prompt_version"],
+                SubFocoInput(
+                    tema=row["tema"],
+                    foco=row["foco"],
+                    periodo=row["periodo"],
+                    sub_foco=row["sub_foco"],
+                ),
+            )
+            for row in cursor.fetchall()
+        ]
+
     # ========================================================================
     # Resource Management
     # ========================================================================
@@ -3,7 +3,7 @@
 This module provides type-safe data models for all pipeline stages:
 - Question models (CriadorOutput, QuestionRecord)
 - Feedback models (FeedbackEstruturado, ComentadorOutput, ValidadorOutput)
-- Pipeline models (BatchState, CheckpointResult, RetryContext)
+- Pipeline models (BatchState, CheckpointResult, RetryContext, WorkItem, WorkResult)
 - Metrics models (QuestionMetrics, BatchMetrics, ModelComparison)
 
 All models use strict validation mode (ConfigDict(strict=True)) to prevent
@@ -21,7 +21,7 @@ from .feedback import ComentadorOutput, FeedbackEstruturado, ValidadorOutput
 from .metrics import BatchMetrics, ModelComparison, QuestionMetrics
 
 # Pipeline models
-from .pipeline import BatchState, CheckpointResult, RetryContext
+from .pipeline import BatchState, CheckpointResult, RetryContext, WorkItem, WorkResult
 
 # RAG models
 from .rag import RagDocument, RagQueryResult
@@ -42,4 +42,6 @@ __all__ = [
     "RetryContext",
     "SubFocoInput",
     "ValidadorOutput",
+    "WorkItem",
+    "WorkResult",
 ]
@@ -1,9 +1,12 @@
 """Pipeline state and checkpoint models for batch processing."""
 
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
 from .feedback import FeedbackEstruturado
+from .metrics import QuestionMetrics
+from .question import QuestionRecord
 
 
 class BatchState(BaseModel):
@@ -26,6 +29,56 @@ class BatchState(BaseModel):
     )
 
 
+class WorkItem(BaseModel):
+    """One unit of work in the run ledger: a single question to generate.
+
+    A work item is identified by (tema, foco, periodo, sub_foco,
+    nivel_dificuldade, posicao_correta). Workers claim queued items with a
+    time-limited lease, so after a crash only unfinished items are resumed and
+    completed ones are never generated (or paid for) twice.
+
+    Status flow:
+        queued -> in_flight -> done
+                           -> failed
+                           -> queued (retryable failure or expired lease)
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    id: int | None = None  # Assigned by the ledger
+    tema: str
+    foco: str
+    periodo: Literal["1º ano", "2º ano", "3º ano", "4º ano"]
+    sub_foco: str
+    nivel_dificuldade: Literal[1, 2, 3]
+    posicao_correta: Literal["A", "B", "C", "D"]
+    status: Literal["queued", "in_flight", "done", "failed"] = "queued"
+    attempts: int = Field(default=0, ge=0)
+    lease_owner: str | None = None
+    lease_expires_at: float | None = Field(
+        default=None,
+        description="Lease expiry as a Unix timestamp (seconds)",
+    )
+    question_id: int | None = None
+    last_error: str | None = None
+
+
+class WorkResult(BaseModel):
+    """Outcome of a work item produced by a (possibly remote) worker.
+
+    Workers that cannot write to the central MetricsStore hand their results
+    to the queue backend; the coordinator merges them into the store.
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    item: WorkItem
+    question: QuestionRecord | None = None
+    metrics: QuestionMetrics | None = None
+
+
 class CheckpointResult(BaseModel):
     """Checkpoint validation data for batch quality control.
 
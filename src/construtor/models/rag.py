@@ -0,0 +1,46 @@
+"""RAG models for documents retrieved from the curated Pinecone index."""
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class RagDocument(BaseModel):
+    """A curated medical document returned by a RAG query.
+
+    Its metadata (título, autores, ano, fonte) is what the Comentador cites
+    as ``referencia_bibliografica`` (FR21, NFR17).
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    texto: str = Field(..., description="Trecho do documento")
+    titulo: str = Field(default="", description="Título da obra")
+    autores: str = Field(default="", description="Autores da obra")
+    ano: str = Field(default="", description="Ano de publicação")
+    fonte: str = Field(default="", description="Fonte (editora, periódico, diretriz)")
+    score: float = Field(default=0.0, description="Similaridade com a query")
+
+    def citation(self) -> str:
+        """Format the document's metadata as a bibliographic reference.
+
+        Returns:
+            "Autores. Título. Fonte, Ano." without the missing parts
+
+        Example:
+            >>> doc = RagDocument(texto="...", titulo="Braunwald", autores="Zipes DP", ano="2022")
+            >>> doc.citation()
+            'Zipes DP. Braunwald. 2022.'
+        """
+        parts = [self.autores, self.titulo, ", ".join(p for p in (self.fonte, self.ano) if p)]
+        return " ".join(f"{part.rstrip('.')}." for part in parts if part)
+
+
+class RagQueryResult(BaseModel):
+    """Documents retrieved for one tema/foco query."""
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    documentos: list[RagDocument] = Field(..., description="Documentos, do mais similar")
+    query: str = Field(..., description="Texto da busca (tema + foco)")
+    latencia: float = Field(default=0.0, ge=0.0, description="Latência da query em segundos")
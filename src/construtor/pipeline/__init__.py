@@ -0,0 +1,40 @@
+"""Pipeline orchestration components.
+
+This module contains the building blocks that drive question generation:
+- StatisticalBalancer: Balanced assignment of the correct answer position
+- StratifiedPlanner: Up-front nivel/posição plan for a whole run
+- SubFocoExpander: Concurrent sub-foco expansion of many focos under a token budget
+- PriorityScheduler: Dispatch order of retries and fresh work
+- ShardedPipeline: Multi-process execution with shared rate-limit budgets
+- DistributedWorker: Multi-node workers sharing a QueueBackend
+"""
+
+from construtor.pipeline.balancer import StatisticalBalancer
+from construtor.pipeline.distributed import BackendRateLimiter, DistributedWorker, merge_results
+from construtor.pipeline.expansion import SubFocoExpander
+from construtor.pipeline.planner import StratifiedPlanner
+from construtor.pipeline.queue_backend import LockedQueueBackend, QueueBackend
+from construtor.pipeline.queue_redis import InMemoryRedis, RedisQueueBackend
+from construtor.pipeline.queue_spool import FileSpoolBackend
+from construtor.pipeline.queue_sqlite import SqliteQueueBackend
+from construtor.pipeline.scheduler import PriorityScheduler, ScheduledTask
+from construtor.pipeline.sharded import RateLimit, ShardedPipeline
+
+__all__ = [
+    "BackendRateLimiter",
+    "DistributedWorker",
+    "FileSpoolBackend",
+    "InMemoryRedis",
+    "LockedQueueBackend",
+    "PriorityScheduler",
+    "QueueBackend",
+    "RateLimit",
+    "RedisQueueBackend",
+    "ScheduledTask",
+    "ShardedPipeline",
+    "SqliteQueueBackend",
+    "StatisticalBalancer",
+    "StratifiedPlanner",
+    "SubFocoExpander",
+    "merge_results",
+]
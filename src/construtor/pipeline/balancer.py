@@ -0,0 +1,199 @@
+"""Statistical balancing of the correct answer position (A/B/C/D).
+
+This module provides StatisticalBalancer, which assigns the correct
+alternative position of each question so that every letter stays between
+20% and 30% of the total (NFR18), and persists its counts in the
+``balancer_state`` table so a resumed run continues from the same balance
+(NFR11).
+
+Draws are contention-free: each draw takes a ticket from an atomic counter
+and the position is a pure function of that ticket. The first tickets work
+off any imbalance loaded from a previous run (letters with the largest
+deficit first); after that, positions come from shuffled blocks of the four
+letters. Counts are derived from the ticket number instead of being
+incremented, so concurrent workers never share mutable state and the
+distribution never drifts more than one question away from perfect balance.
+"""
+
+import itertools
+import logging
+import os
+from typing import Literal
+
+from construtor.metrics.store import MetricsStore
+
+logger = logging.getLogger(__name__)
+
+Position = Literal["A", "B", "C", "D"]
+
+POSITIONS: tuple[Position, ...] = ("A", "B", "C", "D")
+# All 24 orderings of a block; a block's ordering is picked by hashing its number
+_BLOCKS: tuple[tuple[Position, ...], ...] = tuple(itertools.permutations(POSITIONS))
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """SplitMix64 finalizer: cheap, well-distributed 64-bit hash."""
+    value = (value + 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class StatisticalBalancer:
+    """Assigns balanced correct-answer positions to concurrent workers.
+
+    Args:
+        store: MetricsStore used to load the initial counts and to persist
+            snapshots. Without a store the balancer is purely in-memory.
+        snapshot_every: Persist counts every N draws (plus on ``flush``).
+            After a crash at most N - 1 draws are missing from the saved
+            counts, which the next run absorbs as a small deficit.
+        seed: Seed of the block shuffling (random if omitted)
+
+    Raises:
+        ValueError: If snapshot_every is not positive
+
+    Example:
+        >>> balancer = StatisticalBalancer(store, snapshot_every=100)
+        >>> posicao = balancer.get_next_position()
+        >>> balancer.get_statistics()["percentages"]
+        {'A': 25.0, 'B': 25.0, 'C': 25.0, 'D': 25.0}
+        >>> balancer.flush()
+    """
+
+    def __init__(
+        self,
+        store: MetricsStore | None = None,
+        snapshot_every: int = 100,
+        seed: int | None = None,
+    ) -> None:
+        if snapshot_every <= 0:
+            msg = f"snapshot_every must be positive, got {snapshot_every}"
+            raise ValueError(msg)
+
+        self._store = store
+        self._snapshot_every = snapshot_every
+        self._seed = seed if seed is not None else int.from_bytes(os.urandom(8), "little")
+
+        saved = store.get_balancer_state() if store is not None else None
+        self._start(saved or dict.fromkeys(POSITIONS, 0))
+        if saved:
+            logger.info(f"Balancer resumed from saved state: {saved}")
+
+    def get_next_position(self) -> Position:
+        """Draw the correct-answer position for the next question.
+
+        Safe to call from concurrent asyncio tasks and threads: the only
+        shared step is taking a ticket from an ``itertools.count``.
+
+        Returns:
+            One of "A", "B", "C", "D"
+        """
+        ticket = next(self._tickets)
+        position = self._position_at(ticket)
+        drawn = ticket + 1
+        # Benign race: a slower thread may briefly leave a lower value
+        if drawn > self._drawn:
+            self._drawn = drawn
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Balancer draw #{drawn}: {position} | counts={self._counts_after(drawn)}")
+        if drawn % self._snapshot_every == 0:
+            self._save(self._counts_after(drawn))
+        return position
+
+    def get_statistics(self) -> dict:
+        """Get current counts and percentages per position.
+
+        Exact once concurrent draws have returned; while draws are in flight
+        the result may lag by the number of draws in progress.
+
+        Returns:
+            Dictionary with ``total``, ``counts`` (per letter) and
+            ``percentages`` (per letter, 0-100)
+        """
+        counts = self._counts_after(self._drawn)
+        total = sum(counts.values())
+        percentages = {
+            pos: (100.0 * count / total if total else 0.0) for pos, count in counts.items()
+        }
+        return {"total": total, "counts": counts, "percentages": percentages}
+
+    def is_balanced(self, lower: float = 0.20, upper: float = 0.30) -> bool:
+        """Check the NFR18 bounds on the current distribution.
+
+        Args:
+            lower: Minimum share per letter
+            upper: Maximum share per letter
+
+        Returns:
+            True if every letter's share is within [lower, upper]
+        """
+        counts = self._counts_after(self._drawn)
+        total = sum(counts.values())
+        if total == 0:
+            return True
+        return all(lower <= count / total <= upper for count in counts.values())
+
+    def flush(self) -> None:
+        """Persist the current counts (call at checkpoints and shutdown)."""
+        self._save(self._counts_after(self._drawn))
+
+    def reset(self) -> None:
+        """Reset all counts to zero and persist the empty state.
+
+        Must not be called while other workers are drawing.
+        """
+        self._start(dict.fromkeys(POSITIONS, 0))
+        self._save(dict.fromkeys(POSITIONS, 0))
+        logger.info("Balancer reset")
+
+    def _start(self, base: dict[str, int]) -> None:
+        """Set the base counts and precompute the deficit catch-up sequence."""
+        self._base = {pos: base.get(pos, 0) for pos in POSITIONS}
+        target = max(self._base.values())
+        # Largest deficit first, interleaved so the catch-up itself stays spread out
+        deficits = {pos: target - count for pos, count in self._base.items()}
+        catch_up: list[Position] = []
+        while any(deficits.values()):
+            for pos in sorted(POSITIONS, key=lambda p: -deficits[p]):
+                if deficits[pos]:
+                    catch_up.append(pos)
+                    deficits[pos] -= 1
+        self._catch_up: tuple[Position, ...] = tuple(catch_up)
+        # Counts after the whole catch-up: every letter at ``target``
+        self._level = target
+        self._tickets = itertools.count()
+        self._drawn = 0
+
+    def _position_at(self, ticket: int) -> Position:
+        """Position assigned to a ticket (pure function of the ticket)."""
+        if ticket < len(self._catch_up):
+            return self._catch_up[ticket]
+        offset = ticket - len(self._catch_up)
+        block, slot = divmod(offset, len(POSITIONS))
+        ordering = _BLOCKS[_mix64(self._seed ^ block) % len(_BLOCKS)]
+        return ordering[slot]
+
+    def _counts_after(self, drawn: int) -> dict[str, int]:
+        """Counts per letter once ``drawn`` tickets have been issued."""
+        if drawn <= len(self._catch_up):
+            counts = dict(self._base)
+            for pos in self._catch_up[:drawn]:
+                counts[pos] += 1
+            return counts
+
+        offset = drawn - len(self._catch_up)
+        full_blocks, partial = divmod(offset, len(POSITIONS))
+        counts = dict.fromkeys(POSITIONS, self._level + full_blocks)
+        if partial:
+            ordering = _BLOCKS[_mix64(self._seed ^ full_blocks) % len(_BLOCKS)]
+            for pos in ordering[:partial]:
+                counts[pos] += 1
+        return counts
+
+    def _save(self, counts: dict[str, int]) -> None:
+        """Persist a snapshot of the counts if a store is configured."""
+        if self._store is not None:
+            self._store.save_balancer_state(counts)
@@ -0,0 +1,226 @@
+"""Distributed workers coordinated through a QueueBackend.
+
+Several machines can run DistributedWorker against one shared backend (see
+``construtor.pipeline.queue_backend``). Workers lease items, send heartbeats
+while they process them, and draw from global per-model rate budgets kept
+in the backend, so all machines together respect one account's limits.
+Results go to the backend's inbox and ``merge_results`` writes them into one
+MetricsStore.
+
+Backend calls are blocking (file locks, lock spins, SQLite write locks), so
+workers run them in a thread: a worker waiting on the backend keeps its
+in-flight LLM calls and lease heartbeats going.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from collections.abc import Awaitable, Callable
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics.store import MetricsStore
+from construtor.models import WorkItem, WorkResult
+from construtor.pipeline.queue_backend import QueueBackend
+from construtor.pipeline.sharded import RateLimit
+
+logger = logging.getLogger(__name__)
+
+ResultHandler = Callable[[WorkItem], Awaitable[WorkResult]]
+"""Processes one work item and returns its result."""
+
+
+class BackendRateLimiter:
+    """Global per-model rate limiter backed by a QueueBackend.
+
+    Same interface as SharedRateLimiter, so handlers work in both modes.
+
+    Args:
+        backend: Shared queue backend holding the budgets
+        limits: API limits per model; other models are not limited
+    """
+
+    def __init__(self, backend: QueueBackend, limits: dict[str, RateLimit]) -> None:
+        self._backend = backend
+        self._limits = dict(limits)
+
+    async def acquire(self, model: str, tokens: int = 0) -> None:
+        """Wait until a request to ``model`` fits the global budget.
+
+        Args:
+            model: Model name
+            tokens: Estimated tokens of the request
+        """
+        limit = self._limits.get(model)
+        if limit is None:
+            return
+
+        delay = await asyncio.to_thread(
+            self._backend.reserve, f"requests:{model}", 60.0 / limit.requests_per_minute
+        )
+        if limit.tokens_per_minute is not None and tokens > 0:
+            token_delay = await asyncio.to_thread(
+                self._backend.reserve, f"tokens:{model}", tokens * 60.0 / limit.tokens_per_minute
+            )
+            delay = max(delay, token_delay)
+        if delay > 0:
+            logger.debug(f"Global rate budget: waiting {delay:.2f}s for {model}")
+            await asyncio.sleep(delay)
+
+
+class DistributedWorker:
+    """Pulls work items from a shared QueueBackend and processes them.
+
+    Args:
+        backend: Shared queue backend
+        handler: Async callable producing the WorkResult of one item
+        worker_id: Lease owner name (defaults to ``<hostname>-<pid>``)
+        concurrency: Items processed concurrently
+        lease_seconds: Lease duration; heartbeats renew it every third of it
+        max_attempts: Attempts before a failing item is marked failed
+        poll_interval: Wait between polls while other workers still hold
+            leases (their items may come back to the queue)
+
+    Raises:
+        ValueError: If concurrency, lease_seconds, max_attempts or
+            poll_interval is not positive
+
+    Example:
+        >>> backend = RedisQueueBackend(redis.Redis(host, decode_responses=True))
+        >>> limiter = BackendRateLimiter(backend, {"gpt-4o": RateLimit(requests_per_minute=500)})
+        >>> worker = DistributedWorker(backend, make_handler(limiter), concurrency=20)
+        >>> await worker.run()
+    """
+
+    def __init__(
+        self,
+        backend: QueueBackend,
+        handler: ResultHandler,
+        worker_id: str | None = None,
+        concurrency: int = 10,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        poll_interval: float = 5.0,
+    ) -> None:
+        for name, value in (
+            ("concurrency", concurrency),
+            ("lease_seconds", lease_seconds),
+            ("max_attempts", max_attempts),
+            ("poll_interval", poll_interval),
+        ):
+            if value <= 0:
+                msg = f"{name} must be positive, got {value}"
+                raise ValueError(msg)
+
+        self.worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+        self._backend = backend
+        self._handler = handler
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._poll_interval = poll_interval
+        self._in_flight: set[int] = set()
+        self._processed = 0
+
+    async def run(self) -> int:
+        """Process items until the queue is empty and no item is in flight anywhere.
+
+        Returns:
+            Number of items this worker completed
+        """
+        heartbeat = asyncio.create_task(self._heartbeat())
+        try:
+            await asyncio.gather(*(self._consume() for _ in range(self._concurrency)))
+        finally:
+            heartbeat.cancel()
+        logger.info(f"Worker {self.worker_id} finished, {self._processed} items completed")
+        return self._processed
+
+    async def _consume(self) -> None:
+        """Claim and process items one at a time.
+
+        Raises:
+            PipelineError: If the backend returns an item without an id
+        """
+        while True:
+            claimed = await asyncio.to_thread(
+                self._backend.claim, self.worker_id, 1, self._lease_seconds
+            )
+            if not claimed:
+                counts = await asyncio.to_thread(self._backend.counts)
+                if counts["queued"] == 0 and counts["in_flight"] == 0:
+                    return
+                # Items leased elsewhere may still be requeued (failure or expiry)
+                await asyncio.sleep(self._poll_interval)
+                continue
+
+            item = claimed[0]
+            if item.id is None:
+                msg = f"Queue backend returned a work item without id: {item.sub_foco}"
+                raise PipelineError(msg)
+            self._in_flight.add(item.id)
+            try:
+                result = await self._handler(item)
+            except Exception as e:
+                logger.exception(f"Worker {self.worker_id}: work item {item.id} failed")
+                await asyncio.to_thread(
+                    self._backend.fail,
+                    item.id,
+                    self.worker_id,
+                    str(e),
+                    requeue=item.attempts < self._max_attempts,
+                )
+            else:
+                if await asyncio.to_thread(self._backend.complete, self.worker_id, result):
+                    self._processed += 1
+                else:
+                    logger.warning(
+                        f"Worker {self.worker_id}: lease on item {item.id} lost, result dropped"
+                    )
+            finally:
+                self._in_flight.discard(item.id)
+
+    async def _heartbeat(self) -> None:
+        """Renew the leases of in-flight items periodically."""
+        while True:
+            await asyncio.sleep(self._lease_seconds / 3)
+            if self._in_flight:
+                lost = await asyncio.to_thread(
+                    self._backend.heartbeat,
+                    self.worker_id,
+                    sorted(self._in_flight),
+                    self._lease_seconds,
+                )
+                if lost:
+                    logger.warning(f"Worker {self.worker_id} lost leases on items {lost}")
+
+
+def merge_results(backend: QueueBackend, store: MetricsStore, batch_size: int = 100) -> int:
+    """Write the results waiting in the backend into the central MetricsStore.
+
+    Results are acknowledged only after they are saved, so a crash between
+    the two delivers the last batch again on the next merge (at-least-once).
+    The store records each merged work item, so redelivered results are
+    skipped instead of saved twice.
+
+    Args:
+        backend: Shared queue backend
+        store: Central MetricsStore
+        batch_size: Results fetched per round trip
+
+    Returns:
+        Number of results merged (redelivered duplicates excluded)
+    """
+    merged = 0
+    skipped = 0
+    while batch := backend.pending_results(batch_size):
+        for _, result in batch:
+            if store.save_work_result(result):
+                merged += 1
+            else:
+                skipped += 1
+        backend.ack_results([result_id for result_id, _ in batch])
+
+    if merged or skipped:
+        logger.info(f"Merged {merged} results into the metrics store ({skipped} already merged)")
+    return merged
@@ -0,0 +1,201 @@
+"""Concurrent sub-foco expansion of many focos under a token budget.
+
+SubFocoGenerator expands one foco per call; expanding 150+ focos one after
+another leaves the API idle most of the time. SubFocoExpander runs the
+expansion of many focos concurrently (each LLM call still goes through the
+provider's semaphore and rate limits) and yields each foco's sub-focos as
+soon as it completes, so its questions can be planned and queued while the
+other focos are still being expanded.
+
+A run-wide token budget caps the spend: a foco is only started while the
+tokens already used plus the estimated tokens of the focos in flight leave
+room for one more. The estimate starts at ``tokens_per_foco`` and follows
+the observed average once focos complete. Focos not started for lack of
+budget are reported as skipped, never half-expanded.
+"""
+
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+from construtor.agents.subfoco_generator import SubFocoGenerator
+from construtor.config.exceptions import OutputParsingError
+from construtor.metrics.store import MetricsStore
+from construtor.models import FocoInput, SubFocoInput
+from construtor.pipeline.planner import StratifiedPlanner
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_COUNT = 50
+
+
+class SubFocoExpander:
+    """Expands many focos into sub-focos concurrently within a token budget.
+
+    A foco whose generation fails (OutputParsingError) is logged and counted
+    as failed; the other focos go on.
+
+    Args:
+        generator: Sub-foco generator (its provider enforces the API limits)
+        max_concurrency: Focos expanded at the same time
+        token_budget: Maximum tokens for the whole expansion (None = no cap)
+        tokens_per_foco: Token estimate of one foco until focos complete
+
+    Raises:
+        ValueError: If max_concurrency or tokens_per_foco is not positive,
+            or token_budget is negative
+
+    Example:
+        >>> expander = SubFocoExpander(generator, max_concurrency=10, token_budget=2_000_000)
+        >>> queued = await expander.expand_into(focos, StratifiedPlanner(seed=2026), store)
+        >>> expander.get_statistics()["skipped"]
+        0
+    """
+
+    def __init__(
+        self,
+        generator: SubFocoGenerator,
+        max_concurrency: int = 8,
+        token_budget: int | None = None,
+        tokens_per_foco: int = 4000,
+    ) -> None:
+        if max_concurrency <= 0 or tokens_per_foco <= 0:
+            msg = (
+                f"max_concurrency and tokens_per_foco must be positive, "
+                f"got {max_concurrency}, {tokens_per_foco}"
+            )
+            raise ValueError(msg)
+        if token_budget is not None and token_budget < 0:
+            msg = f"token_budget must be non-negative, got {token_budget}"
+            raise ValueError(msg)
+
+        self._generator = generator
+        self._max_concurrency = max_concurrency
+        self._token_budget = token_budget
+        self._tokens_per_foco = tokens_per_foco
+        self._tokens_at_start = 0
+        self._completed = 0
+        self._failed = 0
+        self._skipped = 0
+
+    async def expand(
+        self,
+        focos: list[FocoInput],
+        count: int = _DEFAULT_COUNT,
+    ) -> AsyncIterator[list[SubFocoInput]]:
+        """Expand focos concurrently, yielding each foco's sub-focos as it completes.
+
+        Args:
+            focos: Focos to expand
+            count: Sub-focos per foco
+
+        Yields:
+            The ``count`` sub-focos of one foco, in completion order
+
+        Raises:
+            ValueError: If count is not positive
+        """
+        if count <= 0:
+            msg = f"count must be positive, got {count}"
+            raise ValueError(msg)
+
+        self._tokens_at_start = self._tokens_used()
+        self._completed = self._failed = self._skipped = 0
+        pending_focos = list(focos)
+        running: dict[asyncio.Task, FocoInput] = {}
+        try:
+            while pending_focos or running:
+                while (
+                    pending_focos
+                    and len(running) < self._max_concurrency
+                    and self._can_start(len(running))
+                ):
+                    foco_input = pending_focos.pop(0)
+                    task = asyncio.create_task(self._generator.generate_batch(foco_input, count))
+                    running[task] = foco_input
+
+                if not running:
+                    # Out of budget: nothing in flight and nothing may start
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    foco_input = running.pop(task)
+                    try:
+                        sub_focos = task.result()
+                    except OutputParsingError:
+                        self._failed += 1
+                        logger.exception(f"Sub-foco expansion failed | foco={foco_input.foco}")
+                        continue
+                    self._completed += 1
+                    yield sub_focos
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+        if pending_focos:
+            self._skipped += len(pending_focos)
+            logger.warning(
+                f"Token budget of {self._token_budget} reached: {len(pending_focos)} focos "
+                f"not expanded | first={pending_focos[0].foco}"
+            )
+        logger.info(
+            f"Sub-foco expansion finished | completed={self._completed} | "
+            f"failed={self._failed} | skipped={self._skipped} | "
+            f"tokens={self._tokens_used() - self._tokens_at_start}"
+        )
+
+    async def expand_into(
+        self,
+        focos: list[FocoInput],
+        planner: StratifiedPlanner,
+        store: MetricsStore,
+        count: int = _DEFAULT_COUNT,
+    ) -> int:
+        """Expand focos and queue each foco's questions as soon as it completes.
+
+        Each completed foco is planned (nivel/posição) and written to the
+        work-item ledger, so workers can start on it right away.
+
+        Args:
+            focos: Focos to expand
+            planner: Planner assigning difficulty levels and answer positions
+            store: MetricsStore holding the work-item ledger
+            count: Sub-focos per foco
+
+        Returns:
+            Number of work items added to the ledger
+        """
+        queued = 0
+        async for sub_focos in self.expand(focos, count):
+            queued += planner.persist(planner.plan(sub_focos), store)
+        return queued
+
+    def get_statistics(self) -> dict[str, int | None]:
+        """Get expansion progress and token usage.
+
+        Returns:
+            Dict with completed, failed, skipped (focos) and tokens_used of
+            the last expansion, and the token_budget
+        """
+        return {
+            "completed": self._completed,
+            "failed": self._failed,
+            "skipped": self._skipped,
+            "tokens_used": self._tokens_used() - self._tokens_at_start,
+            "token_budget": self._token_budget,
+        }
+
+    def _can_start(self, in_flight: int) -> bool:
+        """Whether one more foco fits the budget with the focos in flight."""
+        if self._token_budget is None:
+            return True
+        used = self._tokens_used() - self._tokens_at_start
+        finished = self._completed + self._failed
+        estimate = used / finished if finished else self._tokens_per_foco
+        return used + (in_flight + 1) * estimate <= self._token_budget
+
+    def _tokens_used(self) -> int:
+        return int(self._generator.get_statistics()["tokens_used"])
@@ -0,0 +1,184 @@
+"""Stratified planning of difficulty levels and answer positions.
+
+This module provides StratifiedPlanner, which decides up front the
+nivel_dificuldade and posicao_correta of every question in a run instead of
+drawing them one by one. Allocation is stratified by periodo, so each
+periodo (and each foco within it) gets the target mix of difficulty levels,
+and answer positions are balanced within every (periodo, nivel) cell as well
+as across the whole run. The plan is written to the work-item ledger, from
+which workers claim their items.
+
+Allocation is vectorized with NumPy:
+    1. Nivel: largest-remainder quotas per periodo, interleaved by
+       fractional rank so consecutive sub-focos of a foco get different
+       levels.
+    2. Posição: items are laid out (periodo, nivel) cell by cell on one
+       stream of shuffled A/B/C/D blocks, so every cell and the run as a
+       whole are within one question of perfect balance.
+"""
+
+import itertools
+import logging
+from collections import Counter
+
+import numpy as np
+
+from construtor.metrics.store import MetricsStore
+from construtor.models import SubFocoInput, WorkItem
+
+logger = logging.getLogger(__name__)
+
+NIVEIS: tuple[int, ...] = (1, 2, 3)
+POSITIONS: tuple[str, ...] = ("A", "B", "C", "D")
+
+# All 24 orderings of A/B/C/D, as index arrays
+_BLOCKS = np.array(list(itertools.permutations(range(len(POSITIONS)))), dtype=np.int64)
+
+
+def _mix64(values: np.ndarray) -> np.ndarray:
+    """Vectorized SplitMix64 finalizer over uint64 values (wrapping arithmetic)."""
+    with np.errstate(over="ignore"):
+        z = values + np.uint64(0x9E3779B97F4A7C15)
+        z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return z ^ (z >> np.uint64(31))
+
+
+def _largest_remainder(total: int, weights: np.ndarray) -> np.ndarray:
+    """Split ``total`` into integer quotas proportional to ``weights``."""
+    exact = weights / weights.sum() * total
+    quotas = np.floor(exact).astype(np.int64)
+    shortfall = total - int(quotas.sum())
+    if shortfall:
+        # Stable: ties go to the earlier (easier) level
+        order = np.argsort(-(exact - quotas), kind="stable")
+        quotas[order[:shortfall]] += 1
+    return quotas
+
+
+class StratifiedPlanner:
+    """Precomputes balanced (nivel_dificuldade, posicao_correta) assignments.
+
+    Args:
+        nivel_weights: Target share of each difficulty level (normalized);
+            defaults to equal thirds
+        seed: Seed of the position block shuffling; the same inputs and seed
+            always produce the same plan
+
+    Raises:
+        ValueError: If weights are not given for levels 1, 2 and 3 or are
+            not positive
+
+    Example:
+        >>> planner = StratifiedPlanner(seed=2026)
+        >>> plan = planner.plan(sub_focos)
+        >>> planner.persist(plan, store)
+        >>> items = store.claim_work_items("worker-1", limit=10)
+    """
+
+    def __init__(
+        self,
+        nivel_weights: dict[int, float] | None = None,
+        seed: int = 0,
+    ) -> None:
+        weights = nivel_weights or dict.fromkeys(NIVEIS, 1.0)
+        if sorted(weights) != list(NIVEIS) or any(w <= 0 for w in weights.values()):
+            msg = f"nivel_weights must give a positive weight to levels 1, 2 and 3, got {weights}"
+            raise ValueError(msg)
+        self._weights = np.array([weights[nivel] for nivel in NIVEIS], dtype=np.float64)
+        self._seed = np.uint64(seed & 0xFFFFFFFFFFFFFFFF)
+
+    def plan(self, sub_focos: list[SubFocoInput]) -> list[WorkItem]:
+        """Assign a difficulty level and answer position to every sub-foco.
+
+        Args:
+            sub_focos: Sub-focos of the run, grouped by foco (generation order)
+
+        Returns:
+            One queued WorkItem per sub-foco, in input order
+        """
+        n = len(sub_focos)
+        if n == 0:
+            return []
+
+        periodos = np.array([sub_foco.periodo for sub_foco in sub_focos])
+        niveis = np.empty(n, dtype=np.int64)
+
+        # 1. Nivel: stratified per periodo, interleaved within the stratum
+        for periodo in np.unique(periodos):
+            members = np.flatnonzero(periodos == periodo)
+            quotas = _largest_remainder(len(members), self._weights)
+            labels = np.repeat(np.arange(len(NIVEIS)), quotas)
+            ranks = np.concatenate([(np.arange(q) + 0.5) / q for q in quotas if q])
+            niveis[members] = labels[np.argsort(ranks, kind="stable")]
+
+        # 2. Posição: consecutive ranges of one block-balanced stream per cell
+        _, stratum = np.unique(periodos, return_inverse=True)
+        cell_order = np.lexsort((np.arange(n), niveis, stratum))
+        stream_index = np.empty(n, dtype=np.int64)
+        stream_index[cell_order] = np.arange(n)
+        block, slot = np.divmod(stream_index, len(POSITIONS))
+        perm = _mix64(block.astype(np.uint64) ^ self._seed) % np.uint64(len(_BLOCKS))
+        positions = _BLOCKS[perm.astype(np.int64), slot]
+
+        plan = [
+            WorkItem(
+                tema=sub_foco.tema,
+                foco=sub_foco.foco,
+                periodo=sub_foco.periodo,
+                sub_foco=sub_foco.sub_foco,
+                nivel_dificuldade=NIVEIS[nivel],
+                posicao_correta=POSITIONS[position],
+            )
+            for sub_foco, nivel, position in zip(
+                sub_focos, niveis.tolist(), positions.tolist(), strict=True
+            )
+        ]
+        logger.info(f"Planned {n} questions | distribution={self.summary(plan)['total']}")
+        return plan
+
+    def persist(self, plan: list[WorkItem], store: MetricsStore) -> int:
+        """Write the plan to the work-item ledger, skipping planned sub-focos.
+
+        Sub-focos that already have a ledger entry (from an earlier run or a
+        resumed one) keep their original assignment, so re-planning never
+        creates a second question for the same sub-foco.
+
+        Args:
+            plan: Output of ``plan``
+            store: MetricsStore holding the work-item ledger
+
+        Returns:
+            Number of work items added to the ledger
+        """
+        planned = store.get_planned_sub_focos()
+        new_items = [
+            item
+            for item in plan
+            if (item.tema, item.foco, item.periodo, item.sub_foco) not in planned
+        ]
+        if len(new_items) < len(plan):
+            logger.info(f"{len(plan) - len(new_items)} sub-focos already planned, kept as is")
+        return store.enqueue_work_items(new_items)
+
+    @staticmethod
+    def summary(plan: list[WorkItem]) -> dict[str, dict[str, dict[str, int]]]:
+        """Count levels and positions per periodo and for the whole plan.
+
+        Args:
+            plan: Planned (or claimed) work items
+
+        Returns:
+            ``{"total": {...}, "<periodo>": {...}}`` where each entry maps
+            ``"nivel"`` and ``"posicao"`` to their counts
+        """
+        groups: dict[str, list[WorkItem]] = {"total": plan}
+        for item in plan:
+            groups.setdefault(item.periodo, []).append(item)
+        return {
+            name: {
+                "nivel": dict(sorted(Counter(str(i.nivel_dificuldade) for i in items).items())),
+                "posicao": dict(sorted(Counter(i.posicao_correta for i in items).items())),
+            }
+            for name, items in groups.items()
+        }
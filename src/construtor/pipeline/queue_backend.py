@@ -0,0 +1,302 @@
+"""Queue backend interface for distributed workers.
+
+Workers on several machines share one work queue, one set of rate-limit
+budgets and one result inbox through a QueueBackend. Implementations:
+
+- SqliteQueueBackend: the MetricsStore ledger in a SQLite file (use
+  ``journal_mode="DELETE"`` when the file lives on NFS)
+- FileSpoolBackend: JSON files in a shared directory, serialized by a lock file
+- RedisQueueBackend: any Redis-compatible client (InMemoryRedis for tests)
+
+Leases and rate budgets use wall-clock time (``time.time``), so the machines
+must have synchronized clocks (NTP).
+"""
+
+import time
+from abc import ABC, abstractmethod
+from contextlib import AbstractContextManager
+from typing import Protocol, runtime_checkable
+
+from construtor.models import WorkItem, WorkResult
+from construtor.pipeline.sharded import gcra_reserve
+
+WORK_STATUSES: tuple[str, ...] = ("queued", "in_flight", "done", "failed")
+
+
+@runtime_checkable
+class QueueBackend(Protocol):
+    """Shared work queue, lease table, rate budget and result inbox.
+
+    All methods are synchronous and atomic with respect to every other
+    worker using the same backend. They may block (waiting on a lock), so
+    DistributedWorker calls them from threads: they must be thread-safe.
+    """
+
+    def enqueue(self, items: list[WorkItem]) -> int:
+        """Add items as queued; items already known are ignored. Returns inserted count."""
+        ...
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: float) -> list[WorkItem]:
+        """Lease up to ``limit`` queued (or lease-expired) items, oldest first."""
+        ...
+
+    def heartbeat(self, worker_id: str, item_ids: list[int], lease_seconds: float) -> list[int]:
+        """Extend the leases of ``item_ids``. Returns the ids whose lease was lost."""
+        ...
+
+    def complete(self, worker_id: str, result: WorkResult) -> bool:
+        """Mark ``result.item`` done and store the result, if the lease is still held."""
+        ...
+
+    def fail(self, item_id: int, worker_id: str, error: str, requeue: bool) -> bool:
+        """Record a failure (requeue or mark failed), if the lease is still held."""
+        ...
+
+    def reserve(self, bucket: str, cost: float) -> float:
+        """Book ``cost`` seconds of a shared rate budget. Returns the wait in seconds."""
+        ...
+
+    def pending_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        """Return up to ``limit`` unmerged results as (result_id, result), oldest first."""
+        ...
+
+    def ack_results(self, result_ids: list[int]) -> None:
+        """Remove merged results from the inbox."""
+        ...
+
+    def counts(self) -> dict[str, int]:
+        """Number of items per status."""
+        ...
+
+    def close(self) -> None:
+        """Release resources held by the backend."""
+        ...
+
+
+class LockedQueueBackend(ABC):
+    """QueueBackend built on a key-value store and a global lock.
+
+    Subclasses provide storage primitives and a cross-process lock; the queue
+    semantics (idempotent enqueue, leases, expiry, GCRA budgets) live here so
+    every backend behaves the same. Every public operation runs under the
+    lock, which keeps the storage primitives simple. Backend operations are
+    tiny compared to an LLM call, so the serialization is not a bottleneck.
+    """
+
+    def __init__(self) -> None:
+        self._clock = time.time
+
+    # ------------------------------------------------------------------
+    # Storage primitives (called with the lock held)
+    # ------------------------------------------------------------------
+
+    @abstractmethod
+    def _locked(self) -> AbstractContextManager[None]:
+        """Exclusive lock across every process using the backend."""
+
+    @abstractmethod
+    def _register_key(self, key: str) -> bool:
+        """Record an item's natural key; False if it was already known."""
+
+    @abstractmethod
+    def _next_id(self, sequence: str) -> int:
+        """Next value of a named id sequence (starting at 1)."""
+
+    @abstractmethod
+    def _load(self, item_id: int) -> WorkItem | None:
+        """Load an item by id."""
+
+    @abstractmethod
+    def _store(self, item: WorkItem, previous_status: str | None) -> None:
+        """Save an item, moving it from ``previous_status`` to ``item.status``."""
+
+    @abstractmethod
+    def _ids(self, status: str, limit: int | None = None) -> list[int]:
+        """Ids of items in ``status``, lowest first."""
+
+    @abstractmethod
+    def _count(self, status: str) -> int:
+        """Number of items in ``status``."""
+
+    @abstractmethod
+    def _add_result(self, result_id: int, result: WorkResult) -> None:
+        """Add a result to the inbox."""
+
+    @abstractmethod
+    def _load_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        """Oldest results in the inbox."""
+
+    @abstractmethod
+    def _delete_results(self, result_ids: list[int]) -> None:
+        """Remove results from the inbox."""
+
+    @abstractmethod
+    def _load_tat(self, bucket: str) -> float | None:
+        """Theoretical arrival time of a rate bucket."""
+
+    @abstractmethod
+    def _store_tat(self, bucket: str, tat: float) -> None:
+        """Save the theoretical arrival time of a rate bucket."""
+
+    # ------------------------------------------------------------------
+    # QueueBackend
+    # ------------------------------------------------------------------
+
+    def enqueue(self, items: list[WorkItem]) -> int:
+        """Add items as queued; items already known are ignored."""
+        inserted = 0
+        with self._locked():
+            for item in items:
+                if not self._register_key(natural_key(item)):
+                    continue
+                queued = WorkItem(
+                    id=self._next_id("items"),
+                    **item.model_dump(
+                        include={
+                            "tema",
+                            "foco",
+                            "periodo",
+                            "sub_foco",
+                            "nivel_dificuldade",
+                            "posicao_correta",
+                        }
+                    ),
+                )
+                self._store(queued, None)
+                inserted += 1
+        return inserted
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: float) -> list[WorkItem]:
+        """Lease up to ``limit`` queued (or lease-expired) items, oldest first."""
+        if limit <= 0:
+            msg = f"limit must be positive, got {limit}"
+            raise ValueError(msg)
+
+        with self._locked():
+            now = self._clock()
+            for item_id in self._ids("in_flight"):
+                item = self._load(item_id)
+                if item is not None and (item.lease_expires_at or 0.0) < now:
+                    self._store(
+                        item.model_copy(
+                            update={
+                                "status": "queued",
+                                "lease_owner": None,
+                                "lease_expires_at": None,
+                            }
+                        ),
+                        "in_flight",
+                    )
+
+            claimed = []
+            for item_id in self._ids("queued", limit):
+                item = self._load(item_id)
+                if item is None:
+                    continue
+                leased = item.model_copy(
+                    update={
+                        "status": "in_flight",
+                        "lease_owner": worker_id,
+                        "lease_expires_at": now + lease_seconds,
+                        "attempts": item.attempts + 1,
+                    }
+                )
+                self._store(leased, "queued")
+                claimed.append(leased)
+        return claimed
+
+    def heartbeat(self, worker_id: str, item_ids: list[int], lease_seconds: float) -> list[int]:
+        """Extend the leases of ``item_ids``; return the ids whose lease was lost."""
+        lost = []
+        with self._locked():
+            expires_at = self._clock() + lease_seconds
+            for item_id in item_ids:
+                item = self._held(item_id, worker_id)
+                if item is None:
+                    lost.append(item_id)
+                    continue
+                self._store(item.model_copy(update={"lease_expires_at": expires_at}), "in_flight")
+        return lost
+
+    def complete(self, worker_id: str, result: WorkResult) -> bool:
+        """Mark ``result.item`` done and store the result, if the lease is still held."""
+        if result.item.id is None:
+            msg = "result.item has no id"
+            raise ValueError(msg)
+
+        with self._locked():
+            item = self._held(result.item.id, worker_id)
+            if item is None:
+                return False
+            done = item.model_copy(
+                update={"status": "done", "lease_owner": None, "lease_expires_at": None}
+            )
+            self._add_result(self._next_id("results"), result.model_copy(update={"item": done}))
+            self._store(done, "in_flight")
+        return True
+
+    def fail(self, item_id: int, worker_id: str, error: str, requeue: bool) -> bool:
+        """Record a failure (requeue or mark failed), if the lease is still held."""
+        with self._locked():
+            item = self._held(item_id, worker_id)
+            if item is None:
+                return False
+            self._store(
+                item.model_copy(
+                    update={
+                        "status": "queued" if requeue else "failed",
+                        "last_error": error,
+                        "lease_owner": None,
+                        "lease_expires_at": None,
+                    }
+                ),
+                "in_flight",
+            )
+        return True
+
+    def reserve(self, bucket: str, cost: float) -> float:
+        """Book ``cost`` seconds of a shared rate budget; return the wait in seconds."""
+        with self._locked():
+            tat, delay = gcra_reserve(self._load_tat(bucket), self._clock(), cost)
+            self._store_tat(bucket, tat)
+        return delay
+
+    def pending_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        """Return up to ``limit`` unmerged results, oldest first."""
+        with self._locked():
+            return self._load_results(limit)
+
+    def ack_results(self, result_ids: list[int]) -> None:
+        """Remove merged results from the inbox."""
+        if result_ids:
+            with self._locked():
+                self._delete_results(result_ids)
+
+    def counts(self) -> dict[str, int]:
+        """Number of items per status."""
+        with self._locked():
+            return {status: self._count(status) for status in WORK_STATUSES}
+
+    def close(self) -> None:  # noqa: B027 - optional hook, not abstract
+        """Release resources held by the backend."""
+
+    def _held(self, item_id: int, worker_id: str) -> WorkItem | None:
+        """The item if it is in flight and leased by ``worker_id``."""
+        item = self._load(item_id)
+        if item is None or item.status != "in_flight" or item.lease_owner != worker_id:
+            return None
+        return item
+
+
+def natural_key(item: WorkItem) -> str:
+    """Identity of a work item across enqueues (same fields as the ledger's UNIQUE)."""
+    return "\x1f".join(
+        (
+            item.tema,
+            item.foco,
+            item.periodo,
+            item.sub_foco,
+            str(item.nivel_dificuldade),
+            item.posicao_correta,
+        )
+    )
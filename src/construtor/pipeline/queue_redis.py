@@ -0,0 +1,261 @@
+"""Redis-compatible queue backend.
+
+RedisQueueBackend works with any client exposing the redis-py command
+methods it uses (``redis.Redis(decode_responses=True)``, Valkey, KeyDB...).
+No Redis client is a dependency of this package: pass a client in. For tests
+and single-machine runs, InMemoryRedis implements the same commands
+in-process.
+
+Keys (under ``prefix``):
+    lock                  global mutex (SET NX PX)
+    keys                  hash: natural key -> item id
+    seq:<name>            id counters (INCR)
+    items                 hash: item id -> WorkItem JSON
+    status:<status>       sorted set of item ids (score = id)
+    results               hash: result id -> WorkResult JSON
+    results:order         sorted set of pending result ids
+    bucket:<name>         rate-budget arrival time
+"""
+
+import threading
+import time
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Protocol
+
+from construtor.models import WorkItem, WorkResult
+from construtor.pipeline.queue_backend import LockedQueueBackend
+
+# Compare-and-delete in one atomic step: release the mutex only if it is still ours
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+
+
+class RedisLike(Protocol):
+    """Subset of the redis-py client API used by RedisQueueBackend."""
+
+    def set(self, name: str, value: str, nx: bool = False, px: int | None = None) -> object: ...
+    def get(self, name: str) -> str | None: ...
+    def delete(self, *names: str) -> int: ...
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> object: ...
+    def incr(self, name: str) -> int: ...
+    def hsetnx(self, name: str, key: str, value: str) -> object: ...
+    def hset(self, name: str, key: str, value: str) -> object: ...
+    def hget(self, name: str, key: str) -> str | None: ...
+    def hdel(self, name: str, *keys: str) -> int: ...
+    def zadd(self, name: str, mapping: dict[str, float]) -> int: ...
+    def zrem(self, name: str, *values: str) -> int: ...
+    def zrange(self, name: str, start: int, end: int) -> list[str]: ...
+    def zcard(self, name: str) -> int: ...
+
+
+class RedisQueueBackend(LockedQueueBackend):
+    """QueueBackend on a Redis-compatible server.
+
+    Every operation runs under a SET NX PX mutex. The mutex expires after
+    ``lock_ttl`` seconds, so a worker that dies while holding it cannot block
+    the queue.
+
+    Args:
+        client: Redis-compatible client returning ``str`` values
+            (``decode_responses=True``)
+        prefix: Key prefix, to share one server between runs
+        lock_ttl: Expiry of the mutex in seconds
+
+    Example:
+        >>> backend = RedisQueueBackend(redis.Redis(host, decode_responses=True))
+        >>> worker = DistributedWorker(backend, handler)
+    """
+
+    def __init__(
+        self, client: RedisLike, prefix: str = "construtor", lock_ttl: float = 10.0
+    ) -> None:
+        super().__init__()
+        self._client = client
+        self._prefix = prefix
+        self._lock_ttl_ms = int(lock_ttl * 1000)
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        token = uuid.uuid4().hex
+        lock_key = self._key("lock")
+        while not self._client.set(lock_key, token, nx=True, px=self._lock_ttl_ms):
+            time.sleep(0.002)
+        try:
+            yield
+        finally:
+            # Only release our own lock (it may have expired and been re-taken);
+            # a GET then DEL could delete a lock re-taken between the two calls
+            self._client.eval(_RELEASE_SCRIPT, 1, lock_key, token)
+
+    def _register_key(self, key: str) -> bool:
+        return bool(self._client.hsetnx(self._key("keys"), key, "1"))
+
+    def _next_id(self, sequence: str) -> int:
+        return int(self._client.incr(self._key(f"seq:{sequence}")))
+
+    def _load(self, item_id: int) -> WorkItem | None:
+        data = self._client.hget(self._key("items"), str(item_id))
+        return WorkItem.model_validate_json(data) if data is not None else None
+
+    def _store(self, item: WorkItem, previous_status: str | None) -> None:
+        member = str(item.id)
+        self._client.hset(self._key("items"), member, item.model_dump_json())
+        if previous_status is not None and previous_status != item.status:
+            self._client.zrem(self._key(f"status:{previous_status}"), member)
+        self._client.zadd(self._key(f"status:{item.status}"), {member: float(item.id or 0)})
+
+    def _ids(self, status: str, limit: int | None = None) -> list[int]:
+        end = -1 if limit is None else limit - 1
+        return [
+            int(member) for member in self._client.zrange(self._key(f"status:{status}"), 0, end)
+        ]
+
+    def _count(self, status: str) -> int:
+        return int(self._client.zcard(self._key(f"status:{status}")))
+
+    def _add_result(self, result_id: int, result: WorkResult) -> None:
+        self._client.hset(self._key("results"), str(result_id), result.model_dump_json())
+        self._client.zadd(self._key("results:order"), {str(result_id): float(result_id)})
+
+    def _load_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        results = []
+        for member in self._client.zrange(self._key("results:order"), 0, limit - 1):
+            data = self._client.hget(self._key("results"), member)
+            if data is not None:
+                results.append((int(member), WorkResult.model_validate_json(data)))
+        return results
+
+    def _delete_results(self, result_ids: list[int]) -> None:
+        members = [str(result_id) for result_id in result_ids]
+        self._client.hdel(self._key("results"), *members)
+        self._client.zrem(self._key("results:order"), *members)
+
+    def _load_tat(self, bucket: str) -> float | None:
+        value = self._client.get(self._key(f"bucket:{bucket}"))
+        return float(value) if value is not None else None
+
+    def _store_tat(self, bucket: str, tat: float) -> None:
+        self._client.set(self._key(f"bucket:{bucket}"), repr(tat))
+
+    def _key(self, name: str) -> str:
+        return f"{self._prefix}:{name}"
+
+
+class InMemoryRedis:
+    """In-process stand-in for the Redis commands used by RedisQueueBackend.
+
+    Thread-safe; values are strings, as with ``decode_responses=True``.
+    ``eval`` only runs the mutex release script.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._strings: dict[str, str] = {}
+        self._expires: dict[str, float] = {}
+        self._hashes: dict[str, dict[str, str]] = {}
+        self._zsets: dict[str, dict[str, float]] = {}
+
+    def set(self, name: str, value: str, nx: bool = False, px: int | None = None) -> bool | None:
+        with self._lock:
+            self._expire(name)
+            if nx and name in self._strings:
+                return None
+            self._strings[name] = value
+            if px is not None:
+                self._expires[name] = time.monotonic() + px / 1000
+            else:
+                self._expires.pop(name, None)
+            return True
+
+    def get(self, name: str) -> str | None:
+        with self._lock:
+            self._expire(name)
+            return self._strings.get(name)
+
+    def delete(self, *names: str) -> int:
+        with self._lock:
+            deleted = 0
+            for name in names:
+                for store in (self._strings, self._hashes, self._zsets):
+                    if store.pop(name, None) is not None:
+                        deleted += 1
+                self._expires.pop(name, None)
+            return deleted
+
+    def eval(self, script: str, numkeys: int, *keys_and_args: str) -> int:
+        if script != _RELEASE_SCRIPT or numkeys != 1:
+            msg = "InMemoryRedis.eval only runs the mutex release script"
+            raise NotImplementedError(msg)
+        name, token = keys_and_args
+        with self._lock:
+            self._expire(name)
+            if self._strings.get(name) != token:
+                return 0
+            del self._strings[name]
+            self._expires.pop(name, None)
+            return 1
+
+    def incr(self, name: str) -> int:
+        with self._lock:
+            value = int(self._strings.get(name, "0")) + 1
+            self._strings[name] = str(value)
+            return value
+
+    def hsetnx(self, name: str, key: str, value: str) -> int:
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            if key in fields:
+                return 0
+            fields[key] = value
+            return 1
+
+    def hset(self, name: str, key: str, value: str) -> int:
+        with self._lock:
+            fields = self._hashes.setdefault(name, {})
+            added = int(key not in fields)
+            fields[key] = value
+            return added
+
+    def hget(self, name: str, key: str) -> str | None:
+        with self._lock:
+            return self._hashes.get(name, {}).get(key)
+
+    def hdel(self, name: str, *keys: str) -> int:
+        with self._lock:
+            fields = self._hashes.get(name, {})
+            return sum(fields.pop(key, None) is not None for key in keys)
+
+    def zadd(self, name: str, mapping: dict[str, float]) -> int:
+        with self._lock:
+            members = self._zsets.setdefault(name, {})
+            added = sum(member not in members for member in mapping)
+            members.update(mapping)
+            return added
+
+    def zrem(self, name: str, *values: str) -> int:
+        with self._lock:
+            members = self._zsets.get(name, {})
+            return sum(members.pop(value, None) is not None for value in values)
+
+    def zrange(self, name: str, start: int, end: int) -> list[str]:
+        with self._lock:
+            ordered = sorted(self._zsets.get(name, {}).items(), key=lambda kv: (kv[1], kv[0]))
+            stop = len(ordered) if end == -1 else end + 1
+            return [member for member, _ in ordered[start:stop]]
+
+    def zcard(self, name: str) -> int:
+        with self._lock:
+            return len(self._zsets.get(name, {}))
+
+    def _expire(self, name: str) -> None:
+        """Drop a string key whose PX expiry has passed (lock held)."""
+        expires_at = self._expires.get(name)
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._strings[name]
+            del self._expires[name]
@@ -0,0 +1,136 @@
+"""File spool queue backend.
+
+Work items are JSON files in a shared directory (local disk or NFS), one
+subdirectory per status. A POSIX record lock on ``.lock`` serializes every
+operation across processes and machines (NFSv4 supports ``lockf``).
+
+Layout::
+
+    spool/
+        .lock
+        queued/000000000001.json     WorkItem
+        in_flight/  done/  failed/
+        keys/<blake2b>               one empty file per known natural key
+        results/000000000001.json    WorkResult awaiting merge
+        sequences/<name>             id counters
+        buckets/<name>               rate-budget arrival times
+"""
+
+import fcntl
+import hashlib
+import os
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+from construtor.models import WorkItem, WorkResult
+from construtor.pipeline.queue_backend import WORK_STATUSES, LockedQueueBackend
+
+
+class FileSpoolBackend(LockedQueueBackend):
+    """QueueBackend storing work items as files in a shared directory.
+
+    Args:
+        directory: Spool directory (created if missing)
+
+    Example:
+        >>> backend = FileSpoolBackend("/mnt/shared/spool")
+        >>> backend.enqueue(plan)
+        >>> worker = DistributedWorker(backend, handler)
+    """
+
+    def __init__(self, directory: str) -> None:
+        super().__init__()
+        self._root = Path(directory)
+        for name in (*WORK_STATUSES, "keys", "results", "sequences", "buckets"):
+            (self._root / name).mkdir(parents=True, exist_ok=True)
+        self._lock_path = self._root / ".lock"
+        # POSIX record locks do not exclude threads of the same process
+        self._thread_lock = threading.Lock()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self._thread_lock, self._lock_path.open("a+b") as lock_file:
+            fcntl.lockf(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.lockf(lock_file, fcntl.LOCK_UN)
+
+    def _register_key(self, key: str) -> bool:
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        try:
+            (self._root / "keys" / digest).touch(exist_ok=False)
+        except FileExistsError:
+            return False
+        return True
+
+    def _next_id(self, sequence: str) -> int:
+        path = self._root / "sequences" / sequence
+        value = int(path.read_text()) + 1 if path.exists() else 1
+        self._write(path, str(value))
+        return value
+
+    def _load(self, item_id: int) -> WorkItem | None:
+        for status in WORK_STATUSES:
+            path = self._item_path(status, item_id)
+            if path.exists():
+                return WorkItem.model_validate_json(path.read_bytes())
+        return None
+
+    def _store(self, item: WorkItem, previous_status: str | None) -> None:
+        self._write(self._item_path(item.status, item.id), item.model_dump_json())
+        if previous_status is not None and previous_status != item.status:
+            self._item_path(previous_status, item.id).unlink(missing_ok=True)
+
+    def _ids(self, status: str, limit: int | None = None) -> list[int]:
+        return [int(name.removesuffix(".json")) for name in self._names(status)[:limit]]
+
+    def _count(self, status: str) -> int:
+        return len(self._names(status))
+
+    def _add_result(self, result_id: int, result: WorkResult) -> None:
+        self._write(self._root / "results" / f"{result_id:012d}.json", result.model_dump_json())
+
+    def _load_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        names = self._names("results")[:limit]
+        return [
+            (
+                int(name.removesuffix(".json")),
+                WorkResult.model_validate_json((self._root / "results" / name).read_bytes()),
+            )
+            for name in names
+        ]
+
+    def _delete_results(self, result_ids: list[int]) -> None:
+        for result_id in result_ids:
+            (self._root / "results" / f"{result_id:012d}.json").unlink(missing_ok=True)
+
+    def _load_tat(self, bucket: str) -> float | None:
+        path = self._bucket_path(bucket)
+        return float(path.read_text()) if path.exists() else None
+
+    def _store_tat(self, bucket: str, tat: float) -> None:
+        self._write(self._bucket_path(bucket), repr(tat))
+
+    def _names(self, directory: str) -> list[str]:
+        """Sorted record file names of a spool subdirectory (temp files skipped)."""
+        return sorted(
+            entry.name
+            for entry in os.scandir(self._root / directory)
+            if entry.name.endswith(".json") and not entry.name.startswith(".")
+        )
+
+    def _item_path(self, status: str, item_id: int | None) -> Path:
+        return self._root / status / f"{item_id:012d}.json"
+
+    def _bucket_path(self, bucket: str) -> Path:
+        return self._root / "buckets" / hashlib.blake2b(bucket.encode("utf-8")).hexdigest()[:32]
+
+    @staticmethod
+    def _write(path: Path, content: str) -> None:
+        """Write a file atomically (readers never see a partial file)."""
+        temp_path = path.with_name(f".{path.name}.tmp")
+        temp_path.write_text(content, encoding="utf-8")
+        temp_path.replace(path)
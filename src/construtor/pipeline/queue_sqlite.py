@@ -0,0 +1,170 @@
+"""SQLite queue backend.
+
+SqliteQueueBackend serves the MetricsStore work-item ledger to workers on
+several machines through a shared SQLite file, adding two tables next to the
+ledger: the result inbox and the shared rate budgets. On a network
+filesystem use ``journal_mode="DELETE"``: WAL needs shared memory, which
+NFS does not provide.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics.store import MetricsStore
+from construtor.models import WorkItem, WorkResult
+from construtor.pipeline.sharded import gcra_reserve
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteQueueBackend:
+    """QueueBackend on the MetricsStore work-item ledger.
+
+    Args:
+        db_path: Shared SQLite file
+        journal_mode: SQLite journal mode ("DELETE" on NFS, "WAL" locally)
+        timeout: Seconds to wait for the write lock
+
+    Example:
+        >>> backend = SqliteQueueBackend("/mnt/shared/queue.db", journal_mode="DELETE")
+        >>> worker = DistributedWorker(backend, handler)
+    """
+
+    def __init__(self, db_path: str, journal_mode: str = "DELETE", timeout: float = 30.0) -> None:
+        self._store = MetricsStore(db_path, timeout=timeout, journal_mode=journal_mode)
+        self._conn = self._store.conn
+        # One connection shared by the worker's threads: one transaction at a time
+        self._thread_lock = threading.Lock()
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS work_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                payload TEXT NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS rate_buckets (
+                bucket TEXT PRIMARY KEY,
+                tat REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def enqueue(self, items: list[WorkItem]) -> int:
+        """Add items as queued; items already known are ignored."""
+        with self._thread_lock:
+            return self._store.enqueue_work_items(items)
+
+    def claim(self, worker_id: str, limit: int, lease_seconds: float) -> list[WorkItem]:
+        """Lease up to ``limit`` queued (or lease-expired) items, oldest first."""
+        with self._thread_lock:
+            return self._store.claim_work_items(worker_id, limit, lease_seconds)
+
+    def heartbeat(self, worker_id: str, item_ids: list[int], lease_seconds: float) -> list[int]:
+        """Extend the leases of ``item_ids``; return the ids whose lease was lost."""
+        with self._thread_lock:
+            return [
+                item_id
+                for item_id in item_ids
+                if not self._store.renew_work_item_lease(item_id, worker_id, lease_seconds)
+            ]
+
+    def complete(self, worker_id: str, result: WorkResult) -> bool:
+        """Mark ``result.item`` done and store the result, in one transaction."""
+        if result.item.id is None:
+            msg = "result.item has no id"
+            raise ValueError(msg)
+
+        with self._thread_lock:
+            try:
+                cursor = self._conn.cursor()
+                cursor.execute(
+                    """
+                    UPDATE work_items
+                    SET status = 'done', lease_owner = NULL, lease_expires_at = NULL,
+                        updated_at = datetime('now')
+                    WHERE id = ? AND status = 'in_flight' AND lease_owner = ?
+                """,
+                    (result.item.id, worker_id),
+                )
+                if cursor.rowcount != 1:
+                    self._conn.rollback()
+                    logger.warning(
+                        f"Worker {worker_id} no longer holds the lease on work item "
+                        f"{result.item.id}"
+                    )
+                    return False
+                done_item = result.item.model_copy(
+                    update={"status": "done", "lease_owner": None, "lease_expires_at": None}
+                )
+                done = result.model_copy(update={"item": done_item})
+                cursor.execute(
+                    "INSERT INTO work_results (payload) VALUES (?)", (done.model_dump_json(),)
+                )
+                self._conn.commit()
+
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.error(f"Failed to complete work item {result.item.id}: {e}", exc_info=True)
+                raise PipelineError(f"Database write failed: {e}") from e
+
+            return True
+
+    def fail(self, item_id: int, worker_id: str, error: str, requeue: bool) -> bool:
+        """Record a failure (requeue or mark failed), if the lease is still held."""
+        with self._thread_lock:
+            return self._store.fail_work_item(item_id, worker_id, error, requeue=requeue)
+
+    def reserve(self, bucket: str, cost: float) -> float:
+        """Book ``cost`` seconds of a shared rate budget; return the wait in seconds."""
+        with self._thread_lock:
+            try:
+                # IMMEDIATE takes the write lock before reading the arrival time
+                self._conn.execute("BEGIN IMMEDIATE")
+                row = self._conn.execute(
+                    "SELECT tat FROM rate_buckets WHERE bucket = ?", (bucket,)
+                ).fetchone()
+                tat, delay = gcra_reserve(row["tat"] if row else None, time.time(), cost)
+                self._conn.execute(
+                    """
+                    INSERT INTO rate_buckets (bucket, tat) VALUES (?, ?)
+                    ON CONFLICT(bucket) DO UPDATE SET tat = excluded.tat
+                """,
+                    (bucket, tat),
+                )
+                self._conn.commit()
+
+            except sqlite3.Error as e:
+                self._conn.rollback()
+                logger.error(f"Failed to reserve rate budget {bucket}: {e}", exc_info=True)
+                raise PipelineError(f"Database write failed: {e}") from e
+
+            return delay
+
+    def pending_results(self, limit: int) -> list[tuple[int, WorkResult]]:
+        """Return up to ``limit`` unmerged results, oldest first."""
+        with self._thread_lock:
+            rows = self._conn.execute(
+                "SELECT id, payload FROM work_results ORDER BY id LIMIT ?", (limit,)
+            ).fetchall()
+            return [(row["id"], WorkResult.model_validate_json(row["payload"])) for row in rows]
+
+    def ack_results(self, result_ids: list[int]) -> None:
+        """Remove merged results from the inbox."""
+        with self._thread_lock:
+            self._conn.executemany(
+                "DELETE FROM work_results WHERE id = ?", [(result_id,) for result_id in result_ids]
+            )
+            self._conn.commit()
+
+    def counts(self) -> dict[str, int]:
+        """Number of items per status."""
+        with self._thread_lock:
+            return self._store.get_work_item_counts()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._thread_lock:
+            self._store.close()
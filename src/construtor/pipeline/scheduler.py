@@ -0,0 +1,317 @@
+"""Priority scheduling of pipeline work.
+
+This module provides PriorityScheduler, which decides which question a worker
+picks up next. Questions rejected by the Validador (FR14) come back as
+retries carrying their RetryContext; retries are always dispatched before
+fresh work so questions reach a final state (approved or failed) as soon as
+possible instead of queuing behind new ones.
+
+Scheduling rules, in order:
+    1. Retries first: earliest deadline, then highest rodada, then FIFO.
+    2. Fresh work only while fewer than ``max_in_flight`` questions are in
+       flight. A question holds its slot from its first dispatch until
+       ``done``; its retries reuse the slot, so in-flight state (drafts,
+       feedback, retry contexts) never exceeds the cap.
+    3. Among focos with fresh work: earliest deadline, then the foco with the
+       fewest questions in flight, then the one dispatched least so far, so
+       one large foco cannot starve the others.
+
+Work whose deadline passes before it is dispatched is not started; it is
+reported through ``drain_expired`` so the caller can mark it failed.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import time
+from collections.abc import Callable
+
+from pydantic import BaseModel, ConfigDict
+
+from construtor.models import RetryContext, WorkItem
+
+logger = logging.getLogger(__name__)
+
+FocoKey = tuple[str, str, str]
+
+
+class ScheduledTask(BaseModel):
+    """A unit of work handed to a worker by PriorityScheduler.
+
+    Attributes:
+        task_id: Scheduler-assigned id, stable across retries of the question
+        item: The work item (sub-foco, nivel, posição) to generate
+        retry: Retry context if this is a regeneration round, else None
+        deadline: Absolute deadline on the scheduler clock, or None
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    task_id: int
+    item: WorkItem
+    retry: RetryContext | None = None
+    deadline: float | None = None
+
+    @property
+    def foco_key(self) -> FocoKey:
+        """(tema, foco, periodo) of the task, used for fairness."""
+        return (self.item.tema, self.item.foco, self.item.periodo)
+
+
+class PriorityScheduler:
+    """Async scheduler favoring retries, fair across focos, with an in-flight cap.
+
+    Args:
+        max_in_flight: Maximum number of questions started and not yet done
+        clock: Monotonic clock used for deadlines (``time.monotonic``)
+
+    Raises:
+        ValueError: If max_in_flight is not positive
+
+    Example:
+        >>> scheduler = PriorityScheduler(max_in_flight=20)
+        >>> for item in store.claim_work_items("worker-1", limit=100):
+        ...     scheduler.submit(item)
+        >>> scheduler.close()
+        >>> while (task := await scheduler.next()) is not None:
+        ...     if rejected:
+        ...         scheduler.retry(task, retry_context)
+        ...     else:
+        ...         scheduler.done(task)
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 20,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_in_flight <= 0:
+            msg = f"max_in_flight must be positive, got {max_in_flight}"
+            raise ValueError(msg)
+
+        self._max_in_flight = max_in_flight
+        self._clock = clock
+        self._seq = itertools.count()
+        self._task_ids = itertools.count(1)
+
+        # Heap entries: (deadline, tie-breakers..., seq, task)
+        self._retries: list[tuple[float, int, int, ScheduledTask]] = []
+        self._fresh: dict[FocoKey, list[tuple[float, int, ScheduledTask]]] = {}
+        self._fresh_pending = 0
+        self._foco_order: dict[FocoKey, int] = {}
+        self._foco_in_flight: dict[FocoKey, int] = {}
+        self._foco_dispatched: dict[FocoKey, int] = {}
+
+        self._in_flight: dict[int, ScheduledTask] = {}
+        self._waiting_retry: set[int] = set()
+        self._expired: list[ScheduledTask] = []
+        self._closed = False
+        self._wakeup = asyncio.Event()
+
+    # ------------------------------------------------------------------
+    # Producers
+    # ------------------------------------------------------------------
+
+    def submit(self, item: WorkItem, deadline: float | None = None) -> ScheduledTask:
+        """Queue fresh work.
+
+        Args:
+            item: Work item to generate (usually claimed from the ledger)
+            deadline: Absolute deadline on the scheduler clock; the item is
+                not started after it
+
+        Returns:
+            The queued ScheduledTask
+
+        Raises:
+            RuntimeError: If the scheduler was closed
+        """
+        if self._closed:
+            msg = "Cannot submit work to a closed scheduler"
+            raise RuntimeError(msg)
+
+        task = ScheduledTask(task_id=next(self._task_ids), item=item, deadline=deadline)
+        key = task.foco_key
+        self._foco_order.setdefault(key, len(self._foco_order))
+        heapq.heappush(
+            self._fresh.setdefault(key, []), (_deadline_key(deadline), next(self._seq), task)
+        )
+        self._fresh_pending += 1
+        self._wakeup.set()
+        return task
+
+    def retry(self, task: ScheduledTask, retry: RetryContext) -> ScheduledTask:
+        """Re-queue an in-flight question for another round, ahead of fresh work.
+
+        The question keeps its in-flight slot while waiting.
+
+        Args:
+            task: Task previously returned by ``next``
+            retry: Context with the Validador feedback for the new round
+
+        Returns:
+            The re-queued ScheduledTask (same task_id and deadline)
+
+        Raises:
+            ValueError: If the task is not in flight or already waiting for
+                a retry
+        """
+        self._require_in_flight(task)
+        if task.task_id in self._waiting_retry:
+            msg = f"Task {task.task_id} is already queued for retry"
+            raise ValueError(msg)
+        retried = task.model_copy(update={"retry": retry})
+        self._in_flight[task.task_id] = retried
+        self._waiting_retry.add(task.task_id)
+        heapq.heappush(
+            self._retries,
+            (_deadline_key(task.deadline), -retry.rodada_atual, next(self._seq), retried),
+        )
+        self._wakeup.set()
+        logger.debug(
+            f"Retry queued | task={task.task_id} rodada={retry.rodada_atual} foco={task.item.foco}"
+        )
+        return retried
+
+    def done(self, task: ScheduledTask) -> None:
+        """Mark a question as finished (approved or failed), freeing its slot.
+
+        Args:
+            task: Task previously returned by ``next``
+
+        Raises:
+            ValueError: If the task is not in flight
+        """
+        self._require_in_flight(task)
+        self._release(task.task_id)
+        # A queued retry stays in the heap and is skipped when popped
+        self._waiting_retry.discard(task.task_id)
+        self._wakeup.set()
+
+    def close(self) -> None:
+        """Signal that no more fresh work will be submitted.
+
+        ``next`` returns None once the queues are empty and every in-flight
+        question is done.
+        """
+        self._closed = True
+        self._wakeup.set()
+
+    # ------------------------------------------------------------------
+    # Consumers
+    # ------------------------------------------------------------------
+
+    async def next(self) -> ScheduledTask | None:
+        """Wait for the next task to work on.
+
+        Returns:
+            The highest-priority ready task, or None once the scheduler is
+            closed and fully drained
+        """
+        while True:
+            task = self._pop_ready()
+            if task is not None:
+                return task
+            if self._closed and not self._fresh_pending and not self._in_flight:
+                return None
+            self._wakeup.clear()
+            await self._wakeup.wait()
+
+    def drain_expired(self) -> list[ScheduledTask]:
+        """Return (and forget) the tasks whose deadline passed before dispatch.
+
+        Returns:
+            Expired tasks, in the order they were found
+        """
+        expired, self._expired = self._expired, []
+        return expired
+
+    def get_statistics(self) -> dict[str, int]:
+        """Get current queue sizes.
+
+        Returns:
+            Dictionary with ``in_flight``, ``pending_fresh``,
+            ``pending_retries`` and ``expired`` (not yet drained)
+        """
+        return {
+            "in_flight": len(self._in_flight),
+            "pending_fresh": self._fresh_pending,
+            "pending_retries": len(self._waiting_retry),
+            "expired": len(self._expired),
+        }
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _pop_ready(self) -> ScheduledTask | None:
+        """Pop the next dispatchable task, expiring overdue work on the way."""
+        now = self._clock()
+
+        while self._retries:
+            deadline, _, _, task = heapq.heappop(self._retries)
+            self._waiting_retry.discard(task.task_id)
+            if task.task_id not in self._in_flight:
+                continue  # finished with done() while waiting
+            if deadline >= now:
+                return task
+            # The question held a slot while waiting; expiring it frees the slot
+            self._release(task.task_id)
+            self._expire(task)
+
+        while self._fresh_pending and len(self._in_flight) < self._max_in_flight:
+            key = min(self._fresh, key=self._foco_priority)
+            heap = self._fresh[key]
+            deadline, _, task = heapq.heappop(heap)
+            if not heap:
+                del self._fresh[key]
+            self._fresh_pending -= 1
+            if deadline < now:
+                self._expire(task)
+                continue
+
+            self._in_flight[task.task_id] = task
+            self._foco_in_flight[key] = self._foco_in_flight.get(key, 0) + 1
+            self._foco_dispatched[key] = self._foco_dispatched.get(key, 0) + 1
+            return task
+
+        return None
+
+    def _foco_priority(self, key: FocoKey) -> tuple[float, int, int, int]:
+        """Fresh-work ordering between focos (smaller is served first)."""
+        return (
+            self._fresh[key][0][0],
+            self._foco_in_flight.get(key, 0),
+            self._foco_dispatched.get(key, 0),
+            self._foco_order[key],
+        )
+
+    def _release(self, task_id: int) -> None:
+        """Free the in-flight slot of a task."""
+        task = self._in_flight.pop(task_id)
+        key = task.foco_key
+        self._foco_in_flight[key] -= 1
+        if not self._foco_in_flight[key]:
+            del self._foco_in_flight[key]
+
+    def _expire(self, task: ScheduledTask) -> None:
+        """Record a task whose deadline passed before dispatch."""
+        logger.warning(
+            f"Deadline passed before dispatch | task={task.task_id} "
+            f"foco={task.item.foco} sub_foco={task.item.sub_foco}"
+        )
+        self._expired.append(task)
+
+    def _require_in_flight(self, task: ScheduledTask) -> None:
+        """Reject operations on tasks the scheduler does not have in flight."""
+        if task.task_id not in self._in_flight:
+            msg = f"Task {task.task_id} is not in flight"
+            raise ValueError(msg)
+
+
+def _deadline_key(deadline: float | None) -> float:
+    """Heap key of a deadline (no deadline sorts last)."""
+    return math.inf if deadline is None else deadline
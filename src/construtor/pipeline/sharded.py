@@ -0,0 +1,396 @@
+"""Multi-process sharded pipeline execution.
+
+A single asyncio loop does all JSON parsing, strict Pydantic validation,
+SQLite writes and prompt formatting; at high concurrency that loop becomes
+CPU-bound long before the API limits are reached. ShardedPipeline spreads the
+work over N worker processes:
+
+    - Focos are sharded across workers by a stable hash stored in the
+      work-item ledger, so all sub-focos of a foco go to the same worker.
+    - Each worker runs its own event loop and builds its own providers (via
+      the handler factory), claiming items of its shard from the central
+      MetricsStore with leases.
+    - Rate-limit budgets are shared through a coordinator process that hands
+      out request/token reservations, so N workers together stay within the
+      per-model limits.
+    - All workers write to the same SQLite store (WAL mode).
+"""
+
+import asyncio
+import functools
+import logging
+import multiprocessing
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from multiprocessing.managers import BaseManager
+from typing import TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics.store import MetricsStore
+from construtor.models import WorkItem
+
+logger = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Reservations may run this far ahead of the steady rate (allowed burst)
+_BURST_SECONDS = 1.0
+
+WorkHandler = Callable[[WorkItem], Awaitable[int | None]]
+"""Processes one work item and returns the saved question_id (if any)."""
+
+
+def gcra_reserve(tat: float | None, now: float, cost: float) -> tuple[float, float]:
+    """Book ``cost`` seconds of capacity with the generic cell rate algorithm.
+
+    Args:
+        tat: Current theoretical arrival time of the budget (None if unused)
+        now: Current time
+        cost: Capacity consumed, in seconds of the steady rate
+
+    Returns:
+        ``(new_tat, delay)``: the updated arrival time to store and how long
+        the caller must wait before using the reservation
+    """
+    new_tat = max(tat if tat is not None else now, now) + cost
+    return new_tat, max(0.0, new_tat - now - _BURST_SECONDS)
+
+
+class RateLimit(BaseModel):
+    """API limits of one model, shared by all worker processes.
+
+    Attributes:
+        requests_per_minute: Maximum requests per minute
+        tokens_per_minute: Maximum tokens per minute (None = not limited)
+    """
+
+    # MANDATORY: Strict validation - no type coercion
+    model_config = ConfigDict(strict=True)
+
+    requests_per_minute: int = Field(..., gt=0)
+    tokens_per_minute: int | None = Field(default=None, gt=0)
+
+
+class RateBudget:
+    """Per-model request/token budget living in the coordinator process.
+
+    Uses the generic cell rate algorithm: every reservation books the next
+    free slot and returns how long the caller must wait for it, so the
+    coordinator never blocks and each acquisition is a single round trip.
+    The manager serves each proxy connection in its own thread, so
+    reservations are serialized by a lock.
+
+    Args:
+        limits: Rate limits per model name; models without an entry are not
+            limited
+        clock: Monotonic clock (``time.monotonic``)
+    """
+
+    def __init__(
+        self,
+        limits: dict[str, RateLimit],
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._limits = dict(limits)
+        self._clock = clock
+        # Theoretical arrival time of the next request / token per model
+        self._request_tat: dict[str, float] = {}
+        self._token_tat: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, model: str, tokens: int = 0) -> float:
+        """Book one request (and ``tokens`` tokens) for ``model``.
+
+        Args:
+            model: Model name
+            tokens: Estimated tokens of the request
+
+        Returns:
+            Seconds the caller must wait before sending the request
+        """
+        limit = self._limits.get(model)
+        if limit is None:
+            return 0.0
+
+        with self._lock:
+            now = self._clock()
+            delay = self._book(self._request_tat, model, now, 60.0 / limit.requests_per_minute)
+            if limit.tokens_per_minute is not None and tokens > 0:
+                token_cost = tokens * 60.0 / limit.tokens_per_minute
+                delay = max(delay, self._book(self._token_tat, model, now, token_cost))
+            return delay
+
+    @staticmethod
+    def _book(tats: dict[str, float], model: str, now: float, cost: float) -> float:
+        """Advance a theoretical arrival time by ``cost`` seconds; return the wait."""
+        tats[model], delay = gcra_reserve(tats.get(model), now, cost)
+        return delay
+
+
+class _CoordinatorManager(BaseManager):
+    """Manager process hosting the shared RateBudget."""
+
+
+_CoordinatorManager.register("RateBudget", RateBudget)
+
+
+class SharedRateLimiter:
+    """Worker-side handle on the coordinator's RateBudget.
+
+    Args:
+        budget: RateBudget instance or manager proxy to it
+
+    Example:
+        >>> await limiter.acquire("gpt-4o", tokens=1800)
+        >>> response = await provider.generate(prompt, "gpt-4o", 0.7)
+    """
+
+    def __init__(self, budget: RateBudget) -> None:
+        self._budget = budget
+
+    async def acquire(self, model: str, tokens: int = 0) -> None:
+        """Wait until a request to ``model`` fits the shared budget.
+
+        Args:
+            model: Model name
+            tokens: Estimated tokens of the request
+        """
+        # A manager-proxy call is a blocking round trip to the coordinator
+        delay = await asyncio.to_thread(self._budget.reserve, model, tokens)
+        if delay > 0:
+            logger.debug(f"Rate budget: waiting {delay:.2f}s for {model}")
+            await asyncio.sleep(delay)
+
+
+HandlerFactory = Callable[[SharedRateLimiter], WorkHandler]
+"""Builds a worker's handler (and its providers) inside the worker process."""
+
+
+class ShardedPipeline:
+    """Runs the work-item ledger across N worker processes.
+
+    Args:
+        db_path: Central SQLite store holding the work-item ledger
+        handler_factory: Top-level (picklable) callable run once in each
+            worker process with the worker's SharedRateLimiter; returns the
+            async handler for one WorkItem. Providers are created there so
+            each process owns its clients and event loop.
+        workers: Number of worker processes (shards)
+        rate_limits: Shared API limits per model
+        concurrency: Concurrent items per worker
+        lease_seconds: Lease of claimed items; renewed while processing
+        max_attempts: Attempts before a failing item is marked failed
+        start_method: multiprocessing start method (``"spawn"`` is safe with
+            threads and SDK clients)
+
+    Raises:
+        ValueError: If workers, concurrency, lease_seconds or max_attempts is
+            not positive
+
+    Example:
+        >>> def make_handler(limiter):
+        ...     provider = OpenAIProvider(api_key, Semaphore(10))
+        ...     async def handle(item):
+        ...         await limiter.acquire("gpt-4o", tokens=2000)
+        ...         return await generate_and_save(provider, item)
+        ...     return handle
+        >>> pipeline = ShardedPipeline(
+        ...     "output/pipeline_state.db",
+        ...     make_handler,
+        ...     workers=4,
+        ...     rate_limits={"gpt-4o": RateLimit(requests_per_minute=500)},
+        ... )
+        >>> pipeline.run()
+        {'queued': 0, 'in_flight': 0, 'done': 980, 'failed': 20}
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        handler_factory: HandlerFactory,
+        workers: int = 4,
+        rate_limits: dict[str, RateLimit] | None = None,
+        concurrency: int = 10,
+        lease_seconds: float = 300.0,
+        max_attempts: int = 3,
+        start_method: str = "spawn",
+    ) -> None:
+        for name, value in (
+            ("workers", workers),
+            ("concurrency", concurrency),
+            ("lease_seconds", lease_seconds),
+            ("max_attempts", max_attempts),
+        ):
+            if value <= 0:
+                msg = f"{name} must be positive, got {value}"
+                raise ValueError(msg)
+
+        self._db_path = db_path
+        self._handler_factory = handler_factory
+        self._workers = workers
+        self._rate_limits = rate_limits or {}
+        self._concurrency = concurrency
+        self._lease_seconds = lease_seconds
+        self._max_attempts = max_attempts
+        self._context = multiprocessing.get_context(start_method)
+
+    def run(self) -> dict[str, int]:
+        """Process the ledger until every shard has no claimable work.
+
+        Items of a worker process that dies are released back to the queue
+        (they are picked up by the next run).
+
+        Returns:
+            Work-item counts per status after the run
+        """
+        with _CoordinatorManager(ctx=self._context) as manager:
+            budget = manager.RateBudget(self._rate_limits)  # type: ignore[attr-defined]
+            processes = [
+                self._context.Process(
+                    target=_worker_main,
+                    name=_worker_id(index),
+                    args=(
+                        index,
+                        self._workers,
+                        self._db_path,
+                        self._handler_factory,
+                        budget,
+                        self._concurrency,
+                        self._lease_seconds,
+                        self._max_attempts,
+                    ),
+                )
+                for index in range(self._workers)
+            ]
+            logger.info(f"Starting {self._workers} worker processes on {self._db_path}")
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join()
+
+        with MetricsStore(self._db_path) as store:
+            for index, process in enumerate(processes):
+                if process.exitcode != 0:
+                    logger.error(f"Worker {process.name} exited with code {process.exitcode}")
+                    store.release_work_items(_worker_id(index))
+            counts = store.get_work_item_counts()
+
+        logger.info(f"Sharded run finished | {counts}")
+        return counts
+
+
+def _worker_id(index: int) -> str:
+    """Ledger lease owner of a worker process."""
+    return f"shard-{index}"
+
+
+def _worker_main(
+    index: int,
+    count: int,
+    db_path: str,
+    handler_factory: HandlerFactory,
+    budget: RateBudget,
+    concurrency: int,
+    lease_seconds: float,
+    max_attempts: int,
+) -> None:
+    """Worker process entry point: one event loop per process."""
+    store = MetricsStore(db_path)
+    try:
+        handler = handler_factory(SharedRateLimiter(budget))
+        asyncio.run(
+            _run_shard(
+                store,
+                handler,
+                _worker_id(index),
+                (index, count),
+                concurrency,
+                lease_seconds,
+                max_attempts,
+            )
+        )
+    finally:
+        store.close()
+
+
+async def _run_shard(
+    store: MetricsStore,
+    handler: WorkHandler,
+    worker_id: str,
+    shard: tuple[int, int],
+    concurrency: int,
+    lease_seconds: float,
+    max_attempts: int,
+) -> None:
+    """Claim and process items of one shard until none are claimable."""
+    in_flight: set[int] = set()
+    processed = 0
+    # Store calls run in threads (a busy database blocks for up to its
+    # timeout); they share one connection, so one call at a time
+    store_lock = threading.Lock()
+
+    def locked(call: Callable[[], _T]) -> _T:
+        with store_lock:
+            return call()
+
+    async def call_store(call: Callable[[], _T]) -> _T:
+        return await asyncio.to_thread(locked, call)
+
+    async def renew_leases() -> None:
+        while True:
+            await asyncio.sleep(lease_seconds / 3)
+            for item_id in list(in_flight):
+                try:
+                    await call_store(
+                        functools.partial(
+                            store.renew_work_item_lease, item_id, worker_id, lease_seconds
+                        )
+                    )
+                except PipelineError:
+                    # Keep renewing the other leases; this one may expire
+                    logger.exception(f"{worker_id}: cannot renew lease of work item {item_id}")
+
+    async def consume() -> None:
+        nonlocal processed
+        while True:
+            claimed = await call_store(
+                functools.partial(
+                    store.claim_work_items,
+                    worker_id,
+                    1,
+                    lease_seconds,
+                    shard=shard,
+                    max_attempts=max_attempts,
+                )
+            )
+            if not claimed:
+                return
+            item = claimed[0]
+            in_flight.add(item.id)
+            try:
+                question_id = await handler(item)
+            except Exception as e:
+                logger.exception(f"{worker_id}: work item {item.id} failed")
+                requeue = item.attempts < max_attempts
+                await call_store(
+                    functools.partial(
+                        store.fail_work_item, item.id, worker_id, str(e), requeue=requeue
+                    )
+                )
+            else:
+                await call_store(
+                    functools.partial(store.complete_work_item, item.id, worker_id, question_id)
+                )
+                processed += 1
+            finally:
+                in_flight.discard(item.id)
+
+    renewer = asyncio.create_task(renew_leases())
+    try:
+        await asyncio.gather(*(consume() for _ in range(concurrency)))
+    finally:
+        renewer.cancel()
+    logger.info(f"{worker_id}: shard {shard[0]}/{shard[1]} drained, {processed} items done")
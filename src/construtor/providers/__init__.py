@@ -8,6 +8,12 @@ Available providers:
     - LLMProvider: Protocol defining the provider interface
     - OpenAIProvider: Implementation for OpenAI's GPT models
     - AnthropicProvider: Implementation for Anthropic's Claude models
+    - CostAwareRouter: LLMProvider routing each call across provider/model pairs
+    - HedgedProvider: LLMProvider hedging calls slower than the p95 latency
+    - FailoverProvider: LLMProvider with circuit breakers and automatic failover
+    - SharedCooldown: Per-model rate-limit cool-down shared across coroutines
+    - TokenEstimator: Offline prompt token counts per model family
+    - TokenLimitedProvider: LLMProvider enforcing prompt token limits before dispatch
 
 Example:
     ```python
@@ -32,11 +38,24 @@ Example:
 """
 
 from construtor.providers.anthropic_provider import AnthropicProvider
+from construtor.providers.backoff import SharedCooldown
 from construtor.providers.base import LLMProvider
+from construtor.providers.failover import CircuitBreaker, FailoverProvider
+from construtor.providers.hedging import HedgedProvider
 from construtor.providers.openai_provider import OpenAIProvider
+from construtor.providers.router import AUTO_MODEL, CostAwareRouter
+from construtor.providers.tokens import TokenEstimator, TokenLimitedProvider
 
 __all__ = [
+    "AUTO_MODEL",
     "AnthropicProvider",
+    "CircuitBreaker",
+    "CostAwareRouter",
+    "FailoverProvider",
+    "HedgedProvider",
     "LLMProvider",
     "OpenAIProvider",
+    "SharedCooldown",
+    "TokenEstimator",
+    "TokenLimitedProvider",
 ]
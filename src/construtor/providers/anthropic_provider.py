@@ -8,7 +8,7 @@ Key features:
 - Structured outputs via extra_headers with beta flag
 - Manual JSON parsing to Pydantic models
 - Accurate token counting and cost calculation
-- Exponential backoff with jitter for rate limits
+- Retry-after-aware backoff with a shared per-model cool-down
 - Timeout handling with configurable limits
 - Semaphore-controlled concurrency
 - Custom exception hierarchy for error handling
@@ -26,7 +26,6 @@ from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
 )
 
 from construtor.config.exceptions import (
@@ -35,6 +34,7 @@ from construtor.config.exceptions import (
     LLMTimeoutError,
     OutputParsingError,
 )
+from construtor.providers.backoff import SharedCooldown, parse_retry_after
 
 
 class AnthropicProvider:
@@ -47,7 +47,7 @@ class AnthropicProvider:
     Features:
         - Structured outputs: Use response_model for Pydantic validation
         - Cost tracking: Accurate per-call cost calculation
-        - Rate limit handling: Exponential backoff with jitter
+        - Rate limit handling: Server retry hints, shared cool-down, jitter
         - Timeout handling: Configurable request timeouts
         - Concurrency control: Semaphore-limited API calls
 
@@ -88,6 +88,7 @@ class AnthropicProvider:
         client: AsyncAnthropic client for API calls
         semaphore: Semaphore for concurrency control
         timeout: Request timeout in seconds
+        cooldown: Shared per-model rate-limit cool-down windows
     """
 
     # Anthropic pricing per 1 million tokens (as of February 2026)
@@ -105,6 +106,7 @@ class AnthropicProvider:
         api_key: str,
         semaphore: Semaphore,
         timeout: float = 30.0,
+        cooldown: SharedCooldown | None = None,
     ) -> None:
         """Initialize Anthropic provider.
 
@@ -112,10 +114,13 @@ class AnthropicProvider:
             api_key: Anthropic API key from environment or config
             semaphore: Shared semaphore for concurrency control
             timeout: Request timeout in seconds (default 30)
+            cooldown: Per-model rate-limit cool-down windows; pass one instance
+                to several providers to share it (default: one per provider)
         """
         self.client = AsyncAnthropic(api_key=api_key)
         self.semaphore = semaphore
         self.timeout = timeout
+        self.cooldown = cooldown or SharedCooldown()
 
     async def generate(
         self,
@@ -147,6 +152,9 @@ class AnthropicProvider:
             LLMTimeoutError: Request timeout
             OutputParsingError: Pydantic parsing failed
         """
+        # Wait out an open rate-limit cool-down before taking a semaphore slot
+        await self.cooldown.wait(model)
+
         # Use semaphore to control concurrency
         async with self.semaphore:
             return await self._generate_with_retry(
@@ -158,11 +166,7 @@ class AnthropicProvider:
 
     @retry(
         stop=stop_after_attempt(3),  # Max 3 attempts
-        wait=wait_exponential(
-            multiplier=1,
-            min=2,
-            max=10,
-        ),  # 2s, 4s, 8s with jitter
+        # No tenacity wait: each attempt waits on the shared cool-down instead
         retry=retry_if_exception_type(LLMRateLimitError),  # Only retry rate limits
         reraise=True,  # Re-raise exception after max attempts
     )
@@ -175,9 +179,12 @@ class AnthropicProvider:
     ) -> dict[str, Any]:
         """Internal generate with automatic retry on rate limits.
 
-        This method is decorated with @retry for exponential backoff.
-        Only LLMRateLimitError triggers retry - other errors fail immediately.
+        This method is decorated with @retry. Only LLMRateLimitError triggers
+        retry - other errors fail immediately. A rate limit opens the model's
+        cool-down window (server hint or exponential backoff) and every
+        attempt first waits for that window to close.
         """
+        await self.cooldown.wait(model)
         start_time = time.time()
 
         try:
@@ -190,6 +197,7 @@ class AnthropicProvider:
             # Calculate latency
             latency = time.time() - start_time
             result["latency"] = round(latency, 3)
+            self.cooldown.reset(model)
 
             return result
 
@@ -199,6 +207,10 @@ class AnthropicProvider:
                 msg,
                 modelo=model,
             ) from e
+        except LLMRateLimitError as e:
+            # Every coroutine calling this model waits out the window
+            self.cooldown.trip(model, e.retry_after)
+            raise
 
     async def _call_api(
         self,
@@ -274,6 +286,7 @@ class AnthropicProvider:
                 raise LLMRateLimitError(
                     f"{msg} (provider: anthropic)",
                     modelo=model,
+                    retry_after=parse_retry_after(e),
                 ) from e
 
             # General API error
@@ -0,0 +1,161 @@
+"""Retry-after-aware backoff with a shared per-model cool-down.
+
+Under sustained 429s, independent exponential backoffs let every coroutine
+hit the API again at about the same moment, and they ignore how long the
+server asked us to wait. Instead, a 429 opens a cool-down window for the
+model, sized by the server's hint (``retry-after-ms``, ``retry-after`` or
+"try again in 1.5s" in the message) or by exponential backoff when there is
+none. Every coroutine calling that model, retried or fresh, waits for the
+window to close, plus a random jitter so they do not all resume at once.
+"""
+
+import asyncio
+import logging
+import random
+import re
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+
+logger = logging.getLogger(__name__)
+
+_TRY_AGAIN_PATTERN = re.compile(r"try again in (\d+(?:\.\d+)?)\s*(ms|s)\b", re.IGNORECASE)
+
+
+def parse_retry_after(error: BaseException) -> float | None:
+    """Extract the server's retry hint from an SDK rate-limit error.
+
+    Looks at the HTTP response headers (``retry-after-ms``, then
+    ``retry-after`` as seconds or an HTTP date), then at the error message
+    ("Please try again in 1.5s" / "in 120ms").
+
+    Args:
+        error: Exception raised by the OpenAI or Anthropic SDK
+
+    Returns:
+        Seconds to wait, or None if the error carries no hint
+
+    Example:
+        >>> parse_retry_after(Exception("Please try again in 250ms."))
+        0.25
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if isinstance(headers, Mapping):
+        lowered = {str(key).lower(): str(value) for key, value in headers.items()}
+        if "retry-after-ms" in lowered:
+            try:
+                return max(0.0, float(lowered["retry-after-ms"]) / 1000)
+            except ValueError:
+                pass
+        if "retry-after" in lowered:
+            seconds = _parse_retry_after_header(lowered["retry-after"])
+            if seconds is not None:
+                return seconds
+
+    match = _TRY_AGAIN_PATTERN.search(str(error))
+    if match:
+        value = float(match.group(1))
+        return value / 1000 if match.group(2).lower() == "ms" else value
+    return None
+
+
+def _parse_retry_after_header(value: str) -> float | None:
+    """Parse a Retry-After value: delay in seconds or an HTTP date."""
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=UTC)
+    return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+class SharedCooldown:
+    """Per-model cool-down windows shared by every coroutine calling a model.
+
+    Providers own one by default (shared by all their coroutines); pass the
+    same instance to several providers to share it more widely.
+
+    Args:
+        base_delay: First backoff step without a server hint, in seconds
+        max_delay: Cap on any cool-down, hinted or not
+        jitter: Maximum random delay added to each waiter, in seconds
+        clock: Monotonic clock
+        sleep: Async sleep function
+
+    Example:
+        >>> cooldown = SharedCooldown()
+        >>> await cooldown.wait("gpt-4o")         # before every attempt
+        >>> cooldown.trip("gpt-4o", retry_after)  # on a 429
+        >>> cooldown.reset("gpt-4o")              # on success
+    """
+
+    def __init__(
+        self,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        jitter: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep,
+    ) -> None:
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._jitter = jitter
+        self._clock = clock
+        self._sleep = sleep
+        self._until: dict[str, float] = {}
+        self._streak: dict[str, int] = {}
+
+    def remaining(self, model: str) -> float:
+        """Seconds left in the model's cool-down window (0.0 if closed)."""
+        return max(0.0, self._until.get(model, 0.0) - self._clock())
+
+    async def wait(self, model: str) -> None:
+        """Wait until the model's cool-down window closes, plus jitter.
+
+        Returns immediately (without jitter) when no window is open.
+        """
+        while (remaining := self.remaining(model)) > 0:
+            delay = remaining + random.uniform(0.0, self._jitter)
+            logger.debug(f"{model} cooling down, waiting {delay:.2f}s")
+            await self._sleep(delay)
+
+    def trip(self, model: str, retry_after: float | None = None) -> float:
+        """Open (or extend) the model's cool-down window after a 429.
+
+        A 429 for a request sent while the window was already open does not
+        escalate the backoff, so a burst of concurrent 429s counts once.
+
+        Args:
+            model: Model that was rate limited
+            retry_after: Server hint in seconds, if any
+
+        Returns:
+            Seconds until the window closes
+        """
+        now = self._clock()
+        window_open = self._until.get(model, 0.0) > now
+        if retry_after is not None:
+            delay = min(retry_after, self._max_delay)
+        elif window_open:
+            delay = 0.0
+        else:
+            streak = self._streak.get(model, 0)
+            delay = min(self._base_delay * 2**streak, self._max_delay)
+        if not window_open:
+            self._streak[model] = self._streak.get(model, 0) + 1
+
+        self._until[model] = max(self._until.get(model, 0.0), now + delay)
+        remaining = self._until[model] - now
+        logger.warning(f"{model} rate limited, cooling down for {remaining:.2f}s")
+        return remaining
+
+    def reset(self, model: str) -> None:
+        """Reset the backoff streak after a successful call."""
+        self._streak.pop(model, None)
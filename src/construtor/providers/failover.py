@@ -0,0 +1,322 @@
+"""Circuit breakers and automatic failover between LLM providers.
+
+A provider outage used to stall every worker on 30 s timeouts until the
+batch gave up. Each provider/model now has a CircuitBreaker:
+
+- closed: calls go through; consecutive failures are counted
+- open: after ``failure_threshold`` consecutive failures, calls are shed
+  immediately (CircuitOpenError) for ``recovery_seconds``
+- half_open: after the recovery time, a limited number of probe calls go
+  through; a success closes the circuit, a failure opens it again
+
+FailoverProvider wraps a provider and reroutes calls to the configured
+alternatives (another model or provider) while a circuit is open or a call
+fails with an LLMProviderError (NFR8).
+"""
+
+import logging
+import time
+from collections.abc import Callable
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+from construtor.config.exceptions import CircuitOpenError, LLMProviderError
+from construtor.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker for one provider/model.
+
+    Args:
+        name: Name used in logs (e.g. "OpenAIProvider:gpt-4o")
+        failure_threshold: Consecutive failures that open the circuit
+        recovery_seconds: Time the circuit stays open before probing
+        half_open_max_calls: Concurrent probe calls allowed while half-open
+        clock: Monotonic clock
+
+    Raises:
+        ValueError: If failure_threshold or half_open_max_calls is not
+            positive, or recovery_seconds is negative
+
+    Example:
+        >>> breaker = CircuitBreaker("OpenAIProvider:gpt-4o")
+        >>> if breaker.allow():
+        ...     try:
+        ...         result = await provider.generate(prompt, "gpt-4o", 0.7)
+        ...     except LLMProviderError:
+        ...         breaker.record_failure()
+        ...     else:
+        ...         breaker.record_success()
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if failure_threshold <= 0 or half_open_max_calls <= 0:
+            msg = (
+                f"failure_threshold and half_open_max_calls must be positive, "
+                f"got {failure_threshold}, {half_open_max_calls}"
+            )
+            raise ValueError(msg)
+        if recovery_seconds < 0:
+            msg = f"recovery_seconds must be non-negative, got {recovery_seconds}"
+            raise ValueError(msg)
+
+        self.name = name
+        self._failure_threshold = failure_threshold
+        self._recovery_seconds = recovery_seconds
+        self._half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state: CircuitState = "closed"
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._times_opened = 0
+        self._shed = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state (an open circuit turns half-open after the recovery time)."""
+        if self._state == "open" and self._clock() - self._opened_at >= self._recovery_seconds:
+            self._state = "half_open"
+            self._probes = 0
+            logger.info(f"Circuit {self.name} half-open, probing")
+        return self._state
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit starts probing (0.0 if not open)."""
+        if self.state != "open":
+            return 0.0
+        return max(0.0, self._opened_at + self._recovery_seconds - self._clock())
+
+    def allow(self) -> bool:
+        """Whether a call may go through now; reserves a probe slot when half-open.
+
+        Every allowed call must end with ``record_success``,
+        ``record_failure`` or ``release``.
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._probes < self._half_open_max_calls:
+            self._probes += 1
+            return True
+        self._shed += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful call: closes a half-open circuit."""
+        if self._state == "half_open":
+            logger.info(f"Circuit {self.name} closed, provider recovered")
+        self._state = "closed"
+        self._failures = 0
+        self._probes = 0
+
+    def record_failure(self) -> None:
+        """Record a failed call: opens the circuit at the threshold or on a failed probe."""
+        self._failures += 1
+        if self._state == "half_open" or (
+            self._state == "closed" and self._failures >= self._failure_threshold
+        ):
+            self._state = "open"
+            self._opened_at = self._clock()
+            self._probes = 0
+            self._times_opened += 1
+            logger.warning(
+                f"Circuit {self.name} open after {self._failures} consecutive failures, "
+                f"shedding calls for {self._recovery_seconds:.0f}s"
+            )
+
+    def release(self) -> None:
+        """Free the probe slot of a call that ended without an outcome (e.g. cancelled)."""
+        if self._state == "half_open" and self._probes > 0:
+            self._probes -= 1
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get state, consecutive failures, times opened and calls shed.
+
+        Returns:
+            Dict with state, consecutive_failures, times_opened, shed
+        """
+        return {
+            "state": self.state,
+            "consecutive_failures": self._failures,
+            "times_opened": self._times_opened,
+            "shed": self._shed,
+        }
+
+
+class FailoverProvider:
+    """LLMProvider with a circuit breaker per provider/model and automatic failover.
+
+    Calls go to the requested model first, then to its configured
+    alternatives in order, skipping any route whose circuit is open. Only
+    LLMProviderError (API errors, timeouts, exhausted rate-limit retries)
+    counts as a failure; other errors mean the API answered and are
+    raised as-is.
+
+    Example:
+        ```python
+        from asyncio import Semaphore
+        from construtor.providers import AnthropicProvider, FailoverProvider, OpenAIProvider
+
+        openai = OpenAIProvider(api_key="sk-...", semaphore=Semaphore(10))
+        anthropic = AnthropicProvider(api_key="sk-ant-...", semaphore=Semaphore(10))
+        provider = FailoverProvider(
+            openai,
+            fallbacks={"gpt-4o": [(anthropic, "claude-sonnet-4-5"), (openai, "gpt-4o-mini")]},
+        )
+
+        result = await provider.generate(prompt, "gpt-4o", 0.7, CriadorOutput)
+        print(result["model"])  # "claude-sonnet-4-5" while OpenAI is down
+        ```
+
+    Attributes:
+        semaphore: The wrapped provider's semaphore (each route acquires its
+            own provider's semaphore, the wrapper does not)
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        fallbacks: dict[str, list[tuple[LLMProvider, str]]] | None = None,
+        failure_threshold: int = 5,
+        recovery_seconds: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the failover wrapper.
+
+        Args:
+            provider: Provider serving the requested model
+            fallbacks: Alternatives (provider, model) per requested model, in
+                order of preference
+            failure_threshold: Consecutive failures that open a circuit
+            recovery_seconds: Time a circuit stays open before probing
+            half_open_max_calls: Concurrent probe calls while half-open
+            clock: Monotonic clock for the breakers
+        """
+        self._provider = provider
+        self._fallbacks = {model: list(routes) for model, routes in (fallbacks or {}).items()}
+        self._breaker_options = {
+            "failure_threshold": failure_threshold,
+            "recovery_seconds": recovery_seconds,
+            "half_open_max_calls": half_open_max_calls,
+            "clock": clock,
+        }
+        self._breakers: dict[tuple[int, str], CircuitBreaker] = {}
+        # Route label per provider instance: two accounts of one provider
+        # class are separate routes with separate circuits
+        self._labels: dict[int, tuple[LLMProvider, str]] = {}
+        for route_provider in [
+            provider,
+            *(p for routes in self._fallbacks.values() for p, _ in routes),
+        ]:
+            self._label(route_provider)
+        self.semaphore = provider.semaphore
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type[BaseModel] | None = None,
+    ) -> dict[str, Any]:
+        """Generate a completion on the first healthy route.
+
+        Implements LLMProvider Protocol.
+
+        Args:
+            prompt: Text prompt
+            model: Preferred model (served by the wrapped provider)
+            temperature: Sampling temperature 0.0-1.0
+            response_model: Optional Pydantic model for structured output
+
+        Returns:
+            The provider's result dict plus ``model``: the model that
+            actually served the call
+
+        Raises:
+            CircuitOpenError: If every route's circuit is open
+            LLMProviderError: The last route's error if every tried route failed
+        """
+        last_error: LLMProviderError | None = None
+        for provider, route_model in [(self._provider, model), *self._fallbacks.get(model, [])]:
+            breaker = self.breaker(provider, route_model)
+            if not breaker.allow():
+                continue
+
+            try:
+                result = await provider.generate(prompt, route_model, temperature, response_model)
+            except LLMProviderError as e:
+                breaker.record_failure()
+                last_error = e
+                logger.warning(f"{breaker.name} failed, failing over: {e}")
+                continue
+            except Exception:
+                # The API answered (e.g. unparseable output): not a provider failure
+                breaker.record_success()
+                raise
+            except BaseException:
+                breaker.release()
+                raise
+
+            breaker.record_success()
+            if route_model != model:
+                logger.info(f"Call for {model} served by fallback {breaker.name}")
+            return {**result, "model": route_model}
+
+        if last_error is not None:
+            raise last_error
+        retry_in = min(
+            self.breaker(provider, route_model).retry_in()
+            for provider, route_model in [(self._provider, model), *self._fallbacks.get(model, [])]
+        )
+        msg = f"All circuits open for {model}, retry in {retry_in:.0f}s"
+        raise CircuitOpenError(msg, modelo=model)
+
+    def breaker(self, provider: LLMProvider, model: str) -> CircuitBreaker:
+        """Get (or create) the circuit breaker of a provider instance/model.
+
+        Args:
+            provider: Provider instance
+            model: Model ID
+
+        Returns:
+            The route's CircuitBreaker
+        """
+        key = (id(provider), model)
+        if key not in self._breakers:
+            name = f"{self._label(provider)}:{model}"
+            self._breakers[key] = CircuitBreaker(name, **self._breaker_options)
+        return self._breakers[key]
+
+    def get_statistics(self) -> dict[str, dict[str, Any]]:
+        """Get the statistics of every circuit breaker.
+
+        Returns:
+            Per-route breaker statistics, keyed ``"<ProviderClass>:<model>"``
+            (``"<ProviderClass>#2:<model>"`` for a second instance of a class)
+        """
+        return {breaker.name: breaker.get_statistics() for breaker in self._breakers.values()}
+
+    def _label(self, provider: LLMProvider) -> str:
+        """Name of a provider instance, numbered after the first of its class."""
+        entry = self._labels.get(id(provider))
+        if entry is None:
+            class_name = type(provider).__name__
+            same_class = sum(type(p) is type(provider) for p, _ in self._labels.values())
+            label = class_name if same_class == 0 else f"{class_name}#{same_class + 1}"
+            # The provider is kept so its id cannot be reused by another object
+            entry = self._labels[id(provider)] = (provider, label)
+        return entry[1]
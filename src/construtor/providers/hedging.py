@@ -0,0 +1,292 @@
+"""Hedged LLM requests for tail-latency reduction.
+
+With a 30 s provider timeout, one slow call can hold a worker for the whole
+timeout, and the slowest calls dominate the wall-clock time of a batch.
+HedgedProvider wraps an LLMProvider: when a call has not returned by the
+current p95 latency of its model, a second attempt is fired (on the same or
+another provider/model), the first to finish wins and the other is
+cancelled.
+
+Hedging costs money, so it is budget-capped: a hedge is only fired while
+the estimated spend on hedges stays below ``budget_fraction`` of the total
+spend. A cancelled call is billed as much as the winning one (providers
+charge for the tokens already processed, which we cannot observe).
+"""
+
+import asyncio
+import contextlib
+import logging
+import math
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from construtor.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+
+class _ModelStats:
+    """Latency window and spend of one model."""
+
+    def __init__(self, window: int) -> None:
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.calls = 0
+        self.spend = 0.0
+
+    def average_cost(self) -> float:
+        return self.spend / self.calls if self.calls else 0.0
+
+
+class HedgedProvider:
+    """LLMProvider that hedges slow calls with a second attempt.
+
+    Example:
+        ```python
+        from asyncio import Semaphore
+        from construtor.providers import AnthropicProvider, HedgedProvider, OpenAIProvider
+
+        openai = OpenAIProvider(api_key="sk-...", semaphore=Semaphore(10))
+        anthropic = AnthropicProvider(api_key="sk-ant-...", semaphore=Semaphore(10))
+        provider = HedgedProvider(
+            openai,
+            hedge_routes={"gpt-4o": (anthropic, "claude-sonnet-4-5")},
+            budget_fraction=0.03,
+        )
+
+        result = await provider.generate(prompt, "gpt-4o", 0.7, CriadorOutput)
+        print(result["hedged"], result["model"], result["cost"])
+        ```
+
+    Attributes:
+        semaphore: The wrapped provider's semaphore (each attempt acquires its
+            own provider's semaphore, the wrapper does not)
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        hedge_routes: dict[str, tuple[LLMProvider, str]] | None = None,
+        quantile: float = 0.95,
+        budget_fraction: float = 0.03,
+        min_samples: int = 20,
+        window: int = 500,
+        min_delay: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the hedging wrapper.
+
+        Args:
+            provider: Provider serving the first attempt
+            hedge_routes: (provider, model) for the hedge of each model;
+                models not listed are hedged on the same provider and model
+            quantile: Latency quantile after which a call is hedged
+            budget_fraction: Maximum hedge spend as a fraction of total spend
+            min_samples: Latencies observed before a model is hedged
+            window: Recent latencies kept per model for the quantile
+            min_delay: Lower bound of the hedge delay in seconds
+            clock: Monotonic clock for latencies
+
+        Raises:
+            ValueError: If quantile is not in (0, 1), budget_fraction is
+                negative, or min_samples/window is not positive
+        """
+        if not 0.0 < quantile < 1.0:
+            msg = f"quantile must be between 0 and 1, got {quantile}"
+            raise ValueError(msg)
+        if budget_fraction < 0:
+            msg = f"budget_fraction must be non-negative, got {budget_fraction}"
+            raise ValueError(msg)
+        if min_samples <= 0 or window <= 0:
+            msg = f"min_samples and window must be positive, got {min_samples}, {window}"
+            raise ValueError(msg)
+
+        self._provider = provider
+        self._hedge_routes = dict(hedge_routes or {})
+        self._quantile = quantile
+        self._budget_fraction = budget_fraction
+        self._min_samples = min_samples
+        self._window = window
+        self._min_delay = min_delay
+        self._clock = clock
+        self._stats: dict[str, _ModelStats] = {}
+        self._spend = 0.0
+        self._hedge_spend = 0.0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self.semaphore = provider.semaphore
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type[BaseModel] | None = None,
+    ) -> dict[str, Any]:
+        """Generate a completion, hedging it if it runs past the latency quantile.
+
+        Implements LLMProvider Protocol.
+
+        Args:
+            prompt: Text prompt
+            model: Model of the first attempt
+            temperature: Sampling temperature 0.0-1.0
+            response_model: Optional Pydantic model for structured output
+
+        Returns:
+            The winning attempt's result dict, with ``cost`` covering both
+            attempts, ``latency`` measured end to end, plus ``model`` (the
+            model that answered) and ``hedged`` (whether a hedge was fired)
+
+        Raises:
+            LLMProviderError: If the call fails (both attempts, when hedged)
+        """
+        start = self._clock()
+        primary = asyncio.create_task(
+            self._provider.generate(prompt, model, temperature, response_model)
+        )
+        delay = self._hedge_delay(model)
+        try:
+            done, _ = await asyncio.wait({primary}, timeout=delay)
+        except asyncio.CancelledError:
+            primary.cancel()
+            raise
+
+        if primary in done:
+            result = primary.result()
+            self._observe(model, self._clock() - start, result["cost"])
+            return {**result, "model": model, "hedged": False}
+
+        hedge_provider, hedge_model = self._hedge_routes.get(model, (self._provider, model))
+        if not self._hedge_affordable(model, hedge_model):
+            result = await primary
+            self._observe(model, self._clock() - start, result["cost"])
+            return {**result, "model": model, "hedged": False}
+
+        logger.info(f"Hedging {model} call after {delay:.2f}s with {hedge_model}")
+        self._hedges += 1
+        hedge = asyncio.create_task(
+            hedge_provider.generate(prompt, hedge_model, temperature, response_model)
+        )
+        return await self._race(primary, hedge, model, hedge_model, start)
+
+    def get_statistics(self) -> dict[str, Any]:
+        """Get hedging counters, spend and current hedge delay per model.
+
+        Returns:
+            Dict with calls, hedges, hedge_wins, spend, hedge_spend,
+            hedge_spend_fraction and the per-model ``delays`` (None while a
+            model has too few samples)
+        """
+        calls = sum(stats.calls for stats in self._stats.values())
+        return {
+            "calls": calls,
+            "hedges": self._hedges,
+            "hedge_wins": self._hedge_wins,
+            "spend": round(self._spend, 6),
+            "hedge_spend": round(self._hedge_spend, 6),
+            "hedge_spend_fraction": (
+                round(self._hedge_spend / self._spend, 4) if self._spend else 0.0
+            ),
+            "delays": {model: self._hedge_delay(model) for model in self._stats},
+        }
+
+    async def _race(
+        self,
+        primary: asyncio.Task,
+        hedge: asyncio.Task,
+        model: str,
+        hedge_model: str,
+        start: float,
+    ) -> dict[str, Any]:
+        """Return the first successful attempt and cancel the other one."""
+        pending = {primary, hedge}
+        winner: asyncio.Task | None = None
+        while pending and winner is None:
+            try:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            except asyncio.CancelledError:
+                for task in pending:
+                    task.cancel()
+                raise
+            for task in done:
+                if task.exception() is None:
+                    winner = task
+                    break
+                logger.warning(f"Hedged attempt failed: {task.exception()}")
+
+        elapsed = self._clock() - start
+        for task in pending:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await task
+
+        if winner is None:
+            # Both attempts failed: surface the first attempt's error
+            raise primary.exception()  # type: ignore[misc]
+
+        result = winner.result()
+        cost = result["cost"]
+        loser = hedge if winner is primary else primary
+        # A cancelled loser is billed as much as the winner, a failed one not at all
+        if loser.cancelled():
+            loser_cost = cost
+        elif loser.exception() is None:
+            loser_cost = loser.result()["cost"]
+        else:
+            loser_cost = 0.0
+        primary_cost, hedge_cost = (cost, loser_cost) if winner is primary else (loser_cost, cost)
+        if winner is hedge:
+            self._hedge_wins += 1
+
+        # The first attempt ran at least ``elapsed``: a censored latency sample
+        self._observe(model, elapsed, primary_cost)
+        hedge_stats = self._stats_for(hedge_model)
+        hedge_stats.calls += 1
+        hedge_stats.spend += hedge_cost
+        self._spend += hedge_cost
+        self._hedge_spend += hedge_cost
+
+        return {
+            **result,
+            "cost": round(cost + loser_cost, 6),
+            "latency": round(elapsed, 3),
+            "model": model if winner is primary else hedge_model,
+            "hedged": True,
+        }
+
+    def _hedge_delay(self, model: str) -> float | None:
+        """Current hedge delay for a model (None while it has too few samples)."""
+        stats = self._stats.get(model)
+        if stats is None or len(stats.latencies) < self._min_samples:
+            return None
+        ordered = sorted(stats.latencies)
+        index = min(len(ordered) - 1, math.ceil(self._quantile * len(ordered)) - 1)
+        return max(self._min_delay, ordered[index])
+
+    def _hedge_affordable(self, model: str, hedge_model: str) -> bool:
+        """Whether one more hedge on ``hedge_model`` keeps hedge spend within the budget.
+
+        The hedge is priced at the hedge model's average cost; until that model
+        has been called, the first attempt's model stands in for it.
+        """
+        stats = self._stats.get(hedge_model)
+        if stats is None or not stats.calls:
+            stats = self._stats.get(model)
+        expected = stats.average_cost() if stats is not None else 0.0
+        return self._hedge_spend + expected <= self._budget_fraction * (self._spend + expected)
+
+    def _observe(self, model: str, latency: float, cost: float) -> None:
+        stats = self._stats_for(model)
+        stats.latencies.append(latency)
+        stats.calls += 1
+        stats.spend += cost
+        self._spend += cost
+
+    def _stats_for(self, model: str) -> _ModelStats:
+        if model not in self._stats:
+            self._stats[model] = _ModelStats(self._window)
+        return self._stats[model]
@@ -7,7 +7,7 @@ Key features:
 - Async API calls with AsyncOpenAI client
 - Structured outputs via beta.chat.completions.parse()
 - Accurate token counting and cost calculation
-- Exponential backoff with jitter for rate limits
+- Retry-after-aware backoff with a shared per-model cool-down
 - Timeout handling with configurable limits
 - Semaphore-controlled concurrency
 - Custom exception hierarchy for error handling
@@ -24,7 +24,6 @@ from tenacity import (
     retry,
     retry_if_exception_type,
     stop_after_attempt,
-    wait_exponential,
 )
 
 from construtor.config.exceptions import (
@@ -32,6 +31,7 @@ from construtor.config.exceptions import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
+from construtor.providers.backoff import SharedCooldown, parse_retry_after
 
 
 class OpenAIProvider:
@@ -44,7 +44,7 @@ class OpenAIProvider:
     Features:
         - Structured outputs: Use response_model for Pydantic validation
         - Cost tracking: Accurate per-call cost calculation
-        - Rate limit handling: Exponential backoff with jitter
+        - Rate limit handling: Server retry hints, shared cool-down, jitter
         - Timeout handling: Configurable request timeouts
         - Concurrency control: Semaphore-limited API calls
 
@@ -85,6 +85,7 @@ class OpenAIProvider:
         client: AsyncOpenAI client for API calls
         semaphore: Semaphore for concurrency control
         timeout: Request timeout in seconds
+        cooldown: Shared per-model rate-limit cool-down windows
     """
 
     # OpenAI pricing per 1 million tokens (as of February 2026)
@@ -101,6 +102,7 @@ class OpenAIProvider:
         api_key: str,
         semaphore: Semaphore,
         timeout: float = 30.0,
+        cooldown: SharedCooldown | None = None,
     ) -> None:
         """Initialize OpenAI provider.
 
@@ -108,10 +110,13 @@ class OpenAIProvider:
             api_key: OpenAI API key from environment or config
             semaphore: Shared semaphore for concurrency control
             timeout: Request timeout in seconds (default 30)
+            cooldown: Per-model rate-limit cool-down windows; pass one instance
+                to several providers to share it (default: one per provider)
         """
         self.client = AsyncOpenAI(api_key=api_key)
         self.semaphore = semaphore
         self.timeout = timeout
+        self.cooldown = cooldown or SharedCooldown()
 
     async def generate(
         self,
@@ -143,6 +148,9 @@ class OpenAIProvider:
             LLMTimeoutError: Request timeout
             OutputParsingError: Pydantic parsing failed
         """
+        # Wait out an open rate-limit cool-down before taking a semaphore slot
+        await self.cooldown.wait(model)
+
         # Use semaphore to control concurrency
         async with self.semaphore:
             return await self._generate_with_retry(
@@ -154,11 +162,7 @@ class OpenAIProvider:
 
     @retry(
         stop=stop_after_attempt(3),  # Max 3 attempts
-        wait=wait_exponential(
-            multiplier=1,
-            min=2,
-            max=10,
-        ),  # 2s, 4s, 8s with jitter
+        # No tenacity wait: each attempt waits on the shared cool-down instead
         retry=retry_if_exception_type(LLMRateLimitError),  # Only retry rate limits
         reraise=True,  # Re-raise exception after max attempts
     )
@@ -171,9 +175,12 @@ class OpenAIProvider:
     ) -> dict[str, Any]:
         """Internal generate with automatic retry on rate limits.
 
-        This method is decorated with @retry for exponential backoff.
-        Only LLMRateLimitError triggers retry - other errors fail immediately.
+        This method is decorated with @retry. Only LLMRateLimitError triggers
+        retry - other errors fail immediately. A rate limit opens the model's
+        cool-down window (server hint or exponential backoff) and every
+        attempt first waits for that window to close.
         """
+        await self.cooldown.wait(model)
         start_time = time.time()
 
         try:
@@ -188,7 +195,12 @@ class OpenAIProvider:
                 msg,
                 modelo=model,
             ) from e
+        except LLMRateLimitError as e:
+            # Every coroutine calling this model waits out the window
+            self.cooldown.trip(model, e.retry_after)
+            raise
         else:
+            self.cooldown.reset(model)
             # Calculate latency
             latency = time.time() - start_time
             result["latency"] = round(latency, 3)
@@ -247,6 +259,7 @@ class OpenAIProvider:
             raise LLMRateLimitError(
                 f"{msg} (provider: openai)",
                 modelo=model,
+                retry_after=parse_retry_after(e),
             ) from e
 
         except Exception as e:
@@ -261,6 +274,7 @@ class OpenAIProvider:
                 raise LLMRateLimitError(
                     f"{msg} (provider: openai)",
                     modelo=model,
+                    retry_after=parse_retry_after(e),
                 ) from e
 
             # General API error
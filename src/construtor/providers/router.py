@@ -0,0 +1,293 @@
+"""Cost-aware model routing across LLM providers.
+
+This module implements the LLMProvider Protocol on top of several
+(provider, model) routes. Instead of sending every call to
+``PipelineConfig.default_model``, the router picks a model per call from live
+statistics:
+
+- Cost: expected USD per call, from the providers' ``PRICING`` tables until
+  real costs are observed, then an exponential moving average
+- Latency: exponential moving average of observed latencies
+- Headroom: calls in flight versus each route's capacity, plus a cool-down
+  after a rate-limit error
+
+The score of a route is its expected cost per call, with a latency penalty,
+scaled up as the route fills. nivel 1 questions only use the
+cheaper models (configurable). When the preferred route is saturated or
+rate limited, traffic overflows to the next route, usually on the other
+provider.
+"""
+
+import logging
+import statistics
+import time
+from asyncio import Semaphore
+from collections.abc import Callable
+from typing import Any
+
+from pydantic import BaseModel
+
+from construtor.config.exceptions import LLMProviderError, LLMRateLimitError
+from construtor.providers.base import LLMProvider
+
+logger = logging.getLogger(__name__)
+
+AUTO_MODEL = "auto"
+"""Pass as ``model`` to let the router choose freely."""
+
+
+class _Route:
+    """Live statistics of one (provider, model) route."""
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        model: str,
+        capacity: int,
+        prior_cost: float,
+    ) -> None:
+        self.provider = provider
+        self.model = model
+        self.capacity = capacity
+        self.prior_cost = prior_cost
+        self.cost: float | None = None
+        self.latency: float | None = None
+        self.calls = 0
+        self.in_flight = 0
+        self.cooldown_until = 0.0
+
+
+class CostAwareRouter:
+    """LLMProvider that routes each call to the cheapest good-enough model.
+
+    Example:
+        ```python
+        from asyncio import Semaphore
+        from construtor.providers import AnthropicProvider, CostAwareRouter, OpenAIProvider
+
+        openai = OpenAIProvider(api_key="sk-...", semaphore=Semaphore(10))
+        anthropic = AnthropicProvider(api_key="sk-ant-...", semaphore=Semaphore(10))
+        router = CostAwareRouter(
+            [
+                (openai, "gpt-4o"),
+                (openai, "gpt-4o-mini"),
+                (anthropic, "claude-sonnet-4-5"),
+                (anthropic, "claude-haiku-4-5"),
+            ],
+            capacity=10,
+        )
+
+        result = await router.generate(prompt, "auto", 0.7, CriadorOutput, nivel=1)
+        print(result["model"])  # e.g. "gpt-4o-mini"
+        ```
+
+    Attributes:
+        semaphore: Concurrency limit of the router as a whole
+    """
+
+    def __init__(
+        self,
+        routes: list[tuple[LLMProvider, str]],
+        capacity: int | dict[str, int] = 10,
+        nivel_models: dict[int, list[str]] | None = None,
+        expected_tokens: tuple[int, int] = (1500, 800),
+        latency_weight: float = 0.05,
+        cooldown_seconds: float = 30.0,
+        smoothing: float = 0.2,
+        semaphore: Semaphore | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            routes: (provider, model) pairs the router may use
+            capacity: Maximum calls in flight per route (or per model name);
+                a full route overflows to the others
+            nivel_models: Models allowed per nivel_dificuldade. Defaults to
+                the cheaper half of the routes (by list price) for nivel 1
+                and every route for niveis 2 and 3.
+            expected_tokens: (input, output) tokens used to price a call from
+                ``PRICING`` before real costs are observed
+            latency_weight: Relative score penalty per second of latency
+            cooldown_seconds: How long a rate-limited route is avoided
+            smoothing: Weight of the newest observation in moving averages
+            semaphore: Router-wide concurrency limit (defaults to the sum of
+                the route capacities)
+            clock: Monotonic clock for cool-downs
+
+        Raises:
+            ValueError: If no routes are given, a model appears twice, or a
+                capacity is not positive
+        """
+        if not routes:
+            msg = "CostAwareRouter needs at least one route"
+            raise ValueError(msg)
+
+        self._routes: dict[str, _Route] = {}
+        for provider, model in routes:
+            if model in self._routes:
+                msg = f"Model {model} is routed twice"
+                raise ValueError(msg)
+            route_capacity = capacity.get(model, 10) if isinstance(capacity, dict) else capacity
+            if route_capacity <= 0:
+                msg = f"capacity must be positive, got {route_capacity} for {model}"
+                raise ValueError(msg)
+            self._routes[model] = _Route(
+                provider, model, route_capacity, _list_price(provider, model, expected_tokens)
+            )
+
+        # Models missing from PRICING are assumed as expensive as the priciest known one
+        highest_price = max((route.prior_cost for route in self._routes.values()), default=0.0)
+        for route in self._routes.values():
+            if route.prior_cost == 0.0:
+                route.prior_cost = highest_price
+
+        self._nivel_models = nivel_models or self._default_nivel_models()
+        self._latency_weight = latency_weight
+        self._cooldown_seconds = cooldown_seconds
+        self._smoothing = smoothing
+        self._clock = clock
+        self.semaphore = semaphore or Semaphore(sum(r.capacity for r in self._routes.values()))
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type[BaseModel] | None = None,
+        *,
+        nivel: int | None = None,
+    ) -> dict[str, Any]:
+        """Generate a completion on the best available route.
+
+        Implements LLMProvider Protocol.
+
+        Args:
+            prompt: Text prompt
+            model: A routed model to prefer (used while it has headroom) or
+                ``"auto"`` to let the router choose
+            temperature: Sampling temperature 0.0-1.0
+            response_model: Optional Pydantic model for structured output
+            nivel: Difficulty level of the question, restricting the models
+                used in auto mode
+
+        Returns:
+            The provider's result dict plus ``model``: the model that
+            actually served the call
+
+        Raises:
+            LLMRateLimitError: If every eligible route is rate limited
+            LLMProviderError: If the model is unknown or the call fails
+        """
+        async with self.semaphore:
+            tried: set[str] = set()
+            last_error: LLMRateLimitError | None = None
+            while True:
+                route = self._select(model, nivel, exclude=tried)
+                if route is None:
+                    msg = f"All routes rate limited (tried {sorted(tried)})"
+                    raise LLMRateLimitError(
+                        msg,
+                        modelo=model,
+                        retry_after=last_error.retry_after if last_error else None,
+                    ) from last_error
+                tried.add(route.model)
+
+                route.in_flight += 1
+                try:
+                    result = await route.provider.generate(
+                        prompt, route.model, temperature, response_model
+                    )
+                except LLMRateLimitError as e:
+                    last_error = e
+                    route.cooldown_until = self._clock() + self._cooldown_seconds
+                    logger.warning(
+                        f"Route {route.model} rate limited, cooling down "
+                        f"{self._cooldown_seconds:.0f}s and overflowing"
+                    )
+                    continue
+                finally:
+                    route.in_flight -= 1
+
+                self._observe(route, result)
+                return {**result, "model": route.model}
+
+    def get_statistics(self) -> dict[str, dict[str, float | int | None]]:
+        """Get the live statistics and current score of every route.
+
+        Returns:
+            Per-model dict with calls, in_flight, cost, latency and score
+            (expected cost per call, penalized by latency and load)
+        """
+        return {
+            model: {
+                "calls": route.calls,
+                "in_flight": route.in_flight,
+                "cost": route.cost if route.cost is not None else route.prior_cost,
+                "latency": route.latency,
+                "score": self._score(route),
+            }
+            for model, route in self._routes.items()
+        }
+
+    def _select(self, model: str, nivel: int | None, exclude: set[str]) -> _Route | None:
+        """Pick the route for a call, or None if every eligible route is cooling down."""
+        now = self._clock()
+        if model == AUTO_MODEL:
+            names = self._nivel_models.get(nivel, list(self._routes)) if nivel else self._routes
+        elif model in self._routes:
+            names = list(self._routes)
+        else:
+            msg = f"Model {model} is not routed (routes: {sorted(self._routes)})"
+            raise LLMProviderError(msg, modelo=model)
+
+        candidates = [
+            self._routes[name]
+            for name in names
+            if name not in exclude and self._routes[name].cooldown_until <= now
+        ]
+        if not candidates:
+            return None
+
+        # A pinned model is used while it has headroom, then overflows
+        pinned = self._routes.get(model)
+        if pinned in candidates and pinned.in_flight < pinned.capacity:
+            return pinned
+
+        available = [route for route in candidates if route.in_flight < route.capacity]
+        if not available:
+            # Everything is full: queue on the least loaded route
+            return min(candidates, key=lambda route: route.in_flight / route.capacity)
+        return min(available, key=self._score)
+
+    def _score(self, route: _Route) -> float:
+        """Expected cost per call, penalized by latency and load."""
+        cost = route.cost if route.cost is not None else route.prior_cost
+        latency_penalty = 1.0 + self._latency_weight * (route.latency or 0.0)
+        load_penalty = 1.0 + route.in_flight / route.capacity
+        return cost * latency_penalty * load_penalty
+
+    def _observe(self, route: _Route, result: dict[str, Any]) -> None:
+        """Update the moving averages of a route with a call result."""
+        route.calls += 1
+        route.cost = _ewma(route.cost, float(result.get("cost", 0.0)), self._smoothing)
+        route.latency = _ewma(route.latency, float(result.get("latency", 0.0)), self._smoothing)
+
+    def _default_nivel_models(self) -> dict[int, list[str]]:
+        """nivel 1 on the cheaper half of the routes, other niveis on all of them."""
+        median_price = statistics.median(route.prior_cost for route in self._routes.values())
+        cheap = [name for name, route in self._routes.items() if route.prior_cost <= median_price]
+        return {1: cheap, 2: list(self._routes), 3: list(self._routes)}
+
+
+def _list_price(provider: LLMProvider, model: str, expected_tokens: tuple[int, int]) -> float:
+    """Price of a typical call from the provider's PRICING table (0.0 if unknown)."""
+    pricing: dict[str, tuple[float, float]] = getattr(provider, "PRICING", {})
+    input_price, output_price = pricing.get(model, (0.0, 0.0))
+    input_tokens, output_tokens = expected_tokens
+    return (input_tokens * input_price + output_tokens * output_price) / 1_000_000
+
+
+def _ewma(current: float | None, value: float, smoothing: float) -> float:
+    """Exponential moving average, seeded with the first value."""
+    return value if current is None else current + smoothing * (value - current)
@@ -0,0 +1,382 @@
+"""Offline prompt token estimation and enforcement before dispatch.
+
+The token count of a prompt was only known from the provider's response, too
+late to pace against TPM limits, predict cost or catch an oversized prompt.
+TokenEstimator counts tokens locally:
+
+- OpenAI models: the model's tiktoken encoding (o200k_base for the GPT-4o
+  generation and later, cl100k_base for GPT-4/3.5), when ``tiktoken`` (an
+  optional dependency) is installed and its encoding files are available
+- Claude models, and OpenAI models without tiktoken: an approximation that
+  counts words and punctuation, splitting long words into pieces of a
+  family-specific length (Anthropic publishes no offline tokenizer)
+
+Compiled prompt templates are counted as their static segments (counted
+once and cached) plus the values filled in; a prompt rendered by a template
+(RenderedPrompt) is counted that way by ``count``, so the agents' prompts
+are never re-tokenized in full.
+
+TokenLimitedProvider wraps an LLMProvider and uses the estimate before
+every call: oversized prompts are rejected or trimmed, the estimate is
+booked on a rate limiter, and a cost projection is kept from the provider's
+``PRICING`` table.
+"""
+
+import logging
+import math
+import re
+from asyncio import Semaphore
+from typing import Any, Literal, Protocol
+
+from pydantic import BaseModel
+
+from construtor.config.exceptions import InputValidationError
+from construtor.config.prompt_loader import PromptTemplate, RenderedPrompt
+from construtor.providers.base import LLMProvider
+
+try:  # Optional dependency (exact counts for OpenAI models)
+    import tiktoken
+except ImportError:  # pragma: no cover - depends on environment
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+ModelFamily = Literal["openai", "anthropic"]
+
+# Average characters per token of a word piece in the approximation
+_CHARS_PER_TOKEN: dict[str, float] = {"openai": 4.0, "anthropic": 3.5}
+
+# Model prefix -> tiktoken encoding (most specific first)
+_OPENAI_ENCODINGS: tuple[tuple[str, str], ...] = (
+    ("gpt-4o", "o200k_base"),
+    ("gpt-4.1", "o200k_base"),
+    ("gpt-4.5", "o200k_base"),
+    ("gpt-5", "o200k_base"),
+    ("o1", "o200k_base"),
+    ("o3", "o200k_base"),
+    ("o4", "o200k_base"),
+    ("gpt-4", "cl100k_base"),
+    ("gpt-3.5", "cl100k_base"),
+)
+
+_PIECE_PATTERN = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+
+_TRIM_MARKER = "\n[...]\n"
+
+
+def model_family(model: str) -> ModelFamily:
+    """Tokenizer family of a model ID (Claude models are ``"anthropic"``)."""
+    return "anthropic" if model.startswith("claude") else "openai"
+
+
+class TokenRateLimiter(Protocol):
+    """Rate limiter booking requests and tokens per model.
+
+    Implemented by SharedRateLimiter and BackendRateLimiter.
+    """
+
+    async def acquire(self, model: str, tokens: int = 0) -> None:
+        """Wait until a request of ``tokens`` tokens to ``model`` fits the budget."""
+        ...
+
+
+class TokenEstimator:
+    """Offline token counts per model family, with cached template segments.
+
+    Args:
+        chars_per_token: Characters per token of a word piece in the
+            approximation, per family (overrides the defaults)
+        use_tiktoken: Use tiktoken for OpenAI models when it is installed
+
+    Example:
+        >>> estimator = TokenEstimator()
+        >>> estimator.count("Paciente de 65 anos com dispneia", "claude-sonnet-4-5")
+        11
+        >>> estimator.count_prompt(template, "gpt-4o", tema="Cardiologia", foco="IC", ...)
+        2143
+    """
+
+    def __init__(
+        self,
+        chars_per_token: dict[str, float] | None = None,
+        use_tiktoken: bool = True,
+    ) -> None:
+        self._chars_per_token = {**_CHARS_PER_TOKEN, **(chars_per_token or {})}
+        if any(value <= 0 for value in self._chars_per_token.values()):
+            msg = f"chars_per_token must be positive, got {self._chars_per_token}"
+            raise ValueError(msg)
+        self._use_tiktoken = use_tiktoken and tiktoken is not None
+        self._encodings: dict[str, tiktoken.Encoding | None] = {}
+        self._segment_cache: dict[tuple[str, str], int] = {}
+
+    def tokenizer(self, model: str) -> str:
+        """Name of the tokenizer used for a model.
+
+        Returns:
+            A tiktoken encoding name, or ``"approx:<family>"`` for the
+            approximation
+        """
+        family = model_family(model)
+        if family == "openai" and self._encoding(model) is not None:
+            return self._encoding_name(model)
+        return f"approx:{family}"
+
+    def count(self, text: str, model: str) -> int:
+        """Estimate the tokens of a text for a model.
+
+        A RenderedPrompt is counted from its template's cached static
+        segments plus its values (see ``count_prompt``).
+
+        Args:
+            text: Text to count
+            model: Model ID
+
+        Returns:
+            Token count (exact with tiktoken, an estimate otherwise)
+        """
+        if not text:
+            return 0
+        if isinstance(text, RenderedPrompt) and text.source == text.template.text:
+            return self.count_prompt(text.template, model, **text.values)
+        encoding = self._encoding(model) if model_family(model) == "openai" else None
+        if encoding is not None:
+            return len(encoding.encode(text, disallowed_special=()))
+        per_token = self._chars_per_token[model_family(model)]
+        return sum(math.ceil(len(piece) / per_token) for piece in _PIECE_PATTERN.findall(text))
+
+    def count_prompt(self, template: PromptTemplate, model: str, **values: object) -> int:
+        """Estimate the tokens of a rendered template without rendering it.
+
+        The static segments are counted once per template version and
+        tokenizer, then cached; only the values are counted per call.
+
+        Args:
+            template: Compiled prompt template
+            model: Model ID
+            **values: Values of the template's placeholders
+
+        Returns:
+            Estimated token count of ``template.render(**values)``
+        """
+        key = (template.text, self.tokenizer(model))
+        static = self._segment_cache.get(key)
+        if static is None:
+            static = sum(self.count(segment, model) for segment in template.segments)
+            self._segment_cache[key] = static
+        return static + sum(self.count(str(values[name]), model) for name in template.fields)
+
+    def trim(self, text: str, model: str, max_tokens: int) -> str:
+        """Shorten a text to at most ``max_tokens`` tokens.
+
+        The middle is cut (marked ``[...]``), keeping the beginning (role and
+        instructions) and the end (output format) of a prompt.
+
+        Args:
+            text: Text to trim
+            model: Model ID
+            max_tokens: Token limit
+
+        Returns:
+            ``text`` itself if it fits, otherwise a trimmed copy that fits;
+            ``""`` if not even the ``[...]`` marker fits
+        """
+        total = self.count(text, model)
+        if total <= max_tokens:
+            return text
+
+        budget = max(0, max_tokens - self.count(_TRIM_MARKER, model))
+        # Shrink the kept share until the estimate fits (usually 1-2 rounds)
+        keep = int(len(text) * budget / total)
+        while keep > 0:
+            head = text[: keep // 2]
+            tail = text[len(text) - (keep - keep // 2) :]
+            trimmed = head + _TRIM_MARKER + tail
+            if self.count(trimmed, model) <= max_tokens:
+                return trimmed
+            keep = int(keep * 0.9)
+        return ""
+
+    def _encoding(self, model: str) -> "tiktoken.Encoding | None":
+        """tiktoken encoding of an OpenAI model (None if unavailable)."""
+        if not self._use_tiktoken:
+            return None
+        name = self._encoding_name(model)
+        if name not in self._encodings:
+            try:
+                self._encodings[name] = tiktoken.get_encoding(name)
+            except Exception:
+                # Encoding files are downloaded on first use; offline, approximate
+                logger.warning(f"tiktoken encoding {name} unavailable, approximating token counts")
+                self._encodings[name] = None
+        return self._encodings[name]
+
+    @staticmethod
+    def _encoding_name(model: str) -> str:
+        for prefix, name in _OPENAI_ENCODINGS:
+            if model.startswith(prefix):
+                return name
+        return "o200k_base"
+
+
+def project_cost(provider: LLMProvider, model: str, input_tokens: int, output_tokens: int) -> float:
+    """Projected USD cost of a call from the provider's ``PRICING`` table.
+
+    Args:
+        provider: Provider serving the call
+        model: Model ID
+        input_tokens: Estimated prompt tokens
+        output_tokens: Expected completion tokens
+
+    Returns:
+        Projected cost (0.0 if the model is not priced)
+    """
+    pricing: dict[str, tuple[float, float]] = getattr(provider, "PRICING", {})
+    input_price, output_price = pricing.get(model, (0.0, 0.0))
+    return round((input_tokens * input_price + output_tokens * output_price) / 1_000_000, 6)
+
+
+class TokenLimitedProvider:
+    """LLMProvider that estimates every prompt before dispatching it.
+
+    Example:
+        ```python
+        provider = TokenLimitedProvider(
+            OpenAIProvider(api_key="sk-...", semaphore=Semaphore(10)),
+            max_prompt_tokens=8000,
+            on_oversize="trim",
+            limiter=limiter,  # SharedRateLimiter / BackendRateLimiter
+        )
+        result = await provider.generate(prompt, "gpt-4o", 0.7, CriadorOutput)
+        provider.get_statistics()["projected_cost"]
+        ```
+
+    Attributes:
+        semaphore: The wrapped provider's semaphore
+    """
+
+    def __init__(
+        self,
+        provider: LLMProvider,
+        estimator: TokenEstimator | None = None,
+        max_prompt_tokens: int | dict[str, int] | None = None,
+        on_oversize: Literal["reject", "trim"] = "reject",
+        limiter: TokenRateLimiter | None = None,
+        expected_output_tokens: int = 800,
+    ) -> None:
+        """Initialize the wrapper.
+
+        Args:
+            provider: Provider to dispatch to
+            estimator: Token estimator (a new one by default)
+            max_prompt_tokens: Prompt token limit, for every model or per
+                model (models not listed are not limited)
+            on_oversize: Reject oversized prompts (InputValidationError) or
+                trim them to the limit
+            limiter: Rate limiter booked with the estimated prompt tokens
+                plus ``expected_output_tokens`` before each call
+            expected_output_tokens: Completion tokens assumed for rate
+                limiting and cost projection
+
+        Raises:
+            ValueError: If a limit or expected_output_tokens is not positive
+        """
+        if isinstance(max_prompt_tokens, dict):
+            limits, default_limit = dict(max_prompt_tokens), None
+        else:
+            limits, default_limit = {}, max_prompt_tokens
+        bounds = [*limits.values()] if default_limit is None else [default_limit]
+        if any(limit <= 0 for limit in bounds):
+            msg = f"max_prompt_tokens must be positive, got {max_prompt_tokens}"
+            raise ValueError(msg)
+        if expected_output_tokens <= 0:
+            msg = f"expected_output_tokens must be positive, got {expected_output_tokens}"
+            raise ValueError(msg)
+
+        self._provider = provider
+        self._estimator = estimator or TokenEstimator()
+        self._limits = limits
+        self._default_limit = default_limit
+        self._on_oversize = on_oversize
+        self._limiter = limiter
+        self._expected_output_tokens = expected_output_tokens
+        self._calls = 0
+        self._estimated_tokens = 0
+        self._actual_tokens = 0
+        self._projected_cost = 0.0
+        self._actual_cost = 0.0
+        self._rejected = 0
+        self._trimmed = 0
+        self.semaphore: Semaphore = provider.semaphore
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type[BaseModel] | None = None,
+    ) -> dict[str, Any]:
+        """Check, book and dispatch a call.
+
+        Implements LLMProvider Protocol.
+
+        Args:
+            prompt: Text prompt
+            model: Model ID
+            temperature: Sampling temperature 0.0-1.0
+            response_model: Optional Pydantic model for structured output
+
+        Returns:
+            The provider's result dict plus ``prompt_tokens_estimate``
+
+        Raises:
+            InputValidationError: If the prompt exceeds the model's limit and
+                on_oversize is "reject", or the limit is too small to trim to
+        """
+        tokens = self._estimator.count(prompt, model)
+        limit = self._limits.get(model, self._default_limit)
+        if limit is not None and tokens > limit:
+            if self._on_oversize == "reject":
+                self._rejected += 1
+                msg = f"Prompt of ~{tokens} tokens exceeds the {limit}-token limit of {model}"
+                raise InputValidationError(msg, modelo=model)
+            trimmed = self._estimator.trim(prompt, model, limit)
+            if not trimmed:
+                # Never send an empty prompt to a paid API
+                self._rejected += 1
+                msg = f"Prompt of ~{tokens} tokens cannot be trimmed to {limit} tokens for {model}"
+                raise InputValidationError(msg, modelo=model)
+            prompt = trimmed
+            self._trimmed += 1
+            logger.warning(f"Prompt of ~{tokens} tokens trimmed to {limit} for {model}")
+            tokens = self._estimator.count(prompt, model)
+
+        if self._limiter is not None:
+            await self._limiter.acquire(model, tokens + self._expected_output_tokens)
+
+        self._calls += 1
+        self._estimated_tokens += tokens
+        self._projected_cost += project_cost(
+            self._provider, model, tokens, self._expected_output_tokens
+        )
+        result = await self._provider.generate(prompt, model, temperature, response_model)
+        self._actual_tokens += result.get("tokens_used", 0)
+        self._actual_cost += result.get("cost", 0.0)
+        return {**result, "prompt_tokens_estimate": tokens}
+
+    def get_statistics(self) -> dict[str, int | float]:
+        """Get estimated versus actual usage and enforcement counters.
+
+        Returns:
+            Dict with calls, estimated_prompt_tokens, actual_tokens (prompt
+            plus completion, as reported), projected_cost, actual_cost,
+            rejected and trimmed
+        """
+        return {
+            "calls": self._calls,
+            "estimated_prompt_tokens": self._estimated_tokens,
+            "actual_tokens": self._actual_tokens,
+            "projected_cost": round(self._projected_cost, 6),
+            "actual_cost": round(self._actual_cost, 6),
+            "rejected": self._rejected,
+            "trimmed": self._trimmed,
+        }
@@ -1,3 +1,29 @@
 """Pytest configuration and shared fixtures."""
 
-# Shared fixtures will be added here as the project grows
+import pytest
+
+
+class FakeClock:
+    """Manually advanced clock; ``sleep`` advances it instead of waiting."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.now = start
+        self.sleeps: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def fake_clock(request: pytest.FixtureRequest) -> FakeClock:
+    """Clock starting at 0.0, or at the value given by indirect parametrization.
+
+    Example:
+        >>> @pytest.mark.parametrize("fake_clock", [1_000_000.0], indirect=True)
+        ... def test_wall_clock(fake_clock): ...
+    """
+    return FakeClock(getattr(request, "param", 0.0))
@@ -0,0 +1,161 @@
+"""Tests for ComentadorAgent."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from construtor.agents.comentador import (
+    RAG_UNAVAILABLE_REFERENCE,
+    ComentadorAgent,
+    format_rag_context,
+)
+from construtor.config.exceptions import CircuitOpenError, OutputParsingError
+from construtor.io.pinecone_client import InMemoryVectorIndex, PineconeClient
+from construtor.models.feedback import ComentadorOutput
+from construtor.models.question import CriadorOutput, SubFocoInput
+from construtor.models.rag import RagDocument, RagQueryResult
+
+BRAUNWALD = RagDocument(
+    texto="Estertores bibasais e B3 sugerem insuficiência cardíaca descompensada.",
+    titulo="Braunwald Tratado de Doenças Cardiovasculares",
+    autores="Zipes DP",
+    ano="2022",
+    fonte="Elsevier",
+)
+
+
+@pytest.fixture
+def mock_config(monkeypatch: pytest.MonkeyPatch):
+    """PipelineConfig with all necessary fields."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("PINECONE_API_KEY", "pc-test-key")
+    monkeypatch.setenv("PINECONE_INDEX_HOST", "test-index.pinecone.io")
+
+    from construtor.config.settings import PipelineConfig
+
+    return PipelineConfig(_env_file=None)
+
+
+@pytest.fixture
+def mock_provider():
+    """Mock LLMProvider that returns ComentadorOutput."""
+    provider = AsyncMock()
+    output = ComentadorOutput(
+        resposta_declarada="B",
+        comentario_introducao="A insuficiência cardíaca é uma síndrome clínica...",
+        comentario_visao_especifica="Estertores e B3 indicam congestão...",
+        comentario_alt_a="Incorreta: pneumonia cursaria com febre...",
+        comentario_alt_b="Correta: quadro típico de IC descompensada.",
+        comentario_alt_c="Incorreta: DPOC não explica a B3...",
+        comentario_alt_d="Incorreta: embolia não cursa com B3...",
+        comentario_visao_aprovado="B3 + estertores = congestão.",
+        referencia_bibliografica="Zipes DP. Braunwald Tratado de Doenças Cardiovasculares. 2022.",
+    )
+    provider.generate.return_value = {
+        "content": output,
+        "tokens_used": 1400,
+        "cost": 0.02,
+        "latency": 2.1,
+    }
+    return provider
+
+
+@pytest.fixture
+def sample_subfoco():
+    """SubFocoInput de exemplo."""
+    return SubFocoInput(
+        tema="Cardiologia",
+        foco="Insuficiência Cardíaca",
+        sub_foco="Diagnóstico clínico de IC descompensada",
+        periodo="3º ano",
+    )
+
+
+@pytest.fixture
+def sample_question():
+    """Question whose objetivo_educacional must not reach the prompt."""
+    return CriadorOutput(
+        enunciado="Paciente de 65 anos com dispneia aos esforços, estertores bibasais e B3.",
+        alternativa_a="Pneumonia",
+        alternativa_b="Insuficiência cardíaca",
+        alternativa_c="DPOC",
+        alternativa_d="Embolia pulmonar",
+        resposta_correta="B",
+        objetivo_educacional="GABARITO-SECRETO",
+        nivel_dificuldade=2,
+        tipo_enunciado="caso clínico",
+    )
+
+
+@pytest.mark.asyncio
+async def test_review_prompt_is_blind_and_includes_rag(
+    mock_provider, mock_config, sample_subfoco, sample_question
+):
+    """The prompt has the question and the RAG documents but not the gabarito."""
+    agent = ComentadorAgent(mock_provider, mock_config)
+    rag = RagQueryResult(documentos=[BRAUNWALD], query="Cardiologia Insuficiência Cardíaca")
+
+    output = await agent.review_question(sample_subfoco, sample_question, rag)
+
+    prompt = mock_provider.generate.call_args.kwargs["prompt"]
+    assert sample_question.enunciado in prompt
+    assert "B) Insuficiência cardíaca" in prompt
+    assert BRAUNWALD.citation() in prompt
+    assert "resposta_correta" not in prompt
+    assert "GABARITO-SECRETO" not in prompt
+    assert mock_provider.generate.call_args.kwargs["response_model"] is ComentadorOutput
+    assert output.referencia_bibliografica.startswith("Zipes DP")
+
+
+@pytest.mark.asyncio
+async def test_review_without_rag_marks_reference(
+    mock_provider, mock_config, sample_subfoco, sample_question
+):
+    """Without RAG context the reference says RAG was offline."""
+    agent = ComentadorAgent(mock_provider, mock_config)
+
+    output = await agent.review_question(sample_subfoco, sample_question, None)
+
+    assert output.referencia_bibliografica == RAG_UNAVAILABLE_REFERENCE
+    assert "Nenhum documento disponível." in mock_provider.generate.call_args.kwargs["prompt"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_contexts_uses_one_batch(mock_provider, mock_config, sample_subfoco):
+    """Contexts of a batch come from a single batched client call."""
+    index = InMemoryVectorIndex([(BRAUNWALD, {"periodo": "3º ano"})])
+    agent = ComentadorAgent(mock_provider, mock_config, PineconeClient(mock_config, index=index))
+
+    contexts = await agent.fetch_contexts([sample_subfoco, sample_subfoco])
+
+    assert index.searches == 1
+    assert contexts[0].documentos[0].titulo == BRAUNWALD.titulo
+
+    without_rag = ComentadorAgent(mock_provider, mock_config)
+    assert await without_rag.fetch_contexts([sample_subfoco]) == [None]
+
+
+@pytest.mark.asyncio
+async def test_provider_errors_propagate(
+    mock_provider, mock_config, sample_subfoco, sample_question
+):
+    """Provider unavailability stays an LLMProviderError; other failures are parsing errors."""
+    agent = ComentadorAgent(mock_provider, mock_config)
+
+    mock_provider.generate.side_effect = CircuitOpenError("all circuits open")
+    with pytest.raises(CircuitOpenError):
+        await agent.review_question(sample_subfoco, sample_question)
+
+    mock_provider.generate.side_effect = ValueError("invalid JSON")
+    with pytest.raises(OutputParsingError, match="Failed to generate comment"):
+        await agent.review_question(sample_subfoco, sample_question)
+
+
+def test_format_rag_context_numbers_documents():
+    rag = RagQueryResult(documentos=[BRAUNWALD, RagDocument(texto="Sem metadados")], query="q")
+
+    text = format_rag_context(rag)
+
+    assert text.startswith(f"[1] {BRAUNWALD.citation()}\n{BRAUNWALD.texto}")
+    assert "[2] Referência sem metadados\nSem metadados" in text
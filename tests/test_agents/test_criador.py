@@ -1,11 +1,16 @@
 """Tests for CriadorAgent."""
 
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from construtor.agents.criador import CriadorAgent
-from construtor.config.exceptions import OutputParsingError
+from construtor.config.exceptions import (
+    CircuitOpenError,
+    DuplicateQuestionError,
+    OutputParsingError,
+)
+from construtor.metrics.question_index import QuestionMatch
 from construtor.models.question import CriadorOutput, SubFocoInput
 
 
@@ -152,7 +157,7 @@ def test_criador_prompt_file_exists_and_has_all_placeholders():
 def test_initialization_with_provider_and_config(mock_provider, mock_config):
     """Test CriadorAgent initializes with provider and config."""
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="Gere questão: {tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -165,7 +170,7 @@ def test_initialization_with_provider_and_config(mock_provider, mock_config):
 def test_initialization_with_nonexistent_prompt(mock_provider, mock_config):
     """Test CriadorAgent raises error if prompt file doesn't exist."""
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         side_effect=FileNotFoundError("Prompt not found"),
     ):
         with pytest.raises(FileNotFoundError):
@@ -181,7 +186,7 @@ def test_initialization_with_nonexistent_prompt(mock_provider, mock_config):
 async def test_create_question_returns_criador_output(mock_provider, mock_config, sample_subfoco):
     """Test create_question returns complete CriadorOutput."""
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="Gere: {tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -225,7 +230,7 @@ async def test_create_question_formats_prompt_with_all_variables(
 
     prompt_template = "Tema:{tema}|Foco:{foco}|SubFoco:{sub_foco}|Periodo:{periodo}|Pos:{posicao_correta}|Nivel:{nivel_dificuldade}"
 
-    with patch("construtor.agents.criador.load_prompt", return_value=prompt_template):
+    with patch("construtor.config.prompt_loader.load_prompt", return_value=prompt_template):
         agent = CriadorAgent(mock_provider, mock_config)
         await agent.create_question(sample_subfoco, posicao_correta="C", nivel_dificuldade=3)
 
@@ -265,7 +270,7 @@ async def test_create_question_passes_response_model(mock_provider, mock_config,
     }
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -300,7 +305,7 @@ async def test_create_question_with_custom_difficulty_level(mock_provider, mock_
     }
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -336,7 +341,7 @@ async def test_create_question_with_different_positions(mock_provider, mock_conf
         }
 
         with patch(
-            "construtor.agents.criador.load_prompt",
+            "construtor.config.prompt_loader.load_prompt",
             return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
         ):
             agent = CriadorAgent(mock_provider, mock_config)
@@ -373,7 +378,7 @@ async def test_position_validation_failure(mock_provider, mock_config, sample_su
     }
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -394,7 +399,7 @@ async def test_llm_generation_failure_propagates_error(mock_provider, mock_confi
     mock_provider.generate.side_effect = RuntimeError("LLM API error")
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -406,6 +411,21 @@ async def test_llm_generation_failure_propagates_error(mock_provider, mock_confi
         assert "Failed to generate question" in str(exc_info.value)
 
 
+@pytest.mark.asyncio
+async def test_llm_provider_error_is_not_wrapped(mock_provider, mock_config, sample_subfoco):
+    """Test provider failures (e.g. open circuits) propagate unwrapped for failover."""
+    mock_provider.generate.side_effect = CircuitOpenError("All circuits open", modelo="gpt-4o")
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
+    ):
+        agent = CriadorAgent(mock_provider, mock_config)
+
+        with pytest.raises(CircuitOpenError):
+            await agent.create_question(sample_subfoco, posicao_correta="B")
+
+
 @pytest.mark.asyncio
 async def test_output_parsing_error_contains_context(mock_provider, mock_config, sample_subfoco):
     """Test OutputParsingError includes sub_foco, nivel, posicao_esperada context."""
@@ -428,7 +448,7 @@ async def test_output_parsing_error_contains_context(mock_provider, mock_config,
     }
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -446,7 +466,7 @@ async def test_output_parsing_error_contains_context(mock_provider, mock_config,
 async def test_invalid_posicao_correta_raises_value_error(mock_provider, mock_config, sample_subfoco):
     """Test ValueError when posicao_correta is not A/B/C/D."""
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -461,7 +481,7 @@ async def test_invalid_posicao_correta_raises_value_error(mock_provider, mock_co
 async def test_invalid_nivel_dificuldade_raises_value_error(mock_provider, mock_config, sample_subfoco):
     """Test ValueError when nivel_dificuldade is not 1-3."""
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -485,7 +505,7 @@ async def test_successful_generation_logs_info(mock_provider, mock_config, sampl
     caplog.set_level(logging.INFO)
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -519,7 +539,7 @@ async def test_log_contains_all_expected_fields(mock_provider, mock_config, samp
     caplog.set_level(logging.INFO)
 
     with patch(
-        "construtor.agents.criador.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
     ):
         agent = CriadorAgent(mock_provider, mock_config)
@@ -536,3 +556,53 @@ async def test_log_contains_all_expected_fields(mock_provider, mock_config, samp
     assert "tokens=850" in log_msg
     assert "cost=0.0127" in log_msg
     assert "latency=" in log_msg
+
+
+# ============================================================================
+# Cross-run Dedup Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_duplicate_question_is_regenerated_with_avoidance_note(
+    mock_provider, mock_config, sample_subfoco
+):
+    """A duplicate is regenerated with the duplicate's enunciado in the prompt."""
+    question_index = MagicMock()
+    question_index.check.side_effect = [QuestionMatch(question_id=42, similarity=0.9), None]
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
+    ):
+        agent = CriadorAgent(mock_provider, mock_config, question_index=question_index)
+        result = await agent.create_question(sample_subfoco, posicao_correta="B")
+
+    assert result.resposta_correta == "B"
+    assert mock_provider.generate.call_count == 2
+    retry_prompt = mock_provider.generate.call_args_list[1].kwargs["prompt"]
+    assert "não repita" in retry_prompt
+    assert result.enunciado in retry_prompt
+
+
+@pytest.mark.asyncio
+async def test_persistent_duplicate_raises_duplicate_question_error(
+    mock_provider, mock_config, sample_subfoco
+):
+    """After max_duplicate_retries regenerations the duplicate is reported."""
+    question_index = MagicMock()
+    question_index.check.return_value = QuestionMatch(question_id=42, similarity=0.95)
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {sub_foco} {periodo} {posicao_correta} {nivel_dificuldade}",
+    ):
+        agent = CriadorAgent(
+            mock_provider, mock_config, question_index=question_index, max_duplicate_retries=2
+        )
+        with pytest.raises(DuplicateQuestionError, match="duplicates question 42") as exc_info:
+            await agent.create_question(sample_subfoco, posicao_correta="B")
+
+    assert exc_info.value.duplicate_of == 42
+    assert isinstance(exc_info.value, OutputParsingError)
+    assert mock_provider.generate.call_count == 3
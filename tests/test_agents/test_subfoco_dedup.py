@@ -0,0 +1,109 @@
+"""Tests for SubFocoDeduplicator (near-duplicate sub-foco detection)."""
+
+import numpy as np
+import pytest
+
+from construtor.agents.subfoco_dedup import SubFocoDeduplicator, embed_texts
+from construtor.models.question import FocoInput
+
+
+@pytest.fixture
+def foco():
+    """FocoInput de exemplo."""
+    return FocoInput(tema="Cardiologia", foco="Insuficiência Cardíaca", periodo="3º ano")
+
+
+def test_embed_texts_is_normalized_and_deterministic():
+    """Embeddings are unit vectors, stable and blind to case, accents and stopwords."""
+    vectors = embed_texts(["Critérios de Framingham", "criterios  FRAMINGHAM.", ""])
+
+    assert vectors.shape == (3, 2048)
+    assert vectors.dtype == np.float32
+    assert float(vectors[0] @ vectors[1]) == pytest.approx(1.0)
+    assert not vectors[2].any()
+    np.testing.assert_array_equal(vectors[0], embed_texts(["Critérios de Framingham"])[0])
+
+
+def test_paraphrases_dropped_distinct_topics_kept(foco):
+    """Rewordings are dropped; different aspects of the same condition are kept."""
+    dedup = SubFocoDeduplicator()
+    kept = dedup.filter(
+        foco,
+        [
+            "Critérios de Framingham para diagnóstico",
+            "Diagnóstico da insuficiência cardíaca aguda",
+            "Critérios de Framingham no diagnóstico da IC",
+            "Tratamento da insuficiência cardíaca aguda",
+            "Sinais clínicos de congestão pulmonar",
+            "Sinais clínicos da congestão pulmonar na IC",
+        ],
+    )
+
+    assert kept == [
+        "Critérios de Framingham para diagnóstico",
+        "Diagnóstico da insuficiência cardíaca aguda",
+        "Tratamento da insuficiência cardíaca aguda",
+        "Sinais clínicos de congestão pulmonar",
+    ]
+    assert dedup.get_statistics()["dropped"] == 2
+
+
+@pytest.mark.parametrize(
+    "sub_focos",
+    [
+        ["Indicações de betabloqueadores", "Contraindicações de betabloqueadores"],
+        ["Indicações ao transplante cardíaco", "Contraindicações ao transplante cardíaco"],
+        ["Hipercalemia na IC", "Hipocalemia na IC"],
+        ["IC com fração de ejeção reduzida", "IC com fração de ejeção preservada"],
+    ],
+)
+def test_prefixed_words_and_antonyms_are_kept(foco, sub_focos):
+    """A word containing another is not a paraphrase of it (regression)."""
+    dedup = SubFocoDeduplicator()
+
+    assert dedup.filter(foco, sub_focos) == sub_focos
+    dedup.commit(foco, sub_focos[:1])
+    assert dedup.filter(foco, sub_focos[1:]) == sub_focos[1:]
+
+
+def test_focos_differing_in_a_sign_have_separate_indexes():
+    """HER2+ and HER2- sub-focos do not block each other."""
+    dedup = SubFocoDeduplicator()
+    positive = FocoInput(tema="Oncologia", foco="Câncer de mama HER2+", periodo="3º ano")
+    negative = positive.model_copy(update={"foco": "Câncer de mama HER2-"})
+
+    dedup.commit(positive, ["Tratamento adjuvante"])
+
+    assert dedup.filter(negative, ["Tratamento adjuvante"]) == ["Tratamento adjuvante"]
+
+
+def test_index_is_per_foco_and_filled_by_commit(foco):
+    """Only committed sub-focos of the same foco block new candidates."""
+    dedup = SubFocoDeduplicator()
+    candidate = ["Classificação funcional NYHA"]
+
+    dedup.filter(foco, candidate)
+    assert dedup.filter(foco, candidate) == candidate  # filter alone does not index
+
+    dedup.commit(foco, candidate)
+    assert dedup.filter(foco, ["Classificação funcional de NYHA da IC"]) == []
+
+    other_periodo = foco.model_copy(update={"periodo": "4º ano"})
+    assert dedup.filter(other_periodo, candidate) == candidate
+    assert dedup.get_statistics() == {"focos": 1, "sub_focos": 1, "dropped": 1}
+
+
+def test_custom_embedder(foco):
+    """A local model can replace the hashed n-gram embedding."""
+    table = {"a": [1.0, 0.0], "b": [0.99, 0.1], "c": [0.0, 1.0]}
+    dedup = SubFocoDeduplicator(
+        threshold=0.9, embedder=lambda texts: np.array([table[text] for text in texts])
+    )
+
+    assert dedup.filter(foco, ["a", "b", "c"]) == ["a", "c"]
+
+
+def test_invalid_threshold():
+    """Threshold must be in (0, 1]."""
+    with pytest.raises(ValueError, match="threshold"):
+        SubFocoDeduplicator(threshold=0.0)
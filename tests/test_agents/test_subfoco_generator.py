@@ -4,6 +4,7 @@ from unittest.mock import AsyncMock, patch
 
 import pytest
 
+from construtor.agents.subfoco_dedup import SubFocoDeduplicator
 from construtor.agents.subfoco_generator import (
     SubFocoBatchResponse,
     SubFocoGenerator,
@@ -62,7 +63,7 @@ def sample_foco():
 def test_initialization_with_provider_and_config(mock_provider, mock_config):
     """Test SubFocoGenerator initializes with provider and config."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="Gere {count} sub-focos para {tema} {foco} {periodo}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -72,10 +73,23 @@ def test_initialization_with_provider_and_config(mock_provider, mock_config):
     assert generator._prompt_template is not None
 
 
+def test_initialization_with_real_prompt_file(mock_provider, mock_config, sample_foco):
+    """Test that prompts/subfoco_generator.md loads unpatched and fills every placeholder."""
+    generator = SubFocoGenerator(mock_provider, mock_config)
+
+    prompt = generator._format_prompt(sample_foco, 50)
+
+    assert "Cardiologia" in prompt
+    assert "Insuficiência Cardíaca" in prompt
+    assert "3º ano" in prompt
+    assert "exatamente 50 sub-focos" in prompt
+    assert '"sub_focos"' in prompt
+
+
 def test_initialization_with_nonexistent_prompt(mock_provider, mock_config):
     """Test SubFocoGenerator raises error if prompt file doesn't exist."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         side_effect=FileNotFoundError("Prompt not found"),
     ):
         with pytest.raises(FileNotFoundError):
@@ -85,7 +99,7 @@ def test_initialization_with_nonexistent_prompt(mock_provider, mock_config):
 def test_initialization_rejects_zero_count(mock_provider, mock_config, sample_foco):
     """Test generate_batch raises ValueError for count=0."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -103,7 +117,7 @@ def test_initialization_rejects_zero_count(mock_provider, mock_config, sample_fo
 def test_initialization_rejects_negative_count(mock_provider, mock_config, sample_foco):
     """Test generate_batch raises ValueError for negative count."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -123,12 +137,10 @@ def test_initialization_rejects_negative_count(mock_provider, mock_config, sampl
 
 
 @pytest.mark.asyncio
-async def test_generate_batch_returns_subfoco_list(
-    mock_provider, mock_config, sample_foco
-):
+async def test_generate_batch_returns_subfoco_list(mock_provider, mock_config, sample_foco):
     """Test generate_batch returns list[SubFocoInput] with 50 items."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="Gere {count} sub-focos para {tema} {foco} {periodo}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -142,12 +154,10 @@ async def test_generate_batch_returns_subfoco_list(
 
 
 @pytest.mark.asyncio
-async def test_generate_batch_formats_prompt_correctly(
-    mock_provider, mock_config, sample_foco
-):
+async def test_generate_batch_formats_prompt_correctly(mock_provider, mock_config, sample_foco):
     """Test generate_batch formats prompt with correct variables."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="Tema: {tema}, Foco: {foco}, Periodo: {periodo}, Count: {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -165,12 +175,10 @@ async def test_generate_batch_formats_prompt_correctly(
 
 
 @pytest.mark.asyncio
-async def test_generate_batch_passes_response_model(
-    mock_provider, mock_config, sample_foco
-):
+async def test_generate_batch_passes_response_model(mock_provider, mock_config, sample_foco):
     """Test generate_batch passes response_model=SubFocoBatchResponse to provider."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -186,7 +194,7 @@ async def test_generate_batch_uses_config_model_and_temperature(
 ):
     """Test generate_batch uses model and temperature from config."""
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -198,22 +206,18 @@ async def test_generate_batch_uses_config_model_and_temperature(
 
 
 @pytest.mark.asyncio
-async def test_generate_batch_with_custom_count(
-    mock_provider, mock_config, sample_foco
-):
+async def test_generate_batch_with_custom_count(mock_provider, mock_config, sample_foco):
     """Test generate_batch with custom count parameter."""
     # Mock provider returns 10 sub-focos
     mock_provider.generate.return_value = {
-        "content": SubFocoBatchResponse(
-            sub_focos=[f"Sub-foco {i}" for i in range(10)]
-        ),
+        "content": SubFocoBatchResponse(sub_focos=[f"Sub-foco {i}" for i in range(10)]),
         "tokens_used": 500,
         "cost": 0.005,
         "latency": 1.0,
     }
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -228,15 +232,13 @@ async def test_generate_batch_with_different_periodos(mock_provider, mock_config
     periodos = ["1º ano", "2º ano", "3º ano", "4º ano"]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
 
         for periodo in periodos:
-            foco = FocoInput(
-                tema="Cardiologia", foco="Insuficiência Cardíaca", periodo=periodo
-            )
+            foco = FocoInput(tema="Cardiologia", foco="Insuficiência Cardíaca", periodo=periodo)
             result = await generator.generate_batch(foco)
 
             assert all(sf.periodo == periodo for sf in result)
@@ -254,17 +256,13 @@ async def test_retry_on_insufficient_count(mock_provider, mock_config, sample_fo
     # Second call: 50 sub-focos (success)
     mock_provider.generate.side_effect = [
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(30)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(30)]),
             "tokens_used": 800,
             "cost": 0.008,
             "latency": 1.5,
         },
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(50)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(50)]),
             "tokens_used": 1500,
             "cost": 0.015,
             "latency": 2.3,
@@ -272,7 +270,7 @@ async def test_retry_on_insufficient_count(mock_provider, mock_config, sample_fo
     ]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -296,9 +294,7 @@ async def test_deduplication_triggers_retry(mock_provider, mock_config, sample_f
             "latency": 1.5,
         },
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(50)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(50)]),
             "tokens_used": 1500,
             "cost": 0.015,
             "latency": 2.3,
@@ -306,7 +302,7 @@ async def test_deduplication_triggers_retry(mock_provider, mock_config, sample_f
     ]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -317,9 +313,7 @@ async def test_deduplication_triggers_retry(mock_provider, mock_config, sample_f
 
 
 @pytest.mark.asyncio
-async def test_empty_subfoco_filtered_triggers_retry(
-    mock_provider, mock_config, sample_foco
-):
+async def test_empty_subfoco_filtered_triggers_retry(mock_provider, mock_config, sample_foco):
     """Test that empty/whitespace sub-focos are filtered and trigger retry."""
     # First call: 50 items but some are empty/whitespace (only 30 valid)
     # Second call: 50 valid items
@@ -332,9 +326,7 @@ async def test_empty_subfoco_filtered_triggers_retry(
             "latency": 1.5,
         },
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(50)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(50)]),
             "tokens_used": 1500,
             "cost": 0.015,
             "latency": 2.3,
@@ -342,7 +334,7 @@ async def test_empty_subfoco_filtered_triggers_retry(
     ]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -353,14 +345,10 @@ async def test_empty_subfoco_filtered_triggers_retry(
 
 
 @pytest.mark.asyncio
-async def test_whitespace_only_subfoco_filtered(
-    mock_provider, mock_config, sample_foco
-):
+async def test_whitespace_only_subfoco_filtered(mock_provider, mock_config, sample_foco):
     """Test that whitespace-only sub-focos are filtered."""
     # Mix of valid, empty, and whitespace-only
-    mixed_list = [
-        f"sf-{i}" if i < 30 else ("   " if i % 2 == 0 else "") for i in range(50)
-    ]
+    mixed_list = [f"sf-{i}" if i < 30 else ("   " if i % 2 == 0 else "") for i in range(50)]
     mock_provider.generate.side_effect = [
         {
             "content": SubFocoBatchResponse(sub_focos=mixed_list),
@@ -369,9 +357,7 @@ async def test_whitespace_only_subfoco_filtered(
             "latency": 1.5,
         },
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(50)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(50)]),
             "tokens_used": 1500,
             "cost": 0.015,
             "latency": 2.3,
@@ -379,7 +365,7 @@ async def test_whitespace_only_subfoco_filtered(
     ]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -391,9 +377,7 @@ async def test_whitespace_only_subfoco_filtered(
 
 
 @pytest.mark.asyncio
-async def test_output_parsing_error_after_max_retries(
-    mock_provider, mock_config, sample_foco
-):
+async def test_output_parsing_error_after_max_retries(mock_provider, mock_config, sample_foco):
     """Test OutputParsingError raised after max retries with insufficient count."""
     # All attempts return insufficient sub-focos
     mock_provider.generate.return_value = {
@@ -404,7 +388,7 @@ async def test_output_parsing_error_after_max_retries(
     }
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -422,22 +406,129 @@ async def test_output_parsing_error_after_max_retries(
         assert mock_provider.generate.call_count == 3
 
 
+def _batch(sub_focos: list[str]) -> dict:
+    """Provider response for a list of sub-focos."""
+    return {
+        "content": SubFocoBatchResponse(sub_focos=sub_focos),
+        "tokens_used": 100,
+        "cost": 0.001,
+        "latency": 0.5,
+    }
+
+
+@pytest.mark.asyncio
+async def test_top_up_requests_only_missing_subfocos(mock_provider, mock_config, sample_foco):
+    """Test retry keeps valid sub-focos and asks only for the missing ones."""
+    mock_provider.generate.side_effect = [
+        _batch([f"sf-{i}" for i in range(45)]),
+        _batch([f"sf-{i}" for i in range(45, 50)]),
+    ]
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="Count: {count} | {tema} {foco} {periodo}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config)
+        result = await generator.generate_batch(sample_foco)
+
+    assert [sf.sub_foco for sf in result] == [f"sf-{i}" for i in range(50)]
+    top_up_prompt = mock_provider.generate.call_args_list[1].kwargs["prompt"]
+    assert "Count: 5" in top_up_prompt
+    assert "- sf-0\n" in top_up_prompt
+    assert "- sf-44" in top_up_prompt
+    assert "Gere apenas 5 sub-focos NOVOS" in top_up_prompt
+
+
+@pytest.mark.asyncio
+async def test_top_up_accumulates_across_attempts(mock_provider, mock_config, sample_foco):
+    """Test top-ups accumulate and drop duplicates of already-kept sub-focos."""
+    mock_provider.generate.side_effect = [
+        _batch([f"sf-{i}" for i in range(30)]),
+        _batch(["sf-0", "", *[f"sf-{i}" for i in range(30, 45)]]),
+        _batch([f"sf-{i}" for i in range(45, 50)]),
+    ]
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="Count: {count} | {tema} {foco} {periodo}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config)
+        result = await generator.generate_batch(sample_foco)
+
+    assert len(result) == 50
+    assert len({sf.sub_foco for sf in result}) == 50
+    prompts = [call.kwargs["prompt"] for call in mock_provider.generate.call_args_list]
+    assert "Count: 50" in prompts[0]
+    assert "Count: 20" in prompts[1]
+    assert "Count: 5" in prompts[2]
+
+
+@pytest.mark.asyncio
+async def test_full_regeneration_when_top_up_disabled(mock_provider, mock_config, sample_foco):
+    """Test top_up=False regenerates the full batch on shortfall."""
+    mock_provider.generate.side_effect = [
+        _batch([f"sf-{i}" for i in range(45)]),
+        _batch([f"novo-{i}" for i in range(50)]),
+    ]
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="Count: {count} | {tema} {foco} {periodo}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config, top_up=False)
+        result = await generator.generate_batch(sample_foco)
+
+    assert [sf.sub_foco for sf in result] == [f"novo-{i}" for i in range(50)]
+    second_prompt = mock_provider.generate.call_args_list[1].kwargs["prompt"]
+    assert "Count: 50" in second_prompt
+    assert "não repita" not in second_prompt
+
+
+@pytest.mark.asyncio
+async def test_near_duplicates_dropped_and_topped_up(mock_provider, mock_config, sample_foco):
+    """Test paraphrased sub-focos are dropped and replaced before returning."""
+    mock_provider.generate.side_effect = [
+        _batch(
+            [
+                "Critérios de Framingham para diagnóstico",
+                "Critérios de Framingham no diagnóstico da IC",
+                "Tratamento com betabloqueadores",
+            ]
+        ),
+        _batch(["Classificação funcional NYHA"]),
+    ]
+    deduplicator = SubFocoDeduplicator()
+
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="Count: {count} | {tema} {foco} {periodo}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config, deduplicator=deduplicator)
+        result = await generator.generate_batch(sample_foco, count=3)
+
+    assert [sf.sub_foco for sf in result] == [
+        "Critérios de Framingham para diagnóstico",
+        "Tratamento com betabloqueadores",
+        "Classificação funcional NYHA",
+    ]
+    assert "Count: 1" in mock_provider.generate.call_args_list[1].kwargs["prompt"]
+    assert deduplicator.get_statistics()["sub_focos"] == 3
+
+
 # ============================================================================
 # Logging Tests
 # ============================================================================
 
 
 @pytest.mark.asyncio
-async def test_logs_info_on_successful_generation(
-    mock_provider, mock_config, sample_foco, caplog
-):
+async def test_logs_info_on_successful_generation(mock_provider, mock_config, sample_foco, caplog):
     """Test that INFO log is generated on successful generation."""
     import logging
 
     caplog.set_level(logging.INFO)
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -462,17 +553,13 @@ async def test_logs_warning_on_retry(mock_provider, mock_config, sample_foco, ca
     # First call insufficient, second call success
     mock_provider.generate.side_effect = [
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(30)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(30)]),
             "tokens_used": 800,
             "cost": 0.008,
             "latency": 1.5,
         },
         {
-            "content": SubFocoBatchResponse(
-                sub_focos=[f"sf-{i}" for i in range(50)]
-            ),
+            "content": SubFocoBatchResponse(sub_focos=[f"sf-{i}" for i in range(50)]),
             "tokens_used": 1500,
             "cost": 0.015,
             "latency": 2.3,
@@ -480,7 +567,7 @@ async def test_logs_warning_on_retry(mock_provider, mock_config, sample_foco, ca
     ]
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -500,14 +587,12 @@ async def test_logs_warning_on_retry(mock_provider, mock_config, sample_foco, ca
 
 
 @pytest.mark.asyncio
-async def test_subfoco_input_mapping_preserves_original_data(
-    mock_provider, mock_config
-):
+async def test_subfoco_input_mapping_preserves_original_data(mock_provider, mock_config):
     """Test that SubFocoInput items preserve original FocoInput data."""
     foco = FocoInput(tema="Neurologia", foco="AVC Isquêmico", periodo="4º ano")
 
     with patch(
-        "construtor.agents.subfoco_generator.load_prompt",
+        "construtor.config.prompt_loader.load_prompt",
         return_value="{tema} {foco} {periodo} {count}",
     ):
         generator = SubFocoGenerator(mock_provider, mock_config)
@@ -519,3 +604,85 @@ async def test_subfoco_input_mapping_preserves_original_data(
         assert sf.foco == "AVC Isquêmico"
         assert sf.periodo == "4º ano"
         assert sf.sub_foco.startswith("Sub-foco específico")
+
+
+@pytest.mark.asyncio
+async def test_get_statistics_accumulates_usage(mock_provider, mock_config, sample_foco):
+    """Test that token and cost usage accumulate across batches."""
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {periodo} {count}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config)
+        await generator.generate_batch(sample_foco, count=50)
+        await generator.generate_batch(sample_foco, count=50)
+
+    assert generator.get_statistics() == {
+        "calls": 2,
+        "tokens_used": 3000,
+        "cost": 0.03,
+        "catalog_hits": 0,
+    }
+
+
+# ============================================================================
+# Sub-Foco Catalogue Tests
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_catalog_saves_then_reuses_batch(mock_provider, mock_config, sample_foco):
+    """Test that a catalogued foco is served without an LLM call."""
+    from construtor.metrics import MetricsStore
+
+    store = MetricsStore(":memory:")
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {periodo} {count}",
+    ):
+        first = await SubFocoGenerator(mock_provider, mock_config, catalog=store).generate_batch(
+            sample_foco, count=50
+        )
+        generator = SubFocoGenerator(mock_provider, mock_config, catalog=store)
+        second = await generator.generate_batch(sample_foco, count=20)
+
+    assert mock_provider.generate.call_count == 1
+    assert second == first[:20]
+    assert generator.get_statistics()["catalog_hits"] == 1
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_catalog_is_keyed_by_prompt_version(mock_provider, mock_config, sample_foco):
+    """Test that a changed prompt does not reuse the old prompt's sub-focos."""
+    from construtor.metrics import MetricsStore
+
+    store = MetricsStore(":memory:")
+    for template in ("{tema} {foco} {periodo} {count}", "v2 {tema} {foco} {periodo} {count}"):
+        with patch("construtor.config.prompt_loader.load_prompt", return_value=template):
+            generator = SubFocoGenerator(mock_provider, mock_config, catalog=store)
+            await generator.generate_batch(sample_foco, count=50)
+
+    assert mock_provider.generate.call_count == 2
+    store.close()
+
+
+@pytest.mark.asyncio
+async def test_manual_sub_focos_take_precedence(mock_provider, mock_config, sample_foco):
+    """Test that manual catalogue entries (FR3) are used before generating."""
+    from construtor.io.subfoco_catalog import MANUAL_PROMPT_VERSION
+    from construtor.metrics import MetricsStore
+
+    store = MetricsStore(":memory:")
+    manual = SubFocoGenerator._to_inputs(sample_foco, ["Critérios de Framingham", "BNP"])
+    store.save_sub_focos(MANUAL_PROMPT_VERSION, manual)
+    with patch(
+        "construtor.config.prompt_loader.load_prompt",
+        return_value="{tema} {foco} {periodo} {count}",
+    ):
+        generator = SubFocoGenerator(mock_provider, mock_config, catalog=store)
+        result = await generator.generate_batch(sample_foco, count=2)
+
+    assert result == manual
+    mock_provider.generate.assert_not_called()
+    store.close()
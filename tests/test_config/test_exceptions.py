@@ -1,7 +1,9 @@
 """Tests for custom exception hierarchy."""
 
 from construtor.config.exceptions import (
+    CircuitOpenError,
     ConfigurationError,
+    DuplicateQuestionError,
     InputValidationError,
     LLMProviderError,
     LLMRateLimitError,
@@ -162,6 +164,28 @@ class TestLLMTimeoutError:
         assert "rodada=1" in error_str
 
 
+class TestCircuitOpenError:
+    """Test CircuitOpenError class."""
+
+    def test_inherits_from_llm_provider_error(self):
+        """Test that CircuitOpenError is caught as a provider error."""
+        error = CircuitOpenError("Circuit open", modelo="gpt-4o")
+        assert isinstance(error, LLMProviderError)
+        assert isinstance(error, PipelineError)
+        assert "modelo=gpt-4o" in str(error)
+
+
+class TestDuplicateQuestionError:
+    """Test DuplicateQuestionError class."""
+
+    def test_is_retryable_output_error_with_duplicate_id(self):
+        """Test that DuplicateQuestionError carries the duplicated question's ID."""
+        error = DuplicateQuestionError("Duplicate question", foco="Cardiologia", duplicate_of=42)
+        assert isinstance(error, OutputParsingError)
+        assert error.duplicate_of == 42
+        assert "foco=Cardiologia" in str(error)
+
+
 class TestOutputParsingError:
     """Test OutputParsingError class."""
 
@@ -458,6 +482,8 @@ class TestExceptionPublicAPI:
             "InputValidationError",
             "PineconeError",
             "ConfigurationError",
+            "CircuitOpenError",
+            "DuplicateQuestionError",
         ]
 
         assert hasattr(exceptions, "__all__")
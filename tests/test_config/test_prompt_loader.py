@@ -0,0 +1,117 @@
+"""Tests for compiled prompt templates."""
+
+import os
+
+import pytest
+
+from construtor.config import prompt_loader
+from construtor.config.exceptions import ConfigurationError
+from construtor.config.prompt_loader import FilePromptTemplate, PromptTemplate, compile_prompt
+
+CRIADOR_PLACEHOLDERS = {
+    "tema",
+    "foco",
+    "sub_foco",
+    "periodo",
+    "posicao_correta",
+    "nivel_dificuldade",
+}
+
+
+@pytest.fixture
+def prompts_dir(tmp_path, monkeypatch):
+    """Temporary prompts directory."""
+    monkeypatch.setattr(prompt_loader, "PROMPTS_DIR", tmp_path)
+    return tmp_path
+
+
+def _write(path, text: str, mtime_ns: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_render_matches_str_format():
+    """Rendering gives the same text as str.format, escapes and specs included."""
+    text = "{{json}} Tema: {tema} | nível {nivel:02d} | {foco!r} | {tema}"
+    values = {"tema": "Cardiologia", "nivel": 2, "foco": "IC", "extra": "ignored"}
+
+    template = PromptTemplate(text)
+
+    assert template.render(**values) == text.format(**values)
+    assert template.format(**values) == text.format(**values)
+    assert template.placeholders == {"tema", "nivel", "foco"}
+
+
+def test_real_criador_prompt_compiles():
+    """prompts/criador.md uses exactly the placeholders CriadorAgent fills."""
+    template = compile_prompt("criador", placeholders=CRIADOR_PLACEHOLDERS)
+
+    values = dict.fromkeys(CRIADOR_PLACEHOLDERS, "X")
+    assert template.render(**values) == template.text.format(**values)
+
+
+def test_placeholder_mismatch_fails_at_load_time():
+    """Missing or unexpected placeholders are configuration errors."""
+    with pytest.raises(ConfigurationError, match=r"missing=\['count'\] unexpected=\['conut'\]"):
+        PromptTemplate("{tema} {conut}", name="subfoco", placeholders={"tema", "count"})
+
+
+@pytest.mark.parametrize("text", ["{} sub-focos", "{0}", "{foco.nome}", "{foco", "{a:{b}}"])
+def test_malformed_template_raises_configuration_error(text):
+    """Positional, attribute and broken placeholders are rejected."""
+    with pytest.raises(ConfigurationError):
+        PromptTemplate(text)
+
+
+def test_render_without_value_raises_key_error():
+    """A missing value raises KeyError, like str.format."""
+    with pytest.raises(KeyError):
+        PromptTemplate("{tema}").render()
+
+
+def test_file_template_reloads_when_file_changes(prompts_dir, fake_clock):
+    """An edited prompt applies on the next render after the check interval."""
+    path = prompts_dir / "criador.md"
+    _write(path, "v1 {tema}", 1_000_000_000)
+    template = FilePromptTemplate("criador", placeholders={"tema"}, clock=fake_clock)
+    _write(path, "v2 {tema}", 2_000_000_000)
+
+    assert template.render(tema="X") == "v1 X"  # within the check interval
+    fake_clock.now = 5.0
+    assert template.render(tema="X") == "v2 X"
+
+
+def test_invalid_reload_keeps_previous_version(prompts_dir, fake_clock):
+    """A broken edit is rejected and the last good version stays in use."""
+    path = prompts_dir / "criador.md"
+    _write(path, "v1 {tema}", 1_000_000_000)
+    template = FilePromptTemplate("criador", placeholders={"tema"}, clock=fake_clock)
+    _write(path, "v2 {tmea}", 2_000_000_000)
+    fake_clock.now = 5.0
+
+    assert template.reload_if_changed() is False
+    assert template.render(tema="X") == "v1 X"
+
+
+def test_auto_reload_can_be_disabled(prompts_dir):
+    """With auto_reload=False the compiled version never changes."""
+    path = prompts_dir / "criador.md"
+    _write(path, "v1 {tema}", 1_000_000_000)
+    template = compile_prompt("criador", auto_reload=False)
+    _write(path, "v2 {tema}", 2_000_000_000)
+
+    assert template.render(tema="X") == "v1 X"
+
+
+def test_missing_prompt_file_raises(prompts_dir):
+    """A prompt without a file cannot be compiled."""
+    with pytest.raises(FileNotFoundError):
+        compile_prompt("inexistente")
+
+
+def test_segments_and_fields_interleave():
+    """Static segments and field names rebuild the template in order."""
+    template = PromptTemplate("Tema: {tema}; foco {foco} ({tema})")
+
+    assert template.segments == ("Tema: ", "; foco ", " (", ")")
+    assert template.fields == ("tema", "foco", "tema")
@@ -0,0 +1,125 @@
+"""Tests for CsvReader (CSV input through the shared validation core)."""
+
+from pathlib import Path
+
+import pytest
+from openpyxl import Workbook
+
+from construtor.config.exceptions import InputValidationError, OutputParsingError
+from construtor.io import CsvReader, ExcelReader, InputReader, InputRowError
+from construtor.models.question import FocoInput
+
+
+def _write_csv(path: Path, text: str, encoding: str = "utf-8") -> Path:
+    path.write_text(text, encoding=encoding)
+    return path
+
+
+def test_read_valid_csv(tmp_path: Path) -> None:
+    """Valid CSV rows become FocoInput objects with normalized values."""
+    csv_file = _write_csv(
+        tmp_path / "input.csv",
+        "Tema,Foco,Periodo,observacoes\n"
+        "Cardiologia,  Insuficiência Cardíaca ,1º ano,x\n"
+        'Pneumologia,"Asma, crise grave",2º ano,\n',
+    )
+
+    focos = CsvReader().read_input(str(csv_file))
+
+    assert focos == [
+        FocoInput(tema="Cardiologia", foco="Insuficiência Cardíaca", periodo="1º ano"),
+        FocoInput(tema="Pneumologia", foco="Asma, crise grave", periodo="2º ano"),
+    ]
+
+
+def test_csv_with_bom_and_semicolon(tmp_path: Path) -> None:
+    """Excel 'CSV UTF-8' exports (BOM + ';' delimiter) are accepted."""
+    csv_file = _write_csv(
+        tmp_path / "input.csv",
+        "tema;foco;periodo\nCardiologia;Arritmias;3º ano\n",
+        encoding="utf-8-sig",
+    )
+
+    focos = CsvReader(delimiter=";").read_input(str(csv_file))
+
+    assert focos == [FocoInput(tema="Cardiologia", foco="Arritmias", periodo="3º ano")]
+
+
+def test_tsv_uses_tab_delimiter(tmp_path: Path) -> None:
+    """.tsv files are split on tabs by default."""
+    tsv_file = _write_csv(tmp_path / "input.tsv", "tema\tfoco\tperiodo\nA\tB, C\t4º ano\n")
+
+    focos = CsvReader().read_input(str(tsv_file))
+
+    assert focos[0].foco == "B, C"
+
+
+def test_csv_matches_excel_validation(tmp_path: Path) -> None:
+    """CSV and Excel report the same rows for the same invalid data."""
+    rows = [["A", "F1", "1º ano"], ["", "F2", "2º ano"], ["C", "F3", "5º ano"]]
+    csv_file = _write_csv(
+        tmp_path / "input.csv",
+        "tema,foco,periodo\n" + "".join(",".join(row) + "\n" for row in rows),
+    )
+    workbook = Workbook()
+    workbook.active.append(["tema", "foco", "periodo"])
+    for row in rows:
+        workbook.active.append([value or None for value in row])
+    excel_file = tmp_path / "input.xlsx"
+    workbook.save(excel_file)
+
+    csv_errors: list[InputRowError] = []
+    excel_errors: list[InputRowError] = []
+    csv_focos = [
+        f for chunk in CsvReader().iter_input(str(csv_file), errors=csv_errors) for f in chunk
+    ]
+    excel_focos = [
+        f for chunk in ExcelReader().iter_input(str(excel_file), errors=excel_errors) for f in chunk
+    ]
+
+    assert csv_focos == excel_focos
+    assert [(e.row, e.column) for e in csv_errors] == [(e.row, e.column) for e in excel_errors]
+    assert [(e.row, e.column) for e in csv_errors] == [(3, "tema"), (4, "periodo")]
+
+
+def test_csv_missing_columns(tmp_path: Path) -> None:
+    """Missing required columns are reported with the columns found."""
+    csv_file = _write_csv(tmp_path / "input.csv", "tema,foco\nA,B\n")
+
+    with pytest.raises(InputValidationError, match="Missing required columns: \\['periodo'\\]"):
+        CsvReader().read_input(str(csv_file))
+
+
+def test_csv_wrong_extension(tmp_path: Path) -> None:
+    """Only .csv/.tsv files are accepted."""
+    txt_file = _write_csv(tmp_path / "input.txt", "tema,foco,periodo\n")
+
+    with pytest.raises(InputValidationError, match=r"Expected CSV file with \.csv or \.tsv"):
+        CsvReader().read_input(str(txt_file))
+
+
+def test_csv_undecodable_file(tmp_path: Path) -> None:
+    """Encoding errors surface as OutputParsingError."""
+    csv_file = tmp_path / "input.csv"
+    csv_file.write_bytes("tema,foco,periodo\nA,B,1º ano\n".encode("latin-1"))
+
+    with pytest.raises(OutputParsingError, match="Failed to read CSV"):
+        CsvReader().read_input(str(csv_file))
+
+
+def test_delimiter_is_part_of_cache_key() -> None:
+    """Readers with different parser options never share cached rows."""
+    assert CsvReader(delimiter=";").rules_fingerprint() != CsvReader().rules_fingerprint()
+    assert CsvReader().rules_fingerprint() != ExcelReader().rules_fingerprint()
+
+
+def test_reader_without_row_backend_cannot_be_built() -> None:
+    """InputReader is abstract until a subclass implements ``_iter_raw_rows``."""
+
+    class NoBackendReader(InputReader):
+        FORMAT_NAME = "none"
+
+    with pytest.raises(TypeError, match="_iter_raw_rows"):
+        InputReader()
+    with pytest.raises(TypeError, match="_iter_raw_rows"):
+        NoBackendReader()
@@ -521,3 +521,246 @@ def test_multiple_validation_errors_reported(tmp_path: Path) -> None:
     assert "6º ano" in error_msg
     assert "row 2" in error_msg.lower()
     assert "row 3" in error_msg.lower()
+
+
+# ============================================================================
+# Fast Read Path Tests
+# ============================================================================
+
+
+@pytest.fixture(params=["calamine", "openpyxl"])
+def reader_engine(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    """Run a test with each row engine (calamine when installed, openpyxl fallback)."""
+    import construtor.io.excel_reader as excel_reader_module
+
+    if request.param == "calamine" and excel_reader_module.CalamineWorkbook is None:
+        pytest.skip("python-calamine not installed")
+    if request.param == "openpyxl":
+        monkeypatch.setattr(excel_reader_module, "CalamineWorkbook", None)
+    return request.param
+
+
+def test_both_engines_return_same_focos(valid_excel_file: Path, reader_engine: str) -> None:
+    """Test that calamine and openpyxl engines produce identical FocoInput lists."""
+    # Act
+    focos = ExcelReader().read_input(str(valid_excel_file))
+
+    # Assert
+    assert [f.model_dump() for f in focos] == [
+        {"tema": "Cardiologia", "foco": "Insuficiência Cardíaca", "periodo": "3º ano"},
+        {"tema": "Pneumologia", "foco": "Asma", "periodo": "2º ano"},
+        {
+            "tema": "Gastroenterologia",
+            "foco": "Doença do Refluxo Gastroesofágico",
+            "periodo": "4º ano",
+        },
+    ]
+
+
+def test_engines_agree_on_mixed_cell_types(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that calamine and openpyxl read one workbook into identical FocoInputs.
+
+    calamine returns "" for empty cells and floats for every number, openpyxl
+    None and ints; the validation core must hide the difference.
+    """
+    from openpyxl import Workbook
+
+    import construtor.io.excel_reader as excel_reader_module
+
+    pytest.importorskip("python_calamine")
+
+    # Arrange: numbers, padded text, empty cells in unused columns, trailing blank rows
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.append(["Tema", None, "Foco", "notas", "Periodo"])
+    sheet.append(["Cardiologia", None, "Insuficiência Cardíaca", 1.5, "3º ano"])
+    sheet.append([2024, "x", 3.5, None, "1º ano"])
+    sheet.append(["  Pneumologia ", None, 42, None, " 2º ano"])
+    sheet.append([None, None, None, None, None])
+    sheet.append([None, None, None, None, None])
+    file_path = tmp_path / "mixed.xlsx"
+    workbook.save(file_path)
+
+    # Act
+    with_calamine = ExcelReader().read_input(str(file_path))
+    monkeypatch.setattr(excel_reader_module, "CalamineWorkbook", None)
+    with_openpyxl = ExcelReader().read_input(str(file_path))
+
+    # Assert
+    assert with_calamine == with_openpyxl
+    assert [(f.tema, f.foco, f.periodo) for f in with_openpyxl] == [
+        ("Cardiologia", "Insuficiência Cardíaca", "3º ano"),
+        ("2024", "3.5", "1º ano"),
+        ("Pneumologia", "42", "2º ano"),
+    ]
+
+
+def test_extra_columns_are_ignored(tmp_path: Path, reader_engine: str) -> None:
+    """Test that columns outside tema/foco/periodo are not loaded or validated."""
+    # Arrange
+    df = pd.DataFrame(
+        {
+            "observacoes": [None, "revisar"],
+            "Periodo": ["1º ano", "2º ano"],
+            "notas": [1.5, None],
+            "Tema": ["Cardiologia", "Pneumologia"],
+            "Foco": ["ICC", "Asma"],
+        }
+    )
+    file_path = tmp_path / "extra_columns.xlsx"
+    df.to_excel(file_path, index=False, engine="openpyxl")
+
+    # Act
+    focos = ExcelReader().read_input(str(file_path))
+
+    # Assert
+    assert [(f.tema, f.foco, f.periodo) for f in focos] == [
+        ("Cardiologia", "ICC", "1º ano"),
+        ("Pneumologia", "Asma", "2º ano"),
+    ]
+
+
+def test_numeric_cells_read_as_text(tmp_path: Path, reader_engine: str) -> None:
+    """Test that numeric cells become strings like pd.read_excel(dtype=str)."""
+    # Arrange
+    df = pd.DataFrame({"tema": [2024], "foco": [3.5], "periodo": ["1º ano"]})
+    file_path = tmp_path / "numeric.xlsx"
+    df.to_excel(file_path, index=False, engine="openpyxl")
+
+    # Act
+    focos = ExcelReader().read_input(str(file_path))
+
+    # Assert
+    assert focos[0].tema == "2024"
+    assert focos[0].foco == "3.5"
+
+
+def test_default_na_markers_treated_as_missing(tmp_path: Path, reader_engine: str) -> None:
+    """Test that pandas default NA markers (e.g. 'N/A') count as missing data."""
+    # Arrange
+    df = pd.DataFrame(
+        {
+            "tema": ["Cardiologia", "Pneumologia"],
+            "foco": ["ICC", "N/A"],
+            "periodo": ["3º ano", "2º ano"],
+        }
+    )
+    file_path = tmp_path / "na_marker.xlsx"
+    df.to_excel(file_path, index=False, engine="openpyxl")
+
+    # Act & Assert
+    with pytest.raises(InputValidationError) as exc_info:
+        ExcelReader().read_input(str(file_path))
+
+    assert "foco" in str(exc_info.value)
+    assert "[3]" in str(exc_info.value)
+
+
+# ============================================================================
+# Streaming API Tests (iter_input)
+# ============================================================================
+
+
+def _write_rows(tmp_path: Path, name: str, rows: dict[str, list]) -> Path:
+    """Write a DataFrame built from ``rows`` to an Excel file."""
+    file_path = tmp_path / name
+    pd.DataFrame(rows).to_excel(file_path, index=False, engine="openpyxl")
+    return file_path
+
+
+def test_iter_input_yields_chunks_in_order(tmp_path: Path, reader_engine: str) -> None:
+    """Test that iter_input yields validated chunks of at most chunk_size rows."""
+    # Arrange
+    file_path = _write_rows(
+        tmp_path,
+        "chunks.xlsx",
+        {
+            "tema": [f"Tema {i}" for i in range(7)],
+            "foco": [f"Foco {i}" for i in range(7)],
+            "periodo": ["1º ano"] * 7,
+        },
+    )
+
+    # Act
+    chunks = list(ExcelReader().iter_input(str(file_path), chunk_size=3))
+
+    # Assert
+    assert [len(chunk) for chunk in chunks] == [3, 3, 1]
+    assert [foco.foco for chunk in chunks for foco in chunk] == [f"Foco {i}" for i in range(7)]
+    assert all(isinstance(foco, FocoInput) for chunk in chunks for foco in chunk)
+
+
+def test_iter_input_collects_row_errors_without_aborting(
+    tmp_path: Path, reader_engine: str
+) -> None:
+    """Test that invalid rows are collected and valid rows are still yielded."""
+    # Arrange
+    file_path = _write_rows(
+        tmp_path,
+        "row_errors.xlsx",
+        {
+            "tema": ["Cardiologia", None, "Gastroenterologia", "Neurologia"],
+            "foco": ["ICC", "Asma", None, "AVC"],
+            "periodo": ["3º ano", "2º ano", "9º ano", "4º ano"],
+        },
+    )
+    errors = []
+
+    # Act
+    focos = [
+        foco
+        for chunk in ExcelReader().iter_input(str(file_path), chunk_size=2, errors=errors)
+        for foco in chunk
+    ]
+
+    # Assert - rows 2 and 5 valid; row 3 missing tema; row 4 missing foco + bad periodo
+    assert [foco.tema for foco in focos] == ["Cardiologia", "Neurologia"]
+    assert [(error.row, error.column) for error in errors] == [
+        (3, "tema"),
+        (4, "foco"),
+        (4, "periodo"),
+    ]
+    assert errors[2].value == "9º ano"
+
+
+def test_iter_input_raises_summary_after_valid_chunks(tmp_path: Path) -> None:
+    """Test that without an errors list, a summary error is raised at the end."""
+    # Arrange
+    file_path = _write_rows(
+        tmp_path,
+        "summary.xlsx",
+        {
+            "tema": ["Cardiologia", "Pneumologia", "Neurologia"],
+            "foco": ["ICC", "Asma", "AVC"],
+            "periodo": ["3º ano", "5º ano", "6º ano"],
+        },
+    )
+    stream = ExcelReader().iter_input(str(file_path), chunk_size=1)
+
+    # Act - the valid first row is delivered before the error surfaces
+    first_chunk = next(stream)
+    with pytest.raises(InputValidationError) as exc_info:
+        list(stream)
+
+    # Assert
+    assert first_chunk[0].tema == "Cardiologia"
+    error_msg = str(exc_info.value)
+    assert "Row 3" in error_msg
+    assert "Row 4" in error_msg
+    assert "5º ano" in error_msg
+
+
+def test_iter_input_missing_column_raises_before_first_chunk(
+    excel_missing_periodo_column: Path,
+) -> None:
+    """Test that structural errors still abort immediately."""
+    with pytest.raises(InputValidationError) as exc_info:
+        next(ExcelReader().iter_input(str(excel_missing_periodo_column)))
+
+    assert "periodo" in str(exc_info.value).lower()
+
+
+def test_iter_input_rejects_non_positive_chunk_size(valid_excel_file: Path) -> None:
+    """Test that chunk_size must be positive."""
+    with pytest.raises(ValueError, match="chunk_size must be positive"):
+        next(ExcelReader().iter_input(str(valid_excel_file), chunk_size=0))
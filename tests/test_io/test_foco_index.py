@@ -0,0 +1,160 @@
+"""Tests for duplicate foco detection (FocoIndex and reader integration)."""
+
+import logging
+from pathlib import Path
+
+import pytest
+
+from construtor.io import CsvReader, DuplicateFoco, ExcelReader, FocoIndex
+from construtor.io.foco_index import normalize_key, normalize_text
+from construtor.models.question import FocoInput
+
+CSV_WITH_DUPLICATES = (
+    "tema,foco,periodo\n"
+    "Cardiologia,Insuficiência Cardíaca,1º ano\n"  # row 2
+    "Cardiologia,Arritmias,1º ano\n"  # row 3
+    "Cardiologia,Insuficiência Cardíaca,1º ano\n"  # row 4: exact repeat of 2
+    "cardiologia, insuficiencia  cardiaca ,1º ano\n"  # row 5: normalized repeat of 2
+    "Cardiologia,Insuficiência Cardíaca,2º ano\n"  # row 6: other periodo, kept
+)
+
+
+@pytest.fixture
+def csv_with_duplicates(tmp_path: Path) -> Path:
+    path = tmp_path / "input.csv"
+    path.write_text(CSV_WITH_DUPLICATES, encoding="utf-8")
+    return path
+
+
+# ============================================================================
+# normalize_text / FocoIndex
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("Insuficiência Cardíaca", "insuficiencia cardiaca"),
+        ("  INSUFICIÊNCIA\tcardíaca. ", "insuficiencia cardiaca"),
+        ("Diabetes Mellitus tipo-2", "diabetes mellitus tipo 2"),
+        ("Ação", "acao"),
+    ],
+)
+def test_normalize_text(raw: str, expected: str) -> None:
+    """Accents, case, punctuation and whitespace are folded."""
+    assert normalize_text(raw) == expected
+
+
+@pytest.mark.parametrize(
+    ("raw", "expected"),
+    [
+        ("  INSUFICIÊNCIA\tcardíaca ", "insuficiencia cardiaca"),
+        ("Câncer de mama HER2+", "cancer de mama her2+"),
+        ("Gestante Rh-", "gestante rh-"),
+    ],
+)
+def test_normalize_key(raw: str, expected: str) -> None:
+    """Keys fold accents, case and whitespace but keep symbols."""
+    assert normalize_key(raw) == expected
+
+
+def test_index_keeps_symbol_variants_apart() -> None:
+    """Focos that differ only in a sign are clinically different, not duplicates."""
+    index = FocoIndex()
+
+    for row, foco in enumerate(("Câncer de mama HER2+", "Câncer de mama HER2-", "Gestante Rh+")):
+        assert index.check(FocoInput(tema="A", foco=foco, periodo="1º ano"), row=row) is None
+    assert index.check(FocoInput(tema="A", foco="Gestante Rh-", periodo="1º ano"), row=9) is None
+    assert len(index) == 4
+
+
+def test_index_reports_first_occurrence() -> None:
+    """The first occurrence is registered, later ones point back at it."""
+    index = FocoIndex()
+    original = FocoInput(tema="Cardiologia", foco="Arritmias", periodo="1º ano")
+    variant = FocoInput(tema="CARDIOLOGIA", foco="arritmias", periodo="1º ano")
+
+    assert index.check(original, row=2) is None
+    assert index.check(original, row=7) == DuplicateFoco(
+        row=7, first_row=2, tema="Cardiologia", foco="Arritmias", periodo="1º ano", exact=True
+    )
+    duplicate = index.check(variant, row=9)
+    assert duplicate is not None
+    assert duplicate.first_row == 2
+    assert duplicate.exact is False
+    assert len(index) == 1
+
+
+def test_index_keeps_periodo_and_tema_apart() -> None:
+    """Same foco under another periodo or tema is not a duplicate."""
+    index = FocoIndex()
+
+    assert index.check(FocoInput(tema="A", foco="F", periodo="1º ano"), row=2) is None
+    assert index.check(FocoInput(tema="A", foco="F", periodo="2º ano"), row=3) is None
+    assert index.check(FocoInput(tema="B", foco="F", periodo="1º ano"), row=4) is None
+    assert len(index) == 3
+
+
+# ============================================================================
+# Reader integration
+# ============================================================================
+
+
+def test_read_input_merges_duplicates(csv_with_duplicates: Path) -> None:
+    """By default only the first occurrence of each foco is returned."""
+    duplicates: list[DuplicateFoco] = []
+
+    focos = CsvReader().read_input(str(csv_with_duplicates), duplicates=duplicates)
+
+    assert [(f.foco, f.periodo) for f in focos] == [
+        ("Insuficiência Cardíaca", "1º ano"),
+        ("Arritmias", "1º ano"),
+        ("Insuficiência Cardíaca", "2º ano"),
+    ]
+    assert [(d.row, d.first_row, d.exact) for d in duplicates] == [(4, 2, True), (5, 2, False)]
+
+
+def test_flag_keeps_every_row(csv_with_duplicates: Path, caplog: pytest.LogCaptureFixture) -> None:
+    """on_duplicate='flag' reports duplicates without dropping them."""
+    duplicates: list[DuplicateFoco] = []
+
+    with caplog.at_level(logging.WARNING):
+        focos = CsvReader(on_duplicate="flag").read_input(
+            str(csv_with_duplicates), duplicates=duplicates
+        )
+
+    assert len(focos) == 5
+    assert [d.row for d in duplicates] == [4, 5]
+    assert "2 duplicate focos" in caplog.text
+    assert "1 exact, 1 after normalization" in caplog.text
+
+
+def test_iter_input_merges_across_chunks(csv_with_duplicates: Path) -> None:
+    """The index spans the whole file, not just one chunk."""
+    duplicates: list[DuplicateFoco] = []
+
+    chunks = list(
+        CsvReader().iter_input(str(csv_with_duplicates), chunk_size=2, duplicates=duplicates)
+    )
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert [d.row for d in duplicates] == [4, 5]
+
+
+def test_cache_hit_still_merges(csv_with_duplicates: Path) -> None:
+    """Cached rows go through the same duplicate policy with the same row numbers."""
+    CsvReader(use_cache=True).read_input(str(csv_with_duplicates))
+    duplicates: list[DuplicateFoco] = []
+
+    focos = CsvReader(use_cache=True).read_input(str(csv_with_duplicates), duplicates=duplicates)
+    flagged = CsvReader(use_cache=True, on_duplicate="flag").read_input(str(csv_with_duplicates))
+
+    assert len(focos) == 3
+    assert [(d.row, d.first_row) for d in duplicates] == [(4, 2), (5, 2)]
+    assert len(flagged) == 5
+
+
+def test_unknown_policy() -> None:
+    """Only 'merge' and 'flag' are accepted."""
+    with pytest.raises(ValueError, match="on_duplicate must be 'merge' or 'flag'"):
+        ExcelReader(on_duplicate="drop")  # type: ignore[arg-type]
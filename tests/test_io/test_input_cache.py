@@ -0,0 +1,145 @@
+"""Tests for InputCache and ExcelReader sidecar caching."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from construtor.io import ExcelReader
+from construtor.io.input_cache import InputCache
+from construtor.models.question import FocoInput
+
+PERIODOS = ["1º ano", "2º ano", "3º ano", "4º ano"]
+RULES = b"r" * 32
+
+
+@pytest.fixture
+def input_file(tmp_path: Path) -> Path:
+    """Create a small valid input workbook."""
+    df = pd.DataFrame(
+        {
+            "tema": ["Cardiologia", "Cardiologia", "Pneumologia"],
+            "foco": ["Insuficiência Cardíaca", "Arritmias", "Asma"],
+            "periodo": ["3º ano", "3º ano", "2º ano"],
+        }
+    )
+    file_path = tmp_path / "input.xlsx"
+    df.to_excel(file_path, index=False, engine="openpyxl")
+    return file_path
+
+
+@pytest.fixture
+def focos() -> list[FocoInput]:
+    return [
+        FocoInput(tema="Cardiologia", foco="Insuficiência Cardíaca", periodo="3º ano"),
+        FocoInput(tema="Cardiologia", foco="Arritmias", periodo="3º ano"),
+        FocoInput(tema="Pneumologia", foco="Asma", periodo="2º ano"),
+    ]
+
+
+# ============================================================================
+# InputCache
+# ============================================================================
+
+
+def test_roundtrip_preserves_rows(input_file: Path, focos: list[FocoInput]) -> None:
+    """Test that saved rows are loaded back identically."""
+    InputCache(str(input_file), RULES, PERIODOS).save(focos)
+
+    loaded = InputCache(str(input_file), RULES, PERIODOS).load()
+
+    assert loaded == focos
+    assert (input_file.parent / ".input.xlsx.focos.cache").exists()
+
+
+def test_empty_list_roundtrip(input_file: Path) -> None:
+    """Test that an empty input is cached as such (not as a miss)."""
+    InputCache(str(input_file), RULES, PERIODOS).save([])
+
+    assert InputCache(str(input_file), RULES, PERIODOS).load() == []
+
+
+def test_missing_cache_is_miss(input_file: Path) -> None:
+    assert InputCache(str(input_file), RULES, PERIODOS).load() is None
+
+
+def test_file_change_invalidates(input_file: Path, focos: list[FocoInput]) -> None:
+    """Test that editing the input file invalidates the cache."""
+    InputCache(str(input_file), RULES, PERIODOS).save(focos)
+    input_file.write_bytes(input_file.read_bytes() + b"\0")
+
+    assert InputCache(str(input_file), RULES, PERIODOS).load() is None
+
+
+def test_rules_change_invalidates(input_file: Path, focos: list[FocoInput]) -> None:
+    """Test that a different validation rules fingerprint invalidates the cache."""
+    InputCache(str(input_file), RULES, PERIODOS).save(focos)
+
+    assert InputCache(str(input_file), b"x" * 32, PERIODOS).load() is None
+
+
+def test_corrupted_cache_is_miss(input_file: Path, focos: list[FocoInput]) -> None:
+    """Test that a truncated cache file is ignored instead of raising."""
+    cache = InputCache(str(input_file), RULES, PERIODOS)
+    cache.save(focos)
+    cache.cache_path.write_bytes(cache.cache_path.read_bytes()[:-5])
+
+    assert InputCache(str(input_file), RULES, PERIODOS).load() is None
+
+
+def test_cache_is_compact(input_file: Path) -> None:
+    """Test that repeated temas are stored once (string table + indexes)."""
+    many = [FocoInput(tema="Cardiologia", foco=f"Foco {i}", periodo="1º ano") for i in range(1000)]
+    cache = InputCache(str(input_file), RULES, PERIODOS)
+    cache.save(many)
+
+    assert cache.cache_path.stat().st_size < 5_000
+
+
+# ============================================================================
+# ExcelReader integration
+# ============================================================================
+
+
+def test_reader_reuses_cache_without_parsing(
+    input_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that a second read of an unchanged workbook skips parsing."""
+    first = ExcelReader(use_cache=True).read_input(str(input_file))
+
+    def fail(*_args: object) -> None:
+        raise AssertionError("workbook should not be parsed on cache hit")
+
+    monkeypatch.setattr(ExcelReader, "_read_required_columns", fail)
+    monkeypatch.setattr(ExcelReader, "_iter_raw_rows", fail)
+    reader = ExcelReader(use_cache=True)
+
+    assert reader.read_input(str(input_file)) == first
+    assert [f for chunk in reader.iter_input(str(input_file), chunk_size=2) for f in chunk] == first
+
+
+def test_reader_reparses_changed_workbook(input_file: Path) -> None:
+    """Test that the cache is refreshed when the workbook changes."""
+    ExcelReader(use_cache=True).read_input(str(input_file))
+
+    pd.DataFrame({"tema": ["Neurologia"], "foco": ["AVC"], "periodo": ["4º ano"]}).to_excel(
+        input_file, index=False, engine="openpyxl"
+    )
+    focos = ExcelReader(use_cache=True).read_input(str(input_file))
+
+    assert [(f.tema, f.foco) for f in focos] == [("Neurologia", "AVC")]
+
+
+def test_iter_input_populates_cache(input_file: Path) -> None:
+    """Test that a fully valid streamed read writes the cache."""
+    reader = ExcelReader(use_cache=True)
+    streamed = [f for chunk in reader.iter_input(str(input_file)) for f in chunk]
+
+    cache = InputCache(str(input_file), ExcelReader().rules_fingerprint(), PERIODOS)
+    assert cache.load() == streamed
+
+
+def test_cache_disabled_by_default(input_file: Path) -> None:
+    ExcelReader().read_input(str(input_file))
+
+    assert not (input_file.parent / ".input.xlsx.focos.cache").exists()
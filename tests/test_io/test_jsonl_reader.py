@@ -0,0 +1,91 @@
+"""Tests for JsonlReader (JSON Lines input through the shared validation core)."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from construtor.config.exceptions import InputValidationError, OutputParsingError
+from construtor.io import InputRowError, JsonlReader
+from construtor.models.question import FocoInput
+
+
+def _write_jsonl(path: Path, lines: list[object | str]) -> Path:
+    path.write_text(
+        "".join((line if isinstance(line, str) else json.dumps(line)) + "\n" for line in lines),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_read_valid_jsonl(tmp_path: Path) -> None:
+    """Keys are matched case-insensitively and extra keys are ignored."""
+    jsonl_file = _write_jsonl(
+        tmp_path / "input.jsonl",
+        [
+            {"Tema": "Cardiologia", "foco": " Arritmias ", "periodo": "1º ano", "extra": 1},
+            {"periodo": "2º ano", "foco": "Asma", "tema": "Pneumologia"},
+        ],
+    )
+
+    focos = JsonlReader().read_input(str(jsonl_file))
+
+    assert focos == [
+        FocoInput(tema="Cardiologia", foco="Arritmias", periodo="1º ano"),
+        FocoInput(tema="Pneumologia", foco="Asma", periodo="2º ano"),
+    ]
+
+
+def test_row_numbers_are_line_numbers(tmp_path: Path) -> None:
+    """Errors point at the JSONL line, counting blank lines."""
+    jsonl_file = _write_jsonl(
+        tmp_path / "input.jsonl",
+        [
+            {"tema": "A", "foco": "F1", "periodo": "1º ano"},
+            "",
+            {"tema": "B", "periodo": "2º ano"},
+            {"tema": "C", "foco": "F3", "periodo": "9º ano"},
+            "",
+        ],
+    )
+
+    errors: list[InputRowError] = []
+    focos = [f for chunk in JsonlReader().iter_input(str(jsonl_file), errors=errors) for f in chunk]
+
+    assert [f.tema for f in focos] == ["A"]
+    assert [(e.row, e.column) for e in errors] == [
+        (2, "tema"),
+        (2, "foco"),
+        (2, "periodo"),
+        (3, "foco"),
+        (4, "periodo"),
+    ]
+
+
+def test_read_input_reports_missing_data_line(tmp_path: Path) -> None:
+    """read_input fails fast with the offending line number."""
+    jsonl_file = _write_jsonl(
+        tmp_path / "input.jsonl",
+        [{"tema": "A", "foco": "F1", "periodo": "1º ano"}, {"tema": "B", "periodo": "2º ano"}],
+    )
+
+    with pytest.raises(InputValidationError, match="column 'foco' at rows \\[2\\]"):
+        JsonlReader().read_input(str(jsonl_file))
+
+
+def test_invalid_json_line(tmp_path: Path) -> None:
+    """Malformed JSON raises OutputParsingError naming the line."""
+    jsonl_file = _write_jsonl(
+        tmp_path / "input.jsonl", [{"tema": "A", "foco": "F", "periodo": "1º ano"}, "{oops"]
+    )
+
+    with pytest.raises(OutputParsingError, match="Invalid JSON at line 2"):
+        JsonlReader().read_input(str(jsonl_file))
+
+
+def test_non_object_line(tmp_path: Path) -> None:
+    """Every line must be a JSON object."""
+    jsonl_file = _write_jsonl(tmp_path / "input.jsonl", [["A", "F", "1º ano"]])
+
+    with pytest.raises(OutputParsingError, match="Expected a JSON object at line 1"):
+        JsonlReader().read_input(str(jsonl_file))
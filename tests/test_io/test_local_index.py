@@ -0,0 +1,123 @@
+"""Tests for the local replica of the curated document index."""
+
+import json
+
+import numpy as np
+import pytest
+
+from construtor.config.exceptions import ConfigurationError
+from construtor.io.local_index import LocalVectorIndex, export_local_index
+from construtor.io.pinecone_client import InMemoryVectorIndex
+from construtor.models.rag import RagDocument
+
+TOPICS = [
+    ("Insuficiência cardíaca", "Critérios de Framingham e classificação NYHA"),
+    ("Asma", "Broncodilatadores e corticoide inalatório no controle da asma"),
+    ("Diabetes mellitus", "Metformina e insulina no tratamento do diabetes tipo 2"),
+    ("Hipertensão arterial", "Diuréticos tiazídicos e IECA na hipertensão"),
+    ("Pneumonia", "Amoxicilina na pneumonia adquirida na comunidade"),
+    ("Tuberculose", "Esquema RIPE no tratamento da tuberculose pulmonar"),
+]
+
+
+def _documents() -> list[tuple[RagDocument, dict[str, object]]]:
+    return [
+        (
+            RagDocument(texto=texto, titulo=titulo, ano="2022", fonte="Ministério da Saúde"),
+            {"periodo": "3º ano" if i % 2 == 0 else "Internato"},
+        )
+        for i, (titulo, texto) in enumerate(TOPICS)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_build_and_search_brute_force(tmp_path):
+    """The replica answers like the in-memory index, with metadata filters."""
+    replica = LocalVectorIndex.build(_documents(), str(tmp_path / "replica"))
+
+    found = await replica.search("Insuficiência cardíaca Framingham", top_k=2)
+    filtered = await replica.search(
+        "Insuficiência cardíaca Framingham", top_k=6, metadata_filter={"periodo": "Internato"}
+    )
+
+    assert len(replica) == len(TOPICS)
+    assert found[0].titulo == "Insuficiência cardíaca"
+    assert found[0].score > found[1].score
+    assert "Insuficiência cardíaca" not in [doc.titulo for doc in filtered]
+    assert len(filtered) == 3
+
+
+@pytest.mark.asyncio
+async def test_replica_is_memory_mapped_and_reloadable(tmp_path):
+    """A built replica loads from disk with its vectors memory-mapped."""
+    path = str(tmp_path / "replica")
+    LocalVectorIndex.build(_documents(), path, index_version="2026-10-01")
+
+    replica = LocalVectorIndex(path)
+
+    assert isinstance(replica._vectors, np.memmap)
+    assert replica.index_version == "2026-10-01"
+    assert (await replica.search("Esquema RIPE tuberculose", top_k=1))[0].titulo == "Tuberculose"
+
+
+@pytest.mark.asyncio
+async def test_ivf_search_matches_brute_force_with_all_lists(tmp_path):
+    """With nprobe = nlist, IVF scores every row and agrees with brute force."""
+    brute = LocalVectorIndex.build(_documents(), str(tmp_path / "brute"))
+    LocalVectorIndex.build(_documents(), str(tmp_path / "ivf"), nlist=3)
+    ivf = LocalVectorIndex(str(tmp_path / "ivf"), nprobe=3)
+
+    for query in ("Metformina diabetes", "Amoxicilina pneumonia", "IECA hipertensão"):
+        expected = [doc.titulo for doc in await brute.search(query, top_k=3)]
+        assert [doc.titulo for doc in await ivf.search(query, top_k=3)] == expected
+
+
+@pytest.mark.asyncio
+async def test_ivf_with_one_probe_scores_a_subset(tmp_path):
+    """nprobe=1 only reads the rows of the closest cluster."""
+    LocalVectorIndex.build(_documents(), str(tmp_path / "ivf"), nlist=3)
+    ivf = LocalVectorIndex(str(tmp_path / "ivf"), nprobe=1)
+
+    results = await ivf.search("Metformina diabetes", top_k=10)
+
+    assert results[0].titulo == "Diabetes mellitus"
+    assert len(results) < len(TOPICS)
+
+
+@pytest.mark.asyncio
+async def test_export_copies_source_index(tmp_path):
+    """export_local_index copies every document and its metadata."""
+    source = InMemoryVectorIndex(_documents())
+
+    replica = await export_local_index(source, str(tmp_path / "replica"), index_version="v7")
+
+    assert len(replica) == len(TOPICS)
+    rows = (tmp_path / "replica" / "documents.jsonl").read_text(encoding="utf-8").splitlines()
+    assert json.loads(rows[1])["metadata"] == {"periodo": "Internato"}
+    assert replica.index_version == "v7"
+
+
+@pytest.mark.asyncio
+async def test_empty_replica_returns_nothing(tmp_path):
+    replica = LocalVectorIndex.build([], str(tmp_path / "empty"))
+
+    assert await replica.search("Asma", top_k=5) == []
+
+
+def test_missing_or_mismatched_replica_raises(tmp_path):
+    """A directory without a replica, or a wrong embedder, is a configuration error."""
+    with pytest.raises(ConfigurationError, match="Cannot load local vector index"):
+        LocalVectorIndex(str(tmp_path / "missing"))
+
+    path = str(tmp_path / "replica")
+    LocalVectorIndex.build(_documents(), path, dim=256)
+    with pytest.raises(ConfigurationError, match="dimension 256"):
+        LocalVectorIndex(path, embedder=lambda texts: np.zeros((len(texts), 64), np.float32))
+
+
+def test_invalid_arguments_raise(tmp_path):
+    with pytest.raises(ValueError, match="nlist"):
+        LocalVectorIndex.build(_documents(), str(tmp_path / "replica"), nlist=10)
+    LocalVectorIndex.build(_documents(), str(tmp_path / "replica"))
+    with pytest.raises(ValueError, match="nprobe"):
+        LocalVectorIndex(str(tmp_path / "replica"), nprobe=0)
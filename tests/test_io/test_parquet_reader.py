@@ -0,0 +1,133 @@
+"""Tests for ParquetReader and the input format registry."""
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from construtor.config.exceptions import (
+    ConfigurationError,
+    InputValidationError,
+    OutputParsingError,
+)
+from construtor.io import (
+    CsvReader,
+    ExcelReader,
+    JsonlReader,
+    ParquetReader,
+    get_input_reader,
+    parquet_reader,
+)
+from construtor.models.question import FocoInput
+
+pytest.importorskip("pyarrow")
+
+
+def _write_parquet(path: Path, data: dict[str, list[object]]) -> Path:
+    pd.DataFrame(data).to_parquet(path, index=False)
+    return path
+
+
+def test_read_valid_parquet(tmp_path: Path) -> None:
+    """Required columns are projected; extra columns are ignored."""
+    parquet_file = _write_parquet(
+        tmp_path / "input.parquet",
+        {
+            " Tema ": ["Cardiologia", "Pneumologia"],
+            "Foco": ["Arritmias", "Asma "],
+            "periodo": ["1º ano", "2º ano"],
+            "prioridade": [1, 2],
+        },
+    )
+
+    focos = ParquetReader().read_input(str(parquet_file))
+
+    assert focos == [
+        FocoInput(tema="Cardiologia", foco="Arritmias", periodo="1º ano"),
+        FocoInput(tema="Pneumologia", foco="Asma", periodo="2º ano"),
+    ]
+
+
+def test_streams_across_record_batches(tmp_path: Path) -> None:
+    """Chunks are independent of the record batch size."""
+    periodos = ["1º ano", "2º ano", "3º ano", "4º ano"]
+    parquet_file = _write_parquet(
+        tmp_path / "input.parquet",
+        {
+            "tema": [f"Tema {i}" for i in range(25)],
+            "foco": [f"Foco {i}" for i in range(25)],
+            "periodo": [periodos[i % 4] for i in range(25)],
+        },
+    )
+
+    chunks = list(ParquetReader(batch_size=7).iter_input(str(parquet_file), chunk_size=10))
+
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    assert chunks[2][-1].foco == "Foco 24"
+
+
+def test_null_values_are_missing_data(tmp_path: Path) -> None:
+    """Parquet nulls are reported like empty Excel cells."""
+    parquet_file = _write_parquet(
+        tmp_path / "input.parquet",
+        {"tema": ["A", None], "foco": ["F1", "F2"], "periodo": ["1º ano", "2º ano"]},
+    )
+
+    with pytest.raises(InputValidationError, match="column 'tema' at rows \\[3\\]"):
+        ParquetReader().read_input(str(parquet_file))
+
+
+def test_missing_columns_lists_schema(tmp_path: Path) -> None:
+    """The error lists every column of the schema."""
+    parquet_file = _write_parquet(tmp_path / "input.parquet", {"tema": ["A"], "outra": ["B"]})
+
+    with pytest.raises(InputValidationError, match="Found: \\['tema', 'outra'\\]"):
+        ParquetReader().read_input(str(parquet_file))
+
+
+def test_corrupted_parquet(tmp_path: Path) -> None:
+    """Unreadable files raise OutputParsingError."""
+    parquet_file = tmp_path / "input.parquet"
+    parquet_file.write_bytes(b"not a parquet file")
+
+    with pytest.raises(OutputParsingError, match="Failed to read Parquet"):
+        ParquetReader().read_input(str(parquet_file))
+
+
+# ============================================================================
+# get_input_reader
+# ============================================================================
+
+
+@pytest.mark.parametrize(
+    ("file_name", "reader_cls"),
+    [
+        ("input.xlsx", ExcelReader),
+        ("input.XLSM", ExcelReader),
+        ("input.csv", CsvReader),
+        ("input.tsv", CsvReader),
+        ("input.parquet", ParquetReader),
+        ("input.jsonl", JsonlReader),
+        ("input.ndjson", JsonlReader),
+    ],
+)
+def test_get_input_reader_by_extension(file_name: str, reader_cls: type) -> None:
+    """The reader is picked from the file extension."""
+    reader = get_input_reader(file_name, use_cache=True)
+
+    assert type(reader) is reader_cls
+    assert reader.use_cache is True
+
+
+def test_get_input_reader_unsupported() -> None:
+    """Unknown extensions are rejected with the supported list."""
+    with pytest.raises(InputValidationError, match=r"Unsupported input format: \.xls"):
+        get_input_reader("input.xls")
+
+
+def test_reader_without_pyarrow_points_to_extra(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Without pyarrow the error tells how to install the parquet extra."""
+    monkeypatch.setattr(parquet_reader, "pq", None)
+
+    with pytest.raises(ConfigurationError, match="uv sync --extra parquet"):
+        ParquetReader()
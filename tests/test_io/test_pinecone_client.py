@@ -0,0 +1,206 @@
+"""Tests for PineconeClient and the in-memory vector index."""
+
+import asyncio
+
+import pytest
+
+from construtor.config.exceptions import ConfigurationError, PineconeError
+from construtor.io import pinecone_client
+from construtor.io.pinecone_client import InMemoryVectorIndex, PineconeClient, PineconeIndex
+from construtor.models.question import FocoInput, SubFocoInput
+from construtor.models.rag import RagDocument
+
+FRAMINGHAM = RagDocument(
+    texto="Os critérios de Framingham para insuficiência cardíaca combinam critérios maiores.",
+    titulo="Braunwald Tratado de Doenças Cardiovasculares",
+    autores="Zipes DP",
+    ano="2022",
+    fonte="Elsevier",
+)
+ASMA = RagDocument(
+    texto="A asma é uma doença inflamatória crônica das vias aéreas.",
+    titulo="Diretrizes da SBPT para o manejo da asma",
+    ano="2020",
+    fonte="J Bras Pneumol",
+)
+IC_INTERNATO = RagDocument(
+    texto="Manejo da insuficiência cardíaca descompensada na emergência.",
+    titulo="Diretriz Brasileira de Insuficiência Cardíaca",
+    ano="2018",
+    fonte="Arq Bras Cardiol",
+)
+
+
+class FailingIndex:
+    async def search(self, text, top_k, metadata_filter=None):
+        msg = "connection refused"
+        raise ConnectionError(msg)
+
+    async def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+def config(monkeypatch):
+    """PipelineConfig with a short Pinecone timeout."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("PINECONE_API_KEY", "pc-test-key")
+    monkeypatch.setenv("PINECONE_INDEX_HOST", "test-index.pinecone.io")
+    monkeypatch.setenv("PINECONE_TOP_K", "2")
+    monkeypatch.setenv("PINECONE_TIMEOUT", "0.2")
+
+    from construtor.config.settings import PipelineConfig
+
+    return PipelineConfig(_env_file=None)
+
+
+@pytest.fixture
+def index():
+    """Local index with documents of two periodos."""
+    return InMemoryVectorIndex(
+        [
+            (FRAMINGHAM, {"periodo": "3º ano"}),
+            (ASMA, {"periodo": "3º ano"}),
+            (IC_INTERNATO, {"periodo": "Internato"}),
+        ]
+    )
+
+
+def _sub_foco(sub_foco: str, foco: str = "Insuficiência Cardíaca") -> SubFocoInput:
+    return SubFocoInput(tema="Cardiologia", foco=foco, sub_foco=sub_foco, periodo="3º ano")
+
+
+@pytest.mark.asyncio
+async def test_query_returns_most_similar_documents_of_periodo(config, index):
+    """tema + foco is the search text and periodo filters the documents."""
+    client = PineconeClient(config, index=index)
+
+    result = await client.query("Cardiologia", "Insuficiência Cardíaca", "3º ano")
+
+    assert result.query == "Cardiologia Insuficiência Cardíaca"
+    assert [doc.titulo for doc in result.documentos] == [FRAMINGHAM.titulo, ASMA.titulo]
+    assert result.documentos[0].score > result.documentos[1].score
+    assert result.latencia >= 0.0
+
+
+@pytest.mark.asyncio
+async def test_query_without_periodo_filter(config, index):
+    """filter_by_periodo=False searches every document."""
+    client = PineconeClient(config, index=index, filter_by_periodo=False)
+
+    result = await client.query("Cardiologia", "Insuficiência Cardíaca descompensada", "3º ano")
+
+    assert IC_INTERNATO.titulo in [doc.titulo for doc in result.documentos]
+
+
+@pytest.mark.asyncio
+async def test_query_timeout_raises_pinecone_error(config):
+    """A query slower than PINECONE_TIMEOUT raises PineconeError with the foco."""
+    client = PineconeClient(config, index=InMemoryVectorIndex([(ASMA, {})], latency=1.0))
+
+    with pytest.raises(PineconeError, match=r"timeout after 0\.2s") as exc_info:
+        await client.query("Pneumologia", "Asma")
+
+    assert exc_info.value.foco == "Asma"
+    assert client.get_statistics()["failures"] == 1
+
+
+@pytest.mark.asyncio
+async def test_query_failure_raises_pinecone_error(config):
+    """Index errors are wrapped in PineconeError."""
+    client = PineconeClient(config, index=FailingIndex())
+
+    with pytest.raises(PineconeError, match="connection refused"):
+        await client.query("Pneumologia", "Asma")
+
+
+@pytest.mark.asyncio
+async def test_query_many_shares_queries_of_the_same_foco(config, index):
+    """Sub-focos of one foco cost one query; results follow input order."""
+    client = PineconeClient(config, index=index)
+    inputs = [
+        _sub_foco("Critérios de Framingham"),
+        FocoInput(tema="Pneumologia", foco="Asma", periodo="3º ano"),
+        _sub_foco("Classificação NYHA"),
+    ]
+
+    results = await client.query_many(inputs)
+
+    assert index.searches == 2
+    assert results[0] is results[2]
+    assert results[0].documentos[0].titulo == FRAMINGHAM.titulo
+    assert results[1].documentos[0].titulo == ASMA.titulo
+    assert client.get_statistics()["queries"] == 2
+
+
+@pytest.mark.asyncio
+async def test_query_many_runs_queries_concurrently_within_timeout(config):
+    """A batch of slow queries takes about one query's latency."""
+    index = InMemoryVectorIndex([(FRAMINGHAM, {})], latency=0.1)
+    client = PineconeClient(config, index=index, filter_by_periodo=False)
+    inputs = [_sub_foco("X", foco=f"Foco {i}") for i in range(10)]
+
+    start = asyncio.get_running_loop().time()
+    results = await client.query_many(inputs)
+    elapsed = asyncio.get_running_loop().time() - start
+
+    assert all(result is not None for result in results)
+    assert elapsed < 0.2
+
+
+@pytest.mark.asyncio
+async def test_query_many_falls_back_to_none(config, caplog):
+    """Failed or timed-out queries yield None instead of failing the batch."""
+    client = PineconeClient(config, index=InMemoryVectorIndex([(ASMA, {})], latency=1.0))
+
+    assert await client.query_many([_sub_foco("Critérios de Framingham")]) == [None]
+    assert "continuing without RAG" in caplog.text
+
+    failing = PineconeClient(config, index=FailingIndex())
+    assert await failing.query_many([_sub_foco("A"), _sub_foco("B")]) == [None, None]
+    assert await failing.query_many([]) == []
+
+
+def test_pinecone_index_requires_sdk(config, monkeypatch):
+    """Without the pinecone package the default index is a configuration error."""
+    monkeypatch.setattr(pinecone_client, "PineconeAsyncio", None)
+
+    with pytest.raises(ConfigurationError, match="pinecone"):
+        PineconeIndex("key", "host")
+    with pytest.raises(ConfigurationError, match="pinecone"):
+        PineconeClient(config)
+
+
+def test_invalid_max_concurrency_raises(config, index):
+    with pytest.raises(ValueError, match="max_concurrency"):
+        PineconeClient(config, index=index, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_slow_index_is_served_by_fallback(config, index):
+    """Queries over PINECONE_TIMEOUT are answered by the fallback index."""
+    slow = InMemoryVectorIndex([(ASMA, {"periodo": "3º ano"})], latency=1.0)
+    client = PineconeClient(config, index=slow, fallback=index)
+
+    single = await client.query("Cardiologia", "Insuficiência Cardíaca", "3º ano")
+    batch = await client.query_many([_sub_foco("Critérios de Framingham")])
+
+    assert single.documentos[0].titulo == FRAMINGHAM.titulo
+    assert batch[0].documentos[0].titulo == FRAMINGHAM.titulo
+    stats = client.get_statistics()
+    assert stats["fallbacks"] == 2
+    assert stats["failures"] == 2
+
+
+@pytest.mark.asyncio
+async def test_failing_index_is_served_by_fallback(config, index):
+    """Index errors are answered by the fallback; if it fails too, RAG is skipped."""
+    client = PineconeClient(config, index=FailingIndex(), fallback=index)
+
+    assert (await client.query("Pneumologia", "Asma", "3º ano")).documentos[0].titulo == ASMA.titulo
+
+    both_failing = PineconeClient(config, index=FailingIndex(), fallback=FailingIndex())
+    with pytest.raises(PineconeError, match="Fallback index query failed"):
+        await both_failing.query("Pneumologia", "Asma")
+    assert await both_failing.query_many([_sub_foco("A")]) == [None]
@@ -0,0 +1,222 @@
+"""Tests for the two-level RAG result cache."""
+
+import sqlite3
+
+import pytest
+
+from construtor.io.pinecone_client import InMemoryVectorIndex, PineconeClient
+from construtor.io.rag_cache import RagCache
+from construtor.models.question import SubFocoInput
+from construtor.models.rag import RagDocument, RagQueryResult
+
+PERIODO_FILTER = {"periodo": {"$eq": "3º ano"}}
+
+RESULT = RagQueryResult(
+    documentos=[RagDocument(texto="Critérios de Framingham...", titulo="Braunwald", score=0.8)],
+    query="Cardiologia Insuficiência Cardíaca",
+    latencia=0.42,
+)
+
+
+# Cache entries are stamped with wall-clock time; start the fake clock at a realistic epoch.
+wall_clock = pytest.mark.parametrize("fake_clock", [1_000_000.0], indirect=True)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "rag_cache.db")
+
+
+@wall_clock
+def test_exact_hit_uses_folded_query_and_filter(fake_clock):
+    """Case and whitespace do not matter; the filter and the scope do."""
+    cache = RagCache(db_path=None, clock=fake_clock)
+    cache.put("Insuficiência Cardíaca", PERIODO_FILTER, RESULT, scope="Cardiologia")
+
+    assert cache.get(" insuficiência  CARDÍACA", PERIODO_FILTER, scope="cardiologia") == RESULT
+    assert cache.get("Insuficiência Cardíaca", None, scope="Cardiologia") is None
+    assert cache.get("Insuficiência Cardíaca", PERIODO_FILTER, scope="Pediatria") is None
+    assert cache.get("Insuficiencia cardiaca", PERIODO_FILTER, scope="Cardiologia") is None
+
+    stats = cache.get_statistics()
+    assert stats["memory_hits"] == 1
+    assert stats["misses"] == 3
+    assert stats["similar_hits"] == 0
+    assert stats["hit_rate"] == pytest.approx(1 / 4, abs=1e-4)
+
+
+@wall_clock
+def test_exact_keys_keep_signs_and_digits(fake_clock):
+    """Queries that differ only in a sign or a number are different keys."""
+    cache = RagCache(db_path=None, clock=fake_clock)
+    cache.put("Câncer de mama HER2+", None, RESULT, scope="Oncologia")
+    cache.put("Diabetes tipo 1", None, RESULT, scope="Endocrinologia")
+
+    assert cache.get("Câncer de mama HER2-", None, scope="Oncologia") is None
+    assert cache.get("Diabetes tipo 2", None, scope="Endocrinologia") is None
+
+
+@wall_clock
+def test_near_identical_query_reuses_result(fake_clock):
+    """With a threshold, a near-identical foco of the same tema and filter reuses the result."""
+    cache = RagCache(db_path=None, similarity_threshold=0.85, clock=fake_clock)
+    cache.put("Insuficiência Cardíaca", PERIODO_FILTER, RESULT, scope="Cardiologia")
+
+    assert cache.get("Insuficiencia cardiaca", PERIODO_FILTER, scope="Cardiologia") == RESULT
+    assert cache.get("Infarto Agudo do Miocárdio", PERIODO_FILTER, scope="Cardiologia") is None
+    assert cache.get("Insuficiencia cardiaca", None, scope="Cardiologia") is None
+    assert cache.get("Insuficiencia cardiaca", PERIODO_FILTER, scope="Outro") is None
+    assert cache.get_statistics()["similar_hits"] == 1
+
+
+@pytest.mark.parametrize(
+    ("scope", "cached", "query"),
+    [
+        ("Endocrinologia", "Diabetes tipo 1", "Diabetes tipo 2"),
+        ("Oncologia", "Câncer de mama HER2+", "Câncer de mama HER2-"),
+        ("Obstetrícia", "Gestante Rh+", "Gestante Rh-"),
+    ],
+)
+@wall_clock
+def test_differing_digits_or_signs_are_never_near_identical(fake_clock, scope, cached, query):
+    """A shared tema and wording do not make different conditions near-identical."""
+    cache = RagCache(db_path=None, similarity_threshold=0.5, clock=fake_clock)
+    cache.put(cached, None, RESULT, scope=scope)
+
+    assert cache.get(query, None, scope=scope) is None
+
+
+@wall_clock
+def test_lru_evicts_least_recently_used(fake_clock):
+    """The memory level holds at most max_entries results."""
+    cache = RagCache(db_path=None, max_entries=2, clock=fake_clock)
+    cache.put("Asma", None, RESULT)
+    cache.put("DPOC", None, RESULT)
+    cache.get("Asma")
+    cache.put("Pneumonia", None, RESULT)
+
+    assert cache.get("DPOC") is None
+    assert cache.get("Asma") == RESULT
+    assert cache.get_statistics()["memory_entries"] == 2
+
+
+@wall_clock
+def test_disk_level_survives_restart(db_path, fake_clock):
+    """A new cache on the same file serves the entries of the previous run."""
+    with RagCache(db_path, clock=fake_clock) as first:
+        first.put("Insuficiência Cardíaca", PERIODO_FILTER, RESULT, scope="Cardiologia")
+
+    with RagCache(db_path, similarity_threshold=0.85, clock=fake_clock) as second:
+        assert second.get("Insuficiência Cardíaca", PERIODO_FILTER, scope="Cardiologia") == RESULT
+        assert second.get("Insuficiência Cardíaca", PERIODO_FILTER, scope="Cardiologia") == RESULT
+        assert second.get("Insuficiencia cardiaca", PERIODO_FILTER, scope="Cardiologia") == RESULT
+        stats = second.get_statistics()
+
+    assert stats["disk_hits"] == 1
+    assert stats["memory_hits"] == 1
+    assert stats["similar_hits"] == 1
+
+
+@wall_clock
+def test_memory_evicted_entry_is_read_back_from_disk(db_path, fake_clock):
+    cache = RagCache(db_path, max_entries=1, clock=fake_clock)
+    cache.put("Asma", None, RESULT)
+    cache.put("DPOC", None, RESULT)
+
+    assert cache.get("Asma") == RESULT
+    assert cache.get_statistics()["disk_hits"] == 1
+
+
+@wall_clock
+def test_entries_expire_after_ttl(db_path, fake_clock):
+    """Expired entries are misses in both levels and are purged."""
+    cache = RagCache(db_path, ttl=60.0, similarity_threshold=0.85, clock=fake_clock)
+    cache.put("Asma", None, RESULT)
+    fake_clock.now += 61.0
+
+    assert cache.get("Asma") is None
+    assert cache.get("Asma grave") is None
+    cache.close()
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM rag_cache").fetchone()[0] == 0
+
+
+@wall_clock
+def test_new_index_version_invalidates_entries(db_path, fake_clock):
+    """Entries of a previous index version are purged when the cache opens."""
+    with RagCache(db_path, index_version="v1", clock=fake_clock) as cache:
+        cache.put("Asma", None, RESULT)
+
+    with RagCache(db_path, index_version="v2", clock=fake_clock) as cache:
+        assert cache.get("Asma") is None
+
+    with RagCache(db_path, index_version="v1", clock=fake_clock) as cache:
+        assert cache.get("Asma") is None  # purged, not just hidden
+
+
+@wall_clock
+def test_invalidate_clears_both_levels(db_path, fake_clock):
+    with RagCache(db_path, clock=fake_clock) as cache:
+        cache.put("Asma", None, RESULT)
+        cache.invalidate()
+        assert cache.get("Asma") is None
+
+    with RagCache(db_path, clock=fake_clock) as cache:
+        assert cache.get("Asma") is None
+
+
+@wall_clock
+def test_unusable_disk_path_falls_back_to_memory(tmp_path, fake_clock):
+    """A cache file that cannot be opened only disables the disk level."""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("x")
+
+    cache = RagCache(str(blocker / "rag_cache.db"), clock=fake_clock)
+    cache.put("Asma", None, RESULT)
+
+    assert cache.get("Asma") == RESULT
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "match"),
+    [
+        ({"max_entries": 0}, "max_entries"),
+        ({"ttl": 0}, "ttl"),
+        ({"similarity_threshold": 1.5}, "similarity_threshold"),
+    ],
+)
+def test_invalid_arguments_raise(kwargs, match):
+    with pytest.raises(ValueError, match=match):
+        RagCache(db_path=None, **kwargs)
+
+
+@wall_clock
+@pytest.mark.asyncio
+async def test_client_skips_index_for_cached_queries(db_path, fake_clock, monkeypatch):
+    """With a cache, repeated batches and reruns do not query the index."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test-openai")
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "sk-ant-test")
+    monkeypatch.setenv("PINECONE_API_KEY", "pc-test-key")
+    monkeypatch.setenv("PINECONE_INDEX_HOST", "test-index.pinecone.io")
+    from construtor.config.settings import PipelineConfig
+
+    config = PipelineConfig(_env_file=None)
+    index = InMemoryVectorIndex([(RESULT.documentos[0], {"periodo": "3º ano"})])
+    sub_focos = [
+        SubFocoInput(tema="Cardiologia", foco=foco, sub_foco="X", periodo="3º ano")
+        for foco in ("Insuficiência Cardíaca", "Arritmias")
+    ]
+
+    client = PineconeClient(config, index=index, cache=RagCache(db_path, clock=fake_clock))
+    first = await client.query_many(sub_focos)
+    second = await client.query_many(sub_focos)
+    single = await client.query("Cardiologia", "Insuficiência Cardíaca", "3º ano")
+
+    assert index.searches == 2
+    assert second == first
+    assert single == first[0]
+    assert client.get_statistics()["cache_hits"] == 3
+
+    rerun = PineconeClient(config, index=index, cache=RagCache(db_path, clock=fake_clock))
+    assert await rerun.query_many(sub_focos) == first
+    assert index.searches == 2
@@ -0,0 +1,82 @@
+"""Tests for sub-foco catalogue import/export."""
+
+import json
+
+import pytest
+
+from construtor.config.exceptions import OutputParsingError
+from construtor.io import export_sub_foco_catalog, import_sub_foco_catalog
+from construtor.io.subfoco_catalog import MANUAL_PROMPT_VERSION
+from construtor.metrics import MetricsStore
+from construtor.models import FocoInput, SubFocoInput
+
+FOCO = FocoInput(tema="Cardiologia", foco="Insuficiência Cardíaca", periodo="3º ano")
+
+
+@pytest.fixture
+def store():
+    store = MetricsStore(":memory:")
+    yield store
+    store.close()
+
+
+def _sub_focos(names: list[str]) -> list[SubFocoInput]:
+    return [
+        SubFocoInput(tema=FOCO.tema, foco=FOCO.foco, periodo=FOCO.periodo, sub_foco=name)
+        for name in names
+    ]
+
+
+def test_export_then_import_round_trips(store, tmp_path):
+    """An exported catalogue imports into another database unchanged."""
+    store.save_sub_focos("abc123", _sub_focos(["Diagnóstico", "Tratamento"]))
+    store.save_sub_focos(MANUAL_PROMPT_VERSION, _sub_focos(["Epidemiologia"]))
+    path = tmp_path / "catalog" / "sub_focos.jsonl"
+
+    assert export_sub_foco_catalog(store, str(path)) == 3
+
+    other = MetricsStore(":memory:")
+    assert import_sub_foco_catalog(other, str(path)) == 3
+    assert other.get_sub_foco_catalog() == store.get_sub_foco_catalog()
+    assert "Diagnóstico" in path.read_text(encoding="utf-8")
+    other.close()
+
+
+def test_lines_without_prompt_version_are_manual(store, tmp_path):
+    """A hand-written file (FR3) is imported as manual sub-focos."""
+    path = tmp_path / "manual.jsonl"
+    lines = [
+        {"tema": FOCO.tema, "foco": FOCO.foco, "periodo": FOCO.periodo, "sub_foco": name}
+        for name in ["Critérios de Framingham", "BNP no diagnóstico"]
+    ]
+    path.write_text("\n".join(json.dumps(line) for line in lines) + "\n\n", encoding="utf-8")
+
+    assert import_sub_foco_catalog(store, str(path)) == 2
+    assert [s.sub_foco for s in store.get_sub_focos(FOCO, MANUAL_PROMPT_VERSION)] == [
+        "Critérios de Framingham",
+        "BNP no diagnóstico",
+    ]
+
+
+def test_prompt_version_argument_overrides_file(store, tmp_path):
+    """The prompt_version argument applies to every line."""
+    store.save_sub_focos("old", _sub_focos(["Diagnóstico"]))
+    path = tmp_path / "sub_focos.jsonl"
+    export_sub_foco_catalog(store, str(path))
+
+    import_sub_foco_catalog(store, str(path), prompt_version="new")
+
+    assert [s.sub_foco for s in store.get_sub_focos(FOCO, "new")] == ["Diagnóstico"]
+
+
+def test_invalid_line_raises_without_writing(store, tmp_path):
+    """A bad line fails the import before anything is saved."""
+    path = tmp_path / "bad.jsonl"
+    good = {"tema": FOCO.tema, "foco": FOCO.foco, "periodo": FOCO.periodo, "sub_foco": "Ok"}
+    bad = {**good, "periodo": "9º ano"}
+    path.write_text(f"{json.dumps(good)}\n{json.dumps(bad)}\n", encoding="utf-8")
+
+    with pytest.raises(OutputParsingError, match="line 2"):
+        import_sub_foco_catalog(store, str(path))
+
+    assert store.get_sub_foco_catalog() == []
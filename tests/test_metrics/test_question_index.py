@@ -0,0 +1,193 @@
+"""Tests for the MinHash/LSH question index."""
+
+import pytest
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics import MetricsStore, QuestionIndex
+from construtor.metrics.question_index import minhash_signature, question_shingles
+from construtor.models import CriadorOutput, QuestionRecord
+
+
+@pytest.fixture
+def store(tmp_path):
+    """File-based MetricsStore."""
+    store = MetricsStore(str(tmp_path / "test.db"))
+    yield store
+    store.conn.close()
+
+
+def _record(**overrides: object) -> QuestionRecord:
+    fields = {
+        "tema": "Cardiologia",
+        "foco": "Insuficiência Cardíaca",
+        "sub_foco": "Classificação NYHA",
+        "periodo": "3º ano",
+        "nivel_dificuldade": 2,
+        "tipo_enunciado": "caso clínico",
+        "enunciado": (
+            "Paciente de 65 anos, hipertenso, refere dispneia aos médios esforços há três "
+            "meses, sem sintomas em repouso. Qual a classe funcional da NYHA?"
+        ),
+        "alternativa_a": "Classe I, sem limitação da atividade física",
+        "alternativa_b": "Classe II, limitação leve da atividade física",
+        "alternativa_c": "Classe III, limitação acentuada da atividade física",
+        "alternativa_d": "Classe IV, sintomas em repouso",
+        "resposta_correta": "B",
+        "objetivo_educacional": "Classificar a gravidade da IC segundo a NYHA",
+        "comentario_introducao": "A classificação NYHA...",
+        "comentario_visao_especifica": "Sintomas aos médios esforços...",
+        "comentario_alt_a": "Incorreta",
+        "comentario_alt_b": "Correta",
+        "comentario_alt_c": "Incorreta",
+        "comentario_alt_d": "Incorreta",
+        "comentario_visao_aprovado": "Questão adequada",
+        "referencia_bibliografica": "Diretriz Brasileira de IC, 2018",
+        "suporte_imagem": None,
+        "fonte_imagem": None,
+        "modelo_llm": "gpt-4o",
+        "rodadas_validacao": 1,
+        "concordancia_comentador": True,
+    }
+    fields.update(overrides)
+    return QuestionRecord(**fields)
+
+
+def _criador_output(record: QuestionRecord, **overrides: object) -> CriadorOutput:
+    fields = {
+        "enunciado": record.enunciado,
+        "alternativa_a": record.alternativa_a,
+        "alternativa_b": record.alternativa_b,
+        "alternativa_c": record.alternativa_c,
+        "alternativa_d": record.alternativa_d,
+        "resposta_correta": record.resposta_correta,
+        "objetivo_educacional": record.objetivo_educacional,
+        "nivel_dificuldade": record.nivel_dificuldade,
+        "tipo_enunciado": record.tipo_enunciado,
+    }
+    fields.update(overrides)
+    return CriadorOutput(**fields)
+
+
+DIFFERENT = {
+    "enunciado": (
+        "Mulher de 30 anos com palpitações, perda de peso e tremor fino de extremidades. "
+        "TSH suprimido e T4 livre elevado. Qual o diagnóstico mais provável?"
+    ),
+    "alternativa_a": "Doença de Graves",
+    "alternativa_b": "Hipotireoidismo primário",
+    "alternativa_c": "Tireoidite de Hashimoto em fase tardia",
+    "alternativa_d": "Adenoma hipofisário produtor de prolactina",
+}
+
+
+def test_shingles_ignore_accents_case_and_alternative_order():
+    """Normalized text and per-field shingling make formatting irrelevant."""
+    record = _record()
+    reordered = _criador_output(
+        record,
+        enunciado=record.enunciado.upper().replace("é", "e"),
+        alternativa_a=record.alternativa_c,
+        alternativa_c=record.alternativa_a,
+    )
+
+    assert question_shingles(record) == question_shingles(reordered)
+
+
+def test_signature_is_deterministic():
+    """Signatures are persisted, so they must not depend on the process."""
+    shingles = question_shingles(_record())
+
+    signature = minhash_signature(shingles)
+
+    assert signature.shape == (128,)
+    assert (signature == minhash_signature(set(shingles))).all()
+
+
+def test_finds_duplicate_from_earlier_run(tmp_path):
+    """A question saved by a previous run is found by a fresh index."""
+    db_path = str(tmp_path / "test.db")
+    first_run = MetricsStore(db_path)
+    record = _record()
+    question_id = first_run.save_question(record)
+    QuestionIndex(first_run).add(question_id, record)
+    first_run.conn.close()
+
+    second_run = MetricsStore(db_path)
+    match = QuestionIndex(second_run).check(_criador_output(record))
+    second_run.conn.close()
+
+    assert match is not None
+    assert match.question_id == question_id
+    assert match.similarity == 1.0
+
+
+def test_near_duplicate_matches(store):
+    """A lightly edited question is still a duplicate."""
+    record = _record()
+    index = QuestionIndex(store)
+    index.add(store.save_question(record), record)
+
+    edited = _criador_output(
+        record,
+        enunciado=record.enunciado.replace("Paciente de 65 anos", "Paciente de 67 anos"),
+    )
+
+    assert index.check(edited) is not None
+
+
+def test_different_question_does_not_match(store):
+    """An unrelated question is not a duplicate."""
+    record = _record()
+    index = QuestionIndex(store)
+    index.add(store.save_question(record), record)
+
+    assert index.check(_criador_output(record, **DIFFERENT)) is None
+    assert index.find(_criador_output(record, **DIFFERENT)) == []
+
+
+def test_sync_indexes_only_approved_questions(store):
+    """Earlier runs' approved questions are indexed once; others are skipped."""
+    approved = _record()
+    rejected = _record(**DIFFERENT)
+    approved_id = store.save_question(approved)
+    rejected_id = store.save_question(rejected)
+    store.update_question_status(approved_id, "approved")
+    store.update_question_status(rejected_id, "rejected")
+    index = QuestionIndex(store)
+
+    assert index.sync() == 1
+    assert index.sync() == 0
+    assert index.count() == 1
+    assert index.check(_criador_output(approved)).question_id == approved_id
+    assert index.check(_criador_output(approved, **DIFFERENT)) is None
+
+
+def test_add_replaces_existing_signature(store):
+    """Re-indexing a question replaces its signature and buckets."""
+    record = _record()
+    question_id = store.save_question(record)
+    index = QuestionIndex(store)
+    index.add(question_id, record)
+
+    index.add(question_id, _criador_output(record, **DIFFERENT))
+
+    assert index.count() == 1
+    assert index.check(_criador_output(record)) is None
+    assert index.check(_criador_output(record, **DIFFERENT)).question_id == question_id
+
+
+def test_add_unknown_question_raises_pipeline_error(store):
+    """Signatures reference the questions table."""
+    index = QuestionIndex(store)
+
+    with pytest.raises(PipelineError, match="Database write failed"):
+        index.add(999, _record())
+
+    assert index.count() == 0
+
+
+@pytest.mark.parametrize("threshold", [0.0, 1.5])
+def test_invalid_threshold_raises_value_error(store, threshold):
+    """Threshold must be in (0, 1]."""
+    with pytest.raises(ValueError, match="threshold"):
+        QuestionIndex(store, threshold=threshold)
@@ -1,11 +1,21 @@
 """Comprehensive tests for MetricsStore SQLite persistence layer."""
 
 import sqlite3
+import threading
 
 import pytest
 
 from construtor.metrics import MetricsStore
-from construtor.models import BatchState, CheckpointResult, QuestionMetrics, QuestionRecord
+from construtor.metrics import store as store_module
+from construtor.models import (
+    BatchState,
+    CheckpointResult,
+    FocoInput,
+    QuestionMetrics,
+    QuestionRecord,
+    SubFocoInput,
+    WorkItem,
+)
 
 
 @pytest.fixture
@@ -614,3 +624,245 @@ def test_context_manager_closes_connection(tmp_path):
     # Attempting to use it should raise an error
     with pytest.raises(sqlite3.ProgrammingError):
         store.conn.cursor()
+
+
+# ============================================================================
+# Work-Item Ledger Tests
+# ============================================================================
+
+
+def _work_items(count: int, sub_foco: str = "Classificação NYHA") -> list[WorkItem]:
+    """Build ``count`` distinct work items for one sub-foco."""
+    combos = [(nivel, pos) for nivel in (1, 2, 3) for pos in "ABCD"]
+    return [
+        WorkItem(
+            tema="Cardiologia",
+            foco="Insuficiência Cardíaca",
+            periodo="3º ano",
+            sub_foco=sub_foco,
+            nivel_dificuldade=nivel,
+            posicao_correta=pos,
+        )
+        for nivel, pos in combos[:count]
+    ]
+
+
+def test_work_items_table_created(memory_db):
+    """Test that the work_items ledger table exists."""
+    cursor = memory_db.conn.cursor()
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='work_items'")
+    assert cursor.fetchone() is not None
+
+
+def test_enqueue_is_idempotent(memory_db):
+    """Test that re-enqueueing the same run only adds missing items."""
+    assert memory_db.enqueue_work_items(_work_items(3)) == 3
+    assert memory_db.enqueue_work_items(_work_items(5)) == 2
+
+    assert memory_db.get_work_item_counts() == {
+        "queued": 5,
+        "in_flight": 0,
+        "done": 0,
+        "failed": 0,
+    }
+
+
+def test_claim_leases_items_in_order(memory_db):
+    """Test that claims return queued items in order and mark them in flight."""
+    memory_db.enqueue_work_items(_work_items(4))
+
+    first = memory_db.claim_work_items("worker-1", limit=3)
+    second = memory_db.claim_work_items("worker-2", limit=3)
+
+    assert [item.id for item in first] == [1, 2, 3]
+    assert [item.id for item in second] == [4]
+    assert all(item.status == "in_flight" and item.attempts == 1 for item in first)
+    assert first[0].lease_owner == "worker-1"
+    assert memory_db.claim_work_items("worker-3") == []
+
+
+def test_complete_and_fail_require_lease(memory_db):
+    """Test that only the lease owner can finish an item."""
+    memory_db.enqueue_work_items(_work_items(2))
+    done_item, failed_item = memory_db.claim_work_items("worker-1", limit=2)
+
+    assert memory_db.complete_work_item(done_item.id, "worker-2") is False
+    assert memory_db.complete_work_item(done_item.id, "worker-1", question_id=42) is True
+    assert memory_db.fail_work_item(failed_item.id, "worker-1", "LLM timeout") is True
+
+    [done] = memory_db.get_work_items_by_status("done")
+    [failed] = memory_db.get_work_items_by_status("failed")
+    assert done.question_id == 42
+    assert done.lease_owner is None
+    assert failed.last_error == "LLM timeout"
+
+
+def test_requeued_failure_is_claimed_again(memory_db):
+    """Test that retryable failures go back to the queue."""
+    memory_db.enqueue_work_items(_work_items(1))
+    [item] = memory_db.claim_work_items("worker-1")
+
+    memory_db.fail_work_item(item.id, "worker-1", "rate limit", requeue=True)
+    [retry] = memory_db.claim_work_items("worker-2")
+
+    assert retry.id == item.id
+    assert retry.attempts == 2
+    assert retry.last_error == "rate limit"
+
+
+def test_expired_lease_is_reclaimed(memory_db, monkeypatch):
+    """Test that a crashed worker's items are claimable once the lease expires."""
+    memory_db.enqueue_work_items(_work_items(1))
+    [item] = memory_db.claim_work_items("crashed", lease_seconds=30.0)
+    assert memory_db.claim_work_items("worker-2") == []
+
+    now = store_module.time.time()
+    monkeypatch.setattr(store_module.time, "time", lambda: now + 31.0)
+    [reclaimed] = memory_db.claim_work_items("worker-2")
+
+    assert reclaimed.id == item.id
+    assert reclaimed.lease_owner == "worker-2"
+    # The crashed worker's late result is refused
+    assert memory_db.complete_work_item(item.id, "crashed") is False
+
+
+def test_expired_lease_at_attempt_cap_is_failed(memory_db, monkeypatch):
+    """Test that an item whose workers keep dying is failed, not claimed forever."""
+    memory_db.enqueue_work_items(_work_items(2))
+    now = store_module.time.time()
+    for attempt in range(2):
+        monkeypatch.setattr(store_module.time, "time", lambda t=now + 31.0 * attempt: t)
+        claimed = memory_db.claim_work_items(
+            f"killed-{attempt}", limit=1, lease_seconds=30.0, max_attempts=2
+        )
+        assert [item.id for item in claimed] == [1]
+
+    monkeypatch.setattr(store_module.time, "time", lambda: now + 62.0)
+    [next_item] = memory_db.claim_work_items("worker-3", max_attempts=2)
+
+    assert next_item.id == 2
+    [failed] = memory_db.get_work_items_by_status("failed")
+    assert failed.id == 1
+    assert failed.attempts == 2
+    assert failed.lease_owner is None
+    assert "Lease expired after 2 attempts" in failed.last_error
+    with pytest.raises(ValueError, match="max_attempts must be positive"):
+        memory_db.claim_work_items("worker-1", max_attempts=0)
+
+
+def test_renew_lease_keeps_item(memory_db, monkeypatch):
+    """Test that renewing a lease prevents another worker from taking it."""
+    memory_db.enqueue_work_items(_work_items(1))
+    [item] = memory_db.claim_work_items("worker-1", lease_seconds=30.0)
+
+    now = store_module.time.time()
+    monkeypatch.setattr(store_module.time, "time", lambda: now + 20.0)
+    assert memory_db.renew_work_item_lease(item.id, "worker-1", lease_seconds=30.0) is True
+    monkeypatch.setattr(store_module.time, "time", lambda: now + 40.0)
+
+    assert memory_db.claim_work_items("worker-2") == []
+
+
+def test_resume_after_crash_only_runs_unfinished(tmp_path):
+    """Test that a restarted run resumes only unfinished items."""
+    db_path = str(tmp_path / "ledger.db")
+    with MetricsStore(db_path) as store:
+        store.enqueue_work_items(_work_items(4))
+        claimed = store.claim_work_items("run-1", limit=3)
+        store.complete_work_item(claimed[0].id, "run-1", question_id=1)
+        # Crash: claimed[1:] stay in flight
+
+    with MetricsStore(db_path) as store:
+        assert store.enqueue_work_items(_work_items(4)) == 0
+        assert store.release_work_items() == 2
+        resumed = store.claim_work_items("run-2", limit=10)
+
+    assert [item.id for item in resumed] == [2, 3, 4]
+
+
+def test_concurrent_claims_never_overlap(tmp_path):
+    """Test that workers on separate connections never claim the same item."""
+    db_path = str(tmp_path / "ledger.db")
+    with MetricsStore(db_path) as store:
+        store.enqueue_work_items(_work_items(12))
+
+    claimed: dict[str, list[int]] = {}
+
+    def worker(worker_id: str) -> None:
+        with MetricsStore(db_path) as store:
+            ids: list[int] = []
+            while batch := store.claim_work_items(worker_id, limit=1):
+                ids.extend(item.id for item in batch)
+            claimed[worker_id] = ids
+
+    threads = [threading.Thread(target=worker, args=(f"worker-{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_ids = [item_id for ids in claimed.values() for item_id in ids]
+    assert sorted(all_ids) == list(range(1, 13))
+
+
+def test_claim_by_shard_keeps_focos_together(memory_db):
+    """Test that sharded claims split focos, never a foco's sub-focos."""
+    items = [
+        item.model_copy(update={"foco": f"Foco {n}"}) for n in range(8) for item in _work_items(3)
+    ]
+    memory_db.enqueue_work_items(items)
+
+    shards = [
+        memory_db.claim_work_items(f"worker-{index}", limit=100, shard=(index, 2))
+        for index in range(2)
+    ]
+
+    assert sum(len(claimed) for claimed in shards) == 24
+    focos = [{item.foco for item in claimed} for claimed in shards]
+    assert not focos[0] & focos[1]
+    with pytest.raises(ValueError, match="shard must be"):
+        memory_db.claim_work_items("worker-1", shard=(2, 2))
+
+
+def test_claim_rejects_non_positive_limit(memory_db):
+    """Test claim argument validation."""
+    with pytest.raises(ValueError, match="limit must be positive"):
+        memory_db.claim_work_items("worker-1", limit=0)
+
+
+# ============================================================================
+# Sub-Foco Catalogue Tests
+# ============================================================================
+
+
+def _catalog_sub_focos(foco: str, names: list[str]) -> list[SubFocoInput]:
+    return [
+        SubFocoInput(tema="Cardiologia", foco=foco, periodo="3º ano", sub_foco=name)
+        for name in names
+    ]
+
+
+def test_save_and_get_sub_focos_preserves_order(memory_db):
+    """Test that catalogued sub-focos come back per foco and version, in order."""
+    memory_db.save_sub_focos(
+        "v1", _catalog_sub_focos("IC", ["Diagnóstico", "Classificação NYHA", "Tratamento"])
+    )
+    memory_db.save_sub_focos("v1", _catalog_sub_focos("HAS", ["Estadiamento"]))
+    foco = FocoInput(tema="Cardiologia", foco="IC", periodo="3º ano")
+
+    sub_focos = memory_db.get_sub_focos(foco, "v1")
+
+    assert [s.sub_foco for s in sub_focos] == ["Diagnóstico", "Classificação NYHA", "Tratamento"]
+    assert memory_db.get_sub_focos(foco, "v2") == []
+    assert len(memory_db.get_sub_foco_catalog()) == 4
+
+
+def test_save_sub_focos_replaces_foco_entry(memory_db):
+    """Test that saving a foco again replaces its entry for that version only."""
+    memory_db.save_sub_focos("v1", _catalog_sub_focos("IC", ["A", "B", "C"]))
+    memory_db.save_sub_focos("v2", _catalog_sub_focos("IC", ["X"]))
+    memory_db.save_sub_focos("v1", _catalog_sub_focos("IC", ["D"]))
+    foco = FocoInput(tema="Cardiologia", foco="IC", periodo="3º ano")
+
+    assert [s.sub_foco for s in memory_db.get_sub_focos(foco, "v1")] == ["D"]
+    assert [s.sub_foco for s in memory_db.get_sub_focos(foco, "v2")] == ["X"]
@@ -1,10 +1,10 @@
-"""Tests for pipeline models (BatchState, CheckpointResult, RetryContext)."""
+"""Tests for pipeline models (BatchState, CheckpointResult, RetryContext, WorkItem)."""
 
 import pytest
 from pydantic import ValidationError
 
 from construtor.models.feedback import FeedbackEstruturado
-from construtor.models.pipeline import BatchState, CheckpointResult, RetryContext
+from construtor.models.pipeline import BatchState, CheckpointResult, RetryContext, WorkItem
 
 
 def test_batch_state_valid_data():
@@ -207,3 +207,38 @@ def test_retry_context_nested_feedback_validation():
                 "fora_do_nivel": False,
             },
         )
+
+
+def test_work_item_defaults_to_queued():
+    """Test WorkItem starts queued with no lease."""
+    item = WorkItem(
+        tema="Cardiologia",
+        foco="Insuficiência Cardíaca",
+        periodo="3º ano",
+        sub_foco="Classificação NYHA",
+        nivel_dificuldade=2,
+        posicao_correta="B",
+    )
+
+    assert item.id is None
+    assert item.status == "queued"
+    assert item.attempts == 0
+    assert item.lease_owner is None
+
+
+def test_work_item_rejects_invalid_position_and_status():
+    """Test WorkItem only accepts A-D positions and known statuses."""
+    base = {
+        "tema": "Cardiologia",
+        "foco": "Arritmias",
+        "periodo": "1º ano",
+        "sub_foco": "Fibrilação atrial",
+        "nivel_dificuldade": 1,
+    }
+
+    with pytest.raises(ValidationError):
+        WorkItem(**base, posicao_correta="E")
+    with pytest.raises(ValidationError):
+        WorkItem(**base, posicao_correta="A", status="running")
+    with pytest.raises(ValidationError):
+        WorkItem(**{**base, "nivel_dificuldade": "1"}, posicao_correta="A")
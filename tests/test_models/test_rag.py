@@ -0,0 +1,29 @@
+"""Tests for RAG models (RagDocument, RagQueryResult)."""
+
+import pytest
+from pydantic import ValidationError
+
+from construtor.models.rag import RagDocument, RagQueryResult
+
+
+def test_citation_joins_available_metadata():
+    """Missing metadata is left out of the reference."""
+    full = RagDocument(
+        texto="...",
+        titulo="Tratado de Cardiologia.",
+        autores="Zipes DP, Libby P",
+        ano="2022",
+        fonte="Elsevier",
+    )
+
+    assert full.citation() == "Zipes DP, Libby P. Tratado de Cardiologia. Elsevier, 2022."
+    assert RagDocument(texto="...", titulo="Diretriz de IC").citation() == "Diretriz de IC."
+    assert RagDocument(texto="...").citation() == ""
+
+
+def test_rag_models_are_strict():
+    """Strict validation: no coercion of ano or latencia."""
+    with pytest.raises(ValidationError):
+        RagDocument(texto="...", ano=2022)
+    with pytest.raises(ValidationError):
+        RagQueryResult(documentos=[], query="Cardiologia IC", latencia=-1.0)
@@ -0,0 +1 @@
+"""Tests for pipeline module (orchestration components)."""
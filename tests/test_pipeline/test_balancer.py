@@ -0,0 +1,140 @@
+"""Tests for StatisticalBalancer (balanced correct-answer positions)."""
+
+import logging
+import threading
+from collections import Counter
+
+import pytest
+
+from construtor.metrics import MetricsStore
+from construtor.pipeline import StatisticalBalancer
+
+
+@pytest.fixture
+def store():
+    """In-memory MetricsStore."""
+    store = MetricsStore(":memory:")
+    yield store
+    store.close()
+
+
+def test_distribution_stays_within_nfr18_bounds():
+    """Every prefix of 14+ draws keeps each letter between 20% and 30%."""
+    balancer = StatisticalBalancer(seed=7)
+    drawn: Counter[str] = Counter()
+
+    for n in range(1, 2001):
+        drawn[balancer.get_next_position()] += 1
+        if n >= 14:  # below that, one extra letter is already more than 30%
+            assert all(0.20 <= drawn[pos] / n <= 0.30 for pos in "ABCD"), (n, drawn)
+
+    assert balancer.is_balanced()
+    assert balancer.get_statistics()["counts"] == dict(drawn)
+
+
+def test_positions_are_not_a_fixed_cycle():
+    """Blocks are shuffled, so the sequence is not just ABCDABCD."""
+    balancer = StatisticalBalancer(seed=1)
+    blocks = {tuple(balancer.get_next_position() for _ in range(4)) for _ in range(50)}
+
+    assert len(blocks) > 5
+    assert all(sorted(block) == ["A", "B", "C", "D"] for block in blocks)
+
+
+def test_same_seed_same_sequence():
+    """The seed makes the sequence reproducible."""
+    first = StatisticalBalancer(seed=42)
+    second = StatisticalBalancer(seed=42)
+
+    assert [first.get_next_position() for _ in range(40)] == [
+        second.get_next_position() for _ in range(40)
+    ]
+
+
+def test_statistics_percentages():
+    """get_statistics returns counts, total and percentages."""
+    balancer = StatisticalBalancer(seed=3)
+    for _ in range(8):
+        balancer.get_next_position()
+
+    stats = balancer.get_statistics()
+
+    assert stats["total"] == 8
+    assert stats["counts"] == {"A": 2, "B": 2, "C": 2, "D": 2}
+    assert stats["percentages"] == {"A": 25.0, "B": 25.0, "C": 25.0, "D": 25.0}
+
+
+def test_snapshots_are_periodic(store, monkeypatch):
+    """State is written every snapshot_every draws, not on every draw."""
+    writes: list[dict[str, int]] = []
+    original = store.save_balancer_state
+    monkeypatch.setattr(
+        store, "save_balancer_state", lambda counts: (writes.append(counts), original(counts))
+    )
+    balancer = StatisticalBalancer(store, snapshot_every=10, seed=5)
+
+    for _ in range(25):
+        balancer.get_next_position()
+
+    assert [sum(w.values()) for w in writes] == [10, 20]
+    balancer.flush()
+    assert store.get_balancer_state() == balancer.get_statistics()["counts"]
+
+
+def test_resume_works_off_saved_imbalance(store):
+    """A resumed balancer favours the letters that are behind."""
+    store.save_balancer_state({"A": 30, "B": 20, "C": 25, "D": 25})
+    balancer = StatisticalBalancer(store, seed=9)
+
+    catch_up = [balancer.get_next_position() for _ in range(20)]
+
+    assert catch_up[0] == "B"
+    assert Counter(catch_up) == {"B": 10, "C": 5, "D": 5}
+    assert balancer.get_statistics()["counts"] == {"A": 30, "B": 30, "C": 30, "D": 30}
+
+
+def test_reset_clears_counts(store):
+    """reset() zeroes the counts in memory and in the store."""
+    balancer = StatisticalBalancer(store, seed=2)
+    for _ in range(6):
+        balancer.get_next_position()
+
+    balancer.reset()
+
+    assert balancer.get_statistics()["total"] == 0
+    assert store.get_balancer_state() == {"A": 0, "B": 0, "C": 0, "D": 0}
+
+
+def test_concurrent_draws_stay_exactly_balanced():
+    """Threads drawing concurrently never lose or duplicate a draw."""
+    balancer = StatisticalBalancer(seed=11)
+    results: list[list[str]] = [[] for _ in range(8)]
+
+    def worker(out: list[str]) -> None:
+        out.extend(balancer.get_next_position() for _ in range(5000))
+
+    threads = [threading.Thread(target=worker, args=(out,)) for out in results]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    drawn = Counter(pos for out in results for pos in out)
+    assert drawn == {"A": 10000, "B": 10000, "C": 10000, "D": 10000}
+    assert balancer.get_statistics()["counts"] == dict(drawn)
+
+
+def test_debug_log_per_draw(caplog):
+    """Each draw is logged at DEBUG with the current counts."""
+    balancer = StatisticalBalancer(seed=4)
+
+    with caplog.at_level(logging.DEBUG, logger="construtor.pipeline.balancer"):
+        position = balancer.get_next_position()
+
+    assert f"Balancer draw #1: {position}" in caplog.text
+
+
+def test_invalid_snapshot_interval():
+    """snapshot_every must be positive."""
+    with pytest.raises(ValueError, match="snapshot_every must be positive"):
+        StatisticalBalancer(snapshot_every=0)
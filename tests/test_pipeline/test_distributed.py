@@ -0,0 +1,342 @@
+"""Tests for distributed workers and the queue backends."""
+
+import asyncio
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics import MetricsStore
+from construtor.models import QuestionMetrics, QuestionRecord, WorkItem, WorkResult
+from construtor.pipeline import (
+    BackendRateLimiter,
+    DistributedWorker,
+    FileSpoolBackend,
+    InMemoryRedis,
+    QueueBackend,
+    RateLimit,
+    RedisQueueBackend,
+    SqliteQueueBackend,
+    merge_results,
+    queue_redis,
+)
+
+
+@pytest.fixture(params=["sqlite", "spool", "redis"])
+def backend(request: pytest.FixtureRequest, tmp_path: Path) -> Iterator[QueueBackend]:
+    """Each backend implementation, freshly created."""
+    if request.param == "sqlite":
+        backend: QueueBackend = SqliteQueueBackend(str(tmp_path / "queue.db"))
+    elif request.param == "spool":
+        backend = FileSpoolBackend(str(tmp_path / "spool"))
+    else:
+        backend = RedisQueueBackend(InMemoryRedis(), prefix="test")
+    yield backend
+    backend.close()
+
+
+def _items(count: int) -> list[WorkItem]:
+    return [
+        WorkItem(
+            tema="Cardiologia",
+            foco="Insuficiência Cardíaca",
+            periodo="3º ano",
+            sub_foco=f"Sub-foco {n}",
+            nivel_dificuldade=2,
+            posicao_correta="B",
+        )
+        for n in range(count)
+    ]
+
+
+def _result(item: WorkItem) -> WorkResult:
+    question = QuestionRecord(
+        tema=item.tema,
+        foco=item.foco,
+        sub_foco=item.sub_foco,
+        periodo=item.periodo,
+        nivel_dificuldade=item.nivel_dificuldade,
+        tipo_enunciado="caso clínico",
+        enunciado="Paciente de 65 anos com dispneia aos médios esforços...",
+        alternativa_a="NYHA Classe I",
+        alternativa_b="NYHA Classe II",
+        alternativa_c="NYHA Classe III",
+        alternativa_d="NYHA Classe IV",
+        resposta_correta=item.posicao_correta,
+        objetivo_educacional="Classificar gravidade de IC segundo NYHA",
+        comentario_introducao="A classificação NYHA é fundamental...",
+        comentario_visao_especifica="Neste caso, sintomas aos médios esforços...",
+        comentario_alt_a="Classe I: assintomático",
+        comentario_alt_b="Classe II: sintomas aos médios esforços (correto)",
+        comentario_alt_c="Classe III: sintomas aos pequenos esforços",
+        comentario_alt_d="Classe IV: sintomas em repouso",
+        comentario_visao_aprovado="Questão bem elaborada sobre NYHA",
+        referencia_bibliografica="Harrison's Principles of Internal Medicine, 21st ed.",
+        modelo_llm="gpt-4o",
+        rodadas_validacao=1,
+        concordancia_comentador=True,
+    )
+    metrics = QuestionMetrics(
+        modelo="gpt-4o",
+        tokens=1500,
+        custo=0.02,
+        rodadas=1,
+        tempo=2.5,
+        decisao="aprovada",
+        timestamp="2026-01-01T00:00:00",
+    )
+    return WorkResult(item=item, question=question, metrics=metrics)
+
+
+# ============================================================================
+# Backend contract (every implementation)
+# ============================================================================
+
+
+def test_backend_satisfies_protocol(backend: QueueBackend):
+    """Every implementation is a QueueBackend."""
+    assert isinstance(backend, QueueBackend)
+
+
+def test_enqueue_is_idempotent(backend: QueueBackend):
+    """Re-enqueueing a run only adds the missing items."""
+    assert backend.enqueue(_items(3)) == 3
+    assert backend.enqueue(_items(5)) == 2
+    assert backend.counts() == {"queued": 5, "in_flight": 0, "done": 0, "failed": 0}
+
+
+def test_claims_are_exclusive_and_ordered(backend: QueueBackend):
+    """Claims lease the oldest items and never hand out an item twice."""
+    backend.enqueue(_items(5))
+
+    first = backend.claim("worker-1", 3, 60.0)
+    second = backend.claim("worker-2", 3, 60.0)
+
+    assert [item.sub_foco for item in first] == ["Sub-foco 0", "Sub-foco 1", "Sub-foco 2"]
+    assert [item.sub_foco for item in second] == ["Sub-foco 3", "Sub-foco 4"]
+    assert all(item.lease_owner == "worker-1" and item.attempts == 1 for item in first)
+    assert backend.claim("worker-3", 1, 60.0) == []
+
+
+def test_expired_leases_are_reclaimed_and_heartbeats_extend(backend: QueueBackend):
+    """A silent worker loses its items; one sending heartbeats keeps them."""
+    backend.enqueue(_items(2))
+    [stalled] = backend.claim("worker-1", 1, 0.05)
+    [alive] = backend.claim("worker-2", 1, 0.05)
+
+    assert backend.heartbeat("worker-2", [alive.id], 60.0) == []
+    time.sleep(0.1)
+
+    [reclaimed] = backend.claim("worker-3", 5, 60.0)
+    assert reclaimed.id == stalled.id
+    assert reclaimed.attempts == 2
+    assert backend.heartbeat("worker-1", [stalled.id], 60.0) == [stalled.id]
+    assert backend.complete("worker-1", _result(stalled)) is False
+    assert backend.complete("worker-3", _result(reclaimed)) is True
+
+
+def test_fail_requeues_or_marks_failed(backend: QueueBackend):
+    """Retryable failures go back to the queue, others are final."""
+    backend.enqueue(_items(2))
+    retryable, final = backend.claim("worker-1", 2, 60.0)
+
+    assert backend.fail(retryable.id, "worker-1", "timeout", requeue=True) is True
+    assert backend.fail(final.id, "worker-1", "invalid JSON", requeue=False) is True
+    assert backend.fail(final.id, "worker-1", "again", requeue=False) is False
+
+    assert backend.counts() == {"queued": 1, "in_flight": 0, "done": 0, "failed": 1}
+    [requeued] = backend.claim("worker-2", 1, 60.0)
+    assert requeued.last_error == "timeout"
+
+
+def test_results_inbox_is_acknowledged(backend: QueueBackend):
+    """Completed results wait in the inbox until acknowledged."""
+    backend.enqueue(_items(2))
+    for item in backend.claim("worker-1", 2, 60.0):
+        backend.complete("worker-1", _result(item))
+
+    pending = backend.pending_results(10)
+    assert [result.item.sub_foco for _, result in pending] == ["Sub-foco 0", "Sub-foco 1"]
+    assert all(result.item.status == "done" for _, result in pending)
+
+    backend.ack_results([pending[0][0]])
+    assert [result_id for result_id, _ in backend.pending_results(10)] == [pending[1][0]]
+
+
+def test_rate_budget_is_shared(backend: QueueBackend):
+    """Reservations from any worker draw from the same budget."""
+    delays = [backend.reserve("requests:gpt-4o", 0.5) for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.5, abs=0.05)
+    assert delays[3] == pytest.approx(1.0, abs=0.05)
+    assert backend.reserve("requests:other", 0.5) == 0.0
+
+
+def test_spool_is_shared_between_instances(tmp_path: Path):
+    """Two backends on the same directory see the same queue."""
+    first = FileSpoolBackend(str(tmp_path / "spool"))
+    second = FileSpoolBackend(str(tmp_path / "spool"))
+    first.enqueue(_items(2))
+
+    assert len(second.claim("worker-2", 5, 60.0)) == 2
+    assert first.claim("worker-1", 5, 60.0) == []
+
+
+class RacingRedis(InMemoryRedis):
+    """InMemoryRedis whose mutex expires and is re-taken by another worker after a GET."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.stolen = 0
+
+    def get(self, name: str) -> str | None:
+        value = super().get(name)
+        if name.endswith(":lock"):
+            super().delete(name)
+            self.set(name, "other-worker", nx=True, px=10_000)
+        return value
+
+    def delete(self, *names: str) -> int:
+        self.stolen += sum(
+            name.endswith(":lock") and super(RacingRedis, self).get(name) == "other-worker"
+            for name in names
+        )
+        return super().delete(*names)
+
+
+def test_redis_release_never_deletes_a_lock_taken_by_another_worker():
+    """The mutex is released with an atomic compare-and-delete."""
+    client = RacingRedis()
+    backend = RedisQueueBackend(client, prefix="test")
+
+    backend.enqueue(_items(1))
+    backend.claim("worker-1", 1, 60.0)
+
+    assert client.stolen == 0
+
+
+def test_in_memory_redis_release_script_compares_token():
+    client = InMemoryRedis()
+    client.set("lock", "mine", nx=True, px=10_000)
+    release = queue_redis._RELEASE_SCRIPT
+
+    assert client.eval(release, 1, "lock", "theirs") == 0
+    assert client.get("lock") == "mine"
+    assert client.eval(release, 1, "lock", "mine") == 1
+    assert client.get("lock") is None
+    with pytest.raises(NotImplementedError):
+        client.eval("return 1", 0)
+
+
+# ============================================================================
+# Workers and merge
+# ============================================================================
+
+
+@pytest.mark.asyncio
+async def test_workers_share_queue_and_results_merge_into_store(backend: QueueBackend):
+    """Several workers drain one queue; results land in one MetricsStore."""
+    backend.enqueue(_items(12))
+    limiter = BackendRateLimiter(backend, {"gpt-4o": RateLimit(requests_per_minute=60_000)})
+    attempts: dict[str, int] = {}
+
+    async def handle(item: WorkItem) -> WorkResult:
+        await limiter.acquire("gpt-4o", tokens=500)
+        attempts[item.sub_foco] = attempts.get(item.sub_foco, 0) + 1
+        if item.sub_foco == "Sub-foco 3" and attempts[item.sub_foco] == 1:
+            msg = "transient error"
+            raise TimeoutError(msg)
+        await asyncio.sleep(0)
+        return _result(item)
+
+    workers = [
+        DistributedWorker(backend, handle, worker_id=f"node-{n}", concurrency=3, poll_interval=0.01)
+        for n in range(2)
+    ]
+    completed = await asyncio.gather(*(worker.run() for worker in workers))
+
+    assert sum(completed) == 12
+    assert backend.counts() == {"queued": 0, "in_flight": 0, "done": 12, "failed": 0}
+
+    with MetricsStore(":memory:") as store:
+        assert merge_results(backend, store, batch_size=5) == 12
+        assert len(store.get_questions_by_status("pending")) == 12
+        assert store.get_aggregate_metrics()["total_questions"] == 12
+    assert backend.pending_results(10) == []
+
+
+def test_worker_argument_validation(backend: QueueBackend):
+    """Sizes and intervals must be positive."""
+
+    async def handle(item: WorkItem) -> WorkResult:
+        return _result(item)
+
+    with pytest.raises(ValueError, match="concurrency must be positive"):
+        DistributedWorker(backend, handle, concurrency=0)
+
+
+def test_merge_skips_results_delivered_again(backend: QueueBackend):
+    """A crash before the ack redelivers the batch; it is not saved twice."""
+    backend.enqueue(_items(3))
+    for item in backend.claim("worker-1", 3, 60.0):
+        backend.complete("worker-1", _result(item))
+    ack = backend.ack_results
+
+    def crash(result_ids: list[int]) -> None:
+        msg = "coordinator crashed"
+        raise RuntimeError(msg)
+
+    with MetricsStore(":memory:") as store:
+        backend.ack_results = crash  # type: ignore[method-assign]
+        with pytest.raises(RuntimeError, match="crashed"):
+            merge_results(backend, store)
+        backend.ack_results = ack  # type: ignore[method-assign]
+
+        assert merge_results(backend, store) == 0
+        assert len(store.get_questions_by_status("pending")) == 3
+    assert backend.pending_results(10) == []
+
+
+@pytest.mark.asyncio
+async def test_blocking_backend_calls_do_not_stall_the_event_loop(backend: QueueBackend):
+    """While a backend call waits on a lock, other coroutines keep running."""
+    backend.enqueue(_items(2))
+    claim = backend.claim
+
+    def slow_claim(worker_id: str, limit: int, lease_seconds: float) -> list[WorkItem]:
+        time.sleep(0.2)  # e.g. waiting for another machine's lock
+        return claim(worker_id, limit, lease_seconds)
+
+    backend.claim = slow_claim  # type: ignore[method-assign]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def ticker() -> float:
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        return loop.time() - start
+
+    async def handle(item: WorkItem) -> WorkResult:
+        return _result(item)
+
+    worker = DistributedWorker(backend, handle, concurrency=1, poll_interval=0.01)
+    completed, ticker_elapsed = await asyncio.gather(worker.run(), ticker())
+
+    assert completed == 2
+    assert ticker_elapsed < 0.15
+
+
+@pytest.mark.asyncio
+async def test_item_without_id_raises(backend: QueueBackend):
+    """A claimed item without id is a backend error, not an assertion."""
+    backend.claim = lambda *_: _items(1)  # type: ignore[method-assign]
+
+    async def handle(item: WorkItem) -> WorkResult:
+        return _result(item)
+
+    worker = DistributedWorker(backend, handle, concurrency=1)
+    with pytest.raises(PipelineError, match="without id"):
+        await worker.run()
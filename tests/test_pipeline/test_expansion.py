@@ -0,0 +1,150 @@
+"""Tests for SubFocoExpander (concurrent sub-foco expansion)."""
+
+import asyncio
+
+import pytest
+
+from construtor.config.exceptions import OutputParsingError
+from construtor.metrics import MetricsStore
+from construtor.models import FocoInput, SubFocoInput
+from construtor.pipeline import StratifiedPlanner, SubFocoExpander
+
+
+class FakeGenerator:
+    """SubFocoGenerator stand-in with per-foco delays and token usage."""
+
+    def __init__(
+        self,
+        delays: dict[str, float] | None = None,
+        tokens_per_foco: int = 1000,
+        failing: frozenset[str] = frozenset(),
+    ) -> None:
+        self._delays = delays or {}
+        self._tokens_per_foco = tokens_per_foco
+        self._failing = failing
+        self.tokens_used = 0
+        self.started: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def generate_batch(self, foco_input: FocoInput, count: int) -> list[SubFocoInput]:
+        self.started.append(foco_input.foco)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self._delays.get(foco_input.foco, 0.01))
+            self.tokens_used += self._tokens_per_foco
+            if foco_input.foco in self._failing:
+                msg = "Could not generate sub-focos"
+                raise OutputParsingError(msg, foco=foco_input.foco)
+            return [
+                SubFocoInput(
+                    tema=foco_input.tema,
+                    foco=foco_input.foco,
+                    periodo=foco_input.periodo,
+                    sub_foco=f"{foco_input.foco} - sub-foco {i}",
+                )
+                for i in range(count)
+            ]
+        finally:
+            self.in_flight -= 1
+
+    def get_statistics(self) -> dict[str, int | float]:
+        return {"calls": len(self.started), "tokens_used": self.tokens_used, "cost": 0.0}
+
+
+def _focos(n: int) -> list[FocoInput]:
+    return [FocoInput(tema="Cardiologia", foco=f"Foco {i}", periodo="2º ano") for i in range(n)]
+
+
+async def _collect(expander: SubFocoExpander, focos: list[FocoInput], count: int = 3) -> list:
+    return [batch async for batch in expander.expand(focos, count)]
+
+
+@pytest.mark.asyncio
+async def test_expands_every_foco_concurrently():
+    """Focos run concurrently up to max_concurrency and all complete."""
+    generator = FakeGenerator()
+    expander = SubFocoExpander(generator, max_concurrency=4)
+
+    batches = await _collect(expander, _focos(10))
+
+    assert sorted(batch[0].foco for batch in batches) == sorted(f.foco for f in _focos(10))
+    assert all(len(batch) == 3 for batch in batches)
+    assert generator.max_in_flight == 4
+    assert expander.get_statistics()["completed"] == 10
+
+
+@pytest.mark.asyncio
+async def test_yields_focos_in_completion_order():
+    """A fast foco is yielded before a slow one started earlier."""
+    generator = FakeGenerator(delays={"Foco 0": 0.2, "Foco 1": 0.01})
+    expander = SubFocoExpander(generator, max_concurrency=2)
+
+    batches = await _collect(expander, _focos(2))
+
+    assert [batch[0].foco for batch in batches] == ["Foco 1", "Foco 0"]
+
+
+@pytest.mark.asyncio
+async def test_token_budget_stops_starting_focos():
+    """Focos that do not fit the budget are skipped, not half-expanded."""
+    generator = FakeGenerator(tokens_per_foco=1000)
+    expander = SubFocoExpander(
+        generator, max_concurrency=2, token_budget=4500, tokens_per_foco=1000
+    )
+
+    batches = await _collect(expander, _focos(10))
+
+    stats = expander.get_statistics()
+    assert len(batches) == 4
+    assert stats["skipped"] == 6
+    assert stats["tokens_used"] <= 4500
+    assert generator.started == ["Foco 0", "Foco 1", "Foco 2", "Foco 3"]
+
+
+@pytest.mark.asyncio
+async def test_failed_foco_does_not_stop_the_others():
+    """A foco failing with OutputParsingError is counted and skipped."""
+    generator = FakeGenerator(failing=frozenset({"Foco 1"}))
+    expander = SubFocoExpander(generator, max_concurrency=3)
+
+    batches = await _collect(expander, _focos(3))
+
+    assert sorted(batch[0].foco for batch in batches) == ["Foco 0", "Foco 2"]
+    assert expander.get_statistics()["failed"] == 1
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_cancels_running_focos():
+    """Stopping iteration early cancels the focos still in flight."""
+    generator = FakeGenerator(delays={"Foco 1": 10.0, "Foco 2": 10.0})
+    expander = SubFocoExpander(generator, max_concurrency=3)
+
+    stream = expander.expand(_focos(3), 3)
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first[0].foco == "Foco 0"
+    assert generator.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_expand_into_queues_each_completed_foco():
+    """Completed focos are planned and written to the work-item ledger."""
+    store = MetricsStore(":memory:")
+    expander = SubFocoExpander(FakeGenerator(), max_concurrency=2)
+
+    queued = await expander.expand_into(_focos(3), StratifiedPlanner(seed=1), store, count=4)
+
+    assert queued == 12
+    assert store.get_work_item_counts()["queued"] == 12
+    store.close()
+
+
+def test_invalid_arguments_raise_value_error():
+    """Concurrency and estimates must be positive, the budget non-negative."""
+    with pytest.raises(ValueError, match="max_concurrency"):
+        SubFocoExpander(FakeGenerator(), max_concurrency=0)
+    with pytest.raises(ValueError, match="token_budget"):
+        SubFocoExpander(FakeGenerator(), token_budget=-1)
@@ -0,0 +1,129 @@
+"""Tests for StratifiedPlanner (up-front nivel/posição allocation)."""
+
+from collections import Counter
+
+import pytest
+
+from construtor.metrics import MetricsStore
+from construtor.models import SubFocoInput
+from construtor.pipeline import StratifiedPlanner
+
+
+def _sub_focos(focos: int, per_foco: int, periodo: str = "1º ano") -> list[SubFocoInput]:
+    return [
+        SubFocoInput(
+            tema="Cardiologia",
+            foco=f"Foco {f} {periodo}",
+            periodo=periodo,
+            sub_foco=f"Sub-foco {s}",
+        )
+        for f in range(focos)
+        for s in range(per_foco)
+    ]
+
+
+@pytest.fixture
+def store():
+    store = MetricsStore(":memory:")
+    yield store
+    store.close()
+
+
+def test_plan_covers_every_sub_foco_in_order():
+    """One work item per sub-foco, in input order."""
+    sub_focos = _sub_focos(2, 5)
+
+    plan = StratifiedPlanner(seed=1).plan(sub_focos)
+
+    assert [(i.foco, i.sub_foco) for i in plan] == [(s.foco, s.sub_foco) for s in sub_focos]
+    assert all(item.status == "queued" for item in plan)
+
+
+def test_levels_and_positions_are_balanced_per_periodo():
+    """Each periodo and each (periodo, nivel) cell is within one of balance."""
+    sub_focos = (
+        _sub_focos(7, 50, "1º ano") + _sub_focos(3, 50, "3º ano") + _sub_focos(1, 13, "4º ano")
+    )
+
+    plan = StratifiedPlanner(seed=2026).plan(sub_focos)
+
+    for periodo in ("1º ano", "3º ano", "4º ano"):
+        items = [i for i in plan if i.periodo == periodo]
+        niveis = Counter(i.nivel_dificuldade for i in items)
+        assert max(niveis.values()) - min(niveis.values()) <= 1
+        for nivel in (1, 2, 3):
+            positions = Counter(i.posicao_correta for i in items if i.nivel_dificuldade == nivel)
+            assert max(positions.values()) - min(positions.values()) <= 2
+
+    total = Counter(i.posicao_correta for i in plan)
+    assert max(total.values()) - min(total.values()) <= 1
+
+
+def test_each_foco_gets_a_spread_of_levels():
+    """Consecutive sub-focos of a foco are interleaved across levels."""
+    plan = StratifiedPlanner(seed=3).plan(_sub_focos(4, 50))
+
+    for f in range(4):
+        niveis = Counter(i.nivel_dificuldade for i in plan if i.foco == f"Foco {f} 1º ano")
+        assert all(16 <= niveis[nivel] <= 17 for nivel in (1, 2, 3))
+
+
+def test_custom_level_weights():
+    """Level quotas follow the configured weights."""
+    plan = StratifiedPlanner(nivel_weights={1: 0.5, 2: 0.3, 3: 0.2}).plan(_sub_focos(2, 50))
+
+    assert Counter(i.nivel_dificuldade for i in plan) == {1: 50, 2: 30, 3: 20}
+
+
+def test_plan_is_deterministic_for_a_seed():
+    """Same inputs and seed give the same plan; another seed reshuffles positions."""
+    sub_focos = _sub_focos(2, 20)
+
+    first = StratifiedPlanner(seed=5).plan(sub_focos)
+    second = StratifiedPlanner(seed=5).plan(sub_focos)
+    other = StratifiedPlanner(seed=6).plan(sub_focos)
+
+    assert first == second
+    assert [i.posicao_correta for i in first] != [i.posicao_correta for i in other]
+
+
+def test_persist_serves_plan_through_ledger(store):
+    """Persisted plans are claimed by workers and never re-planned."""
+    planner = StratifiedPlanner(seed=7)
+    plan = planner.plan(_sub_focos(1, 8))
+
+    assert planner.persist(plan, store) == 8
+    claimed = store.claim_work_items("worker-1", limit=3)
+    assert [(i.nivel_dificuldade, i.posicao_correta) for i in claimed] == [
+        (i.nivel_dificuldade, i.posicao_correta) for i in plan[:3]
+    ]
+
+    # Re-planning with another seed keeps existing assignments
+    assert (
+        StratifiedPlanner(seed=8).persist(StratifiedPlanner(seed=8).plan(_sub_focos(1, 10)), store)
+        == 2
+    )
+    assert store.get_work_item_counts()["queued"] == 7
+
+
+def test_summary_counts():
+    """summary() reports totals and per-periodo counts."""
+    plan = StratifiedPlanner().plan(_sub_focos(1, 12))
+
+    summary = StratifiedPlanner.summary(plan)
+
+    assert summary["total"]["nivel"] == {"1": 4, "2": 4, "3": 4}
+    assert summary["1º ano"]["posicao"] == {"A": 3, "B": 3, "C": 3, "D": 3}
+
+
+def test_invalid_weights():
+    """Weights must cover levels 1-3 with positive values."""
+    with pytest.raises(ValueError, match="nivel_weights"):
+        StratifiedPlanner(nivel_weights={1: 1.0, 2: 1.0})
+    with pytest.raises(ValueError, match="nivel_weights"):
+        StratifiedPlanner(nivel_weights={1: 1.0, 2: 0.0, 3: 1.0})
+
+
+def test_empty_plan():
+    """Planning nothing returns nothing."""
+    assert StratifiedPlanner().plan([]) == []
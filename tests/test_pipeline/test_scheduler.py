@@ -0,0 +1,191 @@
+"""Tests for PriorityScheduler (retries first, foco fairness, deadlines)."""
+
+import asyncio
+
+import pytest
+
+from construtor.models import FeedbackEstruturado, RetryContext, WorkItem
+from construtor.pipeline import PriorityScheduler
+
+
+def _item(foco: str = "Arritmias", sub_foco: str = "Sub-foco 1") -> WorkItem:
+    return WorkItem(
+        tema="Cardiologia",
+        foco=foco,
+        periodo="1º ano",
+        sub_foco=sub_foco,
+        nivel_dificuldade=2,
+        posicao_correta="A",
+    )
+
+
+def _retry_context(rodada: int = 1) -> RetryContext:
+    return RetryContext(
+        rodada_atual=rodada,
+        feedback_estruturado=FeedbackEstruturado(
+            enunciado_ambiguo=True,
+            distratores_fracos=False,
+            gabarito_questionavel=False,
+            comentario_incompleto=False,
+            fora_do_nivel=False,
+            observacoes="Enunciado ambíguo",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_go_before_fresh_work():
+    """A rejected question is retried before any new question starts."""
+    scheduler = PriorityScheduler(max_in_flight=5)
+    for n in range(3):
+        scheduler.submit(_item(sub_foco=f"Sub-foco {n}"))
+
+    first = await scheduler.next()
+    scheduler.retry(first, _retry_context())
+
+    retried = await scheduler.next()
+    assert retried.task_id == first.task_id
+    assert retried.retry is not None
+    assert retried.retry.rodada_atual == 1
+
+
+@pytest.mark.asyncio
+async def test_higher_rodada_retries_first():
+    """Among retries, the question closest to its final round goes first."""
+    scheduler = PriorityScheduler(max_in_flight=5)
+    scheduler.submit(_item(sub_foco="a"))
+    scheduler.submit(_item(sub_foco="b"))
+    a = await scheduler.next()
+    b = await scheduler.next()
+
+    scheduler.retry(a, _retry_context(1))
+    scheduler.retry(b, _retry_context(2))
+
+    assert (await scheduler.next()).task_id == b.task_id
+    assert (await scheduler.next()).task_id == a.task_id
+
+
+@pytest.mark.asyncio
+async def test_in_flight_cap_blocks_fresh_work_until_done():
+    """Fresh work waits while the cap is reached; retries keep their slot."""
+    scheduler = PriorityScheduler(max_in_flight=2)
+    for n in range(3):
+        scheduler.submit(_item(sub_foco=f"Sub-foco {n}"))
+    a = await scheduler.next()
+    b = await scheduler.next()
+
+    waiter = asyncio.create_task(scheduler.next())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    # A retry does not need a new slot
+    scheduler.retry(a, _retry_context())
+    assert (await waiter).task_id == a.task_id
+    assert scheduler.get_statistics()["in_flight"] == 2
+
+    scheduler.done(b)
+    third = await scheduler.next()
+    assert third.item.sub_foco == "Sub-foco 2"
+
+
+@pytest.mark.asyncio
+async def test_fresh_work_is_fair_across_focos():
+    """A large foco does not starve a small one submitted after it."""
+    scheduler = PriorityScheduler(max_in_flight=10)
+    for n in range(6):
+        scheduler.submit(_item(foco="Grande", sub_foco=f"g{n}"))
+    for n in range(2):
+        scheduler.submit(_item(foco="Pequeno", sub_foco=f"p{n}"))
+
+    order = [(await scheduler.next()).item.foco for _ in range(4)]
+
+    assert order == ["Grande", "Pequeno", "Grande", "Pequeno"]
+
+
+@pytest.mark.asyncio
+async def test_earliest_deadline_first_and_expiry(fake_clock):
+    """Deadlines order fresh work; overdue work is reported, not started."""
+    scheduler = PriorityScheduler(max_in_flight=5, clock=fake_clock)
+    scheduler.submit(_item(foco="Sem prazo"))
+    late = scheduler.submit(_item(foco="Vencido"), deadline=5.0)
+    scheduler.submit(_item(foco="Urgente"), deadline=20.0)
+
+    fake_clock.now = 10.0
+    assert (await scheduler.next()).item.foco == "Urgente"
+    assert (await scheduler.next()).item.foco == "Sem prazo"
+    assert [task.task_id for task in scheduler.drain_expired()] == [late.task_id]
+    assert scheduler.drain_expired() == []
+
+
+@pytest.mark.asyncio
+async def test_expired_retry_frees_its_slot(fake_clock):
+    """A retry past its deadline is expired and releases the question's slot."""
+    scheduler = PriorityScheduler(max_in_flight=1, clock=fake_clock)
+    scheduler.submit(_item(sub_foco="a"), deadline=5.0)
+    scheduler.submit(_item(sub_foco="b"))
+    a = await scheduler.next()
+    scheduler.retry(a, _retry_context())
+
+    fake_clock.now = 6.0
+    b = await scheduler.next()
+
+    assert b.item.sub_foco == "b"
+    assert [task.task_id for task in scheduler.drain_expired()] == [a.task_id]
+
+
+@pytest.mark.asyncio
+async def test_close_drains_then_returns_none():
+    """After close, next() returns None once everything is done."""
+    scheduler = PriorityScheduler(max_in_flight=2)
+    scheduler.submit(_item())
+    scheduler.close()
+    task = await scheduler.next()
+
+    waiter = asyncio.create_task(scheduler.next())
+    await asyncio.sleep(0)
+    assert not waiter.done()  # a retry may still come back
+
+    scheduler.done(task)
+    assert await waiter is None
+    with pytest.raises(RuntimeError, match="closed"):
+        scheduler.submit(_item())
+
+
+@pytest.mark.asyncio
+async def test_invalid_transitions():
+    """Only in-flight tasks can be retried or finished, and retried once at a time."""
+    scheduler = PriorityScheduler()
+    pending = scheduler.submit(_item(sub_foco="a"))
+    with pytest.raises(ValueError, match="not in flight"):
+        scheduler.done(pending)
+
+    task = await scheduler.next()
+    scheduler.retry(task, _retry_context())
+    with pytest.raises(ValueError, match="already queued for retry"):
+        scheduler.retry(task, _retry_context(2))
+
+    # Finishing while the retry waits drops the queued retry
+    scheduler.done(task)
+    scheduler.submit(_item(sub_foco="b"))
+    assert (await scheduler.next()).item.sub_foco == "b"
+
+
+@pytest.mark.asyncio
+async def test_done_while_waiting_for_retry_clears_pending_retry():
+    """A task finished while its retry waits is no longer counted as a pending retry."""
+    scheduler = PriorityScheduler()
+    scheduler.submit(_item())
+    task = await scheduler.next()
+    scheduler.retry(task, _retry_context())
+    assert scheduler.get_statistics()["pending_retries"] == 1
+
+    scheduler.done(task)
+
+    assert scheduler.get_statistics()["pending_retries"] == 0
+    assert scheduler.get_statistics()["in_flight"] == 0
+
+
+def test_invalid_cap():
+    """max_in_flight must be positive."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        PriorityScheduler(max_in_flight=0)
@@ -0,0 +1,256 @@
+"""Tests for the multi-process sharded pipeline."""
+
+import asyncio
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from construtor.config.exceptions import PipelineError
+from construtor.metrics import MetricsStore
+from construtor.models import WorkItem
+from construtor.pipeline import RateLimit, ShardedPipeline, sharded
+from construtor.pipeline.sharded import RateBudget, SharedRateLimiter, WorkHandler, _run_shard
+
+
+def _items(focos: int, per_foco: int) -> list[WorkItem]:
+    return [
+        WorkItem(
+            tema="Cardiologia",
+            foco=f"Foco {f}",
+            periodo="2º ano",
+            sub_foco=f"Sub-foco {s}",
+            nivel_dificuldade=1,
+            posicao_correta="B",
+        )
+        for f in range(focos)
+        for s in range(per_foco)
+    ]
+
+
+# Handler factories must be top-level to reach the worker processes
+
+
+def _pid_handler(limiter: SharedRateLimiter) -> WorkHandler:
+    async def handle(_item: WorkItem) -> int:
+        await limiter.acquire("gpt-4o", tokens=100)
+        return os.getpid()
+
+    return handle
+
+
+def _failing_handler(_limiter: SharedRateLimiter) -> WorkHandler:
+    async def handle(item: WorkItem) -> int:
+        if item.foco == "Foco 0":
+            msg = "invalid JSON from model"
+            raise ValueError(msg)
+        return 1
+
+    return handle
+
+
+# ============================================================================
+# RateBudget
+# ============================================================================
+
+
+def test_budget_allows_burst_then_spaces_requests(fake_clock):
+    """One second of requests goes through at once, then they are spaced."""
+    budget = RateBudget({"gpt-4o": RateLimit(requests_per_minute=120)}, clock=fake_clock)
+
+    delays = [budget.reserve("gpt-4o") for _ in range(5)]
+
+    assert delays == pytest.approx([0.0, 0.0, 0.5, 1.0, 1.5])
+    fake_clock.now = 10.0
+    assert budget.reserve("gpt-4o") == 0.0
+
+
+def test_budget_enforces_tokens_per_minute(fake_clock):
+    """Large requests are limited by the token budget."""
+    budget = RateBudget(
+        {"gpt-4o": RateLimit(requests_per_minute=1000, tokens_per_minute=6000)},
+        clock=fake_clock,
+    )
+
+    assert budget.reserve("gpt-4o", tokens=100) == 0.0  # 1s of tokens, within burst
+    assert budget.reserve("gpt-4o", tokens=1000) == pytest.approx(10.0)
+
+
+def test_budget_ignores_unknown_models(fake_clock):
+    """Models without limits are never delayed."""
+    budget = RateBudget({}, clock=fake_clock)
+
+    assert budget.reserve("claude-sonnet", tokens=10_000) == 0.0
+
+
+def test_concurrent_reservations_book_distinct_slots(monkeypatch):
+    """Reservations from many threads (one per proxy connection) never share a slot."""
+    booked: list[float] = []
+
+    def slow_reserve(tat: float | None, now: float, cost: float) -> tuple[float, float]:
+        time.sleep(0.0005)  # widen the read-modify-write window
+        new_tat, delay = gcra_reserve(tat, now, cost)
+        booked.append(new_tat)
+        return new_tat, delay
+
+    gcra_reserve = sharded.gcra_reserve
+    monkeypatch.setattr(sharded, "gcra_reserve", slow_reserve)
+    budget = RateBudget({"gpt-4o": RateLimit(requests_per_minute=60)}, clock=lambda: 0.0)
+
+    def hammer() -> None:
+        for _ in range(25):
+            budget.reserve("gpt-4o")
+
+    threads = [threading.Thread(target=hammer) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(booked) == 200
+    assert booked == sorted(set(booked))  # strictly increasing
+
+
+@pytest.mark.asyncio
+async def test_limiter_does_not_block_the_event_loop():
+    """A slow round trip to the coordinator does not stall other coroutines."""
+
+    class SlowBudget:
+        def reserve(self, model: str, tokens: int = 0) -> float:
+            time.sleep(0.2)  # manager-proxy round trip
+            return 0.0
+
+    limiter = SharedRateLimiter(SlowBudget())  # type: ignore[arg-type]
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def ticker() -> float:
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        return loop.time() - start
+
+    _, ticker_elapsed = await asyncio.gather(limiter.acquire("gpt-4o", tokens=100), ticker())
+
+    assert ticker_elapsed < 0.15
+
+
+class ScriptedStore:
+    """Work-item store serving scripted items, with slow or failing calls."""
+
+    def __init__(self, items: list[WorkItem], claim_seconds: float = 0.0) -> None:
+        self.items = list(items)
+        self.claim_seconds = claim_seconds
+        self.renewals: list[int] = []
+        self.renew_errors = 0
+        self.completed: list[int] = []
+
+    def claim_work_items(
+        self, worker_id, limit, lease_seconds, shard=None, max_attempts=None
+    ) -> list[WorkItem]:
+        time.sleep(self.claim_seconds)  # write lock held by another process
+        return [self.items.pop(0)] if self.items else []
+
+    def renew_work_item_lease(self, item_id, worker_id, lease_seconds) -> bool:
+        if self.renew_errors:
+            self.renew_errors -= 1
+            msg = "Database write failed: database is locked"
+            raise PipelineError(msg)
+        self.renewals.append(item_id)
+        return True
+
+    def complete_work_item(self, item_id, worker_id, question_id=None) -> bool:
+        self.completed.append(item_id)
+        return True
+
+
+@pytest.mark.asyncio
+async def test_shard_store_calls_do_not_block_the_event_loop():
+    """A claim waiting on the database does not stall the worker's other coroutines."""
+    store = ScriptedStore([], claim_seconds=0.2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+
+    async def ticker() -> float:
+        for _ in range(5):
+            await asyncio.sleep(0.01)
+        return loop.time() - start
+
+    async def handle(_item: WorkItem) -> int:
+        return 1
+
+    _, ticker_elapsed = await asyncio.gather(
+        _run_shard(store, handle, "shard-0", (0, 1), 1, 30.0, 3),  # type: ignore[arg-type]
+        ticker(),
+    )
+
+    assert ticker_elapsed < 0.15
+
+
+@pytest.mark.asyncio
+async def test_failed_lease_renewal_keeps_renewing():
+    """A renewal error is logged and the next renewals still run."""
+    item = _items(1, 1)[0].model_copy(update={"id": 7, "attempts": 1})
+    store = ScriptedStore([item])
+    store.renew_errors = 1
+
+    async def handle(_item: WorkItem) -> int:
+        await asyncio.sleep(0.2)
+        return 1
+
+    await _run_shard(store, handle, "shard-0", (0, 1), 1, 0.03, 3)  # type: ignore[arg-type]
+
+    assert store.renewals
+    assert set(store.renewals) == {7}
+    assert store.completed == [7]
+
+
+# ============================================================================
+# ShardedPipeline
+# ============================================================================
+
+
+def test_run_processes_every_item_with_foco_affinity(tmp_path: Path):
+    """Every item is done and all sub-focos of a foco ran in the same process."""
+    db_path = str(tmp_path / "state.db")
+    with MetricsStore(db_path) as store:
+        store.enqueue_work_items(_items(focos=6, per_foco=4))
+
+    counts = ShardedPipeline(
+        db_path,
+        _pid_handler,
+        workers=2,
+        rate_limits={"gpt-4o": RateLimit(requests_per_minute=60_000)},
+        concurrency=3,
+    ).run()
+
+    assert counts == {"queued": 0, "in_flight": 0, "done": 24, "failed": 0}
+    with MetricsStore(db_path) as store:
+        done = store.get_work_items_by_status("done")
+    pids_by_foco: dict[str, set[int]] = {}
+    for item in done:
+        pids_by_foco.setdefault(item.foco, set()).add(item.question_id)
+    assert all(len(pids) == 1 for pids in pids_by_foco.values())
+    assert os.getpid() not in {pid for pids in pids_by_foco.values() for pid in pids}
+
+
+def test_failures_are_retried_then_marked_failed(tmp_path: Path):
+    """A failing item is retried up to max_attempts, then marked failed."""
+    db_path = str(tmp_path / "state.db")
+    with MetricsStore(db_path) as store:
+        store.enqueue_work_items(_items(focos=2, per_foco=2))
+
+    counts = ShardedPipeline(db_path, _failing_handler, workers=2, max_attempts=2).run()
+
+    assert counts == {"queued": 0, "in_flight": 0, "done": 2, "failed": 2}
+    with MetricsStore(db_path) as store:
+        failed = store.get_work_items_by_status("failed")
+    assert {item.attempts for item in failed} == {2}
+    assert failed[0].last_error == "invalid JSON from model"
+
+
+def test_invalid_arguments(tmp_path: Path):
+    """Sizes must be positive."""
+    with pytest.raises(ValueError, match="workers must be positive"):
+        ShardedPipeline(str(tmp_path / "state.db"), _pid_handler, workers=0)
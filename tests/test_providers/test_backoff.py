@@ -0,0 +1,114 @@
+"""Tests for retry hint parsing and the shared rate-limit cool-down."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from unittest.mock import Mock
+
+import pytest
+
+from construtor.providers import SharedCooldown
+from construtor.providers.backoff import parse_retry_after
+
+
+def error_with_headers(headers: dict[str, str], message: str = "429") -> Exception:
+    """SDK-like error carrying an HTTP response."""
+    error = Exception(message)
+    error.response = Mock(headers=headers)  # type: ignore[attr-defined]
+    return error
+
+
+class TestParseRetryAfter:
+    """Retry hint extraction."""
+
+    def test_retry_after_ms_header_wins(self):
+        """retry-after-ms is more precise than retry-after."""
+        error = error_with_headers({"Retry-After-Ms": "1500", "retry-after": "2"})
+        assert parse_retry_after(error) == 1.5
+
+    def test_retry_after_seconds_header(self):
+        """retry-after in seconds."""
+        assert parse_retry_after(error_with_headers({"retry-after": "7"})) == 7.0
+
+    def test_retry_after_http_date(self):
+        """retry-after as an HTTP date is converted to a delay."""
+        when = datetime.now(UTC) + timedelta(seconds=30)
+        delay = parse_retry_after(error_with_headers({"retry-after": format_datetime(when)}))
+        assert delay is not None
+        assert 25 <= delay <= 30
+
+    def test_hint_in_message(self):
+        """OpenAI's "try again in" message is used when headers are missing."""
+        assert parse_retry_after(Exception("Please try again in 1.25s.")) == 1.25
+        assert parse_retry_after(Exception("Please try again in 120ms.")) == 0.12
+
+    def test_no_hint(self):
+        """Errors without a usable hint return None (mocked responses included)."""
+        assert parse_retry_after(Exception("rate_limit_error")) is None
+        error = Exception("429")
+        error.response = Mock(status_code=429)  # type: ignore[attr-defined]
+        assert parse_retry_after(error) is None
+        assert parse_retry_after(error_with_headers({"retry-after": "soon"})) is None
+
+
+class TestSharedCooldown:
+    """Shared per-model cool-down windows."""
+
+    def test_exponential_backoff_without_hint(self, fake_clock):
+        """Without hints the window grows 2s, 4s, 8s... until a success resets it."""
+        cooldown = SharedCooldown(base_delay=2.0, max_delay=5.0, clock=fake_clock)
+
+        assert cooldown.trip("gpt-4o") == 2.0
+        fake_clock.now = 2.0
+        assert cooldown.trip("gpt-4o") == 4.0
+        fake_clock.now = 6.0
+        assert cooldown.trip("gpt-4o") == 5.0  # capped
+
+        fake_clock.now = 11.0
+        cooldown.reset("gpt-4o")
+        assert cooldown.trip("gpt-4o") == 2.0
+
+    def test_concurrent_429s_do_not_escalate(self, fake_clock):
+        """429s arriving while the window is open count once."""
+        cooldown = SharedCooldown(base_delay=2.0, clock=fake_clock)
+
+        cooldown.trip("gpt-4o")
+        for _ in range(10):
+            assert cooldown.trip("gpt-4o") == 2.0
+        assert cooldown.remaining("claude-sonnet-4-5") == 0.0
+
+    def test_hint_sets_window(self, fake_clock):
+        """A server hint sizes the window (capped at max_delay)."""
+        cooldown = SharedCooldown(max_delay=30.0, clock=fake_clock)
+
+        assert cooldown.trip("gpt-4o", retry_after=12.0) == 12.0
+        assert cooldown.trip("gpt-4o", retry_after=300.0) == 30.0
+
+    @pytest.mark.asyncio
+    async def test_every_waiter_respects_window_with_jitter(self, fake_clock):
+        """All coroutines wait for the window, each with its own jitter."""
+        cooldown = SharedCooldown(jitter=1.0, clock=fake_clock, sleep=fake_clock.sleep)
+
+        await cooldown.wait("gpt-4o")
+        assert fake_clock.sleeps == []  # no window, no wait
+
+        cooldown.trip("gpt-4o", retry_after=10.0)
+        start = fake_clock.now
+        await cooldown.wait("gpt-4o")
+        assert 10.0 <= fake_clock.now - start <= 11.0
+
+    @pytest.mark.asyncio
+    async def test_waiters_spread_out(self):
+        """Concurrent waiters resume at different times, not all at once."""
+        cooldown = SharedCooldown(jitter=0.05)
+        cooldown.trip("gpt-4o", retry_after=0.01)
+        loop = asyncio.get_running_loop()
+        resumed: list[float] = []
+
+        async def waiter() -> None:
+            await cooldown.wait("gpt-4o")
+            resumed.append(loop.time())
+
+        await asyncio.gather(*(waiter() for _ in range(5)))
+
+        assert len(set(resumed)) > 1
@@ -0,0 +1,212 @@
+"""Tests for CircuitBreaker and FailoverProvider."""
+
+import asyncio
+from asyncio import Semaphore
+from typing import Any
+
+import pytest
+
+from construtor.config.exceptions import (
+    CircuitOpenError,
+    LLMProviderError,
+    LLMTimeoutError,
+    OutputParsingError,
+)
+from construtor.providers import CircuitBreaker, FailoverProvider
+from construtor.providers.base import LLMProvider
+
+
+class FlakyProvider:
+    """Provider failing while ``error`` is set."""
+
+    def __init__(self) -> None:
+        self.semaphore = Semaphore(10)
+        self.error: Exception | None = None
+        self.calls: list[str] = []
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(model)
+        if self.error is not None:
+            raise self.error
+        return {"content": prompt, "tokens_used": 10, "cost": 0.001, "latency": 0.1}
+
+
+class OtherProvider(FlakyProvider):
+    """Second provider class (breaker names start with the provider class)."""
+
+
+class TestCircuitBreaker:
+    """State transitions of a single breaker."""
+
+    def test_opens_after_consecutive_failures(self, fake_clock):
+        """The circuit opens at the threshold; a success resets the count."""
+        breaker = CircuitBreaker("p:m", failure_threshold=3, clock=fake_clock)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert breaker.allow() is False
+        assert breaker.get_statistics()["shed"] == 1
+
+    def test_half_open_probe_closes_or_reopens(self, fake_clock):
+        """After the recovery time one probe is allowed; its outcome decides."""
+        breaker = CircuitBreaker(
+            "p:m", failure_threshold=1, recovery_seconds=30.0, clock=fake_clock
+        )
+        breaker.record_failure()
+        assert breaker.retry_in() == 30.0
+
+        fake_clock.now = 30.0
+        assert breaker.state == "half_open"
+        assert breaker.allow() is True
+        assert breaker.allow() is False  # only one probe at a time
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+        fake_clock.now = 60.0
+        assert breaker.allow() is True
+        breaker.record_success()
+        assert breaker.state == "closed"
+        assert breaker.get_statistics()["times_opened"] == 2
+
+    def test_release_frees_probe_slot(self, fake_clock):
+        """A probe ending without an outcome gives its slot back."""
+        breaker = CircuitBreaker("p:m", failure_threshold=1, recovery_seconds=0.0, clock=fake_clock)
+        breaker.record_failure()
+        assert breaker.allow() is True
+        breaker.release()
+        assert breaker.allow() is True
+
+    def test_invalid_arguments(self):
+        """Thresholds and recovery time are validated."""
+        with pytest.raises(ValueError, match="positive"):
+            CircuitBreaker("p:m", failure_threshold=0)
+        with pytest.raises(ValueError, match="recovery_seconds"):
+            CircuitBreaker("p:m", recovery_seconds=-1.0)
+
+
+class TestFailoverProvider:
+    """Failover across routes."""
+
+    def test_implements_llm_provider_protocol(self):
+        """The wrapper can be used wherever an LLMProvider is expected."""
+        assert isinstance(FailoverProvider(FlakyProvider()), LLMProvider)
+
+    @pytest.mark.asyncio
+    async def test_fails_over_and_sheds_open_route(self, fake_clock):
+        """Failures reroute to the fallback; an open circuit is skipped entirely."""
+        openai, anthropic = FlakyProvider(), OtherProvider()
+        openai.error = LLMTimeoutError("timeout", modelo="gpt-4o")
+        provider = FailoverProvider(
+            openai,
+            fallbacks={"gpt-4o": [(anthropic, "claude-sonnet-4-5")]},
+            failure_threshold=2,
+            clock=fake_clock,
+        )
+
+        results = [await provider.generate("p", "gpt-4o", 0.7) for _ in range(4)]
+
+        assert {result["model"] for result in results} == {"claude-sonnet-4-5"}
+        assert openai.calls == ["gpt-4o", "gpt-4o"]  # then shed by the open circuit
+        stats = provider.get_statistics()
+        assert stats["FlakyProvider:gpt-4o"]["state"] == "open"
+        assert stats["FlakyProvider:gpt-4o"]["shed"] == 2
+        assert stats["OtherProvider:claude-sonnet-4-5"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_instances_of_one_class_have_separate_circuits(self, fake_clock):
+        """Two accounts of the same provider class and model do not share a circuit."""
+        primary, backup = FlakyProvider(), FlakyProvider()
+        primary.error = LLMProviderError("429", modelo="gpt-4o")
+        provider = FailoverProvider(
+            primary,
+            fallbacks={"gpt-4o": [(backup, "gpt-4o")]},
+            failure_threshold=1,
+            clock=fake_clock,
+        )
+
+        results = [await provider.generate("p", "gpt-4o", 0.7) for _ in range(3)]
+
+        assert [result["model"] for result in results] == ["gpt-4o"] * 3
+        assert primary.calls == ["gpt-4o"]
+        assert backup.calls == ["gpt-4o"] * 3
+        assert provider.breaker(backup, "gpt-4o") is not provider.breaker(primary, "gpt-4o")
+        stats = provider.get_statistics()
+        assert stats["FlakyProvider:gpt-4o"]["state"] == "open"
+        assert stats["FlakyProvider#2:gpt-4o"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_recovered_provider_gets_traffic_back(self, fake_clock):
+        """After the recovery time a successful probe closes the circuit."""
+        openai, anthropic = FlakyProvider(), OtherProvider()
+        openai.error = LLMProviderError("503", modelo="gpt-4o")
+        provider = FailoverProvider(
+            openai,
+            fallbacks={"gpt-4o": [(anthropic, "claude-sonnet-4-5")]},
+            failure_threshold=1,
+            recovery_seconds=30.0,
+            clock=fake_clock,
+        )
+        await provider.generate("p", "gpt-4o", 0.7)
+
+        openai.error = None
+        fake_clock.now = 31.0
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["model"] == "gpt-4o"
+        assert provider.get_statistics()["FlakyProvider:gpt-4o"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_all_routes_failing(self, fake_clock):
+        """The last error is raised, then CircuitOpenError once every circuit is open."""
+        openai, anthropic = FlakyProvider(), OtherProvider()
+        openai.error = LLMProviderError("openai down", modelo="gpt-4o")
+        anthropic.error = LLMProviderError("anthropic down", modelo="claude-sonnet-4-5")
+        provider = FailoverProvider(
+            openai,
+            fallbacks={"gpt-4o": [(anthropic, "claude-sonnet-4-5")]},
+            failure_threshold=1,
+            clock=fake_clock,
+        )
+
+        with pytest.raises(LLMProviderError, match="anthropic down"):
+            await provider.generate("p", "gpt-4o", 0.7)
+        with pytest.raises(CircuitOpenError, match="All circuits open"):
+            await provider.generate("p", "gpt-4o", 0.7)
+
+    @pytest.mark.asyncio
+    async def test_parsing_errors_do_not_trip_the_circuit(self):
+        """Errors that are not provider failures propagate and count as success."""
+        openai = FlakyProvider()
+        openai.error = OutputParsingError("bad json", modelo="gpt-4o")
+        provider = FailoverProvider(openai, failure_threshold=1)
+
+        with pytest.raises(OutputParsingError):
+            await provider.generate("p", "gpt-4o", 0.7)
+        assert provider.get_statistics()["FlakyProvider:gpt-4o"]["state"] == "closed"
+
+    @pytest.mark.asyncio
+    async def test_cancelled_probe_releases_slot(self, fake_clock):
+        """Cancelling a half-open probe does not leave the circuit stuck."""
+        openai = FlakyProvider()
+        provider = FailoverProvider(openai, failure_threshold=1, clock=fake_clock)
+        breaker = provider.breaker(openai, "gpt-4o")
+        breaker.record_failure()
+        fake_clock.now = 30.0
+
+        openai.error = asyncio.CancelledError()
+        with pytest.raises(asyncio.CancelledError):
+            await provider.generate("p", "gpt-4o", 0.7)
+
+        assert breaker.allow() is True
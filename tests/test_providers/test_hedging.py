@@ -0,0 +1,201 @@
+"""Tests for HedgedProvider (tail-latency hedging)."""
+
+import asyncio
+from asyncio import Semaphore
+from typing import Any
+
+import pytest
+
+from construtor.config.exceptions import LLMProviderError, LLMTimeoutError
+from construtor.providers import HedgedProvider
+from construtor.providers.base import LLMProvider
+
+
+class SlowProvider:
+    """Provider sleeping a scripted delay per call."""
+
+    def __init__(self, delays: list[float] | None = None, cost: float = 0.01) -> None:
+        self.semaphore = Semaphore(100)
+        self.delays = list(delays or [])
+        self.cost = cost
+        self.calls: list[str] = []
+        self.cancelled = 0
+        self.fail_with: Exception | None = None
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(model)
+        delay = self.delays.pop(0) if self.delays else 0.0
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail_with is not None:
+            raise self.fail_with
+        return {"content": model, "tokens_used": 100, "cost": self.cost, "latency": delay}
+
+
+async def warm_up(provider: HedgedProvider, model: str = "gpt-4o", calls: int = 20) -> None:
+    """Record enough fast latencies for hedging to start."""
+    for _ in range(calls):
+        await provider.generate("p", model, 0.7)
+
+
+class TestHedging:
+    """Hedge firing and racing."""
+
+    def test_implements_llm_provider_protocol(self):
+        """The wrapper can be used wherever an LLMProvider is expected."""
+        assert isinstance(HedgedProvider(SlowProvider()), LLMProvider)
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_before_enough_samples(self):
+        """Without a latency history the call is never hedged."""
+        primary = SlowProvider(delays=[0.05])
+        provider = HedgedProvider(primary, min_samples=20, min_delay=0.0)
+
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["hedged"] is False
+        assert primary.calls == ["gpt-4o"]
+        assert provider.get_statistics()["delays"] == {"gpt-4o": None}
+
+    @pytest.mark.asyncio
+    async def test_slow_call_is_hedged_and_loser_cancelled(self):
+        """A call past the p95 fires a hedge; the faster one wins."""
+        primary = SlowProvider(cost=0.01)
+        backup = SlowProvider(cost=0.002)
+        provider = HedgedProvider(
+            primary,
+            hedge_routes={"gpt-4o": (backup, "claude-sonnet-4-5")},
+            budget_fraction=0.5,
+            min_delay=0.0,
+        )
+        await warm_up(provider)
+
+        primary.delays = [5.0]
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["hedged"] is True
+        assert result["model"] == "claude-sonnet-4-5"
+        assert result["latency"] < 1.0
+        assert primary.cancelled == 1
+        # The cancelled call is billed as much as the winner
+        assert result["cost"] == pytest.approx(0.004)
+        stats = provider.get_statistics()
+        assert (stats["hedges"], stats["hedge_wins"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win(self):
+        """If the first attempt finishes first, the hedge is cancelled."""
+        primary = SlowProvider()
+        provider = HedgedProvider(primary, budget_fraction=0.5, min_delay=0.0)
+        await warm_up(provider)
+
+        primary.delays = [0.05, 5.0]  # first attempt, then the hedge
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["hedged"] is True
+        assert result["model"] == "gpt-4o"
+        assert primary.cancelled == 1
+        assert provider.get_statistics()["hedge_wins"] == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_falls_back_to_other(self):
+        """An attempt failing after the hedge fired does not fail the call."""
+        primary = SlowProvider()
+        backup = SlowProvider()
+        provider = HedgedProvider(
+            primary,
+            hedge_routes={"gpt-4o": (backup, "claude-sonnet-4-5")},
+            budget_fraction=0.5,
+            min_delay=0.0,
+        )
+        await warm_up(provider)
+
+        primary.delays = [0.05]
+        primary.fail_with = LLMTimeoutError("timeout", modelo="gpt-4o")
+        backup.delays = [0.1]
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["model"] == "claude-sonnet-4-5"
+        assert result["cost"] == pytest.approx(0.01)  # failed call not billed
+
+    @pytest.mark.asyncio
+    async def test_both_attempts_failing_raise_first_error(self):
+        """When both attempts fail the first attempt's error is raised."""
+        primary = SlowProvider()
+        provider = HedgedProvider(primary, budget_fraction=0.5, min_delay=0.0)
+        await warm_up(provider)
+
+        primary.delays = [0.05, 0.0]
+        primary.fail_with = LLMProviderError("boom", modelo="gpt-4o")
+        with pytest.raises(LLMProviderError, match="boom"):
+            await provider.generate("p", "gpt-4o", 0.7)
+
+
+class TestBudget:
+    """Budget cap on hedge spend."""
+
+    @pytest.mark.asyncio
+    async def test_budget_caps_hedge_spend(self):
+        """Hedges stop once they would exceed the budget fraction."""
+        primary = SlowProvider()
+        provider = HedgedProvider(primary, budget_fraction=0.05, min_delay=0.0)
+        await warm_up(provider, calls=40)
+
+        primary.delays = [0.2, 0.0] * 10
+        results = [await provider.generate("p", "gpt-4o", 0.7) for _ in range(10)]
+
+        assert 0 < sum(result["hedged"] for result in results) < 10
+        assert provider.get_statistics()["hedge_spend_fraction"] <= 0.05
+
+    @pytest.mark.asyncio
+    async def test_budget_prices_hedge_at_the_hedge_model_cost(self):
+        """A cheap first attempt does not make an expensive cross-model hedge affordable."""
+        primary = SlowProvider()
+        backup = SlowProvider(cost=5.0)
+        provider = HedgedProvider(
+            primary,
+            hedge_routes={"gpt-4o": (backup, "o1")},
+            budget_fraction=0.03,
+            min_delay=0.0,
+        )
+        primary.cost = 5.0
+        await warm_up(provider, model="o1", calls=2)
+        primary.cost = 0.01
+        await warm_up(provider)
+
+        primary.delays = [0.1]
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["hedged"] is False
+        assert backup.calls == []
+
+    @pytest.mark.asyncio
+    async def test_zero_budget_never_hedges(self):
+        """budget_fraction=0 disables hedging entirely."""
+        primary = SlowProvider()
+        provider = HedgedProvider(primary, budget_fraction=0.0, min_delay=0.0)
+        await warm_up(provider)
+
+        primary.delays = [0.1]
+        result = await provider.generate("p", "gpt-4o", 0.7)
+
+        assert result["hedged"] is False
+        assert len(primary.calls) == 21
+
+    def test_invalid_arguments(self):
+        """Quantile, budget and sample sizes are validated."""
+        with pytest.raises(ValueError, match="quantile"):
+            HedgedProvider(SlowProvider(), quantile=1.0)
+        with pytest.raises(ValueError, match="budget_fraction"):
+            HedgedProvider(SlowProvider(), budget_fraction=-0.1)
+        with pytest.raises(ValueError, match="positive"):
+            HedgedProvider(SlowProvider(), min_samples=0)
@@ -12,6 +12,7 @@ from construtor.config.exceptions import (
     LLMRateLimitError,
     LLMTimeoutError,
 )
+from construtor.providers.backoff import SharedCooldown
 from construtor.providers.base import LLMProvider
 from construtor.providers.openai_provider import OpenAIProvider
 
@@ -411,3 +412,48 @@ class TestOpenAIProviderRetry:
 
             # Should have tried 3 times (initial + 2 retries)
             assert mock_create.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_retry_honors_retry_after_header(self):
+        """Test that the server's retry-after-ms hint replaces the backoff."""
+        semaphore = Semaphore(5)
+        provider = OpenAIProvider(
+            api_key="test-key",
+            semaphore=semaphore,
+            cooldown=SharedCooldown(jitter=0.0),
+        )
+
+        from openai import RateLimitError
+
+        mock_response = Mock()
+        mock_response.choices = [Mock(message=Mock(content="Success"))]
+        mock_response.usage = Mock(prompt_tokens=10, completion_tokens=20, total_tokens=30)
+
+        call_count = 0
+
+        async def mock_call(*args, **kwargs):
+            nonlocal call_count
+            call_count += 1
+            if call_count == 1:
+                raise RateLimitError(
+                    "Rate limit",
+                    response=Mock(status_code=429, headers={"retry-after-ms": "50"}),
+                    body=None,
+                )
+            return mock_response
+
+        with patch.object(
+            provider.client.chat.completions,
+            "create",
+            new_callable=AsyncMock,
+        ) as mock_create:
+            mock_create.side_effect = mock_call
+
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            result = await provider.generate(prompt="Test", model="gpt-4o", temperature=0.7)
+
+            assert call_count == 2
+            assert result["content"] == "Success"
+            # Waited the hinted 50ms, not the 2s exponential step
+            assert 0.05 <= loop.time() - start < 1.0
@@ -0,0 +1,155 @@
+"""Tests for CostAwareRouter (cost-aware routing across providers)."""
+
+import asyncio
+from asyncio import Semaphore
+from typing import Any, ClassVar
+
+import pytest
+
+from construtor.config.exceptions import LLMProviderError, LLMRateLimitError
+from construtor.providers import AUTO_MODEL, CostAwareRouter
+from construtor.providers.base import LLMProvider
+
+
+class FakeProvider:
+    """Provider returning canned results and recording the models it served."""
+
+    PRICING: ClassVar[dict[str, tuple[float, float]]] = {
+        "big": (3.00, 15.00),
+        "small": (0.15, 0.60),
+        "other-big": (2.50, 10.00),
+        "other-small": (1.00, 5.00),
+    }
+
+    def __init__(self, latency: float = 1.0) -> None:
+        self.semaphore = Semaphore(100)
+        self.calls: list[str] = []
+        self.latency = latency
+        self.rate_limited: set[str] = set()
+        self.retry_after: float | None = None
+        self.gate: asyncio.Event | None = None
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type | None = None,
+    ) -> dict[str, Any]:
+        self.calls.append(model)
+        if model in self.rate_limited:
+            msg = "429 Too Many Requests"
+            raise LLMRateLimitError(msg, modelo=model, retry_after=self.retry_after)
+        if self.gate is not None:
+            await self.gate.wait()
+        input_price, output_price = self.PRICING[model]
+        cost = (1500 * input_price + 800 * output_price) / 1_000_000
+        return {"content": prompt, "tokens_used": 2300, "cost": cost, "latency": self.latency}
+
+
+class TestRouting:
+    """Route selection."""
+
+    def test_router_implements_llm_provider_protocol(self):
+        """The router can be used wherever an LLMProvider is expected."""
+        router = CostAwareRouter([(FakeProvider(), "big")])
+        assert isinstance(router, LLMProvider)
+
+    @pytest.mark.asyncio
+    async def test_nivel_1_uses_cheaper_models(self):
+        """nivel 1 stays on the cheaper half even when a pricier model scores better."""
+        slow, fast = FakeProvider(latency=600.0), FakeProvider()
+        router = CostAwareRouter([(fast, "big"), (slow, "small"), (slow, "other-small")])
+        await router.generate("p", "small", 0.7)
+        await router.generate("p", "other-small", 0.7)
+
+        easy = await router.generate("p", AUTO_MODEL, 0.7, nivel=1)
+        hard = await router.generate("p", AUTO_MODEL, 0.7, nivel=3)
+
+        assert easy["model"] == "small"
+        assert hard["model"] == "big"  # the cheap models are too slow
+
+    @pytest.mark.asyncio
+    async def test_latency_penalty(self):
+        """A much slower route loses to a similar-cost fast one."""
+        slow, fast = FakeProvider(latency=60.0), FakeProvider(latency=1.0)
+        router = CostAwareRouter([(slow, "big"), (fast, "other-big")], latency_weight=0.05)
+        await router.generate("p", "big", 0.7)
+        await router.generate("p", "other-big", 0.7)
+
+        assert router.get_statistics()["big"]["latency"] == 60.0
+        assert (await router.generate("p", AUTO_MODEL, 0.7))["model"] == "other-big"
+
+    @pytest.mark.asyncio
+    async def test_unknown_model(self):
+        """Only routed models (or auto) can be requested."""
+        router = CostAwareRouter([(FakeProvider(), "big")])
+        with pytest.raises(LLMProviderError, match="not routed"):
+            await router.generate("p", "gpt-99", 0.7)
+
+
+class TestOverflow:
+    """Saturation and rate-limit overflow."""
+
+    @pytest.mark.asyncio
+    async def test_saturated_route_overflows_to_other_provider(self):
+        """A pinned model is used until full, then calls overflow."""
+        openai, anthropic = FakeProvider(), FakeProvider()
+        openai.gate = asyncio.Event()
+        router = CostAwareRouter([(openai, "small"), (anthropic, "other-small")], capacity=2)
+
+        blocked = [asyncio.create_task(router.generate("p", "small", 0.7)) for _ in range(2)]
+        await asyncio.sleep(0)
+        overflow = await router.generate("p", "small", 0.7)
+
+        assert overflow["model"] == "other-small"
+        assert router.get_statistics()["small"]["in_flight"] == 2
+        openai.gate.set()
+        assert [(await task)["model"] for task in blocked] == ["small", "small"]
+
+    @pytest.mark.asyncio
+    async def test_rate_limited_route_cools_down(self, fake_clock):
+        """A rate-limit error fails over and the route rests for the cool-down."""
+        openai, anthropic = FakeProvider(), FakeProvider()
+        openai.rate_limited.add("small")
+        router = CostAwareRouter(
+            [(openai, "small"), (anthropic, "other-small")], cooldown_seconds=30.0, clock=fake_clock
+        )
+
+        first = await router.generate("p", AUTO_MODEL, 0.7)
+        second = await router.generate("p", AUTO_MODEL, 0.7)
+        assert (first["model"], second["model"]) == ("other-small", "other-small")
+        assert openai.calls == ["small"]
+
+        fake_clock.now = 31.0
+        openai.rate_limited.clear()
+        assert (await router.generate("p", AUTO_MODEL, 0.7))["model"] == "small"
+
+    @pytest.mark.asyncio
+    async def test_all_routes_rate_limited(self):
+        """When every route is rate limited the last provider error is chained."""
+        provider = FakeProvider()
+        provider.rate_limited.update({"small", "big"})
+        provider.retry_after = 12.0
+        router = CostAwareRouter([(provider, "small"), (provider, "big")])
+
+        with pytest.raises(LLMRateLimitError, match="All routes rate limited") as exc_info:
+            await router.generate("p", AUTO_MODEL, 0.7)
+
+        assert isinstance(exc_info.value.__cause__, LLMRateLimitError)
+        assert exc_info.value.__cause__.modelo == provider.calls[-1]
+        assert exc_info.value.retry_after == 12.0
+
+
+class TestConfiguration:
+    """Constructor validation."""
+
+    def test_invalid_routes(self):
+        """Routes must be non-empty, unique and have positive capacity."""
+        provider = FakeProvider()
+        with pytest.raises(ValueError, match="at least one route"):
+            CostAwareRouter([])
+        with pytest.raises(ValueError, match="routed twice"):
+            CostAwareRouter([(provider, "big"), (provider, "big")])
+        with pytest.raises(ValueError, match="capacity must be positive"):
+            CostAwareRouter([(provider, "big")], capacity={"big": 0})
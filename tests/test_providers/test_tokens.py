@@ -0,0 +1,214 @@
+"""Tests for offline token estimation and TokenLimitedProvider."""
+
+from asyncio import Semaphore
+from typing import Any, ClassVar
+
+import pytest
+
+from construtor.config.exceptions import InputValidationError
+from construtor.config.prompt_loader import PromptTemplate
+from construtor.providers import TokenEstimator, TokenLimitedProvider
+from construtor.providers import tokens as tokens_module
+from construtor.providers.base import LLMProvider
+from construtor.providers.tokens import model_family, project_cost
+
+PROMPT = (
+    "Você é um professor de medicina. Crie uma questão sobre {tema}, foco {foco}, "
+    "sub-foco {sub_foco}, para o {periodo}. A resposta correta é {posicao_correta}; "
+    "repita: {posicao_correta}. Responda em JSON."
+)
+VALUES = {
+    "tema": "Cardiologia",
+    "foco": "Insuficiência Cardíaca",
+    "sub_foco": "Classificação NYHA",
+    "periodo": "3º ano",
+    "posicao_correta": "B",
+}
+
+
+class EchoProvider:
+    """Provider recording the prompts it receives."""
+
+    PRICING: ClassVar[dict[str, tuple[float, float]]] = {"gpt-4o": (2.50, 10.00)}
+
+    def __init__(self) -> None:
+        self.semaphore = Semaphore(10)
+        self.prompts: list[str] = []
+
+    async def generate(
+        self,
+        prompt: str,
+        model: str,
+        temperature: float,
+        response_model: type | None = None,
+    ) -> dict[str, Any]:
+        self.prompts.append(prompt)
+        return {"content": "ok", "tokens_used": 1200, "cost": 0.01, "latency": 0.1}
+
+
+class RecordingLimiter:
+    def __init__(self) -> None:
+        self.bookings: list[tuple[str, int]] = []
+
+    async def acquire(self, model: str, tokens: int = 0) -> None:
+        self.bookings.append((model, tokens))
+
+
+@pytest.fixture
+def estimator():
+    """Approximating estimator (independent of tiktoken being installed)."""
+    return TokenEstimator(use_tiktoken=False)
+
+
+class TestTokenEstimator:
+    """Counting, template caching and trimming."""
+
+    def test_model_family(self):
+        assert model_family("claude-sonnet-4-5") == "anthropic"
+        assert model_family("gpt-4o") == "openai"
+
+    def test_approximation_counts_words_and_punctuation(self, estimator):
+        """Short words are one token, long words several, punctuation one each."""
+        assert estimator.count("", "gpt-4o") == 0
+        assert estimator.count("IC grave.", "gpt-4o") == 4
+        assert estimator.count("hipertensão", "gpt-4o") == 3
+        assert estimator.count("hipertensão", "claude-sonnet-4-5") == 4
+        assert estimator.tokenizer("claude-sonnet-4-5") == "approx:anthropic"
+
+    def test_count_prompt_matches_rendered_prompt(self, estimator):
+        """Static segments plus values count the same as the rendered text."""
+        template = PromptTemplate(PROMPT)
+
+        for model in ("gpt-4o", "claude-sonnet-4-5"):
+            expected = estimator.count(str(template.render(**VALUES)), model)
+            assert estimator.count_prompt(template, model, **VALUES) == expected
+            assert estimator.count(template.render(**VALUES), model) == expected
+
+    def test_rendered_prompt_is_counted_from_cached_segments(self, estimator, monkeypatch):
+        """A rendered prompt is not re-tokenized in full; an extended one is."""
+        template = PromptTemplate(PROMPT)
+        estimator.count(template.render(**VALUES), "gpt-4o")
+        tokenized: list[str] = []
+        pattern = tokens_module._PIECE_PATTERN
+
+        class RecordingPattern:
+            def findall(self, text: str) -> list[str]:
+                tokenized.append(text)
+                return pattern.findall(text)
+
+        monkeypatch.setattr(tokens_module, "_PIECE_PATTERN", RecordingPattern())
+
+        rendered = template.render(**VALUES)
+        estimator.count(rendered, "gpt-4o")
+        assert sorted(tokenized) == sorted(str(VALUES[name]) for name in template.fields)
+
+        tokenized.clear()
+        estimator.count(rendered + " Evite repetir.", "gpt-4o")
+        assert tokenized == [rendered + " Evite repetir."]
+
+    def test_static_segments_are_counted_once(self, estimator, monkeypatch):
+        """The second estimate of a template only counts the values."""
+        template = PromptTemplate(PROMPT)
+        estimator.count_prompt(template, "gpt-4o", **VALUES)
+        counted: list[str] = []
+        original = estimator.count
+        monkeypatch.setattr(
+            estimator, "count", lambda text, model: counted.append(text) or original(text, model)
+        )
+
+        estimator.count_prompt(template, "gpt-4o", **VALUES)
+
+        assert sorted(counted) == sorted(str(VALUES[name]) for name in template.fields)
+
+    def test_trim_keeps_beginning_and_end(self, estimator):
+        """Trimming cuts the middle and fits the limit."""
+        text = "INÍCIO " + "palavra " * 500 + "FIM"
+
+        trimmed = estimator.trim(text, "gpt-4o", 100)
+
+        assert estimator.count(trimmed, "gpt-4o") <= 100
+        assert trimmed.startswith("INÍCIO")
+        assert trimmed.endswith("FIM")
+        assert "[...]" in trimmed
+        assert estimator.trim("curto", "gpt-4o", 100) == "curto"
+
+    def test_invalid_chars_per_token_raises(self):
+        with pytest.raises(ValueError, match="chars_per_token"):
+            TokenEstimator(chars_per_token={"openai": 0})
+
+
+def test_project_cost_uses_pricing_table():
+    """Projected cost comes from the provider's PRICING (0.0 when unknown)."""
+    provider = EchoProvider()
+
+    assert project_cost(provider, "gpt-4o", 1_000_000, 100_000) == 3.5
+    assert project_cost(provider, "unknown", 1000, 1000) == 0.0
+
+
+class TestTokenLimitedProvider:
+    """Enforcement before dispatch."""
+
+    def test_implements_llm_provider_protocol(self):
+        assert isinstance(TokenLimitedProvider(EchoProvider()), LLMProvider)
+
+    @pytest.mark.asyncio
+    async def test_oversized_prompt_is_rejected_before_dispatch(self, estimator):
+        provider = EchoProvider()
+        limited = TokenLimitedProvider(provider, estimator, max_prompt_tokens=10)
+
+        with pytest.raises(InputValidationError, match="exceeds the 10-token limit"):
+            await limited.generate("palavra " * 50, "gpt-4o", 0.7)
+
+        assert provider.prompts == []
+        assert limited.get_statistics()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_oversized_prompt_is_trimmed(self, estimator):
+        provider = EchoProvider()
+        limited = TokenLimitedProvider(
+            provider, estimator, max_prompt_tokens={"gpt-4o": 20}, on_oversize="trim"
+        )
+
+        result = await limited.generate("palavra " * 50, "gpt-4o", 0.7)
+        await limited.generate("palavra " * 50, "claude-sonnet-4-5", 0.7)
+
+        assert estimator.count(provider.prompts[0], "gpt-4o") <= 20
+        assert result["prompt_tokens_estimate"] <= 20
+        assert provider.prompts[1] == "palavra " * 50  # no limit for this model
+        assert limited.get_statistics()["trimmed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_limit_too_small_to_trim_is_rejected(self, estimator):
+        """A limit below the [...] marker never dispatches an empty prompt."""
+        provider = EchoProvider()
+        limited = TokenLimitedProvider(provider, estimator, max_prompt_tokens=2, on_oversize="trim")
+
+        with pytest.raises(InputValidationError, match="cannot be trimmed"):
+            await limited.generate("palavra " * 50, "gpt-4o", 0.7)
+
+        assert provider.prompts == []
+        assert limited.get_statistics()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_estimate_feeds_limiter_and_cost_projection(self, estimator):
+        limiter = RecordingLimiter()
+        limited = TokenLimitedProvider(
+            EchoProvider(), estimator, limiter=limiter, expected_output_tokens=500
+        )
+        prompt = PromptTemplate(PROMPT).render(**VALUES)
+        tokens = estimator.count(prompt, "gpt-4o")
+
+        await limited.generate(prompt, "gpt-4o", 0.7)
+
+        assert limiter.bookings == [("gpt-4o", tokens + 500)]
+        stats = limited.get_statistics()
+        assert stats["estimated_prompt_tokens"] == tokens
+        assert stats["projected_cost"] == round((tokens * 2.5 + 500 * 10.0) / 1_000_000, 6)
+        assert stats["actual_tokens"] == 1200
+        assert stats["actual_cost"] == 0.01
+
+    def test_invalid_limits_raise_value_error(self):
+        with pytest.raises(ValueError, match="max_prompt_tokens"):
+            TokenLimitedProvider(EchoProvider(), max_prompt_tokens=0)
+        with pytest.raises(ValueError, match="max_prompt_tokens"):
+            TokenLimitedProvider(EchoProvider(), max_prompt_tokens={"gpt-4o": -1})